@@ -12,6 +12,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "pygame>=2.5.2",
+        "numpy>=1.24",
     ],
     extras_require={
         "dev": [
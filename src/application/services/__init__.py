@@ -0,0 +1,60 @@
+"""Application services for the simulation engine."""
+
+from .backends import BACKENDS, StepBackend, available_backends, create_backend
+from .commands import CellEdit, CommandQueue, EditBatch
+from .distance_fields import DistanceField, DistanceFieldStage
+from .flow_fields import FlowField, FlowFieldCache, compute_flow_field
+from .metrics import (
+    HistogramSpec,
+    MetricsCollector,
+    MetricsRecord,
+    MetricsStage,
+    attach_metrics,
+    metrics_stream,
+)
+from .random_streams import CounterRNG
+from .reference_rules import ReferenceRuleSet
+from .region_sums import RegionSums, RegionSumsCache
+from .rewind import RewindBuffer, RewindRecorder
+from .rule_compiler import CompiledRuleSet
+from .simulation_engine import SimulationEngine
+from .simulation_worker import SimulationWorker
+from .snapshots import FrameSnapshot, SnapshotBuffer
+from .state_hash import StateHasher, first_divergence, state_hash
+from .tiled_engine import TiledEngine
+
+__all__ = [
+    "CounterRNG",
+    "CompiledRuleSet",
+    "SimulationEngine",
+    "SimulationWorker",
+    "FrameSnapshot",
+    "SnapshotBuffer",
+    "TiledEngine",
+    "HistogramSpec",
+    "MetricsCollector",
+    "MetricsRecord",
+    "MetricsStage",
+    "attach_metrics",
+    "metrics_stream",
+    "FlowField",
+    "FlowFieldCache",
+    "compute_flow_field",
+    "DistanceField",
+    "DistanceFieldStage",
+    "BACKENDS",
+    "StepBackend",
+    "ReferenceRuleSet",
+    "available_backends",
+    "create_backend",
+    "CellEdit",
+    "CommandQueue",
+    "EditBatch",
+    "RegionSums",
+    "RegionSumsCache",
+    "StateHasher",
+    "first_divergence",
+    "state_hash",
+    "RewindBuffer",
+    "RewindRecorder",
+]
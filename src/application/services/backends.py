@@ -0,0 +1,98 @@
+"""Interchangeable backends that apply a rule set to a world."""
+from typing import Dict, List, Optional, Protocol
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.rule_set import RuleSet
+
+from .jit_rules import JIT_AVAILABLE, JitRuleSet
+from .random_streams import CounterRNG
+from .reference_rules import ReferenceRuleSet
+from .rule_compiler import CompiledRuleSet
+
+# Every backend: the cell-by-cell reference interpreter, the NumPy kernels
+# used in production and the NumPy kernels with JIT-compiled aggregates
+BACKENDS = ("python", "numpy", "numba")
+
+
+class StepBackend(Protocol):
+    """Creates worlds from a rule set and advances them by one tick.
+
+    All backends produce bit-identical worlds for the same rule set, seed
+    and grid; they only differ in speed.
+    """
+
+    @property
+    def rule_set(self) -> RuleSet:
+        """RuleSet: The rule definitions being applied."""
+        ...
+
+    @property
+    def grid(self) -> HexGrid:
+        """HexGrid: The grid the rules run on."""
+        ...
+
+    def create_world(self, rng: Optional[CounterRNG] = None) -> World:
+        """Create a world with every declared field initialized.
+
+        Args:
+            rng (Optional[CounterRNG], optional): Random streams for initial
+                expressions. Defaults to None.
+
+        Returns:
+            World: A new world at tick 0
+        """
+        ...
+
+    def apply(self, world: World, rng: Optional[CounterRNG] = None) -> None:
+        """Apply one synchronous update of every rule to a world.
+
+        Args:
+            world (World): The world to update in place
+            rng (Optional[CounterRNG], optional): Random streams for
+                stochastic rules. Defaults to None.
+        """
+        ...
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by tables and buffers of the backend.
+
+        Returns:
+            Dict[str, int]: Bytes by table or buffer name
+        """
+        ...
+
+
+def available_backends() -> List[str]:
+    """List the backends that can run in this environment.
+
+    Returns:
+        List[str]: Backend names, from slowest to fastest
+    """
+    return [name for name in BACKENDS if name != "numba" or JIT_AVAILABLE]
+
+
+def create_backend(name: str, rule_set: RuleSet, grid: HexGrid) -> StepBackend:
+    """Create a backend by name.
+
+    Args:
+        name (str): One of ``BACKENDS``
+        rule_set (RuleSet): The rule definitions to apply
+        grid (HexGrid): The grid the rules will run on
+
+    Returns:
+        StepBackend: The backend, ready to create and update worlds
+
+    Raises:
+        ValueError: If the backend is unknown or unavailable
+        RuleDefinitionError: If an expression is invalid
+    """
+    if name == "python":
+        return ReferenceRuleSet(rule_set, grid)
+    if name == "numpy":
+        return CompiledRuleSet(rule_set, grid)
+    if name == "numba":
+        if not JIT_AVAILABLE:
+            raise ValueError("Backend 'numba' requires the numba package")
+        return JitRuleSet(rule_set, grid)
+    raise ValueError(f"Unknown backend '{name}', expected one of {BACKENDS}")
@@ -0,0 +1,211 @@
+"""Queued world edits, applied in bulk between ticks."""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_region import GridRegion
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CellEdit:
+    """A command writing values into some cells of one field.
+
+    Painting terrain and placing seeds are both cell edits, e.g. setting
+    ``terrain`` to 0 under a brush or ``biomass`` to 0.5 at a click.
+
+    Attributes:
+        field (str): The field to write
+        cells (np.ndarray): The cell ids to write, read-only
+        values (np.ndarray): One value per cell, read-only
+    """
+
+    field: str
+    cells: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def create(
+        cls, field: str, cells: np.ndarray, values: Union[float, np.ndarray]
+    ) -> "CellEdit":
+        """Create an edit, broadcasting a shared value to every cell.
+
+        Args:
+            field (str): The field to write
+            cells (np.ndarray): The cell ids to write
+            values (Union[float, np.ndarray]): A shared value or one per cell
+
+        Returns:
+            CellEdit: The command, owning read-only copies of its arrays
+
+        Raises:
+            ValueError: If a cell id is negative or the values do not fit
+        """
+        cell_ids: np.ndarray = np.array(cells, dtype=np.int64).reshape(-1)
+        if cell_ids.size and cell_ids.min() < 0:
+            raise ValueError("Cell ids must be non-negative")
+        per_cell: np.ndarray = np.array(np.broadcast_to(values, cell_ids.shape))
+        cell_ids.flags.writeable = False
+        per_cell.flags.writeable = False
+        return cls(field, cell_ids, per_cell)
+
+
+@dataclass(frozen=True)
+class EditBatch:
+    """The edits applied at one tick boundary, as one dirty region.
+
+    Attributes:
+        tick (int): The tick of the world when the batch was applied
+        commands (int): The number of coalesced commands
+        fields (Tuple[str, ...]): The fields that were written, sorted
+        cells (np.ndarray): The ids of every written cell, sorted and unique
+        region (GridRegion): The smallest window containing those cells
+    """
+
+    tick: int
+    commands: int
+    fields: Tuple[str, ...]
+    cells: np.ndarray
+    region: GridRegion
+
+
+class CommandQueue:
+    """Collects edit commands from input handlers for the engine to apply.
+
+    Input handlers may submit from any thread while the engine ticks; the
+    engine drains the queue at a tick boundary and applies everything
+    submitted since the previous boundary at once. Edits of the same field
+    are coalesced into one vectorized write, with later commands winning
+    where they overlap, and every field is touched once per batch however
+    many commands wrote it.
+
+    Attributes:
+        on_submit (Optional[Callable[[], None]]): Called after every
+            submission, e.g. to wake a paused simulation thread
+    """
+
+    def __init__(self) -> None:
+        """Create an empty queue."""
+        self.on_submit: Optional[Callable[[], None]] = None
+        self._lock = threading.Lock()
+        self._pending: List[CellEdit] = []
+
+    @property
+    def pending(self) -> int:
+        """int: The number of commands waiting for the next tick boundary."""
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, command: CellEdit) -> None:
+        """Queue a command for the next tick boundary.
+
+        Args:
+            command (CellEdit): The edit to apply
+        """
+        with self._lock:
+            self._pending.append(command)
+        if self.on_submit is not None:
+            self.on_submit()
+
+    def apply(self, world: World) -> Optional[EditBatch]:
+        """Apply every queued command to a world in one batch.
+
+        Must be called from the thread that updates the world, between
+        ticks. Every command is checked before anything is written: one
+        writing a missing field, a cell outside the grid or values the field
+        cannot hold (out of range or fractional for integer fields, too
+        large for float fields) is dropped with a warning, and the rest of the batch is
+        applied, so a bad edit neither stops the simulation nor leaves the
+        world half-edited.
+
+        Args:
+            world (World): The world to edit
+
+        Returns:
+            Optional[EditBatch]: The applied batch, or None if no command
+            wrote a cell
+        """
+        with self._lock:
+            commands, self._pending = self._pending, []
+        if not commands:
+            return None
+
+        by_field: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+        for command in commands:
+            edit = self._validated(world, command)
+            if edit is not None:
+                by_field.setdefault(command.field, []).append(edit)
+
+        updates: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for name, edits in by_field.items():
+            cells = np.concatenate([cells for cells, _ in edits])
+            if cells.size == 0:
+                continue
+            values = np.concatenate([values for _, values in edits])
+            # Keep the last write of every cell
+            unique, last = np.unique(cells[::-1], return_index=True)
+            updates[name] = (unique, values[::-1][last])
+        if not updates:
+            return None
+
+        # Every value already has the field's type, so no write can fail
+        written: Dict[str, np.ndarray] = {}
+        for name, (cells, values) in updates.items():
+            world.fields[name][cells] = values
+            world.touch(name)
+            written[name] = cells
+
+        cells = np.unique(np.concatenate(list(written.values())))
+        batch = EditBatch(
+            tick=world.tick,
+            commands=len(commands),
+            fields=tuple(sorted(written)),
+            cells=cells,
+            region=GridRegion.enclosing(cells, world.grid.dimensions.width),
+        )
+        return batch
+
+    @staticmethod
+    def _validated(
+        world: World, command: CellEdit
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Get a command's cells and values cast to its field, or None if bad."""
+        field = world.fields.get(command.field)
+        if field is None:
+            logger.warning("Dropped an edit of unknown field '%s'", command.field)
+            return None
+        if command.cells.size and command.cells.max() >= world.grid.cell_count:
+            logger.warning("Dropped an edit of '%s' outside the grid", command.field)
+            return None
+        try:
+            with np.errstate(invalid="ignore", over="ignore"):
+                values = command.values.astype(field.dtype)
+                held = _holds(field.dtype, command.values, values)
+        except (TypeError, ValueError) as error:
+            logger.warning("Dropped an edit of '%s': %s", command.field, error)
+            return None
+        if not held:
+            logger.warning(
+                "Dropped an edit of '%s' with values a %s field cannot hold",
+                command.field,
+                field.dtype,
+            )
+            return None
+        return command.cells, values
+
+
+def _holds(dtype: np.dtype, requested: np.ndarray, cast: np.ndarray) -> bool:
+    """Check that casting kept every value, up to float rounding."""
+    if dtype.kind in "biu":
+        # Integers and booleans must read back exactly: no wrapping around,
+        # no truncated fractions
+        return bool(np.all(cast.astype(requested.dtype) == requested))
+    if dtype.kind in "fc":
+        # Narrower floats round, but must not overflow to infinity
+        return not np.any(np.isinf(cast) & ~np.isinf(requested))
+    return True
@@ -0,0 +1,244 @@
+"""Hex distances to the nearest source cell, repaired incrementally."""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+
+# Distance of cells when the grid has no source at all
+FAR = np.iinfo(np.int32).max
+
+
+class DistanceField:
+    """The hex distance from every cell to the nearest source cell.
+
+    The field is built by a breadth-first search spreading from all sources
+    at once over the grid's neighbor table. Afterwards, adding or removing
+    sources repairs only the cells whose distance changes: added sources
+    spread until they stop improving distances, and removing a source
+    resets just the cells it was nearest to and refills them from the
+    surrounding cells. Sparse edits therefore cost in proportion to their
+    footprint, not to the grid size.
+
+    Attributes:
+        grid (HexGrid): The grid the distances belong to
+        distances (np.ndarray): The number of steps from every cell to the
+            nearest source, ``FAR`` when there is no source
+        nearest (np.ndarray): The id of a nearest source of every cell, -1
+            when there is no source
+        sources (np.ndarray): Boolean mask of the source cells
+    """
+
+    def __init__(self, grid: HexGrid, sources: Optional[np.ndarray] = None) -> None:
+        """Build the distances of an initial set of sources.
+
+        Args:
+            grid (HexGrid): The grid to measure distances on
+            sources (Optional[np.ndarray], optional): Boolean mask of the
+                source cells. Defaults to None (no source).
+        """
+        self.grid = grid
+        self.distances: np.ndarray = np.full(grid.cell_count, FAR, dtype=np.int32)
+        self.nearest: np.ndarray = np.full(grid.cell_count, -1, dtype=np.int64)
+        self.sources: np.ndarray = np.zeros(grid.cell_count, dtype=bool)
+        # Scratch mask of the region being repaired, cleared after each use
+        self._marked: np.ndarray = np.zeros(grid.cell_count, dtype=bool)
+        if sources is not None:
+            self.update(sources)
+
+    def add_sources(self, cells: np.ndarray) -> np.ndarray:
+        """Turn cells into sources and spread their distances.
+
+        Args:
+            cells (np.ndarray): Cell ids; cells that already are sources are
+                ignored
+
+        Returns:
+            np.ndarray: The ids of the cells whose distance changed
+        """
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        cells = cells[~self.sources[cells]]
+        self.sources[cells] = True
+        self.distances[cells] = 0
+        self.nearest[cells] = cells
+        changed: np.ndarray = np.concatenate([cells, self._spread(cells)])
+        return changed
+
+    def remove_sources(self, cells: np.ndarray) -> np.ndarray:
+        """Turn sources back into ordinary cells and repair their region.
+
+        Args:
+            cells (np.ndarray): Cell ids; cells that are not sources are
+                ignored
+
+        Returns:
+            np.ndarray: The ids of the cells whose distance changed
+        """
+        changed, _ = self._remove_sources(cells)
+        return changed
+
+    def _remove_sources(self, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Remove sources, returning the changed cells and their old distances."""
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        cells = cells[self.sources[cells]]
+        if cells.size == 0:
+            return cells, self.distances[cells]
+        self.sources[cells] = False
+        table = self.grid.neighbor_table
+
+        # The cells served by the removed sources are connected to them
+        # through cells served by the same sources; unvisited cells of that
+        # region still have a finite distance
+        removed = self._marked
+        removed[cells] = True
+        region, frontier = [], cells
+        while frontier.size:
+            region.append((frontier, self.distances[frontier].copy()))
+            self.distances[frontier] = FAR
+            neighbors = table[:, frontier].ravel()
+            neighbors = np.unique(neighbors[neighbors >= 0])
+            neighbors = neighbors[self.distances[neighbors] != FAR]
+            frontier = neighbors[removed[self.nearest[neighbors]]]
+        removed[cells] = False
+        affected = np.concatenate([visited for visited, _ in region])
+        previous = np.concatenate([distances for _, distances in region])
+        self.nearest[affected] = -1
+
+        # Refill the region from its untouched border, nearest cells first
+        border = table[:, affected].ravel()
+        border = np.unique(border[border >= 0])
+        self._spread(border[self.nearest[border] >= 0])
+        moved = self.distances[affected] != previous
+        return affected[moved], previous[moved]
+
+    def update(self, sources: np.ndarray) -> np.ndarray:
+        """Change the source set to a new mask, repairing what changed.
+
+        Args:
+            sources (np.ndarray): Boolean mask of the new source cells
+
+        Returns:
+            np.ndarray: The ids of the cells whose distance changed
+
+        Raises:
+            ValueError: If the mask does not have one entry per cell
+        """
+        sources = np.asarray(sources, dtype=bool)
+        if sources.shape != (self.grid.cell_count,):
+            raise ValueError(
+                f"Sources must have shape ({self.grid.cell_count},), "
+                f"got {sources.shape}"
+            )
+        removed, before = self._remove_sources(np.flatnonzero(self.sources & ~sources))
+        added = self.add_sources(np.flatnonzero(sources & ~self.sources))
+        # Added sources may bring cells back to the distance they had
+        restored = removed[self.distances[removed] == before]
+        changed: np.ndarray = np.setdiff1d(np.union1d(removed, added), restored)
+        return changed
+
+    def _spread(self, seeds: np.ndarray) -> np.ndarray:
+        """Lower distances outwards from seeds, one distance level at a time.
+
+        Seeds keep their distance and are expanded once the wave reaches
+        their level, so seeds at different distances are handled in order.
+        Returns the ids of the cells whose distance was lowered.
+        """
+        table = self.grid.neighbor_table
+        seeds = seeds[np.argsort(self.distances[seeds], kind="stable")]
+        seed_levels = self.distances[seeds]
+        lowered = []
+        position = 0
+        frontier = seeds[:0]
+        level = 0
+        while frontier.size or position < seeds.size:
+            if not frontier.size:
+                level = int(seed_levels[position])
+            end = int(np.searchsorted(seed_levels, level, side="right"))
+            frontier = np.concatenate([frontier, seeds[position:end]])
+            position = end
+
+            parents = np.tile(frontier, 6)
+            neighbors = table[:, frontier].ravel()
+            closer = neighbors >= 0
+            closer[closer] = self.distances[neighbors[closer]] > level + 1
+            neighbors, first = np.unique(neighbors[closer], return_index=True)
+            self.distances[neighbors] = level + 1
+            self.nearest[neighbors] = self.nearest[parents[closer][first]]
+            lowered.append(neighbors)
+            frontier = neighbors
+            level += 1
+        result: np.ndarray = np.concatenate(lowered) if lowered else seeds[:0]
+        return result
+
+
+class DistanceFieldStage:
+    """Engine stage keeping a world field at the distance to some terrain.
+
+    After every tick, the cells whose ``source_field`` holds one of
+    ``source_values`` (e.g. water terrain) are the sources of a
+    ``DistanceField``. The field is repaired only when the source field was
+    written, and only the changed cells are copied into the ``target``
+    field, so rules can read e.g. ``water_distance`` in the next tick.
+    Declare the target in the rule document to give it a dtype, otherwise
+    it is created as ``int32``.
+
+    Attributes:
+        target (str): The field the distances are written to
+        source_field (str): The field that selects the sources
+        source_values (Sequence[float]): The values marking a source
+        distance_field (Optional[DistanceField]): The maintained distances,
+            None before the first update
+    """
+
+    def __init__(
+        self, target: str, source_field: str, source_values: Sequence[float]
+    ) -> None:
+        """Create the stage.
+
+        Args:
+            target (str): The field to write distances to
+            source_field (str): The field that selects the sources
+            source_values (Sequence[float]): The values marking a source
+        """
+        self.target = target
+        self.source_field = source_field
+        self.source_values = tuple(source_values)
+        self.distance_field: Optional[DistanceField] = None
+        self._source_version: Optional[int] = None
+        self._target_version: Optional[int] = None
+
+    def __call__(self, world: World) -> None:
+        """Repair the distances if the sources changed and write them.
+
+        Args:
+            world (World): The updated world
+
+        Raises:
+            UnknownCellField: If the source field does not exist
+        """
+        values = world.get_field(self.source_field)
+        source_version = world.versions[self.source_field]
+        if source_version == self._source_version and self._up_to_date(world):
+            return
+        mask = np.isin(values, self.source_values)
+        if self.distance_field is None or self.distance_field.grid != world.grid:
+            self.distance_field = DistanceField(world.grid, mask)
+            changed = None
+        else:
+            changed = self.distance_field.update(mask)
+        self._source_version = source_version
+
+        distances = self.distance_field.distances
+        if self.target not in world.fields:
+            world.set_field(self.target, distances.copy())
+        elif changed is None or not self._up_to_date(world):
+            world.fields[self.target][:] = distances
+            world.touch(self.target)
+        elif changed.size:
+            world.fields[self.target][changed] = distances[changed]
+            world.touch(self.target)
+        self._target_version = world.versions[self.target]
+
+    def _up_to_date(self, world: World) -> bool:
+        return world.versions.get(self.target) == self._target_version
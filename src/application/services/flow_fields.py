@@ -0,0 +1,204 @@
+"""Flow fields that steer many agents towards shared goals."""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+
+# Direction of goal cells and of cells from which no goal can be reached
+NO_DIRECTION = -1
+
+FlowFieldKey = Tuple[Tuple[int, ...], str, int]
+
+
+@dataclass(frozen=True)
+class FlowField:
+    """The best first step from every cell towards the nearest goal.
+
+    Attributes:
+        grid (HexGrid): The grid the field belongs to
+        goals (Tuple[int, ...]): The goal cell ids, sorted
+        distances (np.ndarray): The cost of the cheapest path from every
+            cell to a goal, ``inf`` where no goal can be reached
+        directions (np.ndarray): The direction (0-5, as taken by
+            ``GridPosition.get_neighbor`` and the rows of the grid's
+            ``neighbor_table``) of the next cell on that path, or
+            ``NO_DIRECTION`` at goals and unreachable cells
+    """
+
+    grid: HexGrid
+    goals: Tuple[int, ...]
+    distances: np.ndarray
+    directions: np.ndarray
+
+    def next_cells(self, cells: np.ndarray) -> np.ndarray:
+        """Look up the next cell of agents standing on the given cells.
+
+        Args:
+            cells (np.ndarray): Cell ids, e.g. the positions of all animals
+
+        Returns:
+            np.ndarray: The cell to move to, or the same cell for agents at
+            a goal or unable to reach one
+        """
+        cells = np.asarray(cells, dtype=np.int64)
+        directions = self.directions[cells]
+        moving = directions != NO_DIRECTION
+        targets: np.ndarray = cells.copy()
+        targets[moving] = self.grid.neighbor_table[directions[moving], cells[moving]]
+        return targets
+
+
+def compute_flow_field(
+    grid: HexGrid, goals: Iterable[int], costs: np.ndarray
+) -> FlowField:
+    """Compute the flow field towards a set of goal cells.
+
+    Moving into a cell costs that cell's entry of ``costs``; cells with an
+    infinite cost cannot be entered. Distances are found by a wavefront
+    that spreads out from the goals: every round relaxes the neighbors of
+    all cells whose distance improved in the previous round at once, until
+    no distance improves. Ties between equally cheap steps go to the lowest
+    direction index.
+
+    Args:
+        grid (HexGrid): The grid to navigate
+        goals (Iterable[int]): The goal cell ids
+        costs (np.ndarray): The non-negative cost of entering every cell
+
+    Returns:
+        FlowField: The distances and directions towards the nearest goal
+
+    Raises:
+        ValueError: If there is no goal, a goal is outside the grid or the
+            costs do not fit the grid or are negative or NaN
+    """
+    goal_ids = np.unique(np.asarray(list(goals), dtype=np.int64))
+    if goal_ids.size == 0:
+        raise ValueError("A flow field needs at least one goal")
+    if goal_ids[0] < 0 or goal_ids[-1] >= grid.cell_count:
+        raise ValueError("Goal cell outside the grid")
+    costs = np.asarray(costs, dtype=np.float64)
+    if costs.shape != (grid.cell_count,):
+        raise ValueError(
+            f"Costs must have shape ({grid.cell_count},), got {costs.shape}"
+        )
+    if np.isnan(costs).any() or (costs < 0).any():
+        raise ValueError("Costs must be non-negative numbers")
+
+    table = grid.neighbor_table
+    distances: np.ndarray = np.full(grid.cell_count, np.inf)
+    distances[goal_ids] = 0.0
+    frontier = goal_ids
+    while frontier.size:
+        # A neighbor of a frontier cell can reach a goal by entering it
+        through = np.tile(distances[frontier] + costs[frontier], 6)
+        cells = table[:, frontier].ravel()
+        improved = cells >= 0
+        improved[improved] = through[improved] < distances[cells[improved]]
+        cells, through = cells[improved], through[improved]
+        np.minimum.at(distances, cells, through)
+        frontier = np.unique(cells)
+
+    # Step towards the neighbor with the cheapest remaining path
+    through = distances + costs
+    best: np.ndarray = np.full(grid.cell_count, np.inf)
+    directions: np.ndarray = np.full(grid.cell_count, NO_DIRECTION, dtype=np.int8)
+    for direction in range(6):
+        neighbors = table[direction]
+        candidate = np.where(neighbors >= 0, through[neighbors], np.inf)
+        better = candidate < best
+        best[better] = candidate[better]
+        directions[better] = direction
+    directions[goal_ids] = NO_DIRECTION
+
+    distances.flags.writeable = False
+    directions.flags.writeable = False
+    return FlowField(grid, tuple(goal_ids.tolist()), distances, directions)
+
+
+class FlowFieldCache:
+    """Flow fields of recently requested goal sets, least recently used out.
+
+    Many agents heading for the same goals share one field and navigate by
+    looking up their cell in it. A field is keyed by its goal set and the
+    name and version of the world's cost field, so it is recomputed only
+    when the costs are written; since versions are unique across worlds, a
+    cache can serve several worlds.
+
+    Attributes:
+        capacity (int): The maximum number of cached fields
+        hits (int): Requests served from the cache
+        misses (int): Requests that computed a field
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """Create an empty cache.
+
+        Args:
+            capacity (int, optional): The maximum number of cached fields.
+                Defaults to 16.
+
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Flow field cache capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._fields: "OrderedDict[FlowFieldKey, FlowField]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def field(self, world: World, cost_field: str, goals: Iterable[int]) -> FlowField:
+        """Get the flow field towards a goal set, computing it on a miss.
+
+        Args:
+            world (World): The world to navigate
+            cost_field (str): The field holding the cost of entering each cell
+            goals (Iterable[int]): The goal cell ids
+
+        Returns:
+            FlowField: The field for the current costs
+
+        Raises:
+            UnknownCellField: If the cost field does not exist
+            ValueError: If the goals or costs are invalid
+        """
+        costs = world.get_field(cost_field)
+        goal_ids = tuple(sorted(set(int(goal) for goal in goals)))
+        key = (goal_ids, cost_field, world.versions[cost_field])
+        cached = self._fields.get(key)
+        if cached is not None:
+            self._fields.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        flow = compute_flow_field(world.grid, goal_ids, costs)
+        self._fields[key] = flow
+        if len(self._fields) > self.capacity:
+            self._fields.popitem(last=False)
+        return flow
+
+    def clear(self) -> None:
+        """Drop every cached field."""
+        self._fields.clear()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the cached fields.
+
+        Returns:
+            Dict[str, int]: Bytes by item name
+        """
+        return {
+            "flow fields": sum(
+                flow.distances.nbytes + flow.directions.nbytes
+                for flow in self._fields.values()
+            )
+        }
@@ -0,0 +1,244 @@
+"""Accounting of the memory held by each subsystem of a simulation."""
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from .simulation_engine import SimulationEngine
+from .snapshots import FrameSnapshot
+
+
+@dataclass(frozen=True)
+class MemoryItem:
+    """One array, table or cache and the bytes it holds.
+
+    Attributes:
+        subsystem (str): The subsystem owning the memory
+        name (str): What the memory holds
+        nbytes (int): Its size in bytes
+    """
+
+    subsystem: str
+    name: str
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """The memory held by a simulation, item by item.
+
+    Attributes:
+        cell_count (int): The number of cells of the simulated grid
+        items (Tuple[MemoryItem, ...]): Every accounted item
+    """
+
+    cell_count: int
+    items: Tuple[MemoryItem, ...] = ()
+
+    @property
+    def total(self) -> int:
+        """int: The bytes of all items."""
+        return sum(item.nbytes for item in self.items)
+
+    @property
+    def bytes_per_cell(self) -> float:
+        """float: The bytes of all items per grid cell."""
+        return self.total / self.cell_count if self.cell_count else 0.0
+
+    def subsystem_totals(self) -> Dict[str, int]:
+        """Sum the items of each subsystem.
+
+        Returns:
+            Dict[str, int]: Bytes by subsystem, in report order
+        """
+        totals: Dict[str, int] = {}
+        for item in self.items:
+            totals[item.subsystem] = totals.get(item.subsystem, 0) + item.nbytes
+        return totals
+
+    def with_usage(self, subsystem: str, usage: Mapping[str, int]) -> "MemoryReport":
+        """Add the items of another subsystem, e.g. a display's render caches.
+
+        Args:
+            subsystem (str): The subsystem owning the memory
+            usage (Mapping[str, int]): Bytes by item name
+
+        Returns:
+            MemoryReport: A report with the items appended
+        """
+        added = tuple(MemoryItem(subsystem, name, size) for name, size in usage.items())
+        return MemoryReport(self.cell_count, self.items + added)
+
+    def format(self) -> str:
+        """Render the report as a plain-text table.
+
+        Returns:
+            str: One line per item, then subsystem totals and bytes per cell
+        """
+        lines = [f"{'subsystem':<14} {'item':<36} {'bytes':>14}"]
+        for item in self.items:
+            lines.append(f"{item.subsystem:<14} {item.name:<36} {item.nbytes:>14,}")
+        lines.append("")
+        for subsystem, total in self.subsystem_totals().items():
+            lines.append(f"{subsystem:<14} {'(total)':<36} {total:>14,}")
+        lines.append(f"{'all':<14} {'(total)':<36} {self.total:>14,}")
+        lines.append(f"bytes per cell: {self.bytes_per_cell:.1f}")
+        return "\n".join(lines)
+
+
+def engine_memory_report(
+    engine: SimulationEngine, snapshots: Iterable[FrameSnapshot] = ()
+) -> MemoryReport:
+    """Account for the memory of an engine and the snapshots it produced.
+
+    Snapshot arrays shared with the world or with an earlier snapshot are
+    counted once.
+
+    Args:
+        engine (SimulationEngine): The engine to account for
+        snapshots (Iterable[FrameSnapshot], optional): Retained snapshots,
+            e.g. the latest one of a snapshot buffer. Defaults to ().
+
+    Returns:
+        MemoryReport: Cell fields, index tables, rule kernel buffers and
+        snapshot history
+    """
+    world = engine.world
+    items: List[MemoryItem] = [
+        MemoryItem("cell fields", name, values.nbytes)
+        for name, values in world.fields.items()
+    ]
+    for name, nbytes in world.grid.memory_usage().items():
+        items.append(MemoryItem("index tables", f"grid {name}", nbytes))
+    for name, nbytes in engine.rng.memory_usage().items():
+        items.append(MemoryItem("index tables", f"rng {name}", nbytes))
+    for name, nbytes in engine.rules.memory_usage().items():
+        items.append(MemoryItem("rule kernels", name, nbytes))
+
+    seen = {id(values) for values in world.fields.values()}
+    for snapshot in snapshots:
+        for name, values in snapshot.fields.items():
+            if id(values) not in seen:
+                seen.add(id(values))
+                item = MemoryItem(
+                    "history", f"tick {snapshot.tick} {name}", values.nbytes
+                )
+                items.append(item)
+    return MemoryReport(world.grid.cell_count, tuple(items))
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """A source line and the memory its allocations retained.
+
+    Attributes:
+        location (str): ``file:line`` of the allocation
+        size_diff (int): Bytes still allocated at the end of the trace
+        count_diff (int): Blocks still allocated at the end of the trace
+    """
+
+    location: str
+    size_diff: int
+    count_diff: int
+
+
+@dataclass(frozen=True)
+class AllocationTrace:
+    """Allocations made while an engine ticked under ``tracemalloc``.
+
+    Attributes:
+        ticks (int): The number of traced ticks
+        growth (int): Traced bytes retained after the ticks; 0 for a tick
+            loop that reuses its buffers
+        peak (int): The highest traced bytes above the starting point,
+            i.e. the temporaries of a tick
+        sites (Tuple[AllocationSite, ...]): The lines that retained the
+            most memory, largest first
+    """
+
+    ticks: int
+    growth: int
+    peak: int
+    sites: Tuple[AllocationSite, ...]
+
+    @property
+    def growth_per_tick(self) -> float:
+        """float: Retained bytes per traced tick."""
+        return self.growth / self.ticks
+
+    def format(self) -> str:
+        """Render the trace as plain text.
+
+        Returns:
+            str: The totals, then one line per allocation site
+        """
+        lines = [
+            f"traced ticks: {self.ticks}",
+            f"growth per tick: {self.growth_per_tick:,.1f} bytes",
+            f"peak temporaries: {self.peak:,} bytes",
+        ]
+        for site in self.sites:
+            lines.append(
+                f"{site.size_diff:>+14,} B {site.count_diff:>+8} {site.location}"
+            )
+        return "\n".join(lines)
+
+
+def trace_tick_allocations(
+    engine: SimulationEngine, ticks: int, warmup: int = 10, top: int = 10
+) -> AllocationTrace:
+    """Step an engine under ``tracemalloc`` and attribute its allocations.
+
+    Only the ticks after the warmup are measured; the warmup lets lazily
+    built tables and buffers settle, so the trace shows what the
+    steady-state tick loop allocates.
+
+    Args:
+        engine (SimulationEngine): The engine to step
+        ticks (int): The number of ticks to trace
+        warmup (int, optional): Ticks run before measuring. Defaults to 10.
+        top (int, optional): The number of allocation sites to keep.
+            Defaults to 10.
+
+    Returns:
+        AllocationTrace: The traced growth, peak and allocation sites
+
+    Raises:
+        ValueError: If the number of traced ticks is not positive
+    """
+    if ticks <= 0:
+        raise ValueError("Tracing needs a positive number of ticks")
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        engine.run(warmup)
+        # Garbage waiting for the cycle collector is not retained memory
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        for _ in range(ticks):
+            engine.step()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    ignored = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    differences = after.filter_traces(ignored).compare_to(
+        before.filter_traces(ignored), "lineno"
+    )
+    sites = tuple(
+        AllocationSite(str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+        for stat in differences[:top]
+        if stat.size_diff != 0
+    )
+    return AllocationTrace(ticks, current - baseline, max(0, peak - baseline), sites)
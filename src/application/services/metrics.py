@@ -0,0 +1,311 @@
+"""Per-tick aggregate metrics of the cell state."""
+import queue
+import threading
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from src.domain.entities.world import World
+from src.domain.interfaces.cell_state import CellState
+
+from .simulation_engine import SimulationEngine
+from .snapshots import FrameSnapshot
+from .state_hash import HASH_COLUMN, StateHasher
+
+MetricValue = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class HistogramSpec:
+    """Fixed binning of a histogram metric.
+
+    Attributes:
+        low (float): Lower edge of the first bin
+        high (float): Upper edge of the last bin
+        bins (int): Number of equal-width bins
+    """
+
+    low: float
+    high: float
+    bins: int
+
+    def __post_init__(self) -> None:
+        """Validate the binning."""
+        if self.bins <= 0 or not self.high > self.low:
+            raise ValueError("Histogram needs a positive bin count and high > low")
+
+
+@dataclass(frozen=True)
+class MetricsRecord:
+    """The aggregate metrics of one tick.
+
+    Attributes:
+        tick (int): The tick the metrics describe
+        values (Mapping[str, MetricValue]): Scalar or fixed-length array
+            metrics by column name
+    """
+
+    tick: int
+    values: Mapping[str, MetricValue]
+
+
+class MetricsCollector:
+    """Computes per-tick aggregates from array-backed cell state.
+
+    Columns are named ``count.<field>`` (cells per integer category, for
+    example per terrain type), ``total.<field>`` (sum over all cells) and
+    ``histogram.<field>`` (cells per bin; values outside the range are
+    clamped into the outer bins). With ``state_hash`` enabled the
+    ``state_hash`` column holds a 64-bit hash of every field, so two runs
+    can be compared tick by tick without storing their worlds.
+
+    Aggregates are cached by field version, so fields that did not change
+    since the last tick, such as static terrain, cost nothing to report.
+
+    Attributes:
+        counts (Dict[str, int]): Number of categories by counted field
+        totals (Tuple[str, ...]): Fields reported as totals
+        histograms (Dict[str, HistogramSpec]): Binning by histogram field
+        hasher (Optional[StateHasher]): Hashes the state of every tick, if
+            enabled
+    """
+
+    def __init__(
+        self,
+        counts: Optional[Mapping[str, int]] = None,
+        totals: Sequence[str] = (),
+        histograms: Optional[Mapping[str, HistogramSpec]] = None,
+        state_hash: bool = False,
+    ) -> None:
+        """Initialize the collector with the metrics to compute.
+
+        Args:
+            counts (Optional[Mapping[str, int]], optional): Number of
+                categories by integer field. Defaults to None.
+            totals (Sequence[str], optional): Fields to sum. Defaults to ().
+            histograms (Optional[Mapping[str, HistogramSpec]], optional):
+                Binning by field. Defaults to None.
+            state_hash (bool, optional): Report the state hash of every
+                tick; records must then be collected in tick order to only
+                rehash changed fields. Defaults to False.
+        """
+        self.counts = dict(counts or {})
+        self.totals = tuple(totals)
+        self.histograms = dict(histograms or {})
+        self.hasher = StateHasher() if state_hash else None
+        self._cache: Dict[Tuple[str, str], Tuple[int, MetricValue]] = {}
+
+    def restricted_to(self, field_names: Iterable[str]) -> "MetricsCollector":
+        """Create a collector keeping only metrics of the given fields.
+
+        Args:
+            field_names (Iterable[str]): The fields that exist in the world
+
+        Returns:
+            MetricsCollector: The restricted collector
+        """
+        names = set(field_names)
+        return MetricsCollector(
+            counts={name: n for name, n in self.counts.items() if name in names},
+            totals=[name for name in self.totals if name in names],
+            histograms={
+                name: spec for name, spec in self.histograms.items() if name in names
+            },
+            state_hash=self.hasher is not None,
+        )
+
+    def collect(self, state: CellState) -> MetricsRecord:
+        """Compute the metrics of one tick.
+
+        Args:
+            state (CellState): The world or snapshot to aggregate
+
+        Returns:
+            MetricsRecord: The tick's metrics
+        """
+        values: Dict[str, MetricValue] = {}
+        for name, categories in self.counts.items():
+            values[f"count.{name}"] = self._cached(
+                state, name, "count", lambda data: self._count(data, categories)
+            )
+        for name in self.totals:
+            values[f"total.{name}"] = self._cached(
+                state, name, "total", lambda data: float(data.sum(dtype=np.float64))
+            )
+        for name, spec in self.histograms.items():
+            values[f"histogram.{name}"] = self._cached(
+                state, name, "histogram", lambda data: self._histogram(data, spec)
+            )
+        if self.hasher is not None:
+            # A 0-d array keeps all 64 bits, which a float would not
+            values[HASH_COLUMN] = np.array(self.hasher.update(state), dtype=np.uint64)
+        return MetricsRecord(tick=state.tick, values=values)
+
+    def _cached(
+        self,
+        state: CellState,
+        name: str,
+        kind: str,
+        compute: Callable[[np.ndarray], MetricValue],
+    ) -> MetricValue:
+        version = state.versions[name]
+        cached = self._cache.get((name, kind))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = compute(state.fields[name])
+        self._cache[(name, kind)] = (version, value)
+        return value
+
+    @staticmethod
+    def _count(data: np.ndarray, categories: int) -> np.ndarray:
+        inside = data if data.min(initial=0) >= 0 else data[data >= 0]
+        counts: np.ndarray = np.bincount(inside, minlength=categories)
+        return counts[:categories]
+
+    @staticmethod
+    def _histogram(data: np.ndarray, spec: HistogramSpec) -> np.ndarray:
+        scale = spec.bins / (spec.high - spec.low)
+        scaled = np.subtract(data, spec.low, dtype=np.float64)
+        scaled *= scale
+        np.clip(scaled, 0, spec.bins - 1, out=scaled)
+        histogram: np.ndarray = np.bincount(scaled.astype(np.intp), minlength=spec.bins)
+        return histogram
+
+
+def metrics_stream(
+    engine: SimulationEngine, collector: MetricsCollector, ticks: int
+) -> Iterator[MetricsRecord]:
+    """Advance an engine and yield the metrics of every tick.
+
+    Args:
+        engine (SimulationEngine): The engine to advance
+        collector (MetricsCollector): The metrics to compute
+        ticks (int): The number of ticks to simulate
+
+    Yields:
+        MetricsRecord: The metrics of each new tick
+    """
+    for _ in range(ticks):
+        engine.step()
+        yield collector.collect(engine.world)
+
+
+class MetricsStage:
+    """Engine stage computing metrics off the simulation thread.
+
+    Registered with ``SimulationEngine.add_stage``, it only captures a
+    snapshot of the fields that changed during the tick; aggregation and
+    handing records to the sink happen on a background thread. A bounded
+    queue applies back-pressure if the sink falls behind.
+
+    Attributes:
+        collector (MetricsCollector): The metrics to compute
+        sink (Callable[[MetricsRecord], None]): Receives every record in
+            tick order, on the background thread
+        error (Optional[BaseException]): The exception that stopped the
+            background thread, if any
+    """
+
+    def __init__(
+        self,
+        collector: MetricsCollector,
+        sink: Callable[[MetricsRecord], None],
+        max_pending: int = 64,
+    ) -> None:
+        """Initialize the stage and start its background thread.
+
+        Args:
+            collector (MetricsCollector): The metrics to compute
+            sink (Callable[[MetricsRecord], None]): Receives every record
+            max_pending (int, optional): Snapshots that may wait for
+                aggregation before ticks block. Defaults to 64.
+        """
+        self.collector = collector
+        self.sink = sink
+        self.error: Optional[BaseException] = None
+        self._previous: Optional[FrameSnapshot] = None
+        self._pending: "queue.Queue[Optional[FrameSnapshot]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-stage", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, world: World) -> None:
+        """Queue the state of the tick that just completed.
+
+        Args:
+            world (World): The engine's world after the tick
+        """
+        if self.error is not None:
+            raise RuntimeError("Metrics stage failed") from self.error
+        self._previous = FrameSnapshot.capture(world, self._previous)
+        self._pending.put(self._previous)
+
+    def close(self) -> None:
+        """Process every queued tick and stop the background thread."""
+        self._pending.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            snapshot = self._pending.get()
+            if snapshot is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                self.sink(self.collector.collect(snapshot))
+            except Exception as error:  # Surfaced on the next tick
+                self.error = error
+
+
+def attach_metrics(
+    engine: SimulationEngine,
+    sink: Callable[[MetricsRecord], None],
+    counts: Optional[Mapping[str, int]] = None,
+    totals: Sequence[str] = (),
+    histograms: Iterable[Tuple[str, float, float, int]] = (),
+    state_hash: bool = False,
+) -> MetricsStage:
+    """Record the per-tick metrics of an engine through a background stage.
+
+    Metrics of fields the engine's world does not have are left out.
+
+    Args:
+        engine (SimulationEngine): The engine to observe
+        sink (Callable[[MetricsRecord], None]): Receives every record
+        counts (Optional[Mapping[str, int]], optional): Number of categories
+            by integer field. Defaults to None.
+        totals (Sequence[str], optional): Fields to sum. Defaults to ().
+        histograms (Iterable[Tuple[str, float, float, int]], optional):
+            ``(field, low, high, bins)`` of every histogram. Defaults to ().
+        state_hash (bool, optional): Report the state hash of every tick.
+            Defaults to False.
+
+    Returns:
+        MetricsStage: The registered stage; close it when the run ends
+    """
+    collector = MetricsCollector(
+        counts=counts,
+        totals=totals,
+        histograms={
+            name: HistogramSpec(low, high, bins) for name, low, high, bins in histograms
+        },
+        state_hash=state_hash,
+    ).restricted_to(engine.world.fields)
+    stage = MetricsStage(collector, sink)
+    engine.add_stage(stage)
+    return stage
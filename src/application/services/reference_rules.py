@@ -0,0 +1,409 @@
+"""Cell-by-cell interpretation of rule sets, the reference for other backends."""
+import ast
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.rule_set import RuleDefinitionError, RuleSet
+
+from .random_streams import CounterRNG
+from .rule_compiler import INITIAL_STREAM_BASE, NEIGHBOR_AGGREGATES
+
+# A value of one cell: a one-element array, or a plain Python number for
+# constants, so that mixing the two follows the same dtype rules as arrays
+Value = Union[np.ndarray, bool, int, float]
+
+_FUNCTIONS: Dict[str, Callable[..., Value]] = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "min": np.minimum,
+    "max": np.maximum,
+    "clip": np.clip,
+    "where": np.where,
+}
+_CELL_ATTRIBUTES = ("q", "r", "tick")
+_ARITY = {"min": 2, "max": 2, "clip": 3, "where": 3, "random": 0}
+_BINARY_OPERATORS: Dict[type, Callable[[Value, Value], Value]] = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+    ast.FloorDiv: lambda a, b: a // b,
+    ast.Mod: lambda a, b: a % b,
+    ast.Pow: lambda a, b: a**b,
+}
+_COMPARISONS: Dict[type, Callable[[Value, Value], Value]] = {
+    ast.Lt: lambda a, b: a < b,
+    ast.LtE: lambda a, b: a <= b,
+    ast.Gt: lambda a, b: a > b,
+    ast.GtE: lambda a, b: a >= b,
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+}
+
+
+class _Expression(ast.NodeVisitor):
+    """A validated rule expression and the random streams of its calls.
+
+    Streams are numbered in the order the code generator visits ``random()``
+    calls, continuing from ``stream``, so both draw the same numbers.
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        field_names: Sequence[str],
+        parameters: Dict[str, float],
+        stream: int,
+        context: str,
+    ) -> None:
+        self.field_names = set(field_names)
+        self.parameters = parameters
+        self.streams: Dict[int, int] = {}
+        self.next_stream = stream
+        try:
+            self.tree = ast.parse(expression.strip(), mode="eval").body
+            self.visit(self.tree)
+        except SyntaxError as error:
+            raise RuleDefinitionError(
+                f"{context}: invalid expression '{expression}': {error.msg}"
+            ) from error
+        except RuleDefinitionError as error:
+            raise RuleDefinitionError(f"{context}: {error}") from error
+
+    def generic_visit(self, node: ast.AST) -> None:
+        raise RuleDefinitionError(f"unsupported syntax '{type(node).__name__}'")
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if not isinstance(node.value, (bool, int, float)):
+            raise RuleDefinitionError(f"unsupported constant {node.value!r}")
+
+    def visit_Name(self, node: ast.Name) -> None:
+        known = self.field_names | set(self.parameters) | set(_CELL_ATTRIBUTES)
+        if node.id not in known:
+            raise RuleDefinitionError(f"unknown name '{node.id}'")
+
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        if type(node.op) not in _BINARY_OPERATORS:
+            self.generic_visit(node.op)
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> None:
+        if not isinstance(node.op, (ast.USub, ast.UAdd, ast.Not)):
+            self.generic_visit(node.op)
+        self.visit(node.operand)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        for value in node.values:
+            self.visit(value)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        for operator in node.ops:
+            if type(operator) not in _COMPARISONS:
+                self.generic_visit(operator)
+        for term in [node.left] + node.comparators:
+            self.visit(term)
+
+    def visit_IfExp(self, node: ast.IfExp) -> None:
+        for branch in (node.test, node.body, node.orelse):
+            self.visit(branch)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise RuleDefinitionError("only plain function calls are supported")
+        name = node.func.id
+        known = name == "random" or name in NEIGHBOR_AGGREGATES
+        if not known and name not in _FUNCTIONS:
+            raise RuleDefinitionError(f"unknown function '{name}'")
+        for argument in node.args:
+            self.visit(argument)
+        arity = _ARITY.get(name, 1)
+        if len(node.args) != arity:
+            raise RuleDefinitionError(
+                f"{name}() takes {arity} argument(s), got {len(node.args)}"
+            )
+        if name == "random":
+            self.streams[id(node)] = self.next_stream
+            self.next_stream += 1
+
+
+class _CellEvaluator(ast.NodeVisitor):
+    """Evaluates validated expressions for one cell at a time."""
+
+    def __init__(
+        self,
+        grid: HexGrid,
+        fields: Dict[str, np.ndarray],
+        tick: int,
+        rng: Optional[CounterRNG],
+    ) -> None:
+        self.table = grid.neighbor_table
+        self.width = grid.dimensions.width
+        self.fields = fields
+        self.tick = tick
+        self.rng = rng
+        self._expression: Optional[_Expression] = None
+        self._cell = 0
+
+    def evaluate(self, expression: _Expression, node: ast.AST, cell: int) -> Value:
+        """Evaluate a node of a validated expression for one cell.
+
+        Args:
+            expression (_Expression): The expression the node belongs to
+            node (ast.AST): The node to evaluate
+            cell (int): The cell id
+
+        Returns:
+            Value: A one-element array, or a Python number for constants
+        """
+        outer = self._expression, self._cell
+        self._expression, self._cell = expression, cell
+        try:
+            value: Value = self.visit(node)
+        finally:
+            self._expression, self._cell = outer
+        return value
+
+    def visit_Constant(self, node: ast.Constant) -> Value:
+        value: Value = node.value
+        return value
+
+    def visit_Name(self, node: ast.Name) -> Value:
+        assert self._expression is not None
+        cell = self._cell
+        if node.id in self._expression.field_names:
+            values: np.ndarray = self.fields[node.id][cell : cell + 1]
+            return values
+        if node.id in self._expression.parameters:
+            return self._expression.parameters[node.id]
+        if node.id == "tick":
+            return self.tick
+        coordinate = cell % self.width if node.id == "q" else cell // self.width
+        coordinates: np.ndarray = np.array([coordinate], dtype=np.float64)
+        return coordinates
+
+    def visit_BinOp(self, node: ast.BinOp) -> Value:
+        operator = _BINARY_OPERATORS[type(node.op)]
+        return operator(self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> Value:
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.USub):
+            negated: Value = -operand
+            return negated
+        if isinstance(node.op, ast.Not):
+            inverted: Value = np.logical_not(operand)
+            return inverted
+        unchanged: Value = operand
+        return unchanged
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> Value:
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        result: Value = self.visit(node.values[0])
+        for term in node.values[1:]:
+            result = combine(result, self.visit(term))
+        return result
+
+    def visit_Compare(self, node: ast.Compare) -> Value:
+        terms = [self.visit(term) for term in [node.left] + node.comparators]
+        result = _COMPARISONS[type(node.ops[0])](terms[0], terms[1])
+        for index in range(1, len(node.ops)):
+            compare = _COMPARISONS[type(node.ops[index])]
+            result = np.logical_and(result, compare(terms[index], terms[index + 1]))
+        return result
+
+    def visit_IfExp(self, node: ast.IfExp) -> Value:
+        result: Value = np.where(
+            self.visit(node.test), self.visit(node.body), self.visit(node.orelse)
+        )
+        return result
+
+    def visit_Call(self, node: ast.Call) -> Value:
+        assert self._expression is not None and isinstance(node.func, ast.Name)
+        name = node.func.id
+        if name == "random":
+            if self.rng is None:
+                raise RuleDefinitionError("random() requires a random stream service")
+            stream = self._expression.streams[id(node)]
+            ids = np.array([self._cell], dtype=np.uint64)
+            return self.rng.uniform(self.tick, ids, stream)
+        if name in NEIGHBOR_AGGREGATES:
+            return self._aggregate(name, node.args[0])
+        return _FUNCTIONS[name](*(self.visit(argument) for argument in node.args))
+
+    def _aggregate(self, name: str, argument: ast.AST) -> Value:
+        assert self._expression is not None
+        cell = self._cell
+        neighbors = [int(neighbor) for neighbor in self.table[:, cell]]
+        pad = {"neighbor_max": -np.inf, "neighbor_min": np.inf}.get(name, 0.0)
+        ring = [
+            self._as_float(argument, neighbor) if neighbor >= 0 else pad
+            for neighbor in neighbors
+        ]
+
+        # Fold the ring in direction order, like the whole-grid kernels
+        result = ring[0]
+        for value in ring[1:]:
+            if name == "neighbor_max":
+                result = float(np.maximum(result, value))
+            elif name == "neighbor_min":
+                result = float(np.minimum(result, value))
+            else:
+                result += value
+        existing = sum(neighbor >= 0 for neighbor in neighbors)
+        if name == "neighbor_mean":
+            result /= float(max(existing, 1))
+        elif name != "neighbor_sum" and existing == 0:
+            result = self._as_float(argument, cell)
+        aggregate: np.ndarray = np.array([result], dtype=np.float64)
+        return aggregate
+
+    def _as_float(self, node: ast.AST, cell: int) -> float:
+        assert self._expression is not None
+        value = self.evaluate(self._expression, node, cell)
+        return float(np.asarray(value, dtype=np.float64).reshape(-1)[0])
+
+
+class ReferenceRuleSet:
+    """A rule set interpreted cell by cell, as a correctness reference.
+
+    Every expression is evaluated separately for every cell by walking its
+    syntax tree, with neighbor aggregates gathered cell by cell from the
+    grid's neighbor table. Nothing is shared with the code generator of
+    ``CompiledRuleSet`` except NumPy's arithmetic: each cell value is a
+    one-element array, so dtype promotion and rounding match whole-grid
+    arrays and both backends must produce bit-identical worlds.
+
+    The interpreter is orders of magnitude slower than the compiled
+    kernels; use it on small grids to check other backends.
+
+    Attributes:
+        rule_set (RuleSet): The source rule definitions
+        grid (HexGrid): The grid the rules run on
+    """
+
+    def __init__(self, rule_set: RuleSet, grid: HexGrid) -> None:
+        """Validate a rule set for a grid.
+
+        Args:
+            rule_set (RuleSet): The rule definitions to interpret
+            grid (HexGrid): The grid the rules will run on
+
+        Raises:
+            RuleDefinitionError: If an expression is invalid
+        """
+        self.rule_set = rule_set
+        self.grid = grid
+        self._field_names = [spec.name for spec in rule_set.fields]
+        self._dtypes: Dict[str, np.dtype] = {
+            spec.name: np.dtype(spec.dtype) for spec in rule_set.fields
+        }
+        reserved = set(self._field_names) & set(_CELL_ATTRIBUTES)
+        if reserved:
+            raise RuleDefinitionError(
+                f"Field names are reserved: {', '.join(sorted(reserved))}"
+            )
+
+        parameters = rule_set.parameters
+        stream = 0
+        self._rules = []
+        for rule in rule_set.rules:
+            context = f"Rule for '{rule.target}'"
+            value = _Expression(
+                str(rule.expression), self._field_names, parameters, stream, context
+            )
+            stream = value.next_stream
+            where = None
+            if rule.where is not None:
+                where = _Expression(
+                    str(rule.where), self._field_names, parameters, stream, context
+                )
+                stream = where.next_stream
+            self._rules.append((rule.target, value, where))
+
+        self._initializers: Dict[str, _Expression] = {}
+        for index, spec in enumerate(rule_set.fields):
+            if isinstance(spec.initial, str):
+                self._initializers[spec.name] = _Expression(
+                    spec.initial,
+                    self._field_names[:index],
+                    parameters,
+                    INITIAL_STREAM_BASE + index * 1024,
+                    f"Initial value of '{spec.name}'",
+                )
+
+    def create_world(self, rng: Optional[CounterRNG] = None) -> World:
+        """Create a world with every declared field initialized.
+
+        Args:
+            rng (Optional[CounterRNG], optional): Random streams for initial
+                expressions that call ``random()``. Defaults to None.
+
+        Returns:
+            World: A new world at tick 0
+        """
+        world = World(grid=self.grid)
+        evaluator = _CellEvaluator(self.grid, world.fields, 0, rng)
+        for spec in self.rule_set.fields:
+            expression = self._initializers.get(spec.name)
+            if expression is None:
+                world.add_field(spec.name, self._dtypes[spec.name], float(spec.initial))
+                continue
+            values = np.empty(self.grid.cell_count, dtype=self._dtypes[spec.name])
+            for cell in range(self.grid.cell_count):
+                values[cell : cell + 1] = evaluator.evaluate(
+                    expression, expression.tree, cell
+                )
+            world.set_field(spec.name, values)
+        return world
+
+    def apply(self, world: World, rng: Optional[CounterRNG] = None) -> None:
+        """Apply one synchronous update of every rule to a world.
+
+        Args:
+            world (World): The world to update in place; its tick is used as
+                the random stream counter but is not advanced
+            rng (Optional[CounterRNG], optional): Random streams for rules
+                that call ``random()``. Defaults to None.
+
+        Raises:
+            ValueError: If the world is not sized like the grid or does not
+                share its topology
+        """
+        if world.grid != self.grid:
+            raise ValueError(f"World of {world.grid} does not match {self.grid}")
+        evaluator = _CellEvaluator(self.grid, world.fields, world.tick, rng)
+        out = {
+            target: np.empty(self.grid.cell_count, dtype=self._dtypes[target])
+            for target, _, _ in self._rules
+        }
+        for target, value, where in self._rules:
+            for cell in range(self.grid.cell_count):
+                result = evaluator.evaluate(value, value.tree, cell)
+                if where is not None:
+                    condition = evaluator.evaluate(where, where.tree, cell)
+                    result = np.where(
+                        condition, result, world.fields[target][cell : cell + 1]
+                    )
+                out[target][cell : cell + 1] = result
+        for target, values in out.items():
+            world.fields[target] = values
+            world.touch(target)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by precomputed tables; the interpreter has none.
+
+        Returns:
+            Dict[str, int]: An empty mapping
+        """
+        return {}
+
+    def __str__(self) -> str:
+        return f"ReferenceRuleSet({self.rule_set}, {self.grid.dimensions})"
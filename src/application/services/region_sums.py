@@ -0,0 +1,291 @@
+"""Prefix sums answering aggregate queries over rectangles and hex ranges."""
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid, to_axial
+from src.domain.entities.world import UnknownCellField
+from src.domain.interfaces.cell_state import CellState
+from src.domain.value_objects.grid_region import GridRegion
+
+RegionSumsKey = Tuple[str, int]
+
+
+class RegionSums:
+    """Sums of one cell field over rectangles and hex ranges.
+
+    Two tables are built once from the field, in row-major cell order:
+    prefix sums along every row, and the summed-area table obtained by
+    accumulating those down the rows. A rectangle sum then takes four
+    lookups. A hex range of radius ``n`` covers one contiguous run of
+    cells in each of its ``4n + 1`` rows, since rows are half a hex apart:
+    the cells within distance ``n`` of a cell at axial x coordinate ``x``
+    in the row ``dr`` rows away are those whose axial x lies within
+    ``min(n, 2n - |dr|)`` of ``x``, so its sum takes two lookups per row.
+    On a toroidal grid hex ranges wrap around the edges, and a run
+    crossing the right edge takes two more lookups; rectangles are always
+    clipped to the grid.
+
+    Integer and boolean fields are summed exactly as int64; float fields
+    are summed as float64, so large tables may round in the last digits.
+
+    Attributes:
+        grid (HexGrid): The grid the field belongs to
+        total (float): The sum over the whole grid
+    """
+
+    def __init__(self, grid: HexGrid, values: np.ndarray) -> None:
+        """Build the tables of a field.
+
+        Args:
+            grid (HexGrid): The grid the field belongs to
+            values (np.ndarray): One value per cell
+
+        Raises:
+            ValueError: If the values do not have one entry per cell
+        """
+        if values.shape != (grid.cell_count,):
+            raise ValueError(
+                f"Expected {grid.cell_count} values, got shape {values.shape}"
+            )
+        self.grid = grid
+        width, height = grid.dimensions.width, grid.dimensions.height
+        dtype = np.float64 if np.issubdtype(values.dtype, np.inexact) else np.int64
+        # Prefix sums along every row, with a leading zero column
+        self._rows: np.ndarray = np.zeros((height, width + 1), dtype=dtype)
+        np.cumsum(values.reshape(height, width), axis=1, out=self._rows[:, 1:])
+        # Summed-area table, with a leading zero row and column
+        self._area: np.ndarray = np.zeros((height + 1, width + 1), dtype=dtype)
+        np.cumsum(self._rows, axis=0, out=self._area[1:])
+        self.total: float = self._area[-1, -1].item()
+
+    def rect_sum(self, region: GridRegion) -> float:
+        """Sum the field over a window of the grid.
+
+        Args:
+            region (GridRegion): The window, clipped to the grid
+
+        Returns:
+            float: The sum of the cells inside the grid and the window
+        """
+        sums = self.rect_sums(
+            np.array([region.q]),
+            np.array([region.r]),
+            np.array([region.width]),
+            np.array([region.height]),
+        )
+        total: float = sums[0].item()
+        return total
+
+    def rect_sums(
+        self, q: np.ndarray, r: np.ndarray, width: np.ndarray, height: np.ndarray
+    ) -> np.ndarray:
+        """Sum the field over many windows at once.
+
+        Args:
+            q (np.ndarray): The first column of every window
+            r (np.ndarray): The first row of every window
+            width (np.ndarray): The number of columns of every window
+            height (np.ndarray): The number of rows of every window
+
+        Returns:
+            np.ndarray: One sum per window, over its cells inside the grid
+        """
+        grid_width = self.grid.dimensions.width
+        grid_height = self.grid.dimensions.height
+        left = np.clip(q, 0, grid_width)
+        right = np.clip(np.asarray(q) + width, 0, grid_width)
+        top = np.clip(r, 0, grid_height)
+        bottom = np.clip(np.asarray(r) + height, 0, grid_height)
+        area = self._area
+        sums: np.ndarray = (
+            area[bottom, right]
+            - area[top, right]
+            - area[bottom, left]
+            + area[top, left]
+        )
+        return sums
+
+    def hex_sum(self, cell: int, radius: int) -> float:
+        """Sum the field over the cells within a hex distance of a cell.
+
+        Args:
+            cell (int): The center cell id
+            radius (int): The largest hex distance, at least 0
+
+        Returns:
+            float: The sum of the cells of the range inside the grid
+        """
+        sums = self.hex_sums(np.array([cell]), radius)
+        total: float = sums[0].item()
+        return total
+
+    def hex_sums(self, cells: np.ndarray, radius: int) -> np.ndarray:
+        """Sum the field over the hex ranges around many cells at once.
+
+        Args:
+            cells (np.ndarray): The center cell ids
+            radius (int): The largest hex distance, at least 0
+
+        Returns:
+            np.ndarray: One sum per center, over the cells of its range
+            inside the grid
+
+        Raises:
+            ValueError: If the radius is negative, or on a toroidal grid if
+                the range would overlap itself
+        """
+        sums, _ = self._hex_runs(cells, radius)
+        return sums
+
+    def hex_means(self, cells: np.ndarray, radius: int) -> np.ndarray:
+        """Average the field over the hex ranges around many cells at once.
+
+        Args:
+            cells (np.ndarray): The center cell ids
+            radius (int): The largest hex distance, at least 0
+
+        Returns:
+            np.ndarray: One mean per center, over the cells of its range
+            inside the grid
+
+        Raises:
+            ValueError: If the radius is negative, or on a toroidal grid if
+                the range would overlap itself
+        """
+        sums, counts = self._hex_runs(cells, radius)
+        means: np.ndarray = sums / counts
+        return means
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the prefix sum tables.
+
+        Returns:
+            Dict[str, int]: Bytes by table name
+        """
+        return {"prefix sums": self._rows.nbytes + self._area.nbytes}
+
+    def _hex_runs(
+        self, cells: np.ndarray, radius: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum and count the cells of hex ranges, one row run at a time."""
+        if radius < 0:
+            raise ValueError("Radius must not be negative")
+        width, height = self.grid.dimensions.width, self.grid.dimensions.height
+        if self.grid.wrap and (radius >= width or 4 * radius >= height):
+            raise ValueError(
+                f"Radius {radius} overlaps itself on a {width}x{height} torus"
+            )
+        cells = np.asarray(cells, dtype=np.int64)
+        center_q: np.ndarray = cells % width
+        center_r: np.ndarray = cells // width
+        center_x, _ = to_axial(center_q, center_r)
+        sums: np.ndarray = np.zeros(cells.shape, dtype=self._rows.dtype)
+        counts: np.ndarray = np.zeros(cells.shape, dtype=np.int64)
+        for dr in range(-2 * radius, 2 * radius + 1):
+            row: np.ndarray = center_r + dr
+            spread = min(radius, 2 * radius - abs(dr))
+            # The columns whose axial x, 2q + row % 2, is within the spread
+            left: np.ndarray = -((spread + row % 2 - center_x) // 2)
+            right: np.ndarray = (center_x + spread - row % 2) // 2 + 1
+            if self.grid.wrap:
+                length = right - left
+                left, row = self.grid.wrap_coordinates(left, row)
+                right = left + length
+                # Runs past the right edge continue from the first column
+                sums += (
+                    self._rows[row, np.minimum(right, width)]
+                    - self._rows[row, left]
+                    + self._rows[row, np.maximum(right - width, 0)]
+                )
+                counts += length
+                continue
+            inside = (row >= 0) & (row < height)
+            left, right = np.clip(left, 0, width), np.clip(right, 0, width)
+            row = np.clip(row, 0, height - 1)
+            runs = self._rows[row, right] - self._rows[row, left]
+            sums += np.where(inside, runs, 0)
+            counts += np.where(inside, right - left, 0)
+        return sums, counts
+
+
+class RegionSumsCache:
+    """Prefix sums of recently queried fields, least recently used out.
+
+    Tables are keyed by field name and version, so they are built at most
+    once per tick for a field that changes every tick, on the first query,
+    and reused for as long as the field is not written. Since versions are
+    unique across worlds, a cache can serve several worlds and snapshots.
+
+    Attributes:
+        capacity (int): The maximum number of cached tables
+        hits (int): Requests served from the cache
+        misses (int): Requests that built tables
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        """Create an empty cache.
+
+        Args:
+            capacity (int, optional): The maximum number of cached tables.
+                Defaults to 8.
+
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Region sums cache capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._sums: "OrderedDict[RegionSumsKey, RegionSums]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sums)
+
+    def sums(self, state: CellState, field: str) -> RegionSums:
+        """Get the prefix sums of a field, building them on a miss.
+
+        Args:
+            state (CellState): The world or snapshot to query
+            field (str): The field to aggregate
+
+        Returns:
+            RegionSums: The tables for the current values of the field
+
+        Raises:
+            UnknownCellField: If the field does not exist
+        """
+        values = state.fields.get(field)
+        if values is None:
+            raise UnknownCellField(f"Unknown cell field '{field}'")
+        key = (field, state.versions[field])
+        cached = self._sums.get(key)
+        if cached is not None:
+            self._sums.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        sums = RegionSums(state.grid, values)
+        self._sums[key] = sums
+        if len(self._sums) > self.capacity:
+            self._sums.popitem(last=False)
+        return sums
+
+    def clear(self) -> None:
+        """Drop every cached table."""
+        self._sums.clear()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the cached tables.
+
+        Returns:
+            Dict[str, int]: Bytes by item name
+        """
+        return {
+            "region sums": sum(
+                sums.memory_usage()["prefix sums"] for sums in self._sums.values()
+            )
+        }
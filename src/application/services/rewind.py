@@ -0,0 +1,328 @@
+"""Compressed history of recent states for rewinding the simulation."""
+import queue
+import threading
+import zlib
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.interfaces.cell_state import CellState
+
+from .snapshots import FrameSnapshot
+
+
+@dataclass(frozen=True)
+class _PackedField:
+    """One compressed field, shared by consecutive frames it did not change in.
+
+    Attributes:
+        version (int): The field version the data was packed from
+        dtype (np.dtype): The element type of the field
+        size (int): The number of cells
+        data (bytes): The byte-shuffled, deflated values
+    """
+
+    version: int
+    dtype: np.dtype
+    size: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class _PackedFrame:
+    """One stored state.
+
+    Attributes:
+        grid (HexGrid): The grid of the state
+        tick (int): The tick of the state
+        fields (Dict[str, _PackedField]): The compressed fields by name
+    """
+
+    grid: HexGrid
+    tick: int
+    fields: Dict[str, _PackedField]
+
+
+class RewindBuffer:
+    """Keeps recent states compressed in memory, dropping the oldest first.
+
+    Every field is compressed on its own, after grouping the bytes of its
+    values by significance (the first byte of every value, then the
+    second, ...), which lets deflate find the runs shared by neighboring
+    floats. A field whose version did not change since the previous frame
+    shares that frame's compressed copy, so static fields such as terrain
+    are stored once however many frames are kept.
+
+    Frames are only ever appended at the newest end. Pushing a state whose
+    tick is not newer than the newest frame drops the frames it replaces,
+    so after resuming from an earlier point the history continues from
+    there.
+
+    The buffer is safe to share between threads, so that states can be
+    compressed away from the thread that displays them.
+
+    Attributes:
+        memory_budget (int): The most bytes of compressed data kept
+        level (int): The deflate compression level
+    """
+
+    def __init__(self, memory_budget: int, level: int = 1) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            memory_budget (int): The most bytes of compressed data kept;
+                the newest frame is kept even if it alone exceeds it
+            level (int, optional): The deflate compression level, from 1
+                (fastest) to 9 (smallest). Defaults to 1.
+
+        Raises:
+            ValueError: If the budget is not positive
+        """
+        if memory_budget <= 0:
+            raise ValueError("Rewind memory budget must be positive")
+        self.memory_budget = memory_budget
+        self.level = level
+        self._frames: Deque[_PackedFrame] = deque()
+        self._bytes = 0
+        self._decoded: Dict[Tuple[str, int], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def ticks(self) -> List[int]:
+        """List[int]: The tick of every stored frame, oldest first."""
+        with self._lock:
+            return [frame.tick for frame in self._frames]
+
+    def push(self, state: CellState) -> None:
+        """Store a state as the newest frame.
+
+        Args:
+            state (CellState): The world or snapshot to store
+        """
+        with self._lock:
+            if self._frames and state.grid != self._frames[-1].grid:
+                self._clear()
+            while self._frames and self._frames[-1].tick >= state.tick:
+                self._drop(
+                    self._frames.pop(), self._frames[-1] if self._frames else None
+                )
+            previous = self._frames[-1] if self._frames else None
+            fields = {}
+            for name, values in state.fields.items():
+                version = state.versions[name]
+                shared = previous.fields.get(name) if previous is not None else None
+                if shared is not None and shared.version == version:
+                    fields[name] = shared
+                    continue
+                fields[name] = self._pack(version, values)
+                self._bytes += len(fields[name].data)
+            self._frames.append(_PackedFrame(state.grid, state.tick, fields))
+            while self._bytes > self.memory_budget and len(self._frames) > 1:
+                self._drop(self._frames.popleft(), self._frames[0])
+
+    def frame(self, index: int) -> FrameSnapshot:
+        """Decompress a stored frame.
+
+        Args:
+            index (int): The frame index, 0 being the oldest; negative
+                indices count from the newest
+
+        Returns:
+            FrameSnapshot: The stored state with read-only fields; fields
+            unchanged since the previously decompressed frame share its
+            arrays
+
+        Raises:
+            IndexError: If no frame has that index
+        """
+        with self._lock:
+            return self._snapshot(self._frames[index])
+
+    def frame_at(self, tick: int) -> FrameSnapshot:
+        """Decompress the stored frame of a tick.
+
+        Unlike indices, ticks keep naming the same frame while older frames
+        are dropped or newer ones are added.
+
+        Args:
+            tick (int): The tick of the frame
+
+        Returns:
+            FrameSnapshot: The stored state, as returned by ``frame``
+
+        Raises:
+            KeyError: If no stored frame has that tick
+        """
+        with self._lock:
+            ticks = [frame.tick for frame in self._frames]
+            index = bisect_left(ticks, tick)
+            if index == len(ticks) or ticks[index] != tick:
+                raise KeyError(f"No stored frame of tick {tick}")
+            return self._snapshot(self._frames[index])
+
+    def clear(self) -> None:
+        """Drop every stored frame."""
+        with self._lock:
+            self._clear()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes of compressed data held.
+
+        Returns:
+            Dict[str, int]: Bytes by item name
+        """
+        return {"rewind": self._bytes}
+
+    def _snapshot(self, packed: _PackedFrame) -> FrameSnapshot:
+        """Decompress a frame, reusing the previously decompressed arrays."""
+        fields = {}
+        decoded = {}
+        for name, field in packed.fields.items():
+            key = (name, field.version)
+            values = self._decoded.get(key)
+            if values is None:
+                values = self._unpack(field)
+            fields[name] = decoded[key] = values
+        self._decoded = decoded
+        return FrameSnapshot(
+            grid=packed.grid,
+            tick=packed.tick,
+            fields=MappingProxyType(fields),
+            versions=MappingProxyType(
+                {name: field.version for name, field in packed.fields.items()}
+            ),
+        )
+
+    def _clear(self) -> None:
+        self._frames.clear()
+        self._decoded = {}
+        self._bytes = 0
+
+    def _pack(self, version: int, values: np.ndarray) -> _PackedField:
+        """Shuffle the bytes of a field by significance and deflate them."""
+        values = np.ascontiguousarray(values)
+        shuffled = values.view(np.uint8).reshape(values.size, values.itemsize).T
+        data = zlib.compress(shuffled.tobytes(), self.level)
+        return _PackedField(version, values.dtype, values.size, data)
+
+    @staticmethod
+    def _unpack(field: _PackedField) -> np.ndarray:
+        """Inflate a field and restore the byte order of its values."""
+        shuffled = np.frombuffer(zlib.decompress(field.data), dtype=np.uint8)
+        values: np.ndarray = (
+            shuffled.reshape(field.dtype.itemsize, field.size)
+            .T.copy()
+            .view(field.dtype)
+            .reshape(field.size)
+        )
+        values.flags.writeable = False
+        return values
+
+    def _drop(self, frame: _PackedFrame, neighbor: Optional[_PackedFrame]) -> None:
+        """Account for a removed frame's data not shared with its neighbor."""
+        for name, field in frame.fields.items():
+            if neighbor is None or neighbor.fields.get(name) is not field:
+                self._bytes -= len(field.data)
+
+
+class RewindRecorder:
+    """Compresses states into a rewind buffer on a background thread.
+
+    ``record`` only queues the immutable snapshot, so the thread displaying
+    the simulation never waits on compression. When the recorder falls
+    behind, snapshots that do not fit in the queue are skipped rather than
+    stalling the caller; the history then has a gap instead of a lag.
+
+    Attributes:
+        buffer (RewindBuffer): Where the states are stored
+        skipped (int): Snapshots dropped because the queue was full
+        error (Optional[BaseException]): The exception that stopped the
+            recorder thread, if any
+    """
+
+    def __init__(self, buffer: RewindBuffer, max_pending: int = 8) -> None:
+        """Initialize the recorder; its thread starts with the first state.
+
+        Args:
+            buffer (RewindBuffer): Where the states are stored
+            max_pending (int, optional): Snapshots that may wait to be
+                compressed before further ones are skipped. Defaults to 8.
+        """
+        self.buffer = buffer
+        self.skipped = 0
+        self.error: Optional[BaseException] = None
+        self._pending: "queue.Queue[Optional[FrameSnapshot]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, snapshot: FrameSnapshot) -> None:
+        """Queue a snapshot to be stored as the newest frame.
+
+        Args:
+            snapshot (FrameSnapshot): The state to store
+
+        Raises:
+            RuntimeError: If storing an earlier state failed
+        """
+        self.check()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="rewind-recorder", daemon=True
+            )
+            self._thread.start()
+        try:
+            self._pending.put_nowait(snapshot)
+        except queue.Full:
+            self.skipped += 1
+
+    def drain(self) -> None:
+        """Wait until every queued snapshot has been stored.
+
+        Raises:
+            RuntimeError: If storing a state failed
+        """
+        self._pending.join()
+        self.check()
+
+    def check(self) -> None:
+        """Re-raise the exception that stopped the recorder thread, if any.
+
+        Raises:
+            RuntimeError: If storing a state failed
+        """
+        if self.error is not None:
+            raise RuntimeError("Rewind recording failed") from self.error
+
+    def close(self) -> None:
+        """Store every queued snapshot and stop the thread.
+
+        Raises:
+            RuntimeError: If storing a state failed
+        """
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+        self.check()
+
+    def _run(self) -> None:
+        while True:
+            snapshot = self._pending.get()
+            try:
+                if snapshot is None:
+                    break
+                if self.error is None:
+                    self.buffer.push(snapshot)
+            except Exception as error:  # Surfaced on the next record
+                self.error = error
+            finally:
+                self._pending.task_done()
@@ -0,0 +1,584 @@
+"""Compilation of declarative rule sets into vectorized NumPy kernels."""
+import ast
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+from src.domain.value_objects.rule_set import RuleDefinitionError, RuleSet
+
+from .random_streams import CounterRNG
+
+Kernel = Callable[[Dict[str, np.ndarray], Dict[str, np.ndarray], "KernelContext"], None]
+
+# Element-wise functions available in expressions: name -> (NumPy call, arity)
+_ELEMENTWISE_FUNCTIONS: Dict[str, Tuple[str, int]] = {
+    "abs": ("np.abs", 1),
+    "sqrt": ("np.sqrt", 1),
+    "exp": ("np.exp", 1),
+    "log": ("np.log", 1),
+    "floor": ("np.floor", 1),
+    "ceil": ("np.ceil", 1),
+    "min": ("np.minimum", 2),
+    "max": ("np.maximum", 2),
+    "clip": ("np.clip", 3),
+    "where": ("np.where", 3),
+}
+NEIGHBOR_AGGREGATES = ("neighbor_sum", "neighbor_mean", "neighbor_max", "neighbor_min")
+_CELL_ATTRIBUTES = {"q": "ctx.q", "r": "ctx.r", "tick": "ctx.tick"}
+_BINARY_OPERATORS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "**",
+}
+_COMPARISONS = {
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+}
+# Random streams of world initialization never collide with rule streams
+INITIAL_STREAM_BASE = 1 << 32
+
+
+class KernelContext:
+    """Per-grid lookup tables and helpers used by compiled kernels.
+
+    Neighbor aggregates gather through the grid's neighbor table, one
+    direction at a time, with missing neighbors redirected to a padding slot.
+    Directions are always combined in the same order, so results are
+    reproducible bit for bit.
+
+    A context can be placed on a window of a larger grid, in which case cell
+    coordinates and random draws use the cells' ids in the full grid.
+
+    Attributes:
+        cell_count (int): The number of cells in the grid
+        q (np.ndarray): The q coordinate of every cell
+        r (np.ndarray): The r coordinate of every cell
+        tick (int): The tick currently being computed
+        rng (Optional[CounterRNG]): Random streams for ``random()`` calls
+    """
+
+    def __init__(self, grid: HexGrid) -> None:
+        """Precompute the lookup tables for a grid.
+
+        Args:
+            grid (HexGrid): The grid kernels will run on
+        """
+        self.cell_count = grid.cell_count
+        table = grid.neighbor_table
+        self._neighbors = np.where(table < 0, self.cell_count, table)
+        counts = np.count_nonzero(table >= 0, axis=0)
+        self._neighbor_counts = np.maximum(counts, 1).astype(np.float64)
+        self._isolated = np.flatnonzero(counts == 0)
+
+        cell_ids = np.arange(self.cell_count)
+        self.q = (cell_ids % grid.dimensions.width).astype(np.float64)
+        self.r = (cell_ids // grid.dimensions.width).astype(np.float64)
+        self.tick = 0
+        self.rng: Optional[CounterRNG] = None
+        self._cell_ids: Optional[np.ndarray] = None
+
+    def place(self, region: GridRegion, grid_width: int) -> None:
+        """Position the context on a window of a larger grid.
+
+        Args:
+            region (GridRegion): The window, sized like the context's grid
+            grid_width (int): The width of the full grid
+        """
+        self._cell_ids = region.cell_ids(grid_width)
+        self.q = (self._cell_ids % grid_width).astype(np.float64)
+        self.r = (self._cell_ids // grid_width).astype(np.float64)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the context's lookup tables.
+
+        Returns:
+            Dict[str, int]: Bytes by table name
+        """
+        tables = {
+            "neighbors": self._neighbors,
+            "neighbor_counts": self._neighbor_counts,
+            "isolated": self._isolated,
+            "q": self.q,
+            "r": self.r,
+        }
+        if self._cell_ids is not None:
+            tables["cell_ids"] = self._cell_ids
+        return {name: table.nbytes for name, table in tables.items()}
+
+    def neighbor_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum values over the six-cell ring of every cell.
+
+        Args:
+            values (np.ndarray): One value per cell
+
+        Returns:
+            np.ndarray: The float64 ring sums
+        """
+        padded = self._padded(values, 0.0)
+        total: np.ndarray = padded[self._neighbors[0]]
+        for direction in range(1, 6):
+            total += padded[self._neighbors[direction]]
+        return total
+
+    def neighbor_mean(self, values: np.ndarray) -> np.ndarray:
+        """Average values over the existing neighbors of every cell.
+
+        Args:
+            values (np.ndarray): One value per cell
+
+        Returns:
+            np.ndarray: The float64 ring means
+        """
+        total = self.neighbor_sum(values)
+        total /= self._neighbor_counts
+        return total
+
+    def neighbor_max(self, values: np.ndarray) -> np.ndarray:
+        """Take the maximum value over the ring of every cell.
+
+        Args:
+            values (np.ndarray): One value per cell
+
+        Returns:
+            np.ndarray: The float64 ring maxima
+        """
+        return self._extreme(values, -np.inf, np.maximum)
+
+    def neighbor_min(self, values: np.ndarray) -> np.ndarray:
+        """Take the minimum value over the ring of every cell.
+
+        Args:
+            values (np.ndarray): One value per cell
+
+        Returns:
+            np.ndarray: The float64 ring minima
+        """
+        return self._extreme(values, np.inf, np.minimum)
+
+    def random(self, stream: int) -> np.ndarray:
+        """Draw one uniform float per cell for the current tick.
+
+        Args:
+            stream (int): The stream reserved for the calling expression
+
+        Returns:
+            np.ndarray: float64 values in [0, 1)
+
+        Raises:
+            RuleDefinitionError: If no random service has been attached
+        """
+        if self.rng is None:
+            raise RuleDefinitionError("random() requires a random stream service")
+        if self._cell_ids is None:
+            return self.rng.field_uniform(self.tick, self.cell_count, stream)
+        return self.rng.uniform(self.tick, self._cell_ids, stream)
+
+    def _padded(self, values: np.ndarray, pad: float) -> np.ndarray:
+        padded: np.ndarray = np.empty(self.cell_count + 1, dtype=np.float64)
+        padded[: self.cell_count] = values
+        padded[self.cell_count] = pad
+        return padded
+
+    def _extreme(self, values: np.ndarray, pad: float, combine: np.ufunc) -> np.ndarray:
+        padded = self._padded(values, pad)
+        result: np.ndarray = padded[self._neighbors[0]]
+        for direction in range(1, 6):
+            combine(result, padded[self._neighbors[direction]], out=result)
+        # Cells without any neighbor fall back to their own value
+        result[self._isolated] = padded[self._isolated]
+        return result
+
+
+class _ExpressionTranslator(ast.NodeVisitor):
+    """Translates a validated rule expression into NumPy source code.
+
+    Neighbor aggregates and ``random()`` calls are hoisted into the kernel
+    prologue, so each distinct aggregate is computed once per tick no matter
+    how many rules use it. ``reach`` records how deeply aggregates are nested,
+    i.e. how many rings away from a cell the translated expressions read.
+    """
+
+    def __init__(
+        self,
+        field_names: Sequence[str],
+        parameters: Dict[str, float],
+        stream_base: int,
+    ) -> None:
+        self.field_names = set(field_names)
+        self.parameters = parameters
+        self.prologue: List[str] = []
+        self._hoisted: Dict[str, str] = {}
+        self._next_stream = stream_base
+        self._depth = 0
+        self.reach = 0
+
+    def translate(self, expression: str, context: str) -> str:
+        """Translate an expression, reporting errors against ``context``."""
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+            return str(self.visit(tree.body))
+        except SyntaxError as error:
+            raise RuleDefinitionError(
+                f"{context}: invalid expression '{expression}': {error.msg}"
+            ) from error
+        except RuleDefinitionError as error:
+            raise RuleDefinitionError(f"{context}: {error}") from error
+
+    def generic_visit(self, node: ast.AST) -> str:
+        raise RuleDefinitionError(f"unsupported syntax '{type(node).__name__}'")
+
+    def visit_Constant(self, node: ast.Constant) -> str:
+        if isinstance(node.value, (bool, int, float)):
+            return _literal(node.value)
+        raise RuleDefinitionError(f"unsupported constant {node.value!r}")
+
+    def visit_Name(self, node: ast.Name) -> str:
+        if node.id in self.field_names:
+            return f"f_{node.id}"
+        if node.id in self.parameters:
+            return _literal(self.parameters[node.id])
+        if node.id in _CELL_ATTRIBUTES:
+            return _CELL_ATTRIBUTES[node.id]
+        raise RuleDefinitionError(f"unknown name '{node.id}'")
+
+    def visit_BinOp(self, node: ast.BinOp) -> str:
+        operator = _BINARY_OPERATORS.get(type(node.op))
+        if operator is None:
+            return self.generic_visit(node.op)
+        return f"({self.visit(node.left)} {operator} {self.visit(node.right)})"
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> str:
+        operand = str(self.visit(node.operand))
+        if isinstance(node.op, ast.USub):
+            return f"(-{operand})"
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if isinstance(node.op, ast.Not):
+            return f"np.logical_not({operand})"
+        return self.generic_visit(node.op)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> str:
+        function = "np.logical_and" if isinstance(node.op, ast.And) else "np.logical_or"
+        result = str(self.visit(node.values[0]))
+        for value in node.values[1:]:
+            result = f"{function}({result}, {self.visit(value)})"
+        return result
+
+    def visit_Compare(self, node: ast.Compare) -> str:
+        terms = [self.visit(node.left)] + [self.visit(c) for c in node.comparators]
+        parts = []
+        for index, operator_node in enumerate(node.ops):
+            operator = _COMPARISONS.get(type(operator_node))
+            if operator is None:
+                return self.generic_visit(operator_node)
+            parts.append(f"({terms[index]} {operator} {terms[index + 1]})")
+        result = parts[0]
+        for part in parts[1:]:
+            result = f"np.logical_and({result}, {part})"
+        return result
+
+    def visit_IfExp(self, node: ast.IfExp) -> str:
+        return (
+            f"np.where({self.visit(node.test)}, {self.visit(node.body)}, "
+            f"{self.visit(node.orelse)})"
+        )
+
+    def visit_Call(self, node: ast.Call) -> str:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise RuleDefinitionError("only plain function calls are supported")
+        name = node.func.id
+        aggregate = name in NEIGHBOR_AGGREGATES
+        self._depth += aggregate
+        self.reach = max(self.reach, self._depth)
+        arguments = [self.visit(argument) for argument in node.args]
+        self._depth -= aggregate
+        if name == "random":
+            self._check_arity(name, arguments, 0)
+            temporary = self._temporary()
+            self.prologue.append(f"{temporary} = ctx.random({self._next_stream})")
+            self._next_stream += 1
+            return temporary
+        if name in NEIGHBOR_AGGREGATES:
+            self._check_arity(name, arguments, 1)
+            key = f"ctx.{name}({arguments[0]})"
+            if key not in self._hoisted:
+                self._hoisted[key] = self._temporary()
+                self.prologue.append(f"{self._hoisted[key]} = {key}")
+            return self._hoisted[key]
+        if name in _ELEMENTWISE_FUNCTIONS:
+            function, arity = _ELEMENTWISE_FUNCTIONS[name]
+            self._check_arity(name, arguments, arity)
+            return f"{function}({', '.join(arguments)})"
+        raise RuleDefinitionError(f"unknown function '{name}'")
+
+    def _temporary(self) -> str:
+        return f"t{len(self.prologue)}"
+
+    @staticmethod
+    def _check_arity(name: str, arguments: List[str], arity: int) -> None:
+        if len(arguments) != arity:
+            raise RuleDefinitionError(
+                f"{name}() takes {arity} argument(s), got {len(arguments)}"
+            )
+
+
+def _literal(value: float) -> str:
+    """Write a number as kernel source; infinities and NaN have no literal."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"float({repr(value)!r})"
+    return repr(value)
+
+
+def _build_kernel(
+    field_names: Sequence[str],
+    prologue: List[str],
+    assignments: List[Tuple[str, str]],
+) -> Tuple[Kernel, str]:
+    """Assemble and compile the source of one kernel function.
+
+    Returns:
+        Tuple[Kernel, str]: The compiled kernel and its source code
+    """
+    lines = ["def kernel(fields, out, ctx):"]
+    lines += [f"    f_{name} = fields[{name!r}]" for name in field_names]
+    lines += [f"    {statement}" for statement in prologue]
+    lines += [f"    out[{target!r}][...] = {value}" for target, value in assignments]
+    if len(lines) == 1:
+        lines.append("    pass")
+    source = "\n".join(lines) + "\n"
+    namespace: Dict[str, object] = {"np": np}
+    exec(compile(source, "<rule kernel>", "exec"), namespace)  # noqa: S102
+    kernel: Kernel = namespace["kernel"]  # type: ignore[assignment]
+    return kernel, source
+
+
+class CompiledRuleSet:
+    """A rule set compiled into whole-grid NumPy kernels for one grid.
+
+    Compilation happens once: every rule expression is validated against a
+    small whitelisted grammar and translated into NumPy source, and all
+    rules are fused into a single kernel function. Applying the rules never
+    interprets anything per cell.
+
+    Rules are applied synchronously: every rule reads the previous tick's
+    state and writes into a spare buffer that is swapped in afterwards.
+    Callers that keep field arrays across ticks must copy them.
+
+    Worlds too large to update at once can be updated window by window: a
+    window grown by ``reach`` columns and ``2 * reach`` rows on every side,
+    since neighbors lie up to two rows apart, computes the same values for
+    its inner cells as a whole-grid update. Windows must start on an even
+    row so their rows keep the parity, and so the neighbors, of the grid's.
+
+    Attributes:
+        rule_set (RuleSet): The source rule definitions
+        grid (HexGrid): The grid the kernels were compiled for
+        source (str): The generated source of the step kernel
+        reach (int): How many rings of neighbors one update reads
+    """
+
+    # The lookup tables and helpers kernels run with
+    context_type = KernelContext
+
+    def __init__(self, rule_set: RuleSet, grid: HexGrid) -> None:
+        """Compile a rule set for a grid.
+
+        Args:
+            rule_set (RuleSet): The rule definitions to compile
+            grid (HexGrid): The grid the rules will run on
+
+        Raises:
+            RuleDefinitionError: If an expression is invalid
+        """
+        self.rule_set = rule_set
+        self.grid = grid
+        self._grid_context: Optional[KernelContext] = None
+        self._window_contexts: Dict[GridDimensions, KernelContext] = {}
+        self._field_names = [spec.name for spec in rule_set.fields]
+        self._dtypes: Dict[str, np.dtype] = {
+            spec.name: np.dtype(spec.dtype) for spec in rule_set.fields
+        }
+        reserved = set(self._field_names) & set(_CELL_ATTRIBUTES)
+        if reserved:
+            raise RuleDefinitionError(
+                f"Field names are reserved: {', '.join(sorted(reserved))}"
+            )
+
+        self._step_kernel, self.source = self._compile_step()
+        self._initializers = self._compile_initializers()
+        self._spare: Dict[str, np.ndarray] = {}
+
+    @property
+    def targets(self) -> List[str]:
+        """List[str]: The fields written by the step kernel."""
+        return [rule.target for rule in self.rule_set.rules]
+
+    def _compile_step(self) -> Tuple[Kernel, str]:
+        translator = _ExpressionTranslator(
+            self._field_names, self.rule_set.parameters, stream_base=0
+        )
+        assignments = []
+        for rule in self.rule_set.rules:
+            context = f"Rule for '{rule.target}'"
+            value = translator.translate(str(rule.expression), context)
+            if rule.where is not None:
+                condition = translator.translate(str(rule.where), context)
+                value = f"np.where({condition}, {value}, f_{rule.target})"
+            assignments.append((rule.target, value))
+        self.reach = translator.reach
+        return _build_kernel(self._field_names, translator.prologue, assignments)
+
+    def _compile_initializers(self) -> Dict[str, Kernel]:
+        initializers = {}
+        for index, spec in enumerate(self.rule_set.fields):
+            if not isinstance(spec.initial, str):
+                continue
+            # Initial expressions may only read fields declared before them
+            visible = self._field_names[:index]
+            translator = _ExpressionTranslator(
+                visible,
+                self.rule_set.parameters,
+                stream_base=INITIAL_STREAM_BASE + index * 1024,
+            )
+            value = translator.translate(
+                spec.initial, f"Initial value of '{spec.name}'"
+            )
+            initializers[spec.name], _ = _build_kernel(
+                visible, translator.prologue, [(spec.name, value)]
+            )
+        return initializers
+
+    def _context_for(self, region: Optional[GridRegion]) -> KernelContext:
+        if region is None:
+            if self._grid_context is None:
+                self._grid_context = self.context_type(self.grid)
+            return self._grid_context
+        if region.r % 2:
+            raise ValueError(f"{region} does not start on an even row")
+        # Windows of the same size share their neighbor tables
+        context = self._window_contexts.get(region.dimensions)
+        if context is None:
+            context = self.context_type(HexGrid(region.dimensions))
+            self._window_contexts[region.dimensions] = context
+        context.place(region, self.grid.dimensions.width)
+        return context
+
+    def create_world(
+        self, rng: Optional[CounterRNG] = None, region: Optional[GridRegion] = None
+    ) -> World:
+        """Create a world with every declared field initialized.
+
+        Args:
+            rng (Optional[CounterRNG], optional): Random streams for initial
+                expressions that call ``random()``. Defaults to None.
+            region (Optional[GridRegion], optional): Only create this window
+                of the grid. Defaults to None.
+
+        Returns:
+            World: A new world at tick 0, on a grid of the window's size if
+            a region was given
+
+        Raises:
+            ValueError: If the window starts on an odd row
+        """
+        grid = self.grid if region is None else HexGrid(region.dimensions)
+        world = World(grid=grid)
+        context = self._context_for(region)
+        context.tick = 0
+        context.rng = rng
+        for spec in self.rule_set.fields:
+            if spec.name in self._initializers:
+                values = np.empty(grid.cell_count, dtype=self._dtypes[spec.name])
+                self._initializers[spec.name](
+                    world.fields, {spec.name: values}, context
+                )
+                world.set_field(spec.name, values)
+            else:
+                world.add_field(spec.name, self._dtypes[spec.name], float(spec.initial))
+        return world
+
+    def apply(
+        self,
+        world: World,
+        rng: Optional[CounterRNG] = None,
+        region: Optional[GridRegion] = None,
+    ) -> None:
+        """Apply one synchronous update of every rule to a world.
+
+        The world's tick is used as the random stream counter but is not
+        advanced; that is the caller's responsibility.
+
+        Args:
+            world (World): The world to update in place
+            rng (Optional[CounterRNG], optional): Random streams for rules
+                that call ``random()``. Defaults to None.
+            region (Optional[GridRegion], optional): The window of the grid
+                the world holds. Defaults to None, the whole grid.
+
+        Raises:
+            ValueError: If the world is not sized like the grid or window,
+                does not share the grid's topology, or the window starts on
+                an odd row
+        """
+        expected = self.grid if region is None else HexGrid(region.dimensions)
+        if world.grid != expected:
+            raise ValueError(f"World of {world.grid} does not match {expected}")
+        context = self._context_for(region)
+        context.tick = world.tick
+        context.rng = rng
+        cell_count = world.grid.cell_count
+        out = {
+            target: self._spare_buffer(target, cell_count) for target in self.targets
+        }
+        self._step_kernel(world.fields, out, context)
+        for target, values in out.items():
+            self._spare[target] = world.fields[target]
+            world.fields[target] = values
+            world.touch(target)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by kernel contexts and spare output buffers.
+
+        Returns:
+            Dict[str, int]: Bytes by table or buffer name
+        """
+        contexts = {
+            f"window {dims.width}x{dims.height}": context
+            for dims, context in self._window_contexts.items()
+        }
+        if self._grid_context is not None:
+            contexts = {"grid": self._grid_context, **contexts}
+        usage = {
+            f"{label} {name}": nbytes
+            for label, context in contexts.items()
+            for name, nbytes in context.memory_usage().items()
+        }
+        for target, buffer in self._spare.items():
+            usage[f"spare {target}"] = buffer.nbytes
+        return usage
+
+    def _spare_buffer(self, target: str, cell_count: int) -> np.ndarray:
+        dtype = self._dtypes[target]
+        buffer = self._spare.pop(target, None)
+        if buffer is not None and buffer.shape == (cell_count,):
+            # Read-only arrays (e.g. memory-mapped initial state) are dropped
+            if buffer.dtype == dtype and buffer.flags.writeable:
+                return buffer
+        fresh: np.ndarray = np.empty(cell_count, dtype=dtype)
+        return fresh
+
+    def __str__(self) -> str:
+        return f"CompiledRuleSet({self.rule_set}, {self.grid.dimensions})"
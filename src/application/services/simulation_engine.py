@@ -0,0 +1,123 @@
+"""Simulation engine advancing the world state tick by tick."""
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.interfaces.cell_state import CellState
+from src.domain.value_objects.rule_set import RuleSet
+
+from .backends import StepBackend, create_backend
+from .commands import CommandQueue, EditBatch
+from .random_streams import CounterRNG
+
+
+class SimulationEngine:
+    """Advances a world by applying compiled rules one tick at a time.
+
+    Attributes:
+        world (World): The world being simulated
+        rules (StepBackend): The backend applying the update rules
+        rng (CounterRNG): Random streams shared by all stochastic rules
+        commands (CommandQueue): Edits applied at the next tick boundary
+    """
+
+    def __init__(self, world: World, rules: StepBackend, rng: CounterRNG) -> None:
+        """Initialize the engine with an existing world.
+
+        Args:
+            world (World): The world to simulate
+            rules (StepBackend): Rules prepared for the world's grid
+            rng (CounterRNG): Random streams for stochastic rules
+        """
+        self.world = world
+        self.rules = rules
+        self.rng = rng
+        self.commands = CommandQueue()
+        self._stages: List[Callable[[World], None]] = []
+
+    @classmethod
+    def from_rule_set(
+        cls, rule_set: RuleSet, grid: HexGrid, seed: int, backend: str = "numpy"
+    ) -> "SimulationEngine":
+        """Compile a rule set and create a freshly initialized world.
+
+        Args:
+            rule_set (RuleSet): The declarative rules to compile
+            grid (HexGrid): The grid to simulate
+            seed (int): The root seed of all random streams
+            backend (str, optional): The step backend, one of ``BACKENDS``.
+                Defaults to "numpy".
+
+        Returns:
+            SimulationEngine: An engine positioned at tick 0
+
+        Raises:
+            ValueError: If the backend is unknown or unavailable
+        """
+        rules = create_backend(backend, rule_set, grid)
+        rng = CounterRNG(seed)
+        return cls(world=rules.create_world(rng), rules=rules, rng=rng)
+
+    @property
+    def tick(self) -> int:
+        """int: The number of ticks simulated so far."""
+        return self.world.tick
+
+    def add_stage(self, stage: Callable[[World], None]) -> None:
+        """Register a stage that runs after every tick.
+
+        Stages run on the thread that steps the engine, in registration
+        order, and receive the updated world. They must not modify it.
+
+        Args:
+            stage (Callable[[World], None]): The stage to run
+        """
+        self._stages.append(stage)
+
+    def apply_commands(self) -> Optional[EditBatch]:
+        """Apply the queued edit commands as one batch, without ticking.
+
+        Returns:
+            Optional[EditBatch]: The applied batch, or None if no command
+            was queued
+        """
+        return self.commands.apply(self.world)
+
+    def step(self) -> None:
+        """Apply queued edits, advance by one tick and run every stage."""
+        self.apply_commands()
+        self.rules.apply(self.world, self.rng)
+        self.world.tick += 1
+        for stage in self._stages:
+            stage(self.world)
+
+    def restore(self, state: CellState) -> None:
+        """Continue the simulation from an earlier state.
+
+        The state's fields are copied into the world, so ticking does not
+        modify the state. Random streams are keyed by tick, so the ticks
+        that follow a restored state repeat the ones that followed it the
+        first time, unless edits are applied in between.
+
+        Args:
+            state (CellState): The world or snapshot to continue from
+
+        Raises:
+            ValueError: If the state belongs to another grid
+        """
+        if state.grid != self.world.grid:
+            raise ValueError(f"State of {state.grid} does not match {self.world.grid}")
+        for name, values in state.fields.items():
+            self.world.set_field(name, np.array(values))
+        self.world.tick = state.tick
+
+    def run(self, ticks: int) -> None:
+        """Advance the simulation by several ticks.
+
+        Args:
+            ticks (int): The number of ticks to simulate
+        """
+        for _ in range(ticks):
+            self.step()
@@ -0,0 +1,213 @@
+"""Background thread running the simulation engine."""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from src.domain.interfaces.cell_state import CellState
+
+from .simulation_engine import SimulationEngine
+from .snapshots import FrameSnapshot, SnapshotBuffer
+
+T = TypeVar("T")
+
+
+class SimulationWorker:
+    """Runs a simulation engine on its own thread at a target tick rate.
+
+    After every tick the worker captures an immutable snapshot and
+    publishes it to a ``SnapshotBuffer``. The engine is only ever touched
+    from the worker thread, so the render loop never waits on a tick and
+    keeps its own frame rate however slow the simulation is.
+
+    Edits submitted to the engine's command queue are applied at the next
+    tick boundary. While paused, the worker wakes up on every submission,
+    applies the pending batch and publishes one snapshot for it. States to
+    continue from are handed over the same way, through ``restore``, and
+    anything else that needs the engine runs between ticks through
+    ``call``.
+
+    Attributes:
+        engine (SimulationEngine): The engine being run
+        buffer (SnapshotBuffer): Where completed snapshots are published
+        ticks_per_second (float): The target simulation rate
+        error (Optional[BaseException]): The exception that stopped the
+            worker, if any
+    """
+
+    def __init__(
+        self,
+        engine: SimulationEngine,
+        buffer: SnapshotBuffer,
+        ticks_per_second: float,
+    ) -> None:
+        """Initialize the worker without starting it.
+
+        Args:
+            engine (SimulationEngine): The engine to run
+            buffer (SnapshotBuffer): Where completed snapshots are published
+            ticks_per_second (float): The target simulation rate
+
+        Raises:
+            ValueError: If the tick rate is not positive
+        """
+        if ticks_per_second <= 0:
+            raise ValueError("Tick rate must be positive")
+        self.engine = engine
+        self.buffer = buffer
+        self.ticks_per_second = ticks_per_second
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._unpaused = threading.Event()
+        self._unpaused.set()
+        self._wake = threading.Event()
+        self.engine.commands.on_submit = self._wake.set
+        self._lock = threading.Lock()
+        self._restore: Optional[CellState] = None
+        self._calls: List[Tuple[Callable[[], Any], Future]] = []
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """bool: True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def paused(self) -> bool:
+        """bool: True while ticking is suspended."""
+        return not self._unpaused.is_set()
+
+    def start(self) -> None:
+        """Publish the initial state and start ticking in the background.
+
+        Raises:
+            RuntimeError: If the worker is already running
+        """
+        if self.running:
+            raise RuntimeError("Simulation worker is already running")
+        self.buffer.publish(FrameSnapshot.capture(self.engine.world))
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="simulation-worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker after the tick in progress and wait for it.
+
+        Args:
+            timeout (Optional[float], optional): Maximum seconds to wait.
+                Defaults to None (wait until the thread exits).
+        """
+        self._stop.set()
+        self._unpaused.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return
+            self._thread = None
+        # Calls submitted while the thread was exiting run here instead
+        self._run_calls()
+
+    def pause(self) -> None:
+        """Suspend ticking after the tick in progress."""
+        self._unpaused.clear()
+
+    def resume(self) -> None:
+        """Resume ticking."""
+        self._unpaused.set()
+        self._wake.set()
+
+    def restore(self, state: CellState) -> None:
+        """Continue the simulation from an earlier state.
+
+        The engine is restored on the worker thread before its next tick,
+        or straight away while paused, and the restored state is published.
+
+        Args:
+            state (CellState): The world or snapshot to continue from
+        """
+        with self._lock:
+            self._restore = state
+        if not self.running:
+            self._apply_restore()
+        self._wake.set()
+
+    def call(self, function: Callable[[], T]) -> "Future[T]":
+        """Run a function that reads or changes the engine between ticks.
+
+        The function runs on the worker thread before its next tick, or
+        straight away while paused, so it never sees a tick half done.
+        While the worker is not running it runs on the calling thread.
+
+        Args:
+            function (Callable[[], T]): The function to run
+
+        Returns:
+            Future[T]: Completed with the function's result or exception
+        """
+        future: "Future[T]" = Future()
+        with self._lock:
+            self._calls.append((function, future))
+        if not self.running:
+            self._run_calls()
+        self._wake.set()
+        return future
+
+    def check(self) -> None:
+        """Re-raise the exception that stopped the worker, if any.
+
+        Raises:
+            RuntimeError: If the worker thread failed
+        """
+        if self.error is not None:
+            raise RuntimeError("Simulation worker failed") from self.error
+
+    def _run(self) -> None:
+        interval = 1.0 / self.ticks_per_second
+        deadline = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                self._apply_restore()
+                self._run_calls()
+                if not self._unpaused.is_set():
+                    self._wake.wait()
+                    self._wake.clear()
+                    self._apply_restore()
+                    self._run_calls()
+                    if self.engine.apply_commands() is not None:
+                        self._publish()
+                    deadline = time.monotonic()
+                    continue
+                self.engine.step()
+                self._publish()
+                # Keep the target rate, but never try to catch up after a
+                # slow tick
+                deadline = max(deadline + interval, time.monotonic())
+                self._stop.wait(deadline - time.monotonic())
+        except Exception as error:  # Surfaced to the caller through check()
+            self.error = error
+
+    def _apply_restore(self) -> None:
+        with self._lock:
+            state, self._restore = self._restore, None
+        if state is not None:
+            self.engine.restore(state)
+            self._publish()
+
+    def _run_calls(self) -> None:
+        with self._lock:
+            calls, self._calls = self._calls, []
+        for function, future in calls:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function())
+            except Exception as error:  # Surfaced to the caller by the future
+                future.set_exception(error)
+
+    def _publish(self) -> None:
+        self.buffer.publish(
+            FrameSnapshot.capture(self.engine.world, self.buffer.latest())
+        )
@@ -0,0 +1,114 @@
+"""Immutable frame snapshots and their handoff between threads."""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """An immutable copy of the world state at the end of a tick.
+
+    Snapshots own read-only copies of every cell field, so they can be
+    handed to another thread and read while the engine keeps mutating the
+    live world. Fields whose version did not change since the previous
+    snapshot share that snapshot's array instead of being copied again.
+
+    Attributes:
+        grid (HexGrid): The grid the state belongs to
+        tick (int): The tick the snapshot was taken at
+        fields (Mapping[str, np.ndarray]): Read-only cell field arrays
+        versions (Mapping[str, int]): The version of every field
+    """
+
+    grid: HexGrid
+    tick: int
+    fields: Mapping[str, np.ndarray]
+    versions: Mapping[str, int]
+
+    @classmethod
+    def capture(
+        cls, world: World, previous: Optional["FrameSnapshot"] = None
+    ) -> "FrameSnapshot":
+        """Copy the current state of a world into a new snapshot.
+
+        Args:
+            world (World): The world to capture
+            previous (Optional[FrameSnapshot], optional): An earlier snapshot
+                whose unchanged fields can be shared. Defaults to None.
+
+        Returns:
+            FrameSnapshot: The immutable snapshot
+        """
+        fields = {}
+        for name, values in world.fields.items():
+            version = world.versions[name]
+            if previous is not None and previous.versions.get(name) == version:
+                fields[name] = previous.fields[name]
+                continue
+            frozen = values.copy()
+            frozen.flags.writeable = False
+            fields[name] = frozen
+        return cls(
+            grid=world.grid,
+            tick=world.tick,
+            fields=MappingProxyType(fields),
+            versions=MappingProxyType(dict(world.versions)),
+        )
+
+    def get_field(self, name: str) -> np.ndarray:
+        """Get a read-only cell field array by name.
+
+        Args:
+            name (str): The field name
+
+        Returns:
+            np.ndarray: The read-only field array
+
+        Raises:
+            UnknownCellField: If the field does not exist
+        """
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise UnknownCellField(f"Unknown cell field '{name}'") from None
+
+    def __str__(self) -> str:
+        return f"FrameSnapshot(tick={self.tick}, fields={sorted(self.fields)})"
+
+
+class SnapshotBuffer:
+    """Lock-free handoff of the latest completed snapshot to a reader.
+
+    The producer publishes finished snapshots with a single reference store,
+    which is atomic in CPython, and the reader always picks up the most
+    recent one without waiting. Because snapshots are immutable, this
+    behaves like a triple buffer: the producer builds the next frame while
+    the reader draws the one it picked up, and any frame the reader never
+    saw is simply dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._latest: Optional[FrameSnapshot] = None
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """Make a snapshot the latest completed frame.
+
+        Args:
+            snapshot (FrameSnapshot): The finished snapshot
+        """
+        self._latest = snapshot
+
+    def latest(self) -> Optional[FrameSnapshot]:
+        """Get the latest completed frame without blocking.
+
+        Returns:
+            Optional[FrameSnapshot]: The latest snapshot, or None if nothing
+            has been published yet
+        """
+        return self._latest
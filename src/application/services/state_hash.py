@@ -0,0 +1,162 @@
+"""Hashes of the cell state, updated field by field, for determinism checks."""
+import zlib
+from functools import reduce
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+from src.domain.interfaces.cell_state import CellState
+
+# The metrics column holding the state hash of every tick
+HASH_COLUMN = "state_hash"
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+# Cells hashed at once, which keeps the 64-bit temporaries in cache
+_BLOCK_CELLS = 1 << 16
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Scramble 64-bit integers with the splitmix64 finalizer."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * _MIX_1
+    values = values ^ (values >> np.uint64(27))
+    values = values * _MIX_2
+    mixed: np.ndarray = values ^ (values >> np.uint64(31))
+    return mixed
+
+
+def _bits(values: np.ndarray) -> np.ndarray:
+    """View field values as unsigned integers of the same width."""
+    bits: np.ndarray = np.ascontiguousarray(values).view(f"u{values.dtype.itemsize}")
+    return bits
+
+
+def _combine(cells: np.ndarray, bits: np.ndarray, salt: np.uint64) -> int:
+    """XOR together the keys of some cells holding some values."""
+    if not cells.size:
+        return 0
+    keys = _mix(
+        _mix(cells.astype(np.uint64, copy=False) ^ salt) ^ bits.astype(np.uint64)
+    )
+    combined: int = int(np.bitwise_xor.reduce(keys))
+    return combined
+
+
+class StateHasher:
+    """Zobrist-style 64-bit hash of every cell field, kept up to date cheaply.
+
+    Every (field, cell, value) triple gets a pseudo-random 64-bit key,
+    derived by mixing the field name, the cell id and the bits of the value
+    instead of being looked up in a table, and the hash of a state is the
+    XOR of the keys of all its cells. Each field's share of the hash is
+    kept, so fields whose version did not change since the previous update,
+    such as terrain, are not hashed again.
+
+    A field whose version changed is hashed again in full, in blocks, rather
+    than compared with a kept copy to find the cells that differ; this holds
+    for a field changed by a few edited cells as well. The rules
+    rewrite every cell of the fields they update on every tick, and with the
+    built-in rules half to three quarters of those cells change, so a diff
+    saves little and needs a copy of every hashed field. On a 512x512 grid
+    rehashing takes about 5 ms per tick, against 13 ms for a diff with a
+    kept copy and 20 ms for the tick itself.
+
+    The hash covers the values of every field bit for bit, so NaN equals
+    NaN but -0.0 differs from 0.0, and does not depend on the tick. Equal
+    hashes mean identical states with overwhelming probability; different
+    hashes always mean different states.
+
+    Attributes:
+        value (int): The hash of the latest state
+        cells_hashed (int): Cell values hashed by the latest update
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hasher before any state was seen."""
+        self.value = 0
+        self.cells_hashed = 0
+        self._hashes: Dict[str, int] = {}
+        self._versions: Dict[str, int] = {}
+        self._salts: Dict[str, np.uint64] = {}
+
+    def update(self, state: CellState) -> int:
+        """Bring the hash up to date with a state.
+
+        Args:
+            state (CellState): The world or snapshot to hash, usually the
+                next tick of the state seen by the previous update
+
+        Returns:
+            int: The hash of the state
+        """
+        self.cells_hashed = 0
+        for name in [name for name in self._hashes if name not in state.fields]:
+            del self._hashes[name], self._versions[name]
+        for name, values in state.fields.items():
+            version = state.versions[name]
+            if self._versions.get(name) == version:
+                continue
+            self._hashes[name] = self._field_hash(name, values)
+            self._versions[name] = version
+        self.value = reduce(lambda left, right: left ^ right, self._hashes.values(), 0)
+        return self.value
+
+    def _salt(self, name: str) -> np.uint64:
+        salt = self._salts.get(name)
+        if salt is None:
+            # CRC32 rather than hash() so hashes agree across processes
+            seed = np.array([zlib.crc32(name.encode("utf-8"))], dtype=np.uint64)
+            salt = self._salts[name] = _mix(seed)[0]
+        return salt
+
+    def _field_hash(self, name: str, values: np.ndarray) -> int:
+        """Hash every cell of a field, a block at a time to bound temporaries."""
+        salt = self._salt(name)
+        bits = _bits(values)
+        combined = 0
+        for start in range(0, bits.size, _BLOCK_CELLS):
+            block = bits[start : start + _BLOCK_CELLS]
+            cells = np.arange(start, start + block.size, dtype=np.uint64)
+            combined ^= _combine(cells, block, salt)
+        self.cells_hashed += values.size
+        return combined
+
+
+def state_hash(state: CellState) -> int:
+    """Hash a state from scratch.
+
+    Args:
+        state (CellState): The world or snapshot to hash
+
+    Returns:
+        int: The same hash a ``StateHasher`` reports for the state
+    """
+    return StateHasher().update(state)
+
+
+def first_divergence(
+    metrics: Mapping[str, np.ndarray], other: Mapping[str, np.ndarray]
+) -> Optional[int]:
+    """Find the first tick at which two recorded runs differ.
+
+    Args:
+        metrics (Mapping[str, np.ndarray]): The metrics of one run, as
+            returned by ``load_metrics``, with a state hash column
+        other (Mapping[str, np.ndarray]): The metrics of the other run
+
+    Returns:
+        Optional[int]: The first tick recorded by both runs whose states
+        differ, or None if every common tick matches
+
+    Raises:
+        KeyError: If a run has no state hash column
+    """
+    ticks, indices, other_indices = np.intersect1d(
+        metrics["tick"], other["tick"], assume_unique=True, return_indices=True
+    )
+    differs = np.flatnonzero(
+        metrics[HASH_COLUMN][indices] != other[HASH_COLUMN][other_indices]
+    )
+    return int(ticks[differs[0]]) if differs.size else None
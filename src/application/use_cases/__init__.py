@@ -0,0 +1,19 @@
+"""Application use cases orchestrating the simulation services."""
+
+from .backend_equivalence import (
+    BackendMismatch,
+    BackendTiming,
+    EquivalenceReport,
+    compare_backends,
+)
+from .parameter_sweep import SweepRun, execute_run, expand_parameter_grid
+
+__all__ = [
+    "SweepRun",
+    "execute_run",
+    "expand_parameter_grid",
+    "BackendMismatch",
+    "BackendTiming",
+    "EquivalenceReport",
+    "compare_backends",
+]
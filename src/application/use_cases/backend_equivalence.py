@@ -0,0 +1,162 @@
+"""Backend equivalence use case: identical worlds and comparative timings."""
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.application.services.backends import create_backend
+from src.application.services.random_streams import CounterRNG
+from src.application.services.simulation_engine import SimulationEngine
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.rule_set import RuleSet
+
+
+class BackendMismatch(Exception):
+    """Exception raised when two backends produced different worlds."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class BackendTiming:
+    """The time a backend spent stepping worlds.
+
+    Attributes:
+        backend (str): The backend name
+        ticks (int): Ticks stepped over all worlds
+        seconds (float): Wall time spent in those ticks
+    """
+
+    backend: str
+    ticks: int
+    seconds: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        """float: The stepping throughput."""
+        return self.ticks / self.seconds if self.seconds > 0 else float("inf")
+
+
+@dataclass(frozen=True)
+class EquivalenceReport:
+    """The outcome of running the same worlds through several backends.
+
+    Attributes:
+        cell_count (int): The number of cells of every world
+        seeds (Tuple[int, ...]): The seeds of the compared worlds
+        timings (Tuple[BackendTiming, ...]): One timing per backend
+    """
+
+    cell_count: int
+    seeds: Tuple[int, ...]
+    timings: Tuple[BackendTiming, ...]
+
+    def format(self) -> str:
+        """Render the timings as a plain-text table.
+
+        Returns:
+            str: One line per backend with its speed relative to the first
+        """
+        lines = [
+            f"{len(self.seeds)} worlds identical on {len(self.timings)} backends",
+            f"{'backend':<8} {'seconds':>10} {'ticks/s':>12} {'cells/s':>14} "
+            f"{'speedup':>8}",
+        ]
+        baseline = self.timings[0].seconds if self.timings else 0.0
+        for timing in self.timings:
+            speedup = baseline / timing.seconds if timing.seconds > 0 else 0.0
+            lines.append(
+                f"{timing.backend:<8} {timing.seconds:>10.4f} "
+                f"{timing.ticks_per_second:>12,.1f} "
+                f"{timing.ticks_per_second * self.cell_count:>14,.0f} "
+                f"{speedup:>7.1f}x"
+            )
+        return "\n".join(lines)
+
+
+def _first_difference(expected: World, actual: World) -> str:
+    """Describe the first field in which two worlds are not bit-identical."""
+    if set(expected.fields) != set(actual.fields):
+        return f"fields {sorted(expected.fields)} != {sorted(actual.fields)}"
+    for name in sorted(expected.fields):
+        left, right = expected.fields[name], actual.fields[name]
+        if left.dtype != right.dtype:
+            return f"field '{name}' dtype {left.dtype} != {right.dtype}"
+        # Compare bits, so NaN equals NaN but -0.0 differs from 0.0
+        differs = left.view(np.uint8).reshape(left.size, -1) != right.view(
+            np.uint8
+        ).reshape(right.size, -1)
+        cells = np.flatnonzero(differs.any(axis=1))
+        if cells.size:
+            cell = int(cells[0])
+            return (
+                f"field '{name}' differs in {cells.size} cells, first cell "
+                f"{cell}: {left[cell]!r} != {right[cell]!r}"
+            )
+    return ""
+
+
+def compare_backends(
+    rule_set: RuleSet,
+    grid: HexGrid,
+    backends: Sequence[str],
+    seeds: Sequence[int],
+    ticks: int,
+) -> EquivalenceReport:
+    """Run random worlds through every backend and check they stay identical.
+
+    Each seed gives a different random initial world. The backends step
+    their copies in lockstep and the worlds are compared bit for bit after
+    initialization and after every tick, against the first backend. Every
+    backend steps one untimed world first, so JIT compilation and lazily
+    built tables do not count towards its timing.
+
+    Args:
+        rule_set (RuleSet): The rules to apply
+        grid (HexGrid): The grid of every world
+        backends (Sequence[str]): Backend names, the first one being the
+            reference the others are compared with
+        seeds (Sequence[int]): The seeds of the compared worlds
+        ticks (int): Ticks to step every world
+
+    Returns:
+        EquivalenceReport: The time each backend spent stepping
+
+    Raises:
+        BackendMismatch: If a backend's world differs from the reference
+        ValueError: If no backend is given or one is unknown
+    """
+    if not backends:
+        raise ValueError("At least one backend is needed")
+    rules = {name: create_backend(name, rule_set, grid) for name in backends}
+    for backend in rules.values():
+        rng = CounterRNG(0)
+        backend.apply(backend.create_world(rng), rng)
+    seconds: Dict[str, float] = {name: 0.0 for name in backends}
+    for seed in seeds:
+        engines: List[Tuple[str, SimulationEngine]] = []
+        for name, backend in rules.items():
+            rng = CounterRNG(seed)
+            engines.append(
+                (name, SimulationEngine(backend.create_world(rng), backend, rng))
+            )
+        for tick in range(ticks + 1):
+            if tick:
+                for name, engine in engines:
+                    started = time.perf_counter()
+                    engine.step()
+                    seconds[name] += time.perf_counter() - started
+            reference_name, reference = engines[0]
+            for name, engine in engines[1:]:
+                difference = _first_difference(reference.world, engine.world)
+                if difference:
+                    raise BackendMismatch(
+                        f"Seed {seed}, tick {tick}: backend '{name}' differs "
+                        f"from '{reference_name}': {difference}"
+                    )
+    timings = tuple(
+        BackendTiming(name, ticks * len(seeds), seconds[name]) for name in backends
+    )
+    return EquivalenceReport(grid.cell_count, tuple(seeds), timings)
@@ -1,6 +1,6 @@
 """Configuration settings for the HexLife simulation."""
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -10,13 +10,36 @@ class DisplayConfig:
     WINDOW_SIZE: Tuple[int, int] = (1024, 768)
     WINDOW_TITLE: str = "HexLife: Hexagonal Life Simulation"
     FPS: int = 60
+    IDLE_WAIT_MS: int = 500  # Longest block on input while nothing changes
 
     # Grid display settings
     GRID_WIDTH: int = 5
     GRID_HEIGHT: int = 10
+    GRID_WRAP: bool = False  # Join opposite edges into a toroidal grid
+    PAN_STEP: int = 40  # Pixels an arrow key scrolls a toroidal grid
     HEX_SIZE: float = 30.0
     GRID_LINE_WIDTH: int = 1
     GRID_PADDING: int = 20
+    GRID_OUTLINE: bool = True  # Draw shared edges once from a cached outline
+    AUTO_FIT: bool = False  # Pick the hex size that fills the window
+    RESIZE_DEBOUNCE_MS: int = 100  # Quiet time before relayout after resizing
+    CELL_LAYER: bool = True  # Cache filled cells and redraw only changed hexes
+    MINIMAP: bool = True  # Overview of the grid in the bottom-right corner
+    MINIMAP_BLOCK: int = 4  # Cells per side of a minimap block
+    MINIMAP_WIDTH: int = 160  # Minimap width in pixels
+
+    # Brush painting with the left mouse button
+    BRUSH_FIELD: str = "terrain"  # The cell field written by the brush
+    BRUSH_VALUE: float = 0.0  # The value painted, water for terrain
+    BRUSH_RADIUS: int = 1  # Hex distance painted around the stroke
+    BRUSH_SHAPE: str = "circle"  # circle for freehand strokes or line
+
+    # Rewinding: comma and period step one frame, Page Up and Page Down jump
+    REWIND_BUDGET_MB: int = 64  # Compressed recent states kept for rewinding
+    REWIND_JUMP: int = 10  # Frames skipped by Page Up and Page Down
+
+    # Off-screen recording
+    RECORD_MAX_PENDING: int = 8  # Frames buffered before rendering waits
 
 
 @dataclass(frozen=True)
@@ -26,12 +49,50 @@ class Colors:
     BACKGROUND: Tuple[int, int, int] = (0, 0, 0)  # Black
     GRID_LINES: Tuple[int, int, int] = (100, 100, 100)  # Gray
 
+    # Filled cells: water, grassland, forest, rock
+    TERRAIN: Tuple[Tuple[int, int, int], ...] = (
+        (40, 80, 160),
+        (150, 170, 90),
+        (90, 120, 70),
+        (120, 115, 110),
+    )
+    # Plant cover from sparse to dense
+    PLANTS: Tuple[Tuple[int, int, int], ...] = (
+        (110, 170, 60),
+        (70, 150, 40),
+        (40, 120, 30),
+        (20, 90, 20),
+    )
+    PLANT_THRESHOLD: float = 0.2  # Biomass from which plants are shown
+
 
 @dataclass(frozen=True)
 class SimulationConfig:
     """Simulation behavior configuration."""
 
     SIMULATION_SPEED: float = 1.0  # Base speed multiplier
+    TICKS_PER_SECOND: float = 10.0  # Target tick rate at speed 1.0
+    SEED: int = 0  # Root seed of all random streams
+    RULES_PATH: Optional[str] = None  # JSON rule document, None for built-in
+    BACKEND: str = "numpy"  # Step backend: python, numpy or numba
+
+    # Per-tick metrics: (field, categories), totals and (field, low, high, bins)
+    METRIC_COUNTS: Tuple[Tuple[str, int], ...] = (("terrain", 4),)
+    METRIC_TOTALS: Tuple[str, ...] = ("biomass", "moisture")
+    METRIC_HISTOGRAMS: Tuple[Tuple[str, float, float, int], ...] = (
+        ("biomass", 0.0, 1.0, 16),
+    )
+    METRIC_HASH: bool = True  # Record a 64-bit hash of the state every tick
+    METRICS_CHUNK_SIZE: int = 1024  # Ticks per chunk file
+    METRICS_PATH: Optional[str] = None  # Metrics directory, None to disable
+
+    # Periodic checkpoints, written from a forked child where supported
+    CHECKPOINT_PATH: Optional[str] = None  # Checkpoint directory, None to disable
+    CHECKPOINT_INTERVAL: int = 1000  # Ticks between checkpoints
+    CHECKPOINT_FORK: bool = True  # False writes checkpoints synchronously
+
+    # HOST:PORT or unix:PATH the observer server binds and viewers connect to
+    OBSERVER_ADDRESS: str = "127.0.0.1:7878"
 
 
 # Create instances for importing
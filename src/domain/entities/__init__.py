@@ -1,5 +1,15 @@
 """Domain entities for the hexagonal grid system."""
 
+from .entity_store import ANIMAL_COMPONENTS, EntityStore, UnknownComponent
 from .grid import HexGrid, InvalidGridPosition
+from .world import UnknownCellField, World
 
-__all__ = ["HexGrid", "InvalidGridPosition"]
+__all__ = [
+    "ANIMAL_COMPONENTS",
+    "EntityStore",
+    "HexGrid",
+    "InvalidGridPosition",
+    "UnknownCellField",
+    "UnknownComponent",
+    "World",
+]
@@ -0,0 +1,230 @@
+from typing import Dict, Mapping, Optional, Union
+
+import numpy as np
+
+# Components of an animal: the cell it occupies, its energy, its age in ticks
+# and its species number
+ANIMAL_COMPONENTS: Mapping[str, str] = {
+    "position": "int64",
+    "energy": "float32",
+    "age": "uint32",
+    "species": "int16",
+}
+
+
+class UnknownComponent(Exception):
+    """Exception raised when a component that does not exist is accessed."""
+
+    pass
+
+
+class EntityStore:
+    """Structure-of-arrays storage of entities such as animals.
+
+    Every component is one array with a slot per entity, so systems update
+    all entities of a kind with a few vectorized operations instead of
+    visiting entity objects one by one. An entity is identified by its slot
+    index; the slots of despawned entities go to a free list and are reused
+    by later spawns, so a slot id must not be kept past its entity's
+    despawn.
+
+    Spawning and despawning ``k`` entities works on those ``k`` slots only:
+    slots are popped from and pushed onto an array-backed free list, and
+    nothing scans the whole store. When the free list runs dry the arrays
+    double in capacity, so spawning stays amortized O(k).
+
+    Attributes:
+        components (Dict[str, np.dtype]): The dtype of every component
+        alive (np.ndarray): Boolean mask of occupied slots, by slot
+    """
+
+    def __init__(
+        self,
+        components: Mapping[str, Union[str, np.dtype]] = ANIMAL_COMPONENTS,
+        capacity: int = 64,
+    ) -> None:
+        """Create an empty store.
+
+        Args:
+            components (Mapping[str, Union[str, np.dtype]], optional): The
+                dtype of every component. Defaults to ANIMAL_COMPONENTS.
+            capacity (int, optional): The initial number of slots.
+                Defaults to 64.
+
+        Raises:
+            ValueError: If no component is given or the capacity is negative
+        """
+        if not components:
+            raise ValueError("An entity store needs at least one component")
+        if capacity < 0:
+            raise ValueError("Capacity must be a non-negative integer")
+        self.components: Dict[str, np.dtype] = {
+            name: np.dtype(dtype) for name, dtype in components.items()
+        }
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=dtype)
+            for name, dtype in self.components.items()
+        }
+        self.alive: np.ndarray = np.zeros(capacity, dtype=bool)
+        # Free slots as a stack, lowest slot on top
+        self._free: np.ndarray = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self._free_count = capacity
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        """int: The number of slots, occupied or free."""
+        return int(self.alive.size)
+
+    @property
+    def count(self) -> int:
+        """int: The number of living entities."""
+        return self._count
+
+    def component(self, name: str) -> np.ndarray:
+        """Get a component array, indexed by slot.
+
+        Free slots hold stale values; combine with ``alive`` or index with
+        the slots of living entities.
+
+        Args:
+            name (str): The component name
+
+        Returns:
+            np.ndarray: The component array (not a copy)
+
+        Raises:
+            UnknownComponent: If the component does not exist
+        """
+        try:
+            return self._arrays[name]
+        except KeyError:
+            raise UnknownComponent(f"Unknown component '{name}'") from None
+
+    def spawn(self, count: int, **values: Union[float, np.ndarray]) -> np.ndarray:
+        """Create entities in bulk.
+
+        Args:
+            count (int): The number of entities to create
+            **values (Union[float, np.ndarray]): Initial component values,
+                a scalar or one value per entity; other components start
+                at zero
+
+        Returns:
+            np.ndarray: The slots of the new entities
+
+        Raises:
+            ValueError: If the count is negative or values do not fit
+            UnknownComponent: If a value names an unknown component
+        """
+        if count < 0:
+            raise ValueError("Cannot spawn a negative number of entities")
+        unknown = set(values) - set(self._arrays)
+        if unknown:
+            raise UnknownComponent(f"Unknown components: {', '.join(sorted(unknown))}")
+        initial = {
+            name: np.broadcast_to(np.asarray(value), (count,))
+            for name, value in values.items()
+        }
+        if count > self._free_count:
+            self._grow(self._count + count)
+        top = self._free_count
+        slots: np.ndarray = self._free[top - count : top][::-1].copy()
+        self._free_count -= count
+
+        for name, array in self._arrays.items():
+            array[slots] = initial.get(name, 0)
+        self.alive[slots] = True
+        self._count += count
+        return slots
+
+    def despawn(self, slots: np.ndarray) -> None:
+        """Remove entities in bulk and recycle their slots.
+
+        Args:
+            slots (np.ndarray): The slots of living entities, without
+                duplicates
+
+        Raises:
+            ValueError: If a slot is out of range, free or repeated
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        if slots.size == 0:
+            return
+        if slots.min() < 0 or slots.max() >= self.capacity:
+            raise ValueError("Slot out of range")
+        if not self.alive[slots].all():
+            raise ValueError("Cannot despawn a free slot")
+        if np.unique(slots).size != slots.size:
+            raise ValueError("Cannot despawn a slot twice")
+        self.alive[slots] = False
+        top = self._free_count
+        self._free[top : top + slots.size] = slots
+        self._free_count += slots.size
+        self._count -= slots.size
+
+    def living(self, species: Optional[int] = None) -> np.ndarray:
+        """Get the slots of living entities, optionally of one species.
+
+        Args:
+            species (Optional[int], optional): Only entities whose
+                ``species`` component equals this. Defaults to None (all).
+
+        Returns:
+            np.ndarray: Slots in ascending order
+        """
+        mask = self.alive
+        if species is not None:
+            mask = mask & (self.component("species") == species)
+        slots: np.ndarray = np.flatnonzero(mask)
+        return slots
+
+    def cell_counts(self, cell_count: int) -> np.ndarray:
+        """Count the living entities in every cell.
+
+        Args:
+            cell_count (int): The number of cells of the grid
+
+        Returns:
+            np.ndarray: The number of entities per cell id
+        """
+        positions = self.component("position")[self.alive]
+        counts: np.ndarray = np.bincount(positions, minlength=cell_count)
+        return counts
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the component arrays and slot bookkeeping.
+
+        Returns:
+            Dict[str, int]: Bytes by array name
+        """
+        usage = {name: array.nbytes for name, array in self._arrays.items()}
+        usage["alive"] = self.alive.nbytes
+        usage["free list"] = self._free.nbytes
+        return usage
+
+    def _grow(self, needed: int) -> None:
+        old = self.capacity
+        capacity = max(needed, 2 * old, 1)
+        for name, array in self._arrays.items():
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:old] = array
+            self._arrays[name] = grown
+        alive: np.ndarray = np.zeros(capacity, dtype=bool)
+        alive[:old] = self.alive
+        self.alive = alive
+
+        # New slots go below the existing free ones, so the lowest free
+        # slot stays on top
+        free: np.ndarray = np.empty(capacity, dtype=np.int64)
+        added = capacity - old
+        free[:added] = np.arange(capacity - 1, old - 1, -1)
+        free[added : added + self._free_count] = self._free[: self._free_count]
+        self._free = free
+        self._free_count += added
+
+    def __str__(self) -> str:
+        return (
+            f"EntityStore(count={self.count}, capacity={self.capacity}, "
+            f"components={sorted(self.components)})"
+        )
@@ -1,7 +1,47 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Tuple, TypeVar
+
+import numpy as np
 
 from ..value_objects.grid_dimensions import GridDimensions
-from ..value_objects.grid_position import GridPosition
+from ..value_objects.grid_position import NEIGHBOR_OFFSETS, GridPosition
+
+Coordinate = TypeVar("Coordinate", int, np.ndarray)
+
+# Precomputed tables cached on a grid, rebuilt on first use
+_TABLES = ("neighbor_table",)
+
+
+def to_axial(q: Coordinate, r: Coordinate) -> Tuple[Coordinate, Coordinate]:
+    """Convert grid positions to axial hex coordinates.
+
+    In axial coordinates ``(x, z)`` neighbor offsets are the same for every
+    cell and the hex distance of an offset is
+    ``(|dx| + |dz| + |dx + dz|) // 2``.
+
+    Args:
+        q (Coordinate): The column, or an array of columns
+        r (Coordinate): The row, or an array of rows
+
+    Returns:
+        Tuple[Coordinate, Coordinate]: The axial x and z coordinates
+    """
+    x = 2 * q + r % 2
+    return x, r // 2 - q
+
+
+def from_axial(x: Coordinate, z: Coordinate) -> Tuple[Coordinate, Coordinate]:
+    """Convert axial hex coordinates back to grid positions.
+
+    Args:
+        x (Coordinate): The axial x coordinate, or an array of them
+        z (Coordinate): The axial z coordinate, or an array of them
+
+    Returns:
+        Tuple[Coordinate, Coordinate]: The column and row
+    """
+    return x // 2, 2 * z + x
 
 
 class InvalidGridPosition(Exception):
@@ -18,22 +58,196 @@ class HexGrid:
     It is framework-independent and handles the basic grid structure and
     validation.
 
+    Cells are identified by a dense integer id in row-major order
+    (``cell_id = r * width + q``), which is the index used by every
+    array-backed cell field.
+
+    Positions follow the drawn layout described by ``NEIGHBOR_OFFSETS``,
+    where a cell's neighbors depend on the parity of its row; ``to_axial``
+    converts them to axial coordinates for hex distances.
+
+    A grid is either bounded, where edge cells have fewer neighbors, or
+    toroidal, where leaving one edge enters at the opposite edge, so every
+    cell has six neighbors and every position maps onto a cell. A toroidal
+    grid repeats every ``width`` columns, and every ``height`` rows, where
+    the copy below is shifted right by half a column if the height is odd,
+    since its first row then continues the last row with the same parity.
+
     Attributes:
         dimensions (GridDimensions): The dimensions of the grid
+        wrap (bool): True for a toroidal grid
     """
 
     dimensions: GridDimensions
+    wrap: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the topology after initialization.
+
+        Raises:
+            ValueError: If a toroidal grid is too small for six distinct
+                neighbors per cell
+        """
+        if self.wrap and (self.dimensions.width < 2 or self.dimensions.height < 5):
+            raise ValueError("A toroidal grid needs at least 2 columns and 5 rows")
+
+    @property
+    def cell_count(self) -> int:
+        """int: The total number of cells in the grid."""
+        return self.dimensions.width * self.dimensions.height
 
     def is_valid_position(self, position: GridPosition) -> bool:
         """Check if the given position is within the grid boundaries.
 
+        Every position is valid on a toroidal grid.
+
         Args:
             position (GridPosition): The position to validate
 
         Returns:
             bool: True if the position is valid, False otherwise
         """
-        return (
+        return self.wrap or (
             0 <= position.q < self.dimensions.width
             and 0 <= position.r < self.dimensions.height
         )
+
+    def wrapped(self, position: GridPosition) -> GridPosition:
+        """Map a position onto the stored range of a toroidal grid.
+
+        Args:
+            position (GridPosition): Any position
+
+        Returns:
+            GridPosition: The equivalent position with ``0 <= q < width`` and
+            ``0 <= r < height``; positions of bounded grids are unchanged
+        """
+        if not self.wrap:
+            return position
+        q, r = self.wrap_coordinates(position.q, position.r)
+        return GridPosition(q=q, r=r)
+
+    def wrap_coordinates(
+        self, q: Coordinate, r: Coordinate
+    ) -> Tuple[Coordinate, Coordinate]:
+        """Map coordinates onto the stored range of a toroidal grid.
+
+        Args:
+            q (Coordinate): The column, or an array of columns
+            r (Coordinate): The row, or an array of rows
+
+        Returns:
+            Tuple[Coordinate, Coordinate]: The equivalent columns and rows,
+            like ``wrapped``; coordinates of bounded grids are unchanged
+        """
+        if not self.wrap:
+            return q, r
+        width, height = self.dimensions.width, self.dimensions.height
+        copies: Coordinate = r // height
+        row: Coordinate = r % height
+        if height % 2:
+            # Crossing an odd height flips the row parity, which the copies
+            # make up for by their half-column shift
+            q = q + (r % 2 - row % 2 - copies) // 2
+        return q % width, row
+
+    def neighbors(self, position: GridPosition) -> List[GridPosition]:
+        """Get the positions of the six neighbors of a position.
+
+        Args:
+            position (GridPosition): The position of a cell
+
+        Returns:
+            List[GridPosition]: The neighbors in direction order; on a
+            bounded grid they may lie outside the grid
+        """
+        return [self.wrapped(neighbor) for neighbor in position.get_neighbors()]
+
+    def cell_id(self, position: GridPosition) -> int:
+        """Get the dense cell id of a grid position.
+
+        Args:
+            position (GridPosition): The position to convert
+
+        Returns:
+            int: The row-major cell id
+
+        Raises:
+            InvalidGridPosition: If the position is outside the grid
+        """
+        if not self.is_valid_position(position):
+            raise InvalidGridPosition(f"{position} is outside the grid")
+        position = self.wrapped(position)
+        return position.r * self.dimensions.width + position.q
+
+    def position_of(self, cell_id: int) -> GridPosition:
+        """Get the grid position of a dense cell id.
+
+        Args:
+            cell_id (int): The row-major cell id
+
+        Returns:
+            GridPosition: The corresponding grid position
+
+        Raises:
+            InvalidGridPosition: If the id does not belong to the grid
+        """
+        if not 0 <= cell_id < self.cell_count:
+            raise InvalidGridPosition(f"Cell id {cell_id} is outside the grid")
+        r, q = divmod(cell_id, self.dimensions.width)
+        return GridPosition(q=q, r=r)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by precomputed tables.
+
+        Tables that have not been computed yet are not listed.
+
+        Returns:
+            Dict[str, int]: Bytes by table name
+        """
+        cached = vars(self)
+        return {name: cached[name].nbytes for name in _TABLES if name in cached}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to pickle, leaving out the precomputed tables.
+
+        The tables are rebuilt on first use, which is cheaper than sending
+        them along with every grid passed to a worker process.
+
+        Returns:
+            Dict[str, Any]: The instance attributes without the tables
+        """
+        return {
+            name: value for name, value in vars(self).items() if name not in _TABLES
+        }
+
+    @cached_property
+    def neighbor_table(self) -> np.ndarray:
+        """np.ndarray: Precomputed neighbor cell ids, shape (6, cell_count).
+
+        Row ``d`` holds the neighbor of every cell in direction ``d`` (the
+        direction order of ``NEIGHBOR_OFFSETS``), or -1 where that neighbor
+        falls outside the grid. On a toroidal grid neighbors wrap around and
+        the table holds no -1, so lookups never check bounds. The table is
+        read-only.
+        """
+        width, height = self.dimensions.width, self.dimensions.height
+        cell_ids = np.arange(self.cell_count, dtype=np.int64)
+        q, r = cell_ids % width, cell_ids // width
+        # The offsets of every cell's row parity, shape (cell_count, 6, 2)
+        offsets = np.array(NEIGHBOR_OFFSETS, dtype=np.int64)[r % 2]
+
+        table: np.ndarray = np.empty((6, self.cell_count), dtype=np.int64)
+        for direction in range(6):
+            neighbor_q = q + offsets[:, direction, 0]
+            neighbor_r = r + offsets[:, direction, 1]
+            neighbor_q, neighbor_r = self.wrap_coordinates(neighbor_q, neighbor_r)
+            inside = (
+                (neighbor_q >= 0)
+                & (neighbor_q < width)
+                & (neighbor_r >= 0)
+                & (neighbor_r < height)
+            )
+            table[direction] = np.where(inside, neighbor_r * width + neighbor_q, -1)
+        table.flags.writeable = False
+        return table
@@ -0,0 +1,140 @@
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Union
+
+import numpy as np
+
+from .grid import HexGrid
+
+# Versions are unique across all worlds, so equal versions imply equal data
+_versions = itertools.count(1)
+
+
+class UnknownCellField(Exception):
+    """Exception raised when a cell field that does not exist is accessed."""
+
+    pass
+
+
+@dataclass(eq=False)
+class World:
+    """The array-backed cell state of a hexagonal grid.
+
+    Every cell field is a one-dimensional array with one entry per cell,
+    indexed by the grid's dense cell id. Keeping state as whole-grid arrays
+    lets rules, metrics and renderers work on all cells at once instead of
+    visiting cell objects one by one.
+
+    Each field carries a version that changes whenever the field is written,
+    which lets consumers skip work for fields that did not change. Code that
+    modifies a field array in place must call ``touch`` afterwards.
+
+    Worlds compare by identity; compare their fields with NumPy to check
+    whether two states are equal.
+
+    Attributes:
+        grid (HexGrid): The grid the state belongs to
+        fields (Dict[str, np.ndarray]): Cell field arrays by name
+        tick (int): The number of simulation steps applied so far
+        versions (Dict[str, int]): The current version of every field
+    """
+
+    grid: HexGrid
+    fields: Dict[str, np.ndarray] = field(default_factory=dict)
+    tick: int = 0
+    versions: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate that every field has one entry per cell."""
+        for name, values in self.fields.items():
+            self._check_shape(name, values)
+            self.versions.setdefault(name, next(_versions))
+
+    def add_field(
+        self, name: str, dtype: Union[str, np.dtype], fill: float = 0
+    ) -> np.ndarray:
+        """Create a new cell field filled with a constant value.
+
+        Args:
+            name (str): The field name
+            dtype (Union[str, np.dtype]): The NumPy dtype of the field
+            fill (float, optional): The initial value of every cell.
+                Defaults to 0.
+
+        Returns:
+            np.ndarray: The newly created field array
+
+        Raises:
+            ValueError: If a field with that name already exists
+        """
+        if name in self.fields:
+            raise ValueError(f"Cell field '{name}' already exists")
+        values: np.ndarray = np.full(self.grid.cell_count, fill, dtype=dtype)
+        self.fields[name] = values
+        self.touch(name)
+        return values
+
+    def get_field(self, name: str) -> np.ndarray:
+        """Get a cell field array by name.
+
+        Args:
+            name (str): The field name
+
+        Returns:
+            np.ndarray: The field array (not a copy)
+
+        Raises:
+            UnknownCellField: If the field does not exist
+        """
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise UnknownCellField(f"Unknown cell field '{name}'") from None
+
+    def set_field(self, name: str, values: np.ndarray) -> None:
+        """Replace the array of an existing or new cell field.
+
+        Args:
+            name (str): The field name
+            values (np.ndarray): One value per cell
+
+        Raises:
+            ValueError: If the array does not have one entry per cell
+        """
+        self._check_shape(name, values)
+        self.fields[name] = values
+        self.touch(name)
+
+    def touch(self, name: str) -> None:
+        """Record that a field has been written.
+
+        Args:
+            name (str): The field name
+        """
+        self.versions[name] = next(_versions)
+
+    def copy(self) -> "World":
+        """Create a deep copy of the world state.
+
+        Returns:
+            World: A world sharing the grid but owning copies of every field
+        """
+        return World(
+            grid=self.grid,
+            fields={name: values.copy() for name, values in self.fields.items()},
+            tick=self.tick,
+            versions=dict(self.versions),
+        )
+
+    def _check_shape(self, name: str, values: np.ndarray) -> None:
+        if values.shape != (self.grid.cell_count,):
+            raise ValueError(
+                f"Cell field '{name}' must have shape ({self.grid.cell_count},), "
+                f"got {values.shape}"
+            )
+
+    def __str__(self) -> str:
+        return (
+            f"World({self.grid.dimensions}, tick={self.tick}, "
+            f"fields={sorted(self.fields)})"
+        )
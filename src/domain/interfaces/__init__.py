@@ -0,0 +1,6 @@
+"""Interfaces the domain expects from other layers."""
+
+from .cell_state import CellState
+from .world_repository import WorldRepository
+
+__all__ = ["CellState", "WorldRepository"]
@@ -0,0 +1,34 @@
+from typing import Mapping, Protocol
+
+import numpy as np
+
+from ..entities.grid import HexGrid
+
+
+class CellState(Protocol):
+    """Read-only view of array-backed cell state at one tick.
+
+    Both the live ``World`` and immutable snapshots of it satisfy this
+    interface, so consumers such as metrics and renderers work with either.
+    Equal field versions always mean equal field contents.
+    """
+
+    @property
+    def grid(self) -> HexGrid:
+        """HexGrid: The grid the state belongs to."""
+        ...
+
+    @property
+    def tick(self) -> int:
+        """int: The tick the state belongs to."""
+        ...
+
+    @property
+    def fields(self) -> Mapping[str, np.ndarray]:
+        """Mapping[str, np.ndarray]: Cell field arrays by name."""
+        ...
+
+    @property
+    def versions(self) -> Mapping[str, int]:
+        """Mapping[str, int]: The version of every field."""
+        ...
@@ -0,0 +1,57 @@
+from typing import Mapping, Protocol
+
+import numpy as np
+
+from ..entities.grid import HexGrid
+from ..entities.world import World
+from ..value_objects.grid_region import GridRegion
+
+
+class WorldRepository(Protocol):
+    """Storage of a world that is read and written window by window.
+
+    Implementations may keep only part of the world in memory, so callers
+    work on windows instead of whole-grid arrays.
+    """
+
+    @property
+    def grid(self) -> HexGrid:
+        """HexGrid: The grid of the stored world."""
+        ...
+
+    @property
+    def tick(self) -> int:
+        """int: The tick of the stored world."""
+        ...
+
+    @tick.setter
+    def tick(self, value: int) -> None:
+        ...
+
+    @property
+    def field_dtypes(self) -> Mapping[str, np.dtype]:
+        """Mapping[str, np.dtype]: The dtype of every stored cell field."""
+        ...
+
+    def read_region(self, region: GridRegion) -> World:
+        """Copy a window of the stored world into a world of the window's size.
+
+        Args:
+            region (GridRegion): The window to read, inside the grid
+
+        Returns:
+            World: A world holding copies of the window's cells
+        """
+        ...
+
+    def write_region(
+        self, region: GridRegion, fields: Mapping[str, np.ndarray]
+    ) -> None:
+        """Overwrite a window of the stored world.
+
+        Args:
+            region (GridRegion): The window to write, inside the grid
+            fields (Mapping[str, np.ndarray]): New values by field name, in
+                the window's row-major order
+        """
+        ...
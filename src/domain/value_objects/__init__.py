@@ -2,5 +2,15 @@
 
 from .grid_dimensions import GridDimensions
 from .grid_position import GridPosition
+from .grid_region import GridRegion
+from .rule_set import FieldSpec, RuleDefinition, RuleDefinitionError, RuleSet
 
-__all__ = ["GridPosition", "GridDimensions"]
+__all__ = [
+    "GridPosition",
+    "GridDimensions",
+    "GridRegion",
+    "FieldSpec",
+    "RuleDefinition",
+    "RuleDefinitionError",
+    "RuleSet",
+]
@@ -1,56 +1,59 @@
 from dataclasses import dataclass
 from typing import List, Tuple
 
+# Offsets (dq, dr) of the six neighbors of a cell in an even and in an odd
+# row, from north going clockwise (N, NE, SE, S, SW, NW), so direction
+# ``d + 3`` is the opposite of ``d``. Cells are stored in the layout they
+# are drawn in: flat-topped hexes whose rows are half a hex apart, with odd
+# rows shifted right by half a column, so the same row holds the cells two
+# rows above and below, and the diagonal neighbors depend on row parity.
+NEIGHBOR_OFFSETS: Tuple[Tuple[Tuple[int, int], ...], ...] = (
+    ((0, -2), (0, -1), (0, 1), (0, 2), (-1, 1), (-1, -1)),
+    ((0, -2), (1, -1), (1, 1), (0, 2), (0, 1), (0, -1)),
+)
+
 
 @dataclass(frozen=True)
 class GridPosition:
     """A value object representing a position in the hexagonal grid.
 
     This is an immutable value object that represents a position in the grid
-    using axial coordinates (q, r) system for hexagonal grids.
+    by its column and row in the drawn layout described by
+    ``NEIGHBOR_OFFSETS``:
+    - q: The column (pointing from left to right)
+    - r: The row, half a hex below the previous one, with odd rows shifted
+      right by half a column
 
-    The axial coordinate system for hexagons uses two axes:
-    - q: The column axis (pointing from left to right)
-    - r: The row axis (pointing diagonally down-right)
+    Neighbor directions are numbered like the rows of the grid's neighbor
+    table, so a direction index means the same step everywhere.
 
     Attributes:
-        q (int): The q-coordinate in the axial coordinate system (column)
-        r (int): The r-coordinate in the axial coordinate system (row)
+        q (int): The column in the drawn layout
+        r (int): The row in the drawn layout
     """
 
     q: int
     r: int
 
-    # Relative coordinates for neighbors in a flat-topped hexagonal grid
-    # Starting from east and going counter-clockwise
-    _NEIGHBOR_VECTORS = [
-        (1, 0),  # E
-        (0, 1),  # SE
-        (-1, 1),  # SW
-        (-1, 0),  # W
-        (0, -1),  # NW
-        (1, -1),  # NE
-    ]
-
     def get_neighbors(self) -> List["GridPosition"]:
         """Get all neighboring positions in the grid.
 
         Returns a list of all six adjacent positions in the hexagonal grid,
-        starting from the east position and going counter-clockwise.
+        starting from the north position and going clockwise.
 
         Returns:
             List[GridPosition]: List of neighboring positions
         """
         return [
             GridPosition(q=self.q + dq, r=self.r + dr)
-            for dq, dr in self._NEIGHBOR_VECTORS
+            for dq, dr in NEIGHBOR_OFFSETS[self.r % 2]
         ]
 
     def get_neighbor(self, direction: int) -> "GridPosition":
         """Get a specific neighboring position.
 
         Args:
-            direction (int): Direction index (0=E, 1=SE, 2=SW, 3=W, 4=NW, 5=NE)
+            direction (int): Direction index (0=N, 1=NE, 2=SE, 3=S, 4=SW, 5=NW)
 
         Returns:
             GridPosition: The neighboring position in the specified direction
@@ -60,7 +63,7 @@ class GridPosition:
         """
         if not 0 <= direction < 6:
             raise ValueError("Direction must be in range [0,5]")
-        dq, dr = self._NEIGHBOR_VECTORS[direction]
+        dq, dr = NEIGHBOR_OFFSETS[self.r % 2][direction]
         return GridPosition(q=self.q + dq, r=self.r + dr)
 
     def as_tuple(self) -> Tuple[int, int]:
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .grid_dimensions import GridDimensions
+
+
+@dataclass(frozen=True)
+class GridRegion:
+    """A value object representing a rectangular window of a grid.
+
+    The window covers columns ``q .. q + width - 1`` and rows
+    ``r .. r + height - 1``. Neighbor offsets only depend on the parity of
+    a cell's row, so a window starting on an even row behaves like a small
+    grid of its own whose cells keep their neighbors, except along the
+    window border.
+
+    Attributes:
+        q (int): The first column of the window
+        r (int): The first row of the window
+        width (int): The number of columns in the window
+        height (int): The number of rows in the window
+    """
+
+    q: int
+    r: int
+    width: int
+    height: int
+
+    def __post_init__(self) -> None:
+        """Validate the window size after initialization."""
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError("Grid region must have a positive width and height")
+
+    @property
+    def dimensions(self) -> GridDimensions:
+        """GridDimensions: The size of the window as grid dimensions."""
+        return GridDimensions(self.width, self.height)
+
+    @property
+    def cell_count(self) -> int:
+        """int: The number of cells in the window."""
+        return self.width * self.height
+
+    @classmethod
+    def enclosing(cls, cell_ids: np.ndarray, grid_width: int) -> "GridRegion":
+        """Create the smallest window containing the given cells.
+
+        Args:
+            cell_ids (np.ndarray): Row-major cell ids of a grid, at least one
+            grid_width (int): The width of that grid
+
+        Returns:
+            GridRegion: The bounding window of the cells
+
+        Raises:
+            ValueError: If no cell id is given
+        """
+        ids: np.ndarray = np.asarray(cell_ids, dtype=np.int64)
+        if ids.size == 0:
+            raise ValueError("Cannot enclose an empty set of cells")
+        q: np.ndarray = ids % grid_width
+        r: np.ndarray = ids // grid_width
+        first_q, first_r = int(q.min()), int(r.min())
+        return cls(
+            first_q,
+            first_r,
+            int(q.max()) - first_q + 1,
+            int(r.max()) - first_r + 1,
+        )
+
+    def union(self, other: "GridRegion") -> "GridRegion":
+        """Create the smallest window containing both windows.
+
+        Args:
+            other (GridRegion): The other window
+
+        Returns:
+            GridRegion: The bounding window of both
+        """
+        q, r = min(self.q, other.q), min(self.r, other.r)
+        end_q = max(self.q + self.width, other.q + other.width)
+        end_r = max(self.r + self.height, other.r + other.height)
+        return GridRegion(q, r, end_q - q, end_r - r)
+
+    def expanded(self, margin: int) -> "GridRegion":
+        """Grow the window by the same margin on every side.
+
+        Args:
+            margin (int): The number of rows and columns to add on each side
+
+        Returns:
+            GridRegion: The grown window
+        """
+        return GridRegion(
+            self.q - margin,
+            self.r - margin,
+            self.width + 2 * margin,
+            self.height + 2 * margin,
+        )
+
+    def clipped_to(self, dimensions: GridDimensions) -> "GridRegion":
+        """Restrict the window to the cells of a grid.
+
+        Args:
+            dimensions (GridDimensions): The dimensions of the grid
+
+        Returns:
+            GridRegion: The part of the window inside the grid
+
+        Raises:
+            ValueError: If the window lies entirely outside the grid
+        """
+        q, r = max(self.q, 0), max(self.r, 0)
+        end_q = min(self.q + self.width, dimensions.width)
+        end_r = min(self.r + self.height, dimensions.height)
+        return GridRegion(q, r, end_q - q, end_r - r)
+
+    def cell_ids(self, grid_width: int) -> np.ndarray:
+        """Get the row-major cell ids of the window within a grid.
+
+        Args:
+            grid_width (int): The width of the grid the window belongs to
+
+        Returns:
+            np.ndarray: int64 cell ids in the window's own row-major order
+        """
+        rows = np.arange(self.r, self.r + self.height, dtype=np.int64)
+        columns = np.arange(self.q, self.q + self.width, dtype=np.int64)
+        ids: np.ndarray = (rows[:, None] * grid_width + columns[None, :]).ravel()
+        return ids
+
+    def __str__(self) -> str:
+        return (
+            f"GridRegion(q={self.q}, r={self.r}, "
+            f"width={self.width}, height={self.height})"
+        )
@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+_FIELD_DTYPES = (
+    "bool",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "float32",
+    "float64",
+)
+
+
+class RuleDefinitionError(Exception):
+    """Exception raised when a declarative rule definition is invalid."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """A value object declaring one cell field of the simulation.
+
+    Attributes:
+        name (str): The field name, usable in rule expressions
+        dtype (str): The NumPy dtype name of the field array
+        initial (Union[float, str]): Either a constant initial value or an
+            expression evaluated once per cell when the world is created
+    """
+
+    name: str
+    dtype: str = "float64"
+    initial: Union[float, str] = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the field declaration."""
+        if not self.name.isidentifier():
+            raise RuleDefinitionError(f"Invalid field name '{self.name}'")
+        if self.dtype not in _FIELD_DTYPES:
+            raise RuleDefinitionError(
+                f"Field '{self.name}' has unsupported dtype '{self.dtype}'"
+            )
+
+
+@dataclass(frozen=True)
+class RuleDefinition:
+    """A value object describing how one cell field is updated each tick.
+
+    Expressions read the state of the previous tick, so the order of rules
+    within a rule set does not change the result.
+
+    Attributes:
+        target (str): The name of the field the rule writes
+        expression (str): The new value of the field, as an expression over
+            cell fields, parameters and neighbor aggregates
+        where (Optional[str]): Optional condition; cells where it is false
+            keep their previous value
+    """
+
+    target: str
+    expression: str
+    where: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """A value object holding a complete declarative rule definition.
+
+    Attributes:
+        fields (Tuple[FieldSpec, ...]): The cell fields of the world
+        rules (Tuple[RuleDefinition, ...]): The per-tick update rules
+        parameters (Dict[str, float]): Named constants usable in expressions
+    """
+
+    fields: Tuple[FieldSpec, ...]
+    rules: Tuple[RuleDefinition, ...] = ()
+    parameters: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate that names are unique and rules target known fields."""
+        field_names = [spec.name for spec in self.fields]
+        if len(set(field_names)) != len(field_names):
+            raise RuleDefinitionError("Field names must be unique")
+        clashes = set(field_names) & set(self.parameters)
+        if clashes:
+            raise RuleDefinitionError(
+                f"Parameters shadow fields: {', '.join(sorted(clashes))}"
+            )
+        targets = [rule.target for rule in self.rules]
+        if len(set(targets)) != len(targets):
+            raise RuleDefinitionError("Each field may be targeted by one rule only")
+        for target in targets:
+            if target not in field_names:
+                raise RuleDefinitionError(f"Rule targets unknown field '{target}'")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "RuleSet":
+        """Build a rule set from its declarative mapping form.
+
+        The expected layout is::
+
+            {
+                "parameters": {"growth_rate": 0.05},
+                "fields": {"biomass": {"dtype": "float32", "initial": 0.0}},
+                "rules": [
+                    {"target": "biomass", "expression": "biomass + growth_rate"}
+                ]
+            }
+
+        Args:
+            data (Mapping[str, Any]): The parsed rule document
+
+        Returns:
+            RuleSet: The validated rule set
+
+        Raises:
+            RuleDefinitionError: If the document is malformed
+        """
+        try:
+            fields = tuple(
+                FieldSpec(name=name, **spec)
+                for name, spec in data.get("fields", {}).items()
+            )
+            rules = tuple(RuleDefinition(**rule) for rule in data.get("rules", []))
+            parameters = {
+                name: float(value) for name, value in data.get("parameters", {}).items()
+            }
+        except (AttributeError, TypeError, ValueError) as error:
+            raise RuleDefinitionError(f"Malformed rule document: {error}") from error
+        return cls(fields=fields, rules=rules, parameters=parameters)
+
+    def with_parameters(self, overrides: Mapping[str, float]) -> "RuleSet":
+        """Create a copy of the rule set with some parameters replaced.
+
+        Args:
+            overrides (Mapping[str, float]): New values by parameter name
+
+        Returns:
+            RuleSet: The rule set with the overridden parameters
+
+        Raises:
+            RuleDefinitionError: If a parameter is not declared
+        """
+        unknown = set(overrides) - set(self.parameters)
+        if unknown:
+            raise RuleDefinitionError(
+                f"Unknown parameters: {', '.join(sorted(unknown))}"
+            )
+        parameters = dict(self.parameters)
+        parameters.update({name: float(value) for name, value in overrides.items()})
+        return replace(self, parameters=parameters)
+
+    def __str__(self) -> str:
+        return f"RuleSet(fields={len(self.fields)}, rules={len(self.rules)})"
@@ -0,0 +1,382 @@
+"""Periodic world checkpoints written without pausing the simulation."""
+import logging
+import os
+import re
+import shutil
+import sys
+import threading
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from src.domain.entities.world import World
+
+from .world_store import save_world
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_PATTERN = re.compile(r"^tick_(\d{9})$")
+# Threads that never hold a lock the child needs: the metrics stage only
+# touches its own queue and the metrics files
+_FORK_SAFE_THREADS = ("metrics-stage",)
+
+
+class CheckpointError(Exception):
+    """Exception raised when writing a checkpoint failed."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class CheckpointProgress:
+    """Progress of the checkpoint being written.
+
+    Attributes:
+        tick (int): The tick being checkpointed
+        bytes_written (int): Field bytes written so far
+        total_bytes (int): Field bytes of the whole checkpoint, 0 until known
+    """
+
+    tick: int
+    bytes_written: int = 0
+    total_bytes: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """float: The written share of the checkpoint, between 0 and 1."""
+        return self.bytes_written / self.total_bytes if self.total_bytes else 0.0
+
+
+class ForkCheckpointer:
+    """Writes world checkpoints from a forked copy-on-write child process.
+
+    ``start`` forks the process; the child sees the world exactly as it was
+    at the fork, writes it in the ``save_world`` format and exits, while the
+    parent returns immediately and keeps ticking. Pages the parent modifies
+    meanwhile are copied by the kernel, so the checkpoint is consistent and
+    only the modified pages cost extra memory.
+
+    At most one checkpoint is in flight; ``start`` declines while one is
+    being written. Each checkpoint is written to a hidden directory and
+    renamed to ``tick_<tick>`` once complete, and the parent removes the
+    partial directory of a failed child. On platforms without ``os.fork``,
+    or with ``fork=False``, checkpoints are written synchronously instead.
+
+    Forking is only safe while no other thread can hold a lock the child
+    needs: the child inherits every lock another thread happened to hold and
+    could wait on it forever. Threads named in ``fork_safe_threads``, such as
+    the metrics stage, do not count. While any other thread is running, such
+    as the simulation worker of the GUI, ``start`` copies the world instead
+    and writes the copy from a background thread. ``mode`` tells which way
+    the latest checkpoint was written, and every change is logged.
+
+    The checkpointer is an engine stage writing every ``interval`` ticks.
+
+    Attributes:
+        directory (Path): The directory checkpoints are written to
+        interval (int): Ticks between checkpoints written by the stage
+        progress (Optional[CheckpointProgress]): Progress of the checkpoint
+            in flight, or None
+        fork_safe_threads (Tuple[str, ...]): Names of threads that do not
+            prevent forking
+        mode (Optional[str]): How the latest checkpoint was written:
+            ``"fork"``, ``"thread"`` or ``"sync"``; None before the first
+        completed (List[Path]): The checkpoints written so far
+        skipped (int): Checkpoints the stage skipped because one was still
+            in flight
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        interval: int = 1,
+        fork: bool = True,
+        fork_safe_threads: Iterable[str] = _FORK_SAFE_THREADS,
+    ) -> None:
+        """Create the checkpoint directory.
+
+        Args:
+            directory (Union[str, Path]): The directory to write to
+            interval (int, optional): Ticks between checkpoints when used as
+                an engine stage. Defaults to 1.
+            fork (bool, optional): Write from a forked child where the
+                platform supports it. Defaults to True.
+            fork_safe_threads (Iterable[str], optional): Names of threads
+                that never hold a lock the child needs. Defaults to the
+                metrics stage.
+
+        Raises:
+            ValueError: If the interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("Checkpoint interval must be a positive number of ticks")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.interval = interval
+        self.fork = fork and hasattr(os, "fork")
+        self.fork_safe_threads = tuple(fork_safe_threads)
+        self.mode: Optional[str] = None
+        self.progress: Optional[CheckpointProgress] = None
+        self.completed: List[Path] = []
+        self.skipped = 0
+        self._pid: Optional[int] = None
+        self._pipe: Optional[int] = None
+        self._received = b""
+        self._thread: Optional[threading.Thread] = None
+        self._thread_error: Optional[BaseException] = None
+
+    @property
+    def in_flight(self) -> bool:
+        """bool: True while a checkpoint is being written."""
+        return self._pid is not None or self._thread is not None
+
+    def __call__(self, world: World) -> None:
+        """Collect a finished checkpoint and start one every ``interval`` ticks.
+
+        Args:
+            world (World): The updated world
+
+        Raises:
+            CheckpointError: If the previous checkpoint failed
+        """
+        self.poll()
+        if world.tick % self.interval == 0 and not self.start(world):
+            self.skipped += 1
+
+    def start(self, world: World) -> bool:
+        """Start writing a checkpoint of the world's current state.
+
+        Args:
+            world (World): The world to checkpoint
+
+        Returns:
+            bool: False if a checkpoint was already in flight
+
+        Raises:
+            CheckpointError: If a synchronous checkpoint failed
+        """
+        if self.in_flight:
+            return False
+        target = self.path_for(world.tick)
+        partial = self.directory / f".{target.name}.partial"
+        self.progress = CheckpointProgress(world.tick)
+        if not self.fork:
+            self._set_mode("sync")
+            try:
+                self._write(world, partial, target, pipe=None)
+            except Exception as error:
+                raise CheckpointError(
+                    f"Checkpoint of tick {world.tick} failed: {error}"
+                ) from error
+            finally:
+                self.progress = None
+            self.completed.append(target)
+            return True
+
+        if self._other_threads():
+            self._set_mode("thread")
+            self._thread_error = None
+            self._thread = threading.Thread(
+                target=self._write_copy,
+                args=(world.copy(), partial, target),
+                name="checkpoint-writer",
+                daemon=True,
+            )
+            self._thread.start()
+            return True
+
+        self._set_mode("fork")
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # Child: write the forked state and never return
+            status = 1
+            try:
+                os.close(read_end)
+                self._write(world, partial, target, pipe=write_end)
+                status = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                sys.stderr.flush()
+                os._exit(status)
+        os.close(write_end)
+        os.set_blocking(read_end, False)
+        self._pid, self._pipe, self._received = pid, read_end, b""
+        return True
+
+    def poll(self) -> Optional[Path]:
+        """Update the progress and collect the checkpoint if it finished.
+
+        Returns:
+            Optional[Path]: The checkpoint that finished since the last
+            call, or None
+
+        Raises:
+            CheckpointError: If the checkpoint failed
+        """
+        if self._thread is not None:
+            return None if self._thread.is_alive() else self._join()
+        if self._pid is None:
+            return None
+        self._read_progress()
+        pid, status = os.waitpid(self._pid, os.WNOHANG)
+        return self._collect(status) if pid else None
+
+    def wait(self) -> Optional[Path]:
+        """Wait for the checkpoint in flight to finish.
+
+        Returns:
+            Optional[Path]: The finished checkpoint, or None if none was
+            in flight
+
+        Raises:
+            CheckpointError: If the checkpoint failed
+        """
+        if self._thread is not None:
+            return self._join()
+        if self._pid is None:
+            return None
+        _, status = os.waitpid(self._pid, 0)
+        self._read_progress()
+        return self._collect(status)
+
+    def close(self) -> None:
+        """Wait for the checkpoint in flight to finish.
+
+        Raises:
+            CheckpointError: If the checkpoint failed
+        """
+        self.wait()
+
+    def __enter__(self) -> "ForkCheckpointer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def path_for(self, tick: int) -> Path:
+        """Get the directory a checkpoint of a tick is written to.
+
+        Args:
+            tick (int): The checkpointed tick
+
+        Returns:
+            Path: The checkpoint directory
+        """
+        return self.directory / f"tick_{tick:09d}"
+
+    def _other_threads(self) -> List[str]:
+        current = threading.current_thread()
+        return [
+            thread.name
+            for thread in threading.enumerate()
+            if thread is not current and thread.name not in self.fork_safe_threads
+        ]
+
+    def _set_mode(self, mode: str) -> None:
+        if mode == self.mode:
+            return
+        self.mode = mode
+        if mode == "fork":
+            logger.info("Writing checkpoints from forked children")
+        elif mode == "thread":
+            logger.info(
+                "Writing checkpoints from copies, as threads %s are running",
+                ", ".join(self._other_threads()),
+            )
+        else:
+            logger.info("Writing checkpoints synchronously")
+
+    def _write(
+        self, world: World, partial: Path, target: Path, pipe: Optional[int]
+    ) -> None:
+        def report(written: int, total: int) -> None:
+            assert self.progress is not None
+            self.progress = CheckpointProgress(self.progress.tick, written, total)
+            if pipe is not None:
+                os.write(pipe, f"{written} {total}\n".encode("ascii"))
+
+        shutil.rmtree(partial, ignore_errors=True)
+        try:
+            save_world(world, partial, progress=report)
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(partial, target)
+        except BaseException:
+            shutil.rmtree(partial, ignore_errors=True)
+            raise
+
+    def _write_copy(self, world: World, partial: Path, target: Path) -> None:
+        try:
+            self._write(world, partial, target, pipe=None)
+        except BaseException as error:  # Raised by the next poll or wait
+            self._thread_error = error
+
+    def _join(self) -> Path:
+        assert self._thread is not None and self.progress is not None
+        self._thread.join()
+        tick = self.progress.tick
+        self._thread, self.progress = None, None
+        if self._thread_error is not None:
+            error, self._thread_error = self._thread_error, None
+            raise CheckpointError(
+                f"Checkpoint of tick {tick} failed: {error}"
+            ) from error
+        target = self.path_for(tick)
+        self.completed.append(target)
+        return target
+
+    def _read_progress(self) -> None:
+        assert self._pipe is not None and self.progress is not None
+        while True:
+            try:
+                chunk = os.read(self._pipe, 4096)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            self._received += chunk
+        lines = self._received.split(b"\n")
+        self._received = lines.pop()
+        if lines:
+            written, total = (int(value) for value in lines[-1].split())
+            self.progress = CheckpointProgress(self.progress.tick, written, total)
+
+    def _collect(self, status: int) -> Path:
+        assert self._pipe is not None and self.progress is not None
+        os.close(self._pipe)
+        tick = self.progress.tick
+        self._pid, self._pipe, self.progress = None, None, None
+        target = self.path_for(tick)
+        if not os.WIFEXITED(status) or os.WEXITSTATUS(status) != 0:
+            shutil.rmtree(
+                self.directory / f".{target.name}.partial", ignore_errors=True
+            )
+            raise CheckpointError(
+                f"Checkpoint of tick {tick} failed (wait status {status})"
+            )
+        self.completed.append(target)
+        return target
+
+
+def latest_checkpoint(directory: Union[str, Path]) -> Optional[Path]:
+    """Find the most recent complete checkpoint in a directory.
+
+    Args:
+        directory (Union[str, Path]): The checkpoint directory
+
+    Returns:
+        Optional[Path]: The checkpoint of the highest tick, or None; load it
+        with ``load_world``
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return None
+    checkpoints = [
+        path
+        for path in directory.iterdir()
+        if path.is_dir() and _CHECKPOINT_PATTERN.match(path.name)
+    ]
+    if not checkpoints:
+        return None
+    return max(checkpoints, key=lambda path: path.name)
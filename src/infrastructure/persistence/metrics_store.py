@@ -0,0 +1,101 @@
+"""Chunked columnar storage of per-tick metrics."""
+import re
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from src.application.services.metrics import MetricsRecord
+
+_CHUNK_PATTERN = re.compile(r"^(\d{6})\.npy$")
+
+
+class ChunkedMetricsWriter:
+    """Appends metrics records to per-column chunked ``.npy`` files.
+
+    Every column (plus ``tick``) gets its own directory holding numbered
+    chunk files of up to ``chunk_size`` rows, so a long time series can be
+    loaded column by column without reading anything else. Reopening an
+    existing directory continues after its last chunk.
+
+    Attributes:
+        directory (Path): The metrics directory
+        chunk_size (int): Rows per chunk file
+    """
+
+    def __init__(self, directory: Union[str, Path], chunk_size: int = 1024) -> None:
+        """Open or create a metrics directory.
+
+        Args:
+            directory (Union[str, Path]): The metrics directory
+            chunk_size (int, optional): Rows per chunk file. Defaults to 1024.
+
+        Raises:
+            ValueError: If the chunk size is not positive
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self._rows: Dict[str, List[object]] = {}
+        self._next_chunk = len(_chunk_files(self.directory / "tick"))
+
+    def append(self, record: MetricsRecord) -> None:
+        """Buffer one record, writing a chunk once enough rows are buffered.
+
+        Args:
+            record (MetricsRecord): The metrics of one tick
+        """
+        self._rows.setdefault("tick", []).append(record.tick)
+        for column, value in record.values.items():
+            self._rows.setdefault(column, []).append(value)
+        if len(self._rows["tick"]) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows as a (possibly short) chunk."""
+        if not self._rows.get("tick"):
+            return
+        for column, rows in self._rows.items():
+            column_dir = self.directory / column
+            column_dir.mkdir(exist_ok=True)
+            np.save(column_dir / f"{self._next_chunk:06d}.npy", np.stack(rows))
+        self._next_chunk += 1
+        self._rows = {}
+
+    def close(self) -> None:
+        """Write any buffered rows."""
+        self.flush()
+
+    def __enter__(self) -> "ChunkedMetricsWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _chunk_files(column_dir: Path) -> List[Path]:
+    if not column_dir.is_dir():
+        return []
+    return sorted(
+        path for path in column_dir.iterdir() if _CHUNK_PATTERN.match(path.name)
+    )
+
+
+def load_metrics(directory: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """Load every metrics column of a directory written by the writer.
+
+    Args:
+        directory (Union[str, Path]): The metrics directory
+
+    Returns:
+        Dict[str, np.ndarray]: Columns by name, one row per tick
+    """
+    directory = Path(directory)
+    columns = {}
+    for column_dir in sorted(path for path in directory.iterdir() if path.is_dir()):
+        chunks = [np.load(path) for path in _chunk_files(column_dir)]
+        if chunks:
+            columns[column_dir.name] = np.concatenate(chunks)
+    return columns
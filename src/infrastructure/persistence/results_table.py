@@ -0,0 +1,82 @@
+"""Append-only CSV table of simulation run results."""
+import csv
+import os
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Set, Union
+
+
+class ResultsTable:
+    """A CSV results table that is durable row by row.
+
+    Every appended row is flushed and synced to disk before ``append``
+    returns, so a crash loses at most the run in progress. Reopening an
+    existing table keeps its rows and reports which runs are complete.
+
+    Attributes:
+        path (Path): The CSV file
+        columns (List[str]): The column names, starting with ``run_id``
+    """
+
+    def __init__(self, path: Union[str, Path], columns: Sequence[str]) -> None:
+        """Open or create a results table.
+
+        Args:
+            path (Union[str, Path]): The CSV file
+            columns (Sequence[str]): The columns of every row
+
+        Raises:
+            ValueError: If an existing file has different columns
+        """
+        self.path = Path(path)
+        self.columns = ["run_id"] + [name for name in columns if name != "run_id"]
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with open(self.path, newline="", encoding="utf-8") as table_file:
+                header = next(csv.reader(table_file), [])
+            if header != self.columns:
+                raise ValueError(
+                    f"Existing results table {self.path} has different columns"
+                )
+            self._discard_partial_row()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_line(self.columns)
+
+    def completed_run_ids(self) -> Set[str]:
+        """Get the ids of all runs that already have a complete row.
+
+        Returns:
+            Set[str]: The completed run ids
+        """
+        return {row["run_id"] for row in self.rows()}
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Read all complete rows of the table.
+
+        Returns:
+            List[Dict[str, str]]: The rows as column -> value mappings
+        """
+        with open(self.path, newline="", encoding="utf-8") as table_file:
+            reader = csv.DictReader(table_file)
+            return [row for row in reader if None not in row.values()]
+
+    def append(self, row: Mapping[str, object]) -> None:
+        """Append one run's results and sync them to disk.
+
+        Args:
+            row (Mapping[str, object]): Values by column; missing columns
+                are left empty
+        """
+        self._write_line([row.get(column, "") for column in self.columns])
+
+    def _discard_partial_row(self) -> None:
+        """Truncate a last row left without its newline by a crash."""
+        with open(self.path, "rb+") as table_file:
+            content = table_file.read()
+            if not content.endswith(b"\n"):
+                table_file.truncate(content.rfind(b"\n") + 1)
+
+    def _write_line(self, values: Sequence[object]) -> None:
+        with open(self.path, "a", newline="", encoding="utf-8") as table_file:
+            csv.writer(table_file).writerow(values)
+            table_file.flush()
+            os.fsync(table_file.fileno())
@@ -0,0 +1,70 @@
+"""Loading of declarative rule sets from JSON documents."""
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.domain.value_objects.rule_set import RuleDefinitionError, RuleSet
+
+# Built-in ecology used when no rule document is configured.
+# Terrain types: 0 = water, 1 = grassland, 2 = forest, 3 = rock
+DEFAULT_RULES: Dict[str, Any] = {
+    "parameters": {
+        "diffusion": 0.5,
+        "evaporation": 0.02,
+        "rain": 0.01,
+        "growth_rate": 0.1,
+        "spread": 0.05,
+        "decay": 0.02,
+    },
+    "fields": {
+        "terrain": {"dtype": "int8", "initial": "floor(random() * 4)"},
+        "moisture": {"dtype": "float32", "initial": "1.0 if terrain == 0 else 0.3"},
+        "biomass": {
+            "dtype": "float32",
+            "initial": "0.1 if terrain == 1 or terrain == 2 else 0.0",
+        },
+    },
+    "rules": [
+        {
+            "target": "moisture",
+            "expression": (
+                "1.0 if terrain == 0 else clip(moisture + diffusion * "
+                "(neighbor_mean(moisture) - moisture) - evaporation + rain, 0, 1)"
+            ),
+        },
+        {
+            "target": "biomass",
+            "expression": (
+                "clip(biomass + growth_rate * moisture * biomass * (1 - biomass)"
+                " + spread * neighbor_mean(biomass) * (random() < moisture)"
+                " - decay * biomass, 0, 1)"
+            ),
+            "where": "terrain == 1 or terrain == 2",
+        },
+    ],
+}
+
+
+def load_rule_set(path: Optional[Union[str, Path]] = None) -> RuleSet:
+    """Load a rule set from a JSON document.
+
+    Args:
+        path (Optional[Union[str, Path]], optional): Path of the rule
+            document. Defaults to None, which returns the built-in rules.
+
+    Returns:
+        RuleSet: The validated rule set
+
+    Raises:
+        RuleDefinitionError: If the file cannot be read or is malformed
+    """
+    if path is None:
+        return RuleSet.from_dict(DEFAULT_RULES)
+    try:
+        with open(path, encoding="utf-8") as rule_file:
+            data = json.load(rule_file)
+    except (OSError, json.JSONDecodeError) as error:
+        raise RuleDefinitionError(f"Cannot load rules from {path}: {error}") from error
+    if not isinstance(data, dict):
+        raise RuleDefinitionError(f"Rule document {path} must be a JSON object")
+    return RuleSet.from_dict(data)
@@ -0,0 +1,100 @@
+"""Directory-based persistence of world state."""
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+
+FORMAT_VERSION = 1
+_METADATA_FILE = "world.json"
+
+
+class WorldStoreError(Exception):
+    """Exception raised when a stored world cannot be read or written."""
+
+    pass
+
+
+def save_world(
+    world: World,
+    directory: Union[str, Path],
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Path:
+    """Write a world to a directory, one ``.npy`` file per cell field.
+
+    The metadata file is written last, through a temporary file and an
+    atomic rename, so a directory without it is an incomplete snapshot.
+
+    Args:
+        world (World): The world to save
+        directory (Union[str, Path]): Target directory, created if needed
+        progress (Optional[Callable[[int, int], None]], optional): Called
+            after each field with the field bytes written so far and in
+            total. Defaults to None.
+
+    Returns:
+        Path: The directory the world was written to
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    total = sum(values.nbytes for values in world.fields.values())
+    written = 0
+    for name, values in world.fields.items():
+        np.save(directory / f"{name}.npy", values)
+        written += values.nbytes
+        if progress is not None:
+            progress(written, total)
+
+    metadata = {
+        "version": FORMAT_VERSION,
+        "width": world.grid.dimensions.width,
+        "height": world.grid.dimensions.height,
+        "wrap": world.grid.wrap,
+        "tick": world.tick,
+        "fields": {name: str(values.dtype) for name, values in world.fields.items()},
+    }
+    temporary = directory / f"{_METADATA_FILE}.tmp"
+    temporary.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    os.replace(temporary, directory / _METADATA_FILE)
+    return directory
+
+
+def load_world(directory: Union[str, Path], mmap: bool = False) -> World:
+    """Read a world written by ``save_world``.
+
+    Args:
+        directory (Union[str, Path]): The snapshot directory
+        mmap (bool, optional): Map the field files read-only instead of
+            reading them into memory, so that several processes share the
+            same pages. Defaults to False.
+
+    Returns:
+        World: The loaded world
+
+    Raises:
+        WorldStoreError: If the snapshot is missing, incomplete or corrupt
+    """
+    directory = Path(directory)
+    try:
+        metadata = json.loads((directory / _METADATA_FILE).read_text("utf-8"))
+        if metadata.get("version") != FORMAT_VERSION:
+            raise WorldStoreError(
+                f"Unsupported world format version {metadata.get('version')}"
+            )
+        grid = HexGrid(
+            GridDimensions(metadata["width"], metadata["height"]),
+            # Worlds written before toroidal grids existed are bounded
+            wrap=bool(metadata.get("wrap", False)),
+        )
+        fields = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in metadata["fields"]
+        }
+        return World(grid=grid, fields=fields, tick=metadata["tick"])
+    except (OSError, ValueError, KeyError) as error:
+        raise WorldStoreError(f"Cannot load world from {directory}: {error}") from error
@@ -0,0 +1,5 @@
+"""Repositories providing access to stored worlds."""
+
+from .chunked_world_repository import ChunkedWorldRepository, ChunkStoreError
+
+__all__ = ["ChunkedWorldRepository", "ChunkStoreError"]
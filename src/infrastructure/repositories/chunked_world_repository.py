@@ -0,0 +1,399 @@
+"""Chunked, memory-mapped storage of worlds larger than memory."""
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Tuple, Union
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+_METADATA_FILE = "chunks.json"
+_DATA_FILE = "chunks.bin"
+
+ChunkKey = Tuple[int, int]
+_ChunkSlices = Tuple[ChunkKey, Tuple[slice, slice], Tuple[slice, slice]]
+
+
+class ChunkStoreError(Exception):
+    """Exception raised when a chunked world cannot be opened or created."""
+
+    pass
+
+
+@dataclass
+class _Chunk:
+    """A chunk paged into memory: one square array per field."""
+
+    fields: Dict[str, np.ndarray]
+    dirty: bool = False
+
+
+class ChunkedWorldRepository:
+    """A world stored as square chunks in a memory-mapped chunk file.
+
+    The grid is split into ``chunk_size`` x ``chunk_size`` chunks. Each
+    chunk is one fixed-size record of the chunk file holding a block per
+    cell field, so a chunk is paged in with a single contiguous read. Paged
+    in chunks are kept in memory up to ``memory_budget`` bytes and the least
+    recently used chunk is evicted first; modified chunks are written back
+    on eviction and on ``flush``.
+
+    Windows of the world are read into regular ``World`` objects and written
+    back from field arrays, so the step engine can update the world tile by
+    tile. All methods are safe to call from several threads.
+
+    Attributes:
+        directory (Path): The directory holding the chunk file
+        chunk_size (int): The number of rows and columns per chunk
+        memory_budget (int): The maximum bytes of paged in chunks
+        page_ins (int): The number of chunks read from the chunk file
+        evictions (int): The number of chunks dropped from memory
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> None:
+        """Open an existing chunked world.
+
+        Args:
+            directory (Union[str, Path]): The directory written by ``create``
+            memory_budget (int, optional): The maximum bytes of paged in
+                chunks. Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Raises:
+            ChunkStoreError: If the chunked world is missing or corrupt
+            ValueError: If the budget cannot hold a single chunk
+        """
+        self.directory = Path(directory)
+        try:
+            metadata = json.loads((self.directory / _METADATA_FILE).read_text("utf-8"))
+            if metadata.get("version") != FORMAT_VERSION:
+                raise ChunkStoreError(
+                    f"Unsupported chunk format version {metadata.get('version')}"
+                )
+            self._grid = HexGrid(
+                GridDimensions(metadata["width"], metadata["height"]),
+                wrap=bool(metadata.get("wrap", False)),
+            )
+            self.chunk_size = int(metadata["chunk_size"])
+            self._tick = int(metadata["tick"])
+            self._dtypes = {
+                name: np.dtype(dtype) for name, dtype in metadata["fields"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            raise ChunkStoreError(
+                f"Cannot open chunked world in {self.directory}: {error}"
+            ) from error
+        self._metadata = metadata
+
+        cells = self.chunk_size * self.chunk_size
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        offset = 0
+        for name, dtype in self._dtypes.items():
+            self._blocks[name] = (offset, offset + cells * dtype.itemsize)
+            offset += _block_size(dtype, cells)
+        self._record_size = offset
+        dimensions = self._grid.dimensions
+        self._chunks_q = math.ceil(dimensions.width / self.chunk_size)
+        self._chunks_r = math.ceil(dimensions.height / self.chunk_size)
+
+        if memory_budget < self._record_size:
+            raise ValueError(
+                f"Memory budget of {memory_budget} bytes cannot hold a chunk "
+                f"of {self._record_size} bytes"
+            )
+        self.memory_budget = memory_budget
+        self.page_ins = 0
+        self.evictions = 0
+        self._resident: "OrderedDict[ChunkKey, _Chunk]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        data_path = self.directory / _DATA_FILE
+        expected = self._chunks_q * self._chunks_r * self._record_size
+        try:
+            if data_path.stat().st_size != expected:
+                raise ChunkStoreError(
+                    f"Chunk file {data_path} should hold {expected} bytes"
+                )
+            self._data: np.memmap = np.memmap(
+                data_path,
+                dtype=np.uint8,
+                mode="r+",
+                shape=(self._chunks_q * self._chunks_r, self._record_size),
+            )
+        except OSError as error:
+            raise ChunkStoreError(f"Cannot map {data_path}: {error}") from error
+
+    @classmethod
+    def create(
+        cls,
+        directory: Union[str, Path],
+        dimensions: GridDimensions,
+        field_dtypes: Mapping[str, Union[str, np.dtype]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        wrap: bool = False,
+    ) -> "ChunkedWorldRepository":
+        """Create a chunked world with every field set to zero.
+
+        The chunk file is allocated sparsely, so creating a large world is
+        cheap until its chunks are written.
+
+        Args:
+            directory (Union[str, Path]): Target directory, created if needed
+            dimensions (GridDimensions): The dimensions of the grid
+            field_dtypes (Mapping[str, Union[str, np.dtype]]): The dtype of
+                every cell field
+            chunk_size (int, optional): The number of rows and columns per
+                chunk. Defaults to DEFAULT_CHUNK_SIZE.
+            memory_budget (int, optional): The maximum bytes of paged in
+                chunks. Defaults to DEFAULT_MEMORY_BUDGET.
+            wrap (bool, optional): Store a toroidal grid. Defaults to False.
+
+        Returns:
+            ChunkedWorldRepository: The opened repository, at tick 0
+
+        Raises:
+            ValueError: If the chunk size is not positive or no field is given
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        if not field_dtypes:
+            raise ValueError("A chunked world needs at least one field")
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        metadata = {
+            "version": FORMAT_VERSION,
+            "width": dimensions.width,
+            "height": dimensions.height,
+            "wrap": wrap,
+            "chunk_size": chunk_size,
+            "tick": 0,
+            "fields": {
+                name: np.dtype(dtype).name for name, dtype in field_dtypes.items()
+            },
+        }
+        chunk_count = math.ceil(dimensions.width / chunk_size) * math.ceil(
+            dimensions.height / chunk_size
+        )
+        # Size the chunk file before publishing the metadata
+        with open(directory / _DATA_FILE, "wb") as data_file:
+            data_file.truncate(chunk_count * _record_size(field_dtypes, chunk_size))
+        _write_metadata(directory, metadata)
+        return cls(directory, memory_budget)
+
+    @property
+    def grid(self) -> HexGrid:
+        """HexGrid: The grid of the stored world."""
+        return self._grid
+
+    @property
+    def tick(self) -> int:
+        """int: The tick of the stored world, saved by ``flush``."""
+        return self._tick
+
+    @tick.setter
+    def tick(self, value: int) -> None:
+        self._tick = value
+
+    @property
+    def field_dtypes(self) -> Mapping[str, np.dtype]:
+        """Mapping[str, np.dtype]: The dtype of every stored cell field."""
+        return dict(self._dtypes)
+
+    @property
+    def resident_chunks(self) -> int:
+        """int: The number of chunks currently paged into memory."""
+        return len(self._resident)
+
+    def read_region(self, region: GridRegion) -> World:
+        """Copy a window of the stored world into a world of the window's size.
+
+        Args:
+            region (GridRegion): The window to read, inside the grid
+
+        Returns:
+            World: A world holding copies of the window's cells
+
+        Raises:
+            ValueError: If the window is not inside the grid
+        """
+        self._check_region(region)
+        shape = (region.height, region.width)
+        fields = {name: np.empty(shape, dtype) for name, dtype in self._dtypes.items()}
+        with self._lock:
+            for key, in_chunk, in_region in self._chunk_slices(region):
+                chunk = self._chunk(key, load=True)
+                for name, values in fields.items():
+                    values[in_region] = chunk.fields[name][in_chunk]
+        return World(
+            grid=HexGrid(region.dimensions),
+            fields={name: values.reshape(-1) for name, values in fields.items()},
+            tick=self._tick,
+        )
+
+    def write_region(
+        self, region: GridRegion, fields: Mapping[str, np.ndarray]
+    ) -> None:
+        """Overwrite a window of the stored world.
+
+        Args:
+            region (GridRegion): The window to write, inside the grid
+            fields (Mapping[str, np.ndarray]): New values by field name,
+                either flat in the window's row-major order or shaped
+                (height, width). Fields not given keep their values.
+
+        Raises:
+            ValueError: If the window is not inside the grid or an array
+                does not have one value per cell of the window
+            UnknownCellField: If a field is not stored
+        """
+        self._check_region(region)
+        shape = (region.height, region.width)
+        rows: Dict[str, np.ndarray] = {}
+        for name, values in fields.items():
+            if name not in self._dtypes:
+                raise UnknownCellField(f"Unknown cell field '{name}'")
+            if np.size(values) != region.cell_count:
+                raise ValueError(
+                    f"Cell field '{name}' needs {region.cell_count} values for "
+                    f"{region}, got {np.size(values)}"
+                )
+            rows[name] = np.reshape(values, shape)
+        every_field = set(rows) == set(self._dtypes)
+        with self._lock:
+            for key, in_chunk, in_region in self._chunk_slices(region):
+                # Chunks that are overwritten entirely need not be read first
+                covered = every_field and self._covers_chunk(key, in_chunk)
+                chunk = self._chunk(key, load=not covered)
+                for name, values in rows.items():
+                    chunk.fields[name][in_chunk] = values[in_region]
+                chunk.dirty = True
+
+    def flush(self) -> None:
+        """Write every modified chunk and the current tick to disk."""
+        with self._lock:
+            for key, chunk in self._resident.items():
+                if chunk.dirty:
+                    self._write_back(key, chunk)
+            self._data.flush()
+            self._metadata["tick"] = self._tick
+            _write_metadata(self.directory, self._metadata)
+
+    def close(self) -> None:
+        """Flush the repository and drop every paged in chunk."""
+        with self._lock:
+            self.flush()
+            self._resident.clear()
+
+    def __enter__(self) -> "ChunkedWorldRepository":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _check_region(self, region: GridRegion) -> None:
+        if region.clipped_to(self._grid.dimensions) != region:
+            raise ValueError(f"{region} is not inside {self._grid.dimensions}")
+
+    def _chunk_slices(self, region: GridRegion) -> Iterator[_ChunkSlices]:
+        """Yield each chunk overlapping a window with the overlap's slices."""
+        size = self.chunk_size
+        for chunk_r in range(
+            region.r // size, (region.r + region.height - 1) // size + 1
+        ):
+            top = max(region.r, chunk_r * size)
+            bottom = min(region.r + region.height, (chunk_r + 1) * size)
+            for chunk_q in range(
+                region.q // size, (region.q + region.width - 1) // size + 1
+            ):
+                left = max(region.q, chunk_q * size)
+                right = min(region.q + region.width, (chunk_q + 1) * size)
+                in_chunk = (
+                    slice(top - chunk_r * size, bottom - chunk_r * size),
+                    slice(left - chunk_q * size, right - chunk_q * size),
+                )
+                in_region = (
+                    slice(top - region.r, bottom - region.r),
+                    slice(left - region.q, right - region.q),
+                )
+                yield (chunk_q, chunk_r), in_chunk, in_region
+
+    def _covers_chunk(self, key: ChunkKey, in_chunk: Tuple[slice, slice]) -> bool:
+        """Check whether a slice spans every cell of a chunk inside the grid."""
+        dimensions = self._grid.dimensions
+        rows = min(self.chunk_size, dimensions.height - key[1] * self.chunk_size)
+        columns = min(self.chunk_size, dimensions.width - key[0] * self.chunk_size)
+        return in_chunk == (slice(0, rows), slice(0, columns))
+
+    def _chunk(self, key: ChunkKey, load: bool) -> _Chunk:
+        """Get a chunk, paging it in and evicting others as needed."""
+        chunk = self._resident.get(key)
+        if chunk is not None:
+            self._resident.move_to_end(key)
+            return chunk
+        while (len(self._resident) + 1) * self._record_size > self.memory_budget:
+            evicted_key, evicted = self._resident.popitem(last=False)
+            if evicted.dirty:
+                self._write_back(evicted_key, evicted)
+            self.evictions += 1
+
+        shape = (self.chunk_size, self.chunk_size)
+        if load:
+            chunk = _Chunk(
+                {name: np.array(self._view(key, name)) for name in self._dtypes}
+            )
+            self.page_ins += 1
+        else:
+            chunk = _Chunk(
+                {name: np.zeros(shape, dtype) for name, dtype in self._dtypes.items()}
+            )
+        self._resident[key] = chunk
+        return chunk
+
+    def _write_back(self, key: ChunkKey, chunk: _Chunk) -> None:
+        for name, values in chunk.fields.items():
+            self._view(key, name)[...] = values
+        chunk.dirty = False
+
+    def _view(self, key: ChunkKey, name: str) -> np.ndarray:
+        """Map the block of one field of one chunk in the chunk file."""
+        start, end = self._blocks[name]
+        record = key[1] * self._chunks_q + key[0]
+        block: np.ndarray = self._data[record, start:end].view(self._dtypes[name])
+        return block.reshape(self.chunk_size, self.chunk_size)
+
+    def __str__(self) -> str:
+        return (
+            f"ChunkedWorldRepository({self._grid.dimensions}, "
+            f"chunk_size={self.chunk_size}, resident={self.resident_chunks})"
+        )
+
+
+def _block_size(dtype: Union[str, np.dtype], cells: int) -> int:
+    """Bytes of one field block, padded to keep every block 8-byte aligned."""
+    return -(-cells * np.dtype(dtype).itemsize // 8) * 8
+
+
+def _record_size(
+    field_dtypes: Mapping[str, Union[str, np.dtype]], chunk_size: int
+) -> int:
+    cells = chunk_size * chunk_size
+    return sum(_block_size(dtype, cells) for dtype in field_dtypes.values())
+
+
+def _write_metadata(directory: Path, metadata: Dict[str, object]) -> None:
+    temporary = directory / f"{_METADATA_FILE}.tmp"
+    temporary.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    os.replace(temporary, directory / _METADATA_FILE)
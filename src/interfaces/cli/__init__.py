@@ -0,0 +1,9 @@
+"""Headless command line interface."""
+import os
+
+# Raw frame recordings own stdout, so pygame must not print its banner there
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from .app import main  # noqa: E402
+
+__all__ = ["main"]
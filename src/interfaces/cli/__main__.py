@@ -0,0 +1,6 @@
+"""Allow running the headless CLI with ``python -m src.interfaces.cli``."""
+import sys
+
+from .app import main
+
+sys.exit(main())
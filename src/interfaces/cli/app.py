@@ -0,0 +1,193 @@
+"""Headless command line interface of the simulation."""
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from src.application.services.backends import BACKENDS
+from src.application.services.memory_report import (
+    AllocationTrace,
+    engine_memory_report,
+    trace_tick_allocations,
+)
+from src.application.services.metrics import attach_metrics
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.use_cases.backend_equivalence import BackendMismatch
+from src.application.use_cases.parameter_sweep import (
+    expand_parameter_grid,
+    summarize_world,
+)
+from src.config import display, simulation
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.rule_set import RuleDefinitionError
+from src.infrastructure.persistence.checkpoints import CheckpointError, ForkCheckpointer
+from src.infrastructure.persistence.metrics_store import ChunkedMetricsWriter
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.infrastructure.persistence.world_store import WorldStoreError, save_world
+
+from .compare import add_compare_parser, run_compare
+from .record import add_record_parser, run_record
+from .serve import add_serve_parser, run_serve
+from .sweep import add_sweep_parser, run_sweep
+
+# Ticks that let buffers settle before allocations are measured
+_TRACE_WARMUP = 10
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with every subcommand.
+
+    Returns:
+        argparse.ArgumentParser: The CLI parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="hexlife", description="Headless HexLife simulation tools"
+    )
+    parser.add_argument("--width", type=int, default=display.GRID_WIDTH)
+    parser.add_argument("--height", type=int, default=display.GRID_HEIGHT)
+    parser.add_argument(
+        "--wrap",
+        action="store_true",
+        default=display.GRID_WRAP,
+        help="join opposite edges into a toroidal grid",
+    )
+    parser.add_argument(
+        "--rules", default=simulation.RULES_PATH, help="JSON rule document"
+    )
+    parser.add_argument("--ticks", type=int, default=100, help="ticks per run")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=simulation.BACKEND,
+        help="step backend of run, record and serve",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run a single simulation")
+    run_parser.add_argument("--seed", type=int, default=simulation.SEED)
+    run_parser.add_argument(
+        "--save", type=Path, help="directory to save the final world to"
+    )
+    run_parser.add_argument(
+        "--metrics", type=Path, help="directory to record per-tick metrics to"
+    )
+    run_parser.add_argument(
+        "--checkpoint", type=Path, help="directory to write periodic checkpoints to"
+    )
+    run_parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=simulation.CHECKPOINT_INTERVAL,
+        help="ticks between checkpoints",
+    )
+    run_parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="print the memory held by each subsystem after the run",
+    )
+    run_parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="trace the tick loop's allocations with tracemalloc",
+    )
+    add_sweep_parser(subparsers)
+    add_record_parser(subparsers)
+    add_serve_parser(subparsers)
+    add_compare_parser(subparsers)
+    return parser
+
+
+def _run(args: argparse.Namespace, grid: HexGrid) -> int:
+    engine = SimulationEngine.from_rule_set(
+        load_rule_set(args.rules), grid, args.seed, args.backend
+    )
+    checkpoints = None
+    if args.checkpoint is not None:
+        checkpoints = ForkCheckpointer(
+            args.checkpoint, args.checkpoint_every, fork=simulation.CHECKPOINT_FORK
+        )
+        engine.add_stage(checkpoints)
+
+    def advance() -> Optional[AllocationTrace]:
+        if not args.trace_allocations:
+            engine.run(args.ticks)
+            return None
+        warmup = max(0, min(_TRACE_WARMUP, args.ticks - 1))
+        return trace_tick_allocations(engine, args.ticks - warmup, warmup)
+
+    if args.metrics is not None:
+        writer = ChunkedMetricsWriter(args.metrics, simulation.METRICS_CHUNK_SIZE)
+        stage = attach_metrics(
+            engine,
+            writer.append,
+            counts=dict(simulation.METRIC_COUNTS),
+            totals=simulation.METRIC_TOTALS,
+            histograms=simulation.METRIC_HISTOGRAMS,
+            state_hash=simulation.METRIC_HASH,
+        )
+        with writer:
+            trace = advance()
+            stage.close()
+    else:
+        trace = advance()
+    if checkpoints is not None:
+        checkpoints.close()
+        mode = f" ({checkpoints.mode})" if checkpoints.mode else ""
+        print(f"checkpoints: {len(checkpoints.completed)}{mode}")
+    for name, value in summarize_world(engine.world).items():
+        print(f"{name}: {value:.6g}")
+    if args.memory_report:
+        print(engine_memory_report(engine).format())
+    if trace is not None:
+        print(trace.format())
+    if args.save is not None:
+        save_world(engine.world, args.save)
+    return 0
+
+
+def _sweep(args: argparse.Namespace, grid: HexGrid) -> int:
+    parameter_grid = {}
+    for parameter in args.param:
+        parameter_grid.update(parameter)
+    rule_set = load_rule_set(args.rules)
+    unknown = set(parameter_grid) - set(rule_set.parameters)
+    if unknown:
+        raise RuleDefinitionError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    runs = expand_parameter_grid(parameter_grid, args.seeds)
+    failures = run_sweep(rule_set, grid, runs, args.ticks, args.output, args.workers)
+    return 1 if failures else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the headless CLI.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Arguments without the
+            program name. Defaults to None (use ``sys.argv``).
+
+    Returns:
+        int: The process exit code
+    """
+    args = build_parser().parse_args(argv)
+    commands = {
+        "run": _run,
+        "sweep": _sweep,
+        "record": run_record,
+        "serve": run_serve,
+        "compare-backends": run_compare,
+    }
+    try:
+        grid = HexGrid(GridDimensions(args.width, args.height), wrap=args.wrap)
+        return commands[args.command](args, grid)
+    except (
+        RuleDefinitionError,
+        WorldStoreError,
+        CheckpointError,
+        BackendMismatch,
+        ValueError,
+        RuntimeError,
+        OSError,
+    ) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
@@ -0,0 +1,61 @@
+"""Backend comparison command of the headless CLI."""
+import argparse
+from typing import List
+
+from src.application.services.backends import BACKENDS, available_backends
+from src.application.use_cases.backend_equivalence import compare_backends
+from src.domain.entities.grid import HexGrid
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+from .sweep import parse_seeds
+
+
+def _parse_backends(text: str) -> List[str]:
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BACKENDS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid backends '{text}', choose from {', '.join(BACKENDS)}"
+        )
+    return names
+
+
+def add_compare_parser(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the ``compare-backends`` command.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The CLI's subcommands
+    """
+    parser = subparsers.add_parser(
+        "compare-backends",
+        help="check that every step backend produces identical worlds and time them",
+    )
+    parser.add_argument(
+        "--backends",
+        type=_parse_backends,
+        default=available_backends(),
+        help="comma-separated backends, the first is the reference",
+    )
+    parser.add_argument(
+        "--seeds", type=parse_seeds, default=[0, 1, 2], help="seeds, e.g. 0-9"
+    )
+
+
+def run_compare(args: argparse.Namespace, grid: HexGrid) -> int:
+    """Run random worlds through the chosen backends and print their timings.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments
+        grid (HexGrid): The grid of every world
+
+    Returns:
+        int: The process exit code
+
+    Raises:
+        BackendMismatch: If two backends produced different worlds
+    """
+    report = compare_backends(
+        load_rule_set(args.rules), grid, args.backends, args.seeds, args.ticks
+    )
+    print(report.format())
+    return 0
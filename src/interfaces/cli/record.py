@@ -0,0 +1,126 @@
+"""Off-screen frame recording command of the headless CLI."""
+import argparse
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import pygame
+
+from src.application.services.simulation_engine import SimulationEngine
+from src.config import colors, display, simulation
+from src.domain.entities.grid import HexGrid
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellPalette
+from src.interfaces.pygame_adapter.rendering.frame_export import (
+    FrameExporter,
+    FrameSink,
+    PngFrameSink,
+    RawFrameSink,
+)
+from src.interfaces.pygame_adapter.rendering.grid_display import (
+    DisplayConfig,
+    GridDisplay,
+)
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    """Parse a frame size such as ``1280x720``."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid frame size '{text}'") from None
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"invalid frame size '{text}'")
+    return width, height
+
+
+def add_record_parser(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the ``record`` command.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The CLI's subcommands
+    """
+    parser = subparsers.add_parser(
+        "record", help="render frames of a run off-screen, e.g. for a timelapse"
+    )
+    parser.add_argument("--seed", type=int, default=simulation.SEED)
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="directory for numbered PNG frames, or - for raw RGB24 on stdout",
+    )
+    parser.add_argument(
+        "--every", type=int, default=1, help="ticks between recorded frames"
+    )
+    parser.add_argument(
+        "--size",
+        type=_parse_size,
+        default=display.WINDOW_SIZE,
+        metavar="WIDTHxHEIGHT",
+        help="frame size in pixels",
+    )
+
+
+def run_record(args: argparse.Namespace, grid: HexGrid) -> int:
+    """Simulate a run and export a frame every ``args.every`` ticks.
+
+    Frames are rendered into a plain surface, so no display is needed.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments
+        grid (HexGrid): The grid to simulate
+
+    Returns:
+        int: The process exit code
+
+    Raises:
+        ValueError: If the frame interval is not positive
+    """
+    if args.every <= 0:
+        raise ValueError("Frame interval must be a positive number of ticks")
+    engine = SimulationEngine.from_rule_set(
+        load_rule_set(args.rules), grid, args.seed, args.backend
+    )
+    surface = pygame.Surface(args.size)
+    grid_display = GridDisplay(
+        grid=grid,
+        config=DisplayConfig(
+            hex_size=display.HEX_SIZE,
+            background_color=colors.BACKGROUND,
+            line_color=colors.GRID_LINES,
+            line_width=display.GRID_LINE_WIDTH,
+            padding=display.GRID_PADDING,
+            outline=display.GRID_OUTLINE,
+            palette=CellPalette(
+                terrain_colors=colors.TERRAIN,
+                plant_colors=colors.PLANTS,
+                plant_threshold=colors.PLANT_THRESHOLD,
+            ),
+            auto_fit=True,
+        ),
+        surface=surface,
+    )
+    raw = args.output == "-"
+    sink: FrameSink
+    if raw:
+        sink = RawFrameSink(sys.stdout.buffer)
+    else:
+        sink = PngFrameSink(Path(args.output))
+
+    exporter = FrameExporter(sink, max_pending=display.RECORD_MAX_PENDING)
+    try:
+        grid_display.render(engine.world)
+        exporter.submit(surface)
+        for tick in range(1, args.ticks + 1):
+            engine.step()
+            if tick % args.every == 0:
+                grid_display.render(engine.world)
+                exporter.submit(surface)
+    finally:
+        exporter.close()
+    # Raw frames own stdout, so the summary goes to stderr
+    print(
+        f"frames: {exporter.frames_written} ({args.size[0]}x{args.size[1]})",
+        file=sys.stderr if raw else sys.stdout,
+    )
+    return 0
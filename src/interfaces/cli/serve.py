@@ -0,0 +1,63 @@
+"""Observer server command of the headless CLI."""
+import argparse
+import time
+
+from src.application.services.simulation_engine import SimulationEngine
+from src.config import simulation
+from src.domain.entities.grid import HexGrid
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.interfaces.observer.protocol import parse_address
+from src.interfaces.observer.server import ObserverServer
+
+
+def add_serve_parser(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the ``serve`` command.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The CLI's subcommands
+    """
+    parser = subparsers.add_parser(
+        "serve", help="run a simulation and stream it to observer viewers"
+    )
+    parser.add_argument("--seed", type=int, default=simulation.SEED)
+    parser.add_argument(
+        "--listen",
+        default=simulation.OBSERVER_ADDRESS,
+        help="HOST:PORT or unix:PATH to accept observers on",
+    )
+    parser.add_argument(
+        "--tps",
+        type=float,
+        default=simulation.TICKS_PER_SECOND,
+        help="ticks per second, 0 for as fast as possible",
+    )
+
+
+def run_serve(args: argparse.Namespace, grid: HexGrid) -> int:
+    """Simulate ``args.ticks`` ticks, or until interrupted if 0, while serving.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments
+        grid (HexGrid): The grid to simulate
+
+    Returns:
+        int: The process exit code
+    """
+    engine = SimulationEngine.from_rule_set(
+        load_rule_set(args.rules), grid, args.seed, args.backend
+    )
+    interval = 1.0 / args.tps if args.tps > 0 else 0.0
+    with ObserverServer(parse_address(args.listen)) as server:
+        server(engine.world)
+        engine.add_stage(server)
+        print(f"serving on {server.address}", flush=True)
+        deadline = time.monotonic()
+        try:
+            while args.ticks <= 0 or engine.tick < args.ticks:
+                engine.step()
+                deadline += interval
+                time.sleep(max(0.0, deadline - time.monotonic()))
+        except KeyboardInterrupt:
+            pass
+    print(f"ticks: {engine.tick}")
+    return 0
@@ -0,0 +1,275 @@
+"""Parameter sweep command of the headless CLI."""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+
+from src.application.services.random_streams import CounterRNG
+from src.application.services.rule_compiler import CompiledRuleSet
+from src.application.use_cases.parameter_sweep import SweepRun, execute_run
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.rule_set import RuleSet
+from src.infrastructure.persistence.results_table import ResultsTable
+from src.infrastructure.persistence.world_store import load_world, save_world
+
+
+@dataclass(frozen=True)
+class _SweepTask:
+    """Everything a pool worker needs to execute one run."""
+
+    rule_set: RuleSet
+    grid: HexGrid
+    run: SweepRun
+    ticks: int
+    initial_state: str
+
+
+def _execute_task(task: _SweepTask) -> Dict[str, float]:
+    """Execute one run in a pool worker, mapping the shared initial state."""
+    initial_world = load_world(task.initial_state, mmap=True)
+    return execute_run(task.rule_set, task.grid, task.run, task.ticks, initial_world)
+
+
+def _initial_state_key(rule_set: RuleSet, grid: HexGrid, run: SweepRun) -> str:
+    """Identify the initial world of a run.
+
+    Runs that share the seed and every parameter read by initial-value
+    expressions start from the same world, so it is generated only once.
+    """
+    referenced = set()
+    for spec in rule_set.fields:
+        if isinstance(spec.initial, str):
+            tree = ast.parse(spec.initial, mode="eval")
+            referenced |= {
+                node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+            }
+    parameters = rule_set.with_parameters(run.parameters).parameters
+    key = {
+        "seed": run.seed,
+        "grid": [grid.dimensions.width, grid.dimensions.height, grid.wrap],
+        "fields": [[spec.name, spec.dtype, spec.initial] for spec in rule_set.fields],
+        "parameters": {
+            name: parameters[name] for name in sorted(referenced & set(parameters))
+        },
+    }
+    digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _prepare_initial_state(
+    rule_set: RuleSet, grid: HexGrid, run: SweepRun, cache_dir: Path
+) -> str:
+    """Create (or reuse) the cached initial world of a run on disk."""
+    directory = cache_dir / _initial_state_key(rule_set, grid, run)
+    if not (directory / "world.json").exists():
+        rules = CompiledRuleSet(rule_set.with_parameters(run.parameters), grid)
+        save_world(rules.create_world(CounterRNG(run.seed)), directory)
+    return str(directory)
+
+
+def _sweep_configuration(rule_set: RuleSet, grid: HexGrid, ticks: int) -> Any:
+    """Describe everything besides seed and parameters that a result depends on."""
+    rules = json.dumps(asdict(rule_set), sort_keys=True).encode("utf-8")
+    return {
+        "grid": [grid.dimensions.width, grid.dimensions.height, grid.wrap],
+        "ticks": ticks,
+        "rules": hashlib.sha1(rules).hexdigest(),
+    }
+
+
+def _check_configuration(output_dir: Path, configuration: Any) -> None:
+    """Record the sweep configuration, refusing to mix it with another one."""
+    path = output_dir / "sweep.json"
+    if path.exists():
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+        if recorded != configuration:
+            raise ValueError(
+                f"Results in {output_dir} were written with another grid, tick "
+                f"count or rule set ({recorded}); use a new output directory"
+            )
+        return
+    if (output_dir / "results.csv").exists():
+        raise ValueError(
+            f"Results in {output_dir} have no recorded configuration; "
+            f"use a new output directory"
+        )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(configuration, indent=2), encoding="utf-8")
+
+
+def sweep_columns(rule_set: RuleSet, parameter_names: Sequence[str]) -> List[str]:
+    """Get the results table columns of a sweep.
+
+    Args:
+        rule_set (RuleSet): The swept rule set
+        parameter_names (Sequence[str]): The swept parameters
+
+    Returns:
+        List[str]: The column names, after ``run_id``
+    """
+    metrics = []
+    for name in sorted(spec.name for spec in rule_set.fields):
+        metrics += [f"{name}_mean", f"{name}_sum"]
+    return ["seed"] + sorted(parameter_names) + metrics + ["ticks", "elapsed_seconds"]
+
+
+def run_sweep(
+    rule_set: RuleSet,
+    grid: HexGrid,
+    runs: Sequence[SweepRun],
+    ticks: int,
+    output_dir: Path,
+    workers: int,
+) -> int:
+    """Execute every unfinished run of a sweep over a process pool.
+
+    Initial worlds are generated once, saved under ``output_dir/cache`` and
+    memory-mapped read-only by the workers, so runs sharing a terrain share
+    its pages. Only two runs per worker are submitted at a time, the next
+    one as soon as a run finishes, so an idle worker always picks up the
+    next run, long runs never hold back a batch and large sweeps do not
+    queue every task up front. Each finished run is appended to
+    ``output_dir/results.csv`` immediately; runs already in the table are
+    skipped.
+
+    Run ids only cover the seed and parameters, so the grid, tick count
+    and rule set are recorded in ``output_dir/sweep.json``, and resuming
+    with a different configuration is refused rather than mixing two
+    experiments in one table.
+
+    Args:
+        rule_set (RuleSet): The base rules
+        grid (HexGrid): The grid to simulate
+        runs (Sequence[SweepRun]): Every run of the sweep
+        ticks (int): Ticks per run
+        output_dir (Path): Directory of the results table and cache
+        workers (int): Number of worker processes
+
+    Returns:
+        int: The number of runs that failed
+
+    Raises:
+        ValueError: If the output directory holds results of a sweep with
+            another configuration
+    """
+    _check_configuration(output_dir, _sweep_configuration(rule_set, grid, ticks))
+    parameter_names = sorted({name for run in runs for name in run.parameters})
+    table = ResultsTable(
+        output_dir / "results.csv", sweep_columns(rule_set, parameter_names)
+    )
+    completed = table.completed_run_ids()
+    pending = [run for run in runs if run.run_id not in completed]
+    print(f"{len(runs) - len(pending)} of {len(runs)} runs already complete")
+
+    tasks = [
+        _SweepTask(
+            rule_set=rule_set,
+            grid=grid,
+            run=run,
+            ticks=ticks,
+            initial_state=_prepare_initial_state(
+                rule_set, grid, run, output_dir / "cache"
+            ),
+        )
+        for run in pending
+    ]
+
+    failures = 0
+    remaining: Iterator[_SweepTask] = iter(tasks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Dict[Future, SweepRun] = {}
+
+        def submit_next() -> None:
+            task = next(remaining, None)
+            if task is not None:
+                in_flight[pool.submit(_execute_task, task)] = task.run
+
+        for _slot in range(2 * workers):
+            submit_next()
+        while in_flight:
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                run = in_flight.pop(future)
+                submit_next()
+                try:
+                    summary = future.result()
+                except Exception as error:  # A failed run must not end the sweep
+                    failures += 1
+                    print(f"run {run.run_id} failed: {error}", file=sys.stderr)
+                    continue
+                table.append(
+                    {
+                        "run_id": run.run_id,
+                        "seed": run.seed,
+                        **run.parameters,
+                        **summary,
+                    }
+                )
+                print(f"run {run.run_id} done in {summary['elapsed_seconds']:.2f}s")
+    return failures
+
+
+def _parse_parameter(text: str) -> Dict[str, List[float]]:
+    name, separator, values = text.partition("=")
+    if not separator or not name or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2,... got '{text}'")
+    try:
+        return {name: [float(value) for value in values.split(",")]}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid values in '{text}'") from None
+
+
+def parse_seeds(text: str) -> List[int]:
+    """Parse a seed list such as ``0-9`` or ``1,5,7``.
+
+    Args:
+        text (str): Comma-separated seeds and inclusive ranges
+
+    Returns:
+        List[int]: The seeds in the given order
+
+    Raises:
+        argparse.ArgumentTypeError: If the text is not a seed list
+    """
+    seeds: List[int] = []
+    try:
+        for part in text.split(","):
+            first, _, last = part.partition("-")
+            seeds += range(int(first), int(last or first) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seeds '{text}'") from None
+    return seeds
+
+
+def add_sweep_parser(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the ``sweep`` command.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The CLI's subcommands
+    """
+    parser = subparsers.add_parser(
+        "sweep", help="run a grid of seeds and parameters over a process pool"
+    )
+    parser.add_argument(
+        "--param",
+        type=_parse_parameter,
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="values of a rule parameter to sweep (repeatable)",
+    )
+    parser.add_argument(
+        "--seeds", type=parse_seeds, default=[0], help="seeds, e.g. 0-9 or 1,5,7"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument(
+        "--output", type=Path, required=True, help="results and cache directory"
+    )
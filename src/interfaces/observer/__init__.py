@@ -0,0 +1,12 @@
+"""Streaming of a running simulation to remote observers."""
+from .client import ObserverClient
+from .protocol import Address, ProtocolError, parse_address
+from .server import ObserverServer
+
+__all__ = [
+    "Address",
+    "ObserverClient",
+    "ObserverServer",
+    "ProtocolError",
+    "parse_address",
+]
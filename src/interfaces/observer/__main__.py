@@ -0,0 +1,6 @@
+"""Allow running the observer viewer with ``python -m src.interfaces.observer``."""
+import sys
+
+from .viewer import main
+
+sys.exit(main())
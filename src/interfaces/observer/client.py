@@ -0,0 +1,89 @@
+"""Client side of the observer stream."""
+import socket
+from types import TracebackType
+from typing import Optional, Type
+
+from src.domain.entities.world import World
+
+from .protocol import (
+    DELTA,
+    SNAPSHOT,
+    Address,
+    ProtocolError,
+    apply_delta,
+    decode_snapshot,
+    read_handshake,
+    read_message,
+)
+
+
+class ObserverClient:
+    """Mirrors the state streamed by an observer server.
+
+    Attributes:
+        world (Optional[World]): The mirrored state, or None until the
+            first snapshot has been received
+    """
+
+    def __init__(self, address: Address, timeout: Optional[float] = None) -> None:
+        """Connect to a server and check its greeting.
+
+        Args:
+            address (Address): A (host, port) pair or a Unix socket path
+            timeout (Optional[float], optional): Seconds to wait for data
+                before ``receive`` fails. Defaults to None (wait forever).
+
+        Raises:
+            OSError: If the server cannot be reached
+            ProtocolError: If the peer is not a compatible observer server
+        """
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(address)
+            self._stream = self._socket.makefile("rb")
+            read_handshake(self._stream)
+        except (OSError, ProtocolError):
+            self._socket.close()
+            raise
+        self.world: Optional[World] = None
+
+    def receive(self) -> World:
+        """Wait for the next message and apply it to the mirrored state.
+
+        Returns:
+            World: The mirrored state, updated in place by deltas
+
+        Raises:
+            EOFError: If the server closed the connection
+            ProtocolError: If the message is malformed or unexpected
+        """
+        kind, payload = read_message(self._stream)
+        if kind == SNAPSHOT:
+            self.world = decode_snapshot(payload)
+        elif kind == DELTA and self.world is not None:
+            apply_delta(self.world, payload)
+        else:
+            raise ProtocolError(f"Unexpected message of kind {kind}")
+        return self.world
+
+    def close(self) -> None:
+        """Close the connection, waking a thread blocked in ``receive``."""
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._stream.close()
+        self._socket.close()
+
+    def __enter__(self) -> "ObserverClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,285 @@
+"""Binary wire format of the observer stream.
+
+A connection starts with ``MAGIC`` and the protocol version byte, followed
+by messages of a one-byte kind and a four-byte payload length::
+
+    SNAPSHOT  width:u32 height:u32 tick:u64 fields:u16
+              then per field: name, dtype, every cell value
+    DELTA     tick:u64 fields:u16
+              then per changed field: name, encoding:u8, count:u32 and
+              either ``count`` cell ids (u32) and values (SPARSE) or every
+              cell value (DENSE)
+
+Names and dtypes are a u8 length and ASCII text; header integers are
+big-endian and cell ids and values little-endian. Fields that did not change
+are omitted from a delta.
+"""
+import struct
+from typing import BinaryIO, Dict, Tuple, Union
+
+import numpy as np
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.interfaces.cell_state import CellState
+from src.domain.value_objects.grid_dimensions import GridDimensions
+
+MAGIC = b"HXOB"
+VERSION = 1
+HANDSHAKE = MAGIC + bytes([VERSION])
+
+SNAPSHOT = 1
+DELTA = 2
+
+SPARSE = 0
+DENSE = 1
+
+_HEADER = struct.Struct("!BI")
+_SNAPSHOT = struct.Struct("!IIQH")
+_DELTA = struct.Struct("!QH")
+_FIELD_CHANGE = struct.Struct("!BI")
+_CELL_ID: np.dtype = np.dtype("<u4")
+
+# A (host, port) pair for TCP or a filesystem path for a Unix socket
+Address = Union[Tuple[str, int], str]
+
+
+class ProtocolError(Exception):
+    """Exception raised when an observer stream is malformed."""
+
+    pass
+
+
+def parse_address(text: str) -> Address:
+    """Parse an observer address such as ``127.0.0.1:7878`` or ``unix:PATH``.
+
+    Args:
+        text (str): ``HOST:PORT`` for TCP, ``unix:PATH`` or a path
+            containing a slash for a Unix socket
+
+    Returns:
+        Address: The TCP address or socket path
+
+    Raises:
+        ValueError: If a TCP address has no valid port
+    """
+    if text.startswith("unix:"):
+        return text[len("unix:") :]
+    if "/" in text:
+        return text
+    host, _, port = text.rpartition(":")
+    if not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"Invalid observer address '{text}'")
+    return host or "127.0.0.1", int(port)
+
+
+def _frame(kind: int, payload: bytes) -> bytes:
+    return _HEADER.pack(kind, len(payload)) + payload
+
+
+def _pack_text(text: str) -> bytes:
+    encoded = text.encode("ascii")
+    return bytes([len(encoded)]) + encoded
+
+
+def _wire_dtype(dtype: np.dtype) -> np.dtype:
+    """The little-endian dtype cell values are sent as."""
+    wire: np.dtype = dtype.newbyteorder("<")
+    return wire
+
+
+def encode_snapshot(state: CellState) -> bytes:
+    """Encode the complete state of every field.
+
+    Args:
+        state (CellState): The state to send
+
+    Returns:
+        bytes: One SNAPSHOT message
+    """
+    dimensions = state.grid.dimensions
+    parts = [
+        _SNAPSHOT.pack(
+            dimensions.width, dimensions.height, state.tick, len(state.fields)
+        )
+    ]
+    for name, values in state.fields.items():
+        dtype = _wire_dtype(values.dtype)
+        parts += [
+            _pack_text(name),
+            _pack_text(dtype.str),
+            values.astype(dtype).tobytes(),
+        ]
+    return _frame(SNAPSHOT, b"".join(parts))
+
+
+def encode_delta(previous: CellState, current: CellState) -> bytes:
+    """Encode the cells that changed between two states of the same world.
+
+    Fields with equal versions are skipped without comparing them. A changed
+    field is sent as the ids and values of its changed cells, or as a dense
+    array when that is smaller.
+
+    Args:
+        previous (CellState): The state the receiver already has
+        current (CellState): The state to bring the receiver to
+
+    Returns:
+        bytes: One DELTA message
+
+    Raises:
+        ValueError: If the states do not have the same fields
+    """
+    if set(previous.fields) != set(current.fields):
+        raise ValueError("Deltas need the same fields in both states")
+    parts = []
+    changed_fields = 0
+    for name, values in current.fields.items():
+        if previous.versions.get(name) == current.versions.get(name):
+            continue
+        changed = np.flatnonzero(previous.fields[name] != values)
+        if changed.size == 0:
+            continue
+        changed_fields += 1
+        dtype = _wire_dtype(values.dtype)
+        parts.append(_pack_text(name))
+        if changed.size * (_CELL_ID.itemsize + dtype.itemsize) < values.nbytes:
+            parts.append(_FIELD_CHANGE.pack(SPARSE, changed.size))
+            parts.append(changed.astype(_CELL_ID).tobytes())
+            parts.append(values[changed].astype(dtype).tobytes())
+        else:
+            parts.append(_FIELD_CHANGE.pack(DENSE, values.size))
+            parts.append(values.astype(dtype).tobytes())
+    header = _DELTA.pack(current.tick, changed_fields)
+    return _frame(DELTA, header + b"".join(parts))
+
+
+def read_handshake(stream: BinaryIO) -> None:
+    """Read and check the greeting that starts every observer stream.
+
+    Args:
+        stream (BinaryIO): A buffered binary stream, e.g. ``socket.makefile``
+
+    Raises:
+        ProtocolError: If the peer is not an observer server of this version
+    """
+    greeting = stream.read(len(HANDSHAKE))
+    if greeting[: len(MAGIC)] != MAGIC:
+        raise ProtocolError("Peer is not an observer server")
+    if greeting != HANDSHAKE:
+        raise ProtocolError(f"Unsupported observer protocol version {greeting[-1]}")
+
+
+def read_message(stream: BinaryIO) -> Tuple[int, bytes]:
+    """Read the next message from a stream.
+
+    Args:
+        stream (BinaryIO): A buffered binary stream, e.g. ``socket.makefile``
+
+    Returns:
+        Tuple[int, bytes]: The message kind and payload
+
+    Raises:
+        EOFError: If the stream ends between messages
+        ProtocolError: If the stream ends inside a message
+    """
+    header = stream.read(_HEADER.size)
+    if not header:
+        raise EOFError("Observer stream closed")
+    if len(header) < _HEADER.size:
+        raise ProtocolError("Truncated message header")
+    kind, length = _HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise ProtocolError("Truncated message payload")
+    return kind, payload
+
+
+class _Reader:
+    """Sequential reader over a message payload."""
+
+    def __init__(self, payload: bytes) -> None:
+        self._view = memoryview(payload)
+        self._offset = 0
+
+    def unpack(self, layout: struct.Struct) -> Tuple[int, ...]:
+        values = layout.unpack_from(self._view, self._offset)
+        self._offset += layout.size
+        return values
+
+    def text(self) -> str:
+        (length,) = self.take(1)
+        return self.take(length).decode("ascii")
+
+    def array(self, dtype: np.dtype, count: int) -> np.ndarray:
+        values: np.ndarray = np.frombuffer(
+            self.take(count * dtype.itemsize), dtype=dtype
+        )
+        return values
+
+    def take(self, length: int) -> bytes:
+        if self._offset + length > len(self._view):
+            raise ProtocolError("Message payload is too short")
+        chunk = bytes(self._view[self._offset : self._offset + length])
+        self._offset += length
+        return chunk
+
+
+def decode_snapshot(payload: bytes) -> World:
+    """Build a world from a SNAPSHOT payload.
+
+    Args:
+        payload (bytes): The message payload
+
+    Returns:
+        World: A world with writable copies of every field
+
+    Raises:
+        ProtocolError: If the payload is malformed
+    """
+    reader = _Reader(payload)
+    try:
+        width, height, tick, field_count = reader.unpack(_SNAPSHOT)
+        grid = HexGrid(GridDimensions(width, height))
+        fields: Dict[str, np.ndarray] = {}
+        for _ in range(field_count):
+            name = reader.text()
+            dtype: np.dtype = np.dtype(reader.text())
+            values = reader.array(dtype, grid.cell_count)
+            fields[name] = values.astype(dtype.newbyteorder("="))
+    except (struct.error, TypeError, ValueError) as error:
+        raise ProtocolError(f"Malformed snapshot: {error}") from error
+    return World(grid=grid, fields=fields, tick=tick)
+
+
+def apply_delta(world: World, payload: bytes) -> None:
+    """Apply a DELTA payload to a world received earlier.
+
+    Args:
+        world (World): The world to update in place
+        payload (bytes): The message payload
+
+    Raises:
+        ProtocolError: If the payload is malformed or names unknown fields
+    """
+    reader = _Reader(payload)
+    try:
+        tick, field_count = reader.unpack(_DELTA)
+        for _ in range(field_count):
+            name = reader.text()
+            if name not in world.fields:
+                raise ProtocolError(f"Delta names unknown field '{name}'")
+            values = world.fields[name]
+            dtype = _wire_dtype(values.dtype)
+            encoding, count = reader.unpack(_FIELD_CHANGE)
+            if encoding == SPARSE:
+                cell_ids = reader.array(_CELL_ID, count)
+                values[cell_ids] = reader.array(dtype, count)
+            elif encoding == DENSE and count == values.size:
+                values[:] = reader.array(dtype, count)
+            else:
+                raise ProtocolError(f"Invalid change of field '{name}'")
+            world.touch(name)
+    except (struct.error, IndexError) as error:
+        raise ProtocolError(f"Malformed delta: {error}") from error
+    world.tick = tick
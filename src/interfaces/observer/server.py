@@ -0,0 +1,190 @@
+"""Socket server streaming a running simulation to observers."""
+import os
+import socket
+import threading
+from types import TracebackType
+from typing import Dict, Optional, Set, Tuple, Type
+
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.world import World
+
+from .protocol import HANDSHAKE, Address, encode_delta, encode_snapshot
+
+
+class ObserverServer:
+    """Streams the latest simulation state to any number of observers.
+
+    Every observer receives a full snapshot when it connects and a binary
+    delta of the changed cells whenever a newer state is published. Each
+    observer is served by its own thread that always sends the difference
+    between the state it last sent and the latest one, so a slow observer
+    skips intermediate ticks instead of queueing them: the server holds at
+    most one snapshot per observer, however far behind it falls. Observers
+    that are in step share the encoded delta.
+
+    The server is an engine stage, so ``engine.add_stage(server)`` publishes
+    every tick; states can also be published directly with ``publish``.
+
+    Attributes:
+        address (Address): The bound address; for TCP, the actual port
+    """
+
+    def __init__(self, address: Address, backlog: int = 8) -> None:
+        """Bind the socket and start accepting observers.
+
+        Args:
+            address (Address): A (host, port) pair for TCP, where port 0
+                picks a free port, or a path for a Unix socket
+            backlog (int, optional): Connections that may wait to be
+                accepted. Defaults to 8.
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._listener = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            if family == socket.AF_INET:
+                self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._listener.bind(address)
+            self._listener.listen(backlog)
+        except OSError:
+            self._listener.close()
+            raise
+        self.address: Address = self._listener.getsockname()
+        self._latest: Optional[FrameSnapshot] = None
+        self._deltas: Dict[int, Tuple[FrameSnapshot, bytes]] = {}
+        self._connections: Set[socket.socket] = set()
+        self._threads: Set[threading.Thread] = set()
+        self._closed = False
+        self._changed = threading.Condition()
+        self._accepter = threading.Thread(
+            target=self._accept, name="observer-accept", daemon=True
+        )
+        self._accepter.start()
+
+    @property
+    def observers(self) -> int:
+        """int: The number of connected observers."""
+        with self._changed:
+            return len(self._connections)
+
+    def __call__(self, world: World) -> None:
+        """Publish the world's state after a tick, as an engine stage.
+
+        Args:
+            world (World): The updated world
+        """
+        self.publish(FrameSnapshot.capture(world, self._latest))
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """Make a snapshot the state every observer is brought to next.
+
+        Args:
+            snapshot (FrameSnapshot): The latest state
+        """
+        with self._changed:
+            self._latest = snapshot
+            self._deltas.clear()
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        """Disconnect every observer and stop accepting new ones."""
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._changed.notify_all()
+            connections = list(self._connections)
+        for connection in connections:
+            self._shutdown(connection)
+        self._shutdown(self._listener)
+        self._listener.close()
+        self._accepter.join()
+        for thread in list(self._threads):
+            thread.join()
+        if isinstance(self.address, str):
+            try:
+                os.unlink(self.address)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "ObserverServer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def _shutdown(connection: socket.socket) -> None:
+        # Wakes threads blocked in accept or sendall on the socket
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._changed:
+                if self._closed:
+                    connection.close()
+                    return
+                thread = threading.Thread(
+                    target=self._serve,
+                    args=(connection,),
+                    name="observer-client",
+                    daemon=True,
+                )
+                self._connections.add(connection)
+                self._threads.add(thread)
+            thread.start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        sent: Optional[FrameSnapshot] = None
+        try:
+            connection.sendall(HANDSHAKE)
+            while True:
+                with self._changed:
+                    self._changed.wait_for(
+                        lambda: self._closed
+                        or (self._latest is not None and self._latest is not sent)
+                    )
+                    if self._closed:
+                        return
+                    latest = self._latest
+                if latest is None:  # Nothing published yet
+                    continue
+                if sent is None:
+                    message = encode_snapshot(latest)
+                else:
+                    message = self._delta(sent, latest)
+                connection.sendall(message)
+                sent = latest
+        except OSError:
+            pass  # The observer disconnected
+        finally:
+            connection.close()
+            with self._changed:
+                self._connections.discard(connection)
+                self._threads.discard(threading.current_thread())
+
+    def _delta(self, sent: FrameSnapshot, latest: FrameSnapshot) -> bytes:
+        """Encode a delta, reusing it for observers in step with each other."""
+        with self._changed:
+            cached = self._deltas.get(id(sent))
+            if cached is not None and cached[0] is sent and self._latest is latest:
+                return cached[1]
+        message = encode_delta(sent, latest)
+        with self._changed:
+            if self._latest is latest:
+                self._deltas[id(sent)] = (sent, message)
+        return message
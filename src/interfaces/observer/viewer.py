@@ -0,0 +1,188 @@
+"""Pygame window showing a simulation streamed by an observer server."""
+import argparse
+import sys
+import threading
+from typing import Optional, Sequence
+
+import pygame
+
+from src.application.services.snapshots import FrameSnapshot, SnapshotBuffer
+from src.config import colors, display, simulation
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellPalette
+from src.interfaces.pygame_adapter.rendering.grid_display import (
+    DisplayConfig,
+    GridDisplay,
+)
+
+from .client import ObserverClient
+from .protocol import ProtocolError, parse_address
+
+
+class ObserverViewer:
+    """Renders the state mirrored by an observer client.
+
+    Messages are received and applied on a background thread, which hands
+    finished frames to the render loop through a snapshot buffer, so a slow
+    window never stalls the connection.
+
+    Attributes:
+        client (ObserverClient): The connection to the server
+        connected (bool): False once the server closed the stream
+        error (Optional[BaseException]): The exception that stopped the
+            receiver thread, if any
+    """
+
+    def __init__(self, client: ObserverClient) -> None:
+        """Wait for the first snapshot and open the window.
+
+        Args:
+            client (ObserverClient): A connected client
+
+        Raises:
+            EOFError: If the server closes before sending a snapshot
+            ProtocolError: If the stream is malformed
+        """
+        self.client = client
+        world = client.receive()
+        self.connected = True
+        self.error: Optional[BaseException] = None
+        self.running = False
+
+        pygame.init()
+        self.screen = pygame.display.set_mode(display.WINDOW_SIZE, pygame.RESIZABLE)
+        pygame.display.set_caption(f"{display.WINDOW_TITLE} (observer)")
+        self.clock = pygame.time.Clock()
+        self.grid_display = GridDisplay(
+            grid=world.grid,
+            config=DisplayConfig(
+                hex_size=display.HEX_SIZE,
+                background_color=colors.BACKGROUND,
+                line_color=colors.GRID_LINES,
+                line_width=display.GRID_LINE_WIDTH,
+                padding=display.GRID_PADDING,
+                outline=display.GRID_OUTLINE,
+                auto_fit=True,
+                resize_debounce=display.RESIZE_DEBOUNCE_MS / 1000,
+                palette=CellPalette(
+                    terrain_colors=colors.TERRAIN,
+                    plant_colors=colors.PLANTS,
+                    plant_threshold=colors.PLANT_THRESHOLD,
+                ),
+            ),
+            surface=self.screen,
+        )
+
+        self.snapshots = SnapshotBuffer()
+        self.snapshots.publish(FrameSnapshot.capture(world))
+        self.snapshot: Optional[FrameSnapshot] = None
+        self._receiver = threading.Thread(
+            target=self._receive, name="observer-receiver", daemon=True
+        )
+        self._receiver.start()
+
+    def check(self) -> None:
+        """Re-raise the exception that stopped the receiver thread, if any.
+
+        Raises:
+            RuntimeError: If receiving the stream failed
+        """
+        if self.error is not None:
+            raise RuntimeError("Observer stream failed") from self.error
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Process one pygame event.
+
+        Args:
+            event (pygame.event.Event): The event to process
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.VIDEORESIZE:
+            # The resizable window's surface follows the window already
+            self.screen = pygame.display.get_surface() or self.screen
+            self.grid_display.handle_resize((event.w, event.h), self.screen)
+
+    def update(self) -> bool:
+        """Pick up the latest received state and apply a settled resize.
+
+        Returns:
+            bool: True if the frame must be redrawn
+        """
+        self.check()
+        changed = self.grid_display.update_layout()
+        snapshot = self.snapshots.latest()
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            changed = True
+        return changed
+
+    def run(self) -> None:
+        """Show the stream until the window is closed."""
+        self.running = True
+        while self.running:
+            for event in pygame.event.get():
+                self.handle_event(event)
+            if self.update():
+                self.grid_display.render(self.snapshot)
+                pygame.display.flip()
+            self.clock.tick(display.FPS)
+
+    def close(self) -> None:
+        """Disconnect and close the window."""
+        self.client.close()
+        self._receiver.join()
+        pygame.quit()
+
+    def _receive(self) -> None:
+        previous = self.snapshots.latest()
+        try:
+            while True:
+                world = self.client.receive()
+                previous = FrameSnapshot.capture(world, previous)
+                self.snapshots.publish(previous)
+        except (EOFError, OSError, ValueError):
+            pass  # The server or the viewer closed the connection
+        except Exception as error:  # Surfaced by the render loop
+            self.error = error
+        self.connected = False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the observer viewer.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Arguments without the
+            program name. Defaults to None (use ``sys.argv``).
+
+    Returns:
+        int: The process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="hexlife-observer", description="Watch a served HexLife simulation"
+    )
+    parser.add_argument(
+        "address",
+        nargs="?",
+        default=simulation.OBSERVER_ADDRESS,
+        help="HOST:PORT or unix:PATH of the server",
+    )
+    args = parser.parse_args(argv)
+    try:
+        client = ObserverClient(parse_address(args.address))
+    except (OSError, ProtocolError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    try:
+        viewer = ObserverViewer(client)
+    except (OSError, EOFError, ProtocolError) as error:
+        client.close()
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    try:
+        viewer.run()
+    except RuntimeError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    finally:
+        viewer.close()
+    return 0
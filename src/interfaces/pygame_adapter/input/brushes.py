@@ -0,0 +1,229 @@
+"""Brush tools painting cell fields from mouse input."""
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.application.services.commands import CellEdit, CommandQueue
+from src.domain.entities.grid import HexGrid, from_axial, to_axial
+
+# Brush shapes: "circle" paints freehand strokes of hex ranges while the
+# button is held, "line" paints a straight stroke from press to release
+BRUSH_SHAPES = ("circle", "line")
+
+
+def hex_range_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the axial offsets of every cell within a hex distance.
+
+    Args:
+        radius (int): The largest hex distance, at least 0
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The axial x and z offsets (see
+        ``to_axial``) of the ``3 * radius * (radius + 1) + 1`` cells of the
+        range
+    """
+    dx, dz = np.meshgrid(
+        np.arange(-radius, radius + 1), np.arange(-radius, radius + 1), indexing="ij"
+    )
+    inside = np.abs(dx + dz) <= radius
+    return dx[inside], dz[inside]
+
+
+def _hex_distance(dx: int, dz: int) -> int:
+    return (abs(dx) + abs(dz) + abs(dx + dz)) // 2
+
+
+def hex_line(grid: HexGrid, start: int, end: int) -> np.ndarray:
+    """Get the cells of a straight line between two cells.
+
+    The line is interpolated in axial coordinates of the drawn layout at
+    every hex step and rounded to the nearest cell, so it follows the
+    straight line between the drawn centers and consecutive cells of the
+    line are neighbors on screen. On a toroidal grid the line crosses the
+    edges where that is shorter, and may leave the stored range of
+    positions.
+
+    Args:
+        grid (HexGrid): The grid of both cells
+        start (int): The first cell id
+        end (int): The last cell id
+
+    Returns:
+        np.ndarray: Grid (q, r) positions of shape (2, steps + 1), from
+        start to end
+    """
+    width = grid.dimensions.width
+    start_x, start_z = to_axial(start % width, start // width)
+    end_x, end_z = to_axial(end % width, end // width)
+    dx, dz = end_x - start_x, end_z - start_z
+    if grid.wrap:
+        # The axial offsets between copies of the grid, across and down
+        height = grid.dimensions.height
+        across, down = (2 * width, -width), (height % 2, height // 2)
+        dx, dz = min(
+            (
+                (dx + a * across[0] + b * down[0], dz + a * across[1] + b * down[1])
+                for a in range(-2, 3)
+                for b in range(-2, 3)
+            ),
+            key=lambda offset: _hex_distance(*offset),
+        )
+    steps = _hex_distance(dx, dz)
+    # A tiny nudge keeps points on cell borders from rounding both ways
+    t = np.linspace(0.0, 1.0, steps + 1)
+    x = start_x + 1e-6 + dx * t
+    z = start_z + 2e-6 + dz * t
+    y = -x - z
+    rx, ry, rz = np.round(x), np.round(y), np.round(z)
+    x_error, y_error, z_error = np.abs(rx - x), np.abs(ry - y), np.abs(rz - z)
+    fix_x = (x_error > y_error) & (x_error > z_error)
+    fix_z = ~fix_x & (z_error >= y_error)
+    rx = np.where(fix_x, -ry - rz, rx)
+    rz = np.where(fix_z, -rx - ry, rz)
+    line: np.ndarray = np.stack(from_axial(rx.astype(np.int64), rz.astype(np.int64)))
+    return line
+
+
+@dataclass(frozen=True)
+class Brush:
+    """A brush writing one value into one field.
+
+    Attributes:
+        field (str): The field to paint, e.g. ``terrain``
+        value (float): The value written into every painted cell
+        radius (int): The hex distance painted around the stroke
+        shape (str): One of ``BRUSH_SHAPES``
+    """
+
+    field: str
+    value: float
+    radius: int = 0
+    shape: str = "circle"
+
+    def __post_init__(self) -> None:
+        """Validate the brush."""
+        if self.radius < 0:
+            raise ValueError("Brush radius must not be negative")
+        if self.shape not in BRUSH_SHAPES:
+            raise ValueError(f"Unknown brush shape '{self.shape}'")
+
+    def footprint(self, grid: HexGrid, start: int, end: int) -> np.ndarray:
+        """Get the cells painted by one stroke segment.
+
+        The segment is the straight line between two cells, widened by the
+        brush radius; a single click is the segment from a cell to itself.
+
+        Args:
+            grid (HexGrid): The grid being painted
+            start (int): The cell id where the segment starts
+            end (int): The cell id where the segment ends
+
+        Returns:
+            np.ndarray: The ids of the painted cells inside the grid, sorted;
+            on a toroidal grid the footprint wraps around the edges instead
+        """
+        line_x, line_z = to_axial(*hex_line(grid, start, end))
+        offset_x, offset_z = hex_range_offsets(self.radius)
+        q, r = from_axial(
+            (line_x[:, None] + offset_x[None, :]).ravel(),
+            (line_z[:, None] + offset_z[None, :]).ravel(),
+        )
+        q, r = grid.wrap_coordinates(q, r)
+        width, height = grid.dimensions.width, grid.dimensions.height
+        inside = (q >= 0) & (q < width) & (r >= 0) & (r < height)
+        cells: np.ndarray = np.unique(r[inside] * width + q[inside])
+        return cells
+
+
+class BrushTool:
+    """Turns mouse strokes into edit commands for the simulation.
+
+    Every stroke segment becomes one ``CellEdit`` covering all of its cells,
+    so the engine writes it with one vectorized assignment at the next tick
+    boundary, and the renderer only redraws the hexes whose color changed.
+
+    Attributes:
+        grid (HexGrid): The grid being painted
+        commands (CommandQueue): Where edit commands are submitted
+        brush (Brush): The active brush
+        locate (Callable[[Tuple[int, int]], Optional[int]]): Finds the cell
+            under a mouse position, or None off the grid
+    """
+
+    def __init__(
+        self,
+        grid: HexGrid,
+        commands: CommandQueue,
+        brush: Brush,
+        locate: Callable[[Tuple[int, int]], Optional[int]],
+    ) -> None:
+        """Initialize the tool without a stroke in progress.
+
+        Args:
+            grid (HexGrid): The grid being painted
+            commands (CommandQueue): Where edit commands are submitted
+            brush (Brush): The active brush
+            locate (Callable[[Tuple[int, int]], Optional[int]]): Finds the
+                cell under a mouse position, or None off the grid
+        """
+        self.grid = grid
+        self.commands = commands
+        self.brush = brush
+        self.locate = locate
+        self._anchor: Optional[int] = None
+        self._last: Optional[int] = None
+
+    @property
+    def painting(self) -> bool:
+        """bool: True while a stroke is in progress."""
+        return self._anchor is not None
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Process a mouse event.
+
+        Args:
+            event (pygame.event.Event): The event to process
+
+        Returns:
+            bool: True if the event belonged to a stroke
+        """
+        # Synthetic events may lack the button of real mouse events
+        button = getattr(event, "button", None)
+        if event.type == pygame.MOUSEBUTTONDOWN and button == 1:
+            return self._press(self.locate(event.pos))
+        if self._anchor is None or self._last is None:
+            return False
+        if event.type == pygame.MOUSEMOTION:
+            cell = self.locate(event.pos)
+            if cell is not None and cell != self._last:
+                if self.brush.shape == "circle":
+                    self.paint(self._last, cell)
+                self._last = cell
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and button == 1:
+            cell = self.locate(event.pos)
+            if self.brush.shape == "line":
+                self.paint(self._anchor, self._last if cell is None else cell)
+            self._anchor = self._last = None
+            return True
+        return False
+
+    def _press(self, cell: Optional[int]) -> bool:
+        if cell is None:
+            return False
+        self._anchor = self._last = cell
+        if self.brush.shape == "circle":
+            self.paint(cell, cell)
+        return True
+
+    def paint(self, start: int, end: int) -> None:
+        """Submit the edit of one stroke segment.
+
+        Args:
+            start (int): The cell id where the segment starts
+            end (int): The cell id where the segment ends
+        """
+        cells = self.brush.footprint(self.grid, start, end)
+        self.commands.submit(CellEdit.create(self.brush.field, cells, self.brush.value))
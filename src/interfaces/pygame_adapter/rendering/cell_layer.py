@@ -0,0 +1,93 @@
+"""Cached surface of filled cells, redrawn only where cells change."""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from .cell_renderer import CellRenderer
+from .hex_sprite_atlas import Color
+
+
+class CellLayer:
+    """Keeps the filled cells of the last frame on an off-screen surface.
+
+    Every frame the color state of each cell is compared with the state the
+    layer was drawn with. Only the rectangle around the sprites of changed
+    cells is cleared and redrawn, together with every cell overlapping it
+    in the usual cell id order, so the layer stays pixel-identical to a
+    full redraw. A brush stroke therefore costs a handful of blits however
+    large the grid is; the layer is redrawn in full only when the surface
+    size or the layout changes.
+
+    Attributes:
+        cell_renderer (CellRenderer): Draws the cells
+        background_color (Color): The color behind the cells
+        last_redraw (Optional[pygame.Rect]): The area redrawn by the latest
+            frame, or None if nothing changed
+    """
+
+    def __init__(self, cell_renderer: CellRenderer, background_color: Color) -> None:
+        """Initialize an empty layer.
+
+        Args:
+            cell_renderer (CellRenderer): Draws the cells
+            background_color (Color): The color behind the cells
+        """
+        self.cell_renderer = cell_renderer
+        self.background_color = background_color
+        self.last_redraw: Optional[pygame.Rect] = None
+        self._surface: Optional[pygame.Surface] = None
+        self._key: Optional[Tuple[object, ...]] = None
+        self._states: Optional[np.ndarray] = None
+
+    def render(self, surface: pygame.Surface, states: np.ndarray) -> None:
+        """Bring the layer up to date and blit it onto a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on, covered fully
+            states (np.ndarray): Atlas sprite index of every cell, by cell id
+        """
+        transformer = self.cell_renderer.transformer
+        key = (
+            surface.get_size(),
+            transformer.hex_size,
+            transformer.origin_x,
+            transformer.origin_y,
+        )
+        layer = self._surface
+        if layer is None or self._states is None or key != self._key:
+            layer = pygame.Surface(surface.get_size(), 0, surface)
+            self._redraw(layer, states, layer.get_rect(), None)
+            self._surface, self._key = layer, key
+        else:
+            changed = np.flatnonzero(states != self._states)
+            self.last_redraw = None
+            if changed.size:
+                area = self.cell_renderer.bounds(changed)
+                self._redraw(layer, states, area, self.cell_renderer.cells_in(area))
+        self._states = states.copy()
+        surface.blit(layer, (0, 0))
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the pixel bytes held by the cached layer.
+
+        Returns:
+            Dict[str, int]: Bytes by cache name, empty before the first render
+        """
+        if self._surface is None:
+            return {}
+        return {"cell layer": self._surface.get_pitch() * self._surface.get_height()}
+
+    def _redraw(
+        self,
+        layer: pygame.Surface,
+        states: np.ndarray,
+        area: pygame.Rect,
+        cells: Optional[np.ndarray],
+    ) -> None:
+        area = area.clip(layer.get_rect())
+        layer.set_clip(area)
+        layer.fill(self.background_color)
+        self.cell_renderer.render(layer, states, cells)
+        layer.set_clip(None)
+        self.last_redraw = area
@@ -0,0 +1,239 @@
+"""Rendering of filled cells through pre-rendered hexagon sprites."""
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.domain.entities.grid import HexGrid
+from src.domain.interfaces.cell_state import CellState
+
+from .coordinate_transformer import HexToPixelTransformer
+from .hex_sprite_atlas import Color, HexSpriteAtlas
+
+
+@dataclass(frozen=True)
+class CellPalette:
+    """Colors of filled cells by terrain type and plant cover.
+
+    Cells are colored by their ``terrain`` type. Cells whose ``biomass``
+    reaches ``plant_threshold`` use one of the plant colors instead, later
+    colors for denser plant cover.
+
+    Attributes:
+        terrain_colors (Tuple[Color, ...]): The color of every terrain type
+        plant_colors (Tuple[Color, ...]): Plant colors from sparse to dense
+        plant_threshold (float): The biomass from which a cell shows plants
+    """
+
+    terrain_colors: Tuple[Color, ...]
+    plant_colors: Tuple[Color, ...] = ()
+    plant_threshold: float = 0.2
+
+    def __post_init__(self) -> None:
+        """Validate the palette."""
+        if not self.terrain_colors:
+            raise ValueError("A palette needs at least one terrain color")
+        if not 0 <= self.plant_threshold < 1:
+            raise ValueError("Plant threshold must be in [0, 1)")
+
+    @property
+    def colors(self) -> Tuple[Color, ...]:
+        """Tuple[Color, ...]: Every state color, terrain types first."""
+        return self.terrain_colors + self.plant_colors
+
+    def states(self, state: CellState) -> np.ndarray:
+        """Compute the color state of every cell.
+
+        Args:
+            state (CellState): The cell state to color
+
+        Returns:
+            np.ndarray: Indices into ``colors``, one per cell
+        """
+        return self.classify(
+            state.fields.get("terrain"),
+            state.fields.get("biomass"),
+            state.grid.cell_count,
+        )
+
+    def classify(
+        self,
+        terrain: Optional[np.ndarray],
+        biomass: Optional[np.ndarray],
+        count: int,
+    ) -> np.ndarray:
+        """Compute color states from terrain types and biomass values.
+
+        Args:
+            terrain (Optional[np.ndarray]): Terrain types, or None for the
+                first terrain color everywhere
+            biomass (Optional[np.ndarray]): Biomass values, or None for no
+                plant cover
+            count (int): The number of colored items, e.g. cells
+
+        Returns:
+            np.ndarray: Indices into ``colors``, one per item
+        """
+        if terrain is None:
+            states: np.ndarray = np.zeros(count, dtype=np.intp)
+        else:
+            states = np.clip(terrain, 0, len(self.terrain_colors) - 1).astype(np.intp)
+        if biomass is not None and self.plant_colors:
+            levels = len(self.plant_colors)
+            scaled = (biomass - self.plant_threshold) / (1 - self.plant_threshold)
+            level = np.clip((scaled * levels).astype(np.intp), 0, levels - 1)
+            plants = biomass >= self.plant_threshold
+            states[plants] = len(self.terrain_colors) + level[plants]
+        return states
+
+
+class CellRenderer:
+    """Draws filled cells with a single batched blit per frame.
+
+    The destination of every cell's sprite is computed once per transformer
+    layout, and all cells are drawn through one ``Surface.blits`` call with
+    the sprite of their state. The atlas is re-rendered only when the
+    transformer's hexagon size changes.
+
+    Attributes:
+        grid (HexGrid): The grid to render
+        transformer (HexToPixelTransformer): Coordinate transformer
+            for pixel conversion
+        atlas (HexSpriteAtlas): The sprite of every cell state
+    """
+
+    def __init__(
+        self,
+        grid: HexGrid,
+        transformer: HexToPixelTransformer,
+        atlas: HexSpriteAtlas,
+    ) -> None:
+        """Initialize the cell renderer.
+
+        Args:
+            grid (HexGrid): The grid to render
+            transformer (HexToPixelTransformer): Coordinate transformer
+                for pixel conversion
+            atlas (HexSpriteAtlas): The sprite of every cell state
+        """
+        self.grid = grid
+        self.transformer = transformer
+        self.atlas = atlas
+        self._layout: Optional[Tuple[float, float, float]] = None
+        self._destinations: List[Tuple[int, int]] = []
+        self._destination_array: Optional[np.ndarray] = None
+
+    def render(
+        self,
+        surface: pygame.Surface,
+        states: np.ndarray,
+        cells: Optional[np.ndarray] = None,
+    ) -> None:
+        """Draw cells in the color of their state.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on
+            states (np.ndarray): Atlas sprite index of every cell, by cell id
+            cells (Optional[np.ndarray], optional): Ids of the cells to draw,
+                in drawing order. Defaults to None (every cell).
+        """
+        sprites = self.atlas.sprites
+        destinations = self.destinations()
+        if cells is None:
+            surface.blits(
+                list(zip([sprites[state] for state in states.tolist()], destinations)),
+                doreturn=False,
+            )
+            return
+        surface.blits(
+            [(sprites[states[cell]], destinations[cell]) for cell in cells.tolist()],
+            doreturn=False,
+        )
+
+    def cells_in(self, rect: pygame.Rect) -> np.ndarray:
+        """Find the cells whose sprite overlaps a rectangle.
+
+        Args:
+            rect (pygame.Rect): The rectangle in pixels
+
+        Returns:
+            np.ndarray: The ids of those cells, in ascending order
+        """
+        corners = self.destination_array()
+        width, height = self.atlas.sprites[0].get_size()
+        x, y = corners[:, 0], corners[:, 1]
+        overlaps = (
+            (x < rect.right)
+            & (x + width > rect.left)
+            & (y < rect.bottom)
+            & (y + height > rect.top)
+        )
+        cells: np.ndarray = np.flatnonzero(overlaps)
+        return cells
+
+    def bounds(self, cells: np.ndarray) -> pygame.Rect:
+        """Get the smallest rectangle covering the sprites of some cells.
+
+        Args:
+            cells (np.ndarray): The ids of at least one cell
+
+        Returns:
+            pygame.Rect: The rectangle in pixels
+        """
+        corners = self.destination_array()[cells]
+        width, height = self.atlas.sprites[0].get_size()
+        left, top = corners.min(axis=0).tolist()
+        right, bottom = corners.max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left + width, bottom - top + height)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the sprite atlas and the layout cache.
+
+        Returns:
+            Dict[str, int]: Bytes by cache name
+        """
+        destinations = sys.getsizeof(self._destinations) + sum(
+            sys.getsizeof(position) for position in self._destinations
+        )
+        if self._destination_array is not None:
+            destinations += self._destination_array.nbytes
+        return {**self.atlas.memory_usage(), "destinations": destinations}
+
+    def destinations(self) -> List[Tuple[int, int]]:
+        """Get the top-left sprite position of every cell, by cell id.
+
+        Returns:
+            List[Tuple[int, int]]: Pixel positions for the current layout
+        """
+        layout = (
+            self.transformer.hex_size,
+            self.transformer.origin_x,
+            self.transformer.origin_y,
+        )
+        if layout != self._layout:
+            self.atlas.resize(self.transformer.hex_size)
+            anchor_x, anchor_y = self.atlas.anchor
+            self._destinations = []
+            for cell_id in range(self.grid.cell_count):
+                center = self.transformer.hex_to_pixel(self.grid.position_of(cell_id))
+                self._destinations.append(
+                    (round(center.x - anchor_x), round(center.y - anchor_y))
+                )
+            self._destination_array = None
+            self._layout = layout
+        return self._destinations
+
+    def destination_array(self) -> np.ndarray:
+        """Get the top-left sprite position of every cell as an array.
+
+        Returns:
+            np.ndarray: Pixel positions of shape (cell_count, 2), by cell id
+        """
+        destinations = self.destinations()
+        if self._destination_array is None:
+            self._destination_array = np.array(destinations, dtype=np.int64).reshape(
+                -1, 2
+            )
+        return self._destination_array
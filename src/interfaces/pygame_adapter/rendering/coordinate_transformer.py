@@ -1,6 +1,6 @@
 """Coordinate transformation utilities for rendering hexagonal grids."""
 from dataclasses import dataclass
-from math import sqrt
+from math import floor, sqrt
 from typing import List, Tuple
 
 from src.domain.value_objects.grid_position import GridPosition
@@ -76,6 +76,34 @@ class HexToPixelTransformer:
         y = self.origin_y + self.hex_size * (sqrt(3) / 2) * hex_pos.r
         return PixelPosition(x=x, y=y)
 
+    def pixel_to_hex(self, x: float, y: float) -> GridPosition:
+        """Find the hexagon containing a pixel.
+
+        Hexagons tile the plane, so the hexagon containing a pixel is the
+        one with the nearest center; only the rows around the pixel and the
+        nearest column of each are candidates.
+
+        Args:
+            x (float): The x-coordinate in pixels
+            y (float): The y-coordinate in pixels
+
+        Returns:
+            GridPosition: The position of the hexagon, which may lie outside
+            the grid
+        """
+        row_height = self.hex_size * sqrt(3) / 2
+        nearest_row = floor((y - self.origin_y) / row_height + 0.5)
+        best = GridPosition(q=0, r=0)
+        best_distance = float("inf")
+        for r in range(nearest_row - 1, nearest_row + 2):
+            column = (x - self.origin_x) / (3 * self.hex_size) - (r % 2) / 2
+            candidate = GridPosition(q=floor(column + 0.5), r=r)
+            center = self.hex_to_pixel(candidate)
+            distance = (center.x - x) ** 2 + (center.y - y) ** 2
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
     def get_hex_vertices(
         self,
         center: PixelPosition,
@@ -0,0 +1,171 @@
+"""Export of rendered frames to image files or raw pixel streams."""
+import queue
+import threading
+from pathlib import Path
+from typing import BinaryIO, Optional, Protocol, Tuple, Union
+
+import pygame
+
+FrameSize = Tuple[int, int]
+
+
+class FrameSink(Protocol):
+    """Destination of exported frames, written from the exporter's thread."""
+
+    def write(self, index: int, size: FrameSize, pixels: bytes) -> None:
+        """Write one frame of packed 8-bit RGB pixels."""
+        ...
+
+    def close(self) -> None:
+        """Finish writing after the last frame."""
+        ...
+
+
+class PngFrameSink:
+    """Writes every frame to a numbered PNG file.
+
+    Attributes:
+        directory (Path): The directory the files are written to
+        prefix (str): The file name prefix, followed by the frame number
+    """
+
+    def __init__(self, directory: Union[str, Path], prefix: str = "frame") -> None:
+        """Create the output directory.
+
+        Args:
+            directory (Union[str, Path]): The directory to write to
+            prefix (str, optional): The file name prefix. Defaults to "frame".
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+
+    def write(self, index: int, size: FrameSize, pixels: bytes) -> None:
+        """Encode one frame as ``<prefix>_<index>.png``.
+
+        Args:
+            index (int): The frame number
+            size (FrameSize): The frame size (width, height)
+            pixels (bytes): Packed 8-bit RGB pixels, row by row
+        """
+        image = pygame.image.frombuffer(pixels, size, "RGB")
+        pygame.image.save(image, str(self.directory / f"{self.prefix}_{index:06d}.png"))
+
+    def close(self) -> None:
+        """Nothing to finish; every file is complete once written."""
+
+
+class RawFrameSink:
+    """Streams frames as raw RGB24 pixels, e.g. into a video encoder's stdin.
+
+    Attributes:
+        stream (BinaryIO): The binary stream frames are written to
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """Initialize the sink.
+
+        Args:
+            stream (BinaryIO): The binary stream to write to
+        """
+        self.stream = stream
+
+    def write(self, index: int, size: FrameSize, pixels: bytes) -> None:
+        """Append one frame's pixels to the stream.
+
+        Args:
+            index (int): The frame number
+            size (FrameSize): The frame size (width, height)
+            pixels (bytes): Packed 8-bit RGB pixels, row by row
+        """
+        self.stream.write(pixels)
+
+    def close(self) -> None:
+        """Flush the stream."""
+        self.stream.flush()
+
+
+class FrameExporter:
+    """Hands rendered frames to a sink on a background writer thread.
+
+    ``submit`` only copies the surface's pixels; encoding and writing happen
+    on the writer thread, so rendering continues while earlier frames are
+    written. At most ``max_pending`` frames wait in the queue: when the sink
+    falls behind, ``submit`` blocks instead of buffering without bound.
+
+    Attributes:
+        sink (FrameSink): Where frames are written
+        frames_written (int): The number of frames the sink has written
+        error (Optional[BaseException]): The exception that stopped the
+            writer thread, if any
+    """
+
+    def __init__(self, sink: FrameSink, max_pending: int = 8) -> None:
+        """Initialize the exporter and start its writer thread.
+
+        Args:
+            sink (FrameSink): Where frames are written
+            max_pending (int, optional): Frames that may wait to be written
+                before ``submit`` blocks. Defaults to 8.
+        """
+        self.sink = sink
+        self.frames_written = 0
+        self.error: Optional[BaseException] = None
+        self._submitted = 0
+        self._pending: "queue.Queue[Optional[Tuple[int, FrameSize, bytes]]]" = (
+            queue.Queue(maxsize=max_pending)
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="frame-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, surface: pygame.Surface) -> None:
+        """Queue a copy of a rendered frame, waiting while the queue is full.
+
+        Args:
+            surface (pygame.Surface): The rendered frame
+
+        Raises:
+            RuntimeError: If writing an earlier frame failed
+        """
+        self.check()
+        pixels = pygame.image.tobytes(surface, "RGB")
+        self._pending.put((self._submitted, surface.get_size(), pixels))
+        self._submitted += 1
+
+    def check(self) -> None:
+        """Re-raise the exception that stopped the writer thread, if any.
+
+        Raises:
+            RuntimeError: If writing a frame failed
+        """
+        if self.error is not None:
+            raise RuntimeError("Frame export failed") from self.error
+
+    def close(self) -> None:
+        """Write every queued frame, close the sink and stop the thread.
+
+        Raises:
+            RuntimeError: If writing a frame failed
+        """
+        self._pending.put(None)
+        self._thread.join()
+        self.check()
+
+    def _run(self) -> None:
+        while True:
+            frame = self._pending.get()
+            if frame is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self.sink.write(*frame)
+                self.frames_written += 1
+            except Exception as error:  # Surfaced on the next submit
+                self.error = error
+        try:
+            self.sink.close()
+        except Exception as error:
+            self.error = self.error or error
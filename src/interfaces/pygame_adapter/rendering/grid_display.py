@@ -1,13 +1,24 @@
 """Grid display management for the hexagonal grid."""
+import math
+import time
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from src.domain.entities.grid import HexGrid
+from src.domain.interfaces.cell_state import CellState
 
+from .cell_layer import CellLayer
+from .cell_renderer import CellPalette, CellRenderer
 from .coordinate_transformer import HexToPixelTransformer
 from .grid_renderer import GridRenderer
+from .hex_sprite_atlas import HexSpriteAtlas
+from .minimap import Minimap
+
+# Window sizes whose layout is remembered
+_LAYOUT_CACHE_SIZE = 16
 
 
 @dataclass
@@ -15,11 +26,28 @@ class DisplayConfig:
     """Configuration for grid display.
 
     Attributes:
-        hex_size (float): Size (radius) of hexagons in pixels
+        hex_size (float): Size (radius) of hexagons in pixels, unless
+            ``auto_fit`` picks it from the window size
         background_color (Tuple[int, int, int]): RGB color for background
         line_color (Tuple[int, int, int]): RGB color for grid lines
         line_width (int): Width of grid lines in pixels
         padding (int): Minimum padding around the grid in pixels
+        outline (bool): Draw shared edges once through a cached outline
+        palette (Optional[CellPalette]): Colors of filled cells, or None to
+            draw the grid lines only
+        auto_fit (bool): Size hexagons so the grid fills the window
+        min_hex_size (float): Smallest hexagon size chosen by auto-fit
+        resize_debounce (float): Seconds the window size must stay
+            unchanged before the layout is recomputed
+        cell_layer (bool): Keep filled cells on a cached layer and redraw
+            only the cells whose color changed; toroidal grids keep their
+            own cached tile instead
+        minimap (bool): Show a minimap in the bottom-right corner; needs a
+            palette
+        minimap_block (int): The side in cells of a minimap block
+        minimap_width (int): The width of the minimap in pixels
+        minimap_viewport_color (Tuple[int, int, int]): RGB color of the
+            visible area's outline on the minimap
     """
 
     hex_size: float
@@ -27,6 +55,16 @@ class DisplayConfig:
     line_color: Tuple[int, int, int] = (100, 100, 100)
     line_width: int = 1
     padding: int = 20
+    outline: bool = True
+    palette: Optional[CellPalette] = None
+    auto_fit: bool = False
+    min_hex_size: float = 2.0
+    resize_debounce: float = 0.1
+    cell_layer: bool = False
+    minimap: bool = False
+    minimap_block: int = 8
+    minimap_width: int = 160
+    minimap_viewport_color: Tuple[int, int, int] = (255, 255, 255)
 
 
 class GridDisplay:
@@ -36,6 +74,17 @@ class GridDisplay:
     - Grid positioning and centering
     - Window resize handling
     - Grid rendering with proper configuration
+    - Filled cells colored by cell state, when a palette is configured
+    - Panning toroidal grids, which are drawn as repeated tiles
+
+    A toroidal grid is drawn once onto a transparent tile, redrawn only when
+    cell colors change, and the tile is blitted as often as needed to cover
+    the window. Horizontally the tile repeats every ``width`` columns. Rows
+    are drawn alternately shifted by half a column, so when the height is
+    odd the row after the last one has the opposite shift of the first row;
+    the copies below are then shifted by half a column to keep the hexes
+    interlocking. This is the same shift with which ``HexGrid`` wraps
+    positions, so every cell is drawn next to its neighbors across the edges.
 
     Attributes:
         grid (HexGrid): The grid to display
@@ -43,6 +92,9 @@ class GridDisplay:
         surface (pygame.Surface): The surface to render on
         transformer (HexToPixelTransformer): Coordinate transformer
         renderer (GridRenderer): Grid renderer
+        cell_renderer (Optional[CellRenderer]): Filled cell renderer
+        cell_layer (Optional[CellLayer]): Cached filled cells, if enabled
+        minimap (Optional[Minimap]): Overview of the grid, if enabled
     """
 
     def __init__(
@@ -58,78 +110,376 @@ class GridDisplay:
         self.grid = grid
         self.config = config
         self.surface = surface
+        self._layouts: Dict[Tuple[int, int], HexToPixelTransformer] = {}
+        self._resize_deadline: Optional[float] = None
+        self._pan = (0.0, 0.0)
+        self._tile: Optional[pygame.Surface] = None
+        self._tile_key: Optional[Tuple[object, ...]] = None
+        self._tile_states: Optional[np.ndarray] = None
 
         # Initialize with centered grid
         self.transformer = self._create_centered_transformer()
         self.renderer = GridRenderer(
             grid=grid,
-            transformer=self.transformer,
+            transformer=self._renderer_transformer(),
             line_color=config.line_color,
             line_width=config.line_width,
+            outline=config.outline,
         )
+        self.cell_renderer: Optional[CellRenderer] = None
+        self.cell_layer: Optional[CellLayer] = None
+        if config.palette is not None:
+            atlas = HexSpriteAtlas(config.palette.colors, self.transformer.hex_size)
+            self.cell_renderer = CellRenderer(grid, self._renderer_transformer(), atlas)
+            if config.cell_layer and not grid.wrap:
+                self.cell_layer = CellLayer(self.cell_renderer, config.background_color)
+        self.minimap: Optional[Minimap] = None
+        if config.palette is not None and config.minimap:
+            # Keep the aspect ratio of the grid as drawn
+            unit_width, unit_height = self._calculate_grid_pixel_size(1.0)
+            height = max(round(config.minimap_width * unit_height / unit_width), 1)
+            self.minimap = Minimap(
+                grid,
+                config.palette,
+                config.minimap_block,
+                (config.minimap_width, height),
+                config.minimap_viewport_color,
+            )
+
+    @property
+    def resize_pending(self) -> bool:
+        """bool: True while a resize waits for the window size to settle."""
+        return self._resize_deadline is not None
 
-    def _calculate_grid_pixel_size(self) -> Tuple[float, float]:
+    def _calculate_grid_pixel_size(
+        self, hex_size: Optional[float] = None
+    ) -> Tuple[float, float]:
         """Calculate the total size of the grid in pixels.
 
+        Args:
+            hex_size (Optional[float], optional): The hexagon size to measure
+                with. Defaults to the configured size.
+
         Returns:
             Tuple[float, float]: The (width, height) of the grid in pixels
         """
+        if hex_size is None:
+            hex_size = self.config.hex_size
         # For flat-topped hexagons:
         # Total width = columns * (3 * size) + size
         # Total height = rows * (sqrt(3)/2 * size)
-        total_width = (
-            self.grid.dimensions.width * 3 * self.config.hex_size
-        ) + self.config.hex_size
-        total_height = self.grid.dimensions.height * (
-            self.config.hex_size * (3**0.5) / 2
-        )
+        total_width = (self.grid.dimensions.width * 3 * hex_size) + hex_size
+        total_height = self.grid.dimensions.height * (hex_size * (3**0.5) / 2)
 
         return total_width, total_height
 
+    def _fit_hex_size(self, surface_size: Tuple[int, int]) -> float:
+        """Find the largest hexagon size at which the grid fits the window.
+
+        Args:
+            surface_size (Tuple[int, int]): The window size (width, height)
+
+        Returns:
+            float: The hexagon size, at least ``min_hex_size``
+        """
+        # The grid's pixel size is proportional to the hexagon size
+        unit_width, unit_height = self._calculate_grid_pixel_size(1.0)
+        available_width = surface_size[0] - 2 * self.config.padding
+        available_height = surface_size[1] - 2 * self.config.padding
+        fitted = min(available_width / unit_width, available_height / unit_height)
+        return max(fitted, self.config.min_hex_size)
+
     def _create_centered_transformer(self) -> HexToPixelTransformer:
         """Create a transformer with the grid centered in the window.
 
+        Layouts are cached by window size, so returning to a size seen
+        before costs a dictionary lookup.
+
         Returns:
-            HexToPixelTransformer: A new transformer with centered origin
+            HexToPixelTransformer: The transformer for the current window size
         """
         # Get surface and grid dimensions
-        surface_width = self.surface.get_width()
-        surface_height = self.surface.get_height()
-        grid_width, grid_height = self._calculate_grid_pixel_size()
+        surface_size = (self.surface.get_width(), self.surface.get_height())
+        transformer = self._layouts.get(surface_size)
+        if transformer is not None:
+            return transformer
+
+        hex_size = (
+            self._fit_hex_size(surface_size)
+            if self.config.auto_fit
+            else self.config.hex_size
+        )
+        grid_width, grid_height = self._calculate_grid_pixel_size(hex_size)
 
         # Calculate origin position to center the grid
-        origin_x = (surface_width - grid_width) / 2
-        origin_y = (surface_height - grid_height) / 2
+        origin_x = (surface_size[0] - grid_width) / 2
+        origin_y = (surface_size[1] - grid_height) / 2
 
         # Add padding
         origin_x += self.config.padding
         origin_y += self.config.padding
 
-        return HexToPixelTransformer(
-            hex_size=self.config.hex_size, origin_x=origin_x, origin_y=origin_y
+        transformer = HexToPixelTransformer(
+            hex_size=hex_size, origin_x=origin_x, origin_y=origin_y
         )
+        if len(self._layouts) >= _LAYOUT_CACHE_SIZE:
+            del self._layouts[next(iter(self._layouts))]
+        self._layouts[surface_size] = transformer
+        return transformer
 
-    def handle_resize(self, new_size: Tuple[int, int]) -> None:
+    def handle_resize(
+        self, new_size: Tuple[int, int], surface: Optional[pygame.Surface] = None
+    ) -> None:
         """Handle window resize event.
 
+        Only the new surface is recorded; the layout is recomputed by
+        ``update_layout`` once no further resize arrived for the debounce
+        delay, so dragging a window edge does not relayout on every event.
+
         Args:
             new_size (Tuple[int, int]): New window size (width, height)
+            surface (Optional[pygame.Surface], optional): The resized display
+                surface. Defaults to the current display surface.
         """
-        # Update surface reference
-        self.surface = pygame.display.set_mode(new_size, pygame.RESIZABLE)
+        self.surface = surface or pygame.display.get_surface() or self.surface
+        self._resize_deadline = time.monotonic() + self.config.resize_debounce
+
+    def update_layout(self, now: Optional[float] = None) -> bool:
+        """Apply a pending resize once the window size has settled.
+
+        Args:
+            now (Optional[float], optional): The current ``time.monotonic()``
+                value. Defaults to the current time.
+
+        Returns:
+            bool: True if the layout changed
+        """
+        if self._resize_deadline is None:
+            return False
+        if (time.monotonic() if now is None else now) < self._resize_deadline:
+            return False
+        self._resize_deadline = None
         # Recalculate transformer for new window size
-        self.transformer = self._create_centered_transformer()
-        # Update renderer with new transformer
-        self.renderer = GridRenderer(
-            grid=self.grid,
-            transformer=self.transformer,
-            line_color=self.config.line_color,
-            line_width=self.config.line_width,
+        transformer = self._create_centered_transformer()
+        if transformer is self.transformer:
+            return False
+        self.transformer = transformer
+        # Renderers keep their caches and rebuild what depends on the layout
+        self.renderer.transformer = self._renderer_transformer()
+        if self.cell_renderer is not None:
+            self.cell_renderer.transformer = self.renderer.transformer
+        return True
+
+    def pan(self, dx: float, dy: float) -> bool:
+        """Scroll a toroidal grid across the window.
+
+        Bounded grids stay centered in the window.
+
+        Args:
+            dx (float): Pixels to move the grid to the right
+            dy (float): Pixels to move the grid down
+
+        Returns:
+            bool: True if the view moved
+        """
+        if not self.grid.wrap:
+            return False
+        x, y = self._pan[0] + dx, self._pan[1] + dy
+        period_x, shift_x, period_y = self._periods()
+        # Keep the offset within one tile; the view repeats beyond it
+        copies = math.floor(y / period_y)
+        self._pan = ((x - copies * shift_x) % period_x, y - copies * period_y)
+        return True
+
+    def cell_at(self, pixel: Tuple[float, float]) -> Optional[int]:
+        """Find the cell displayed at a pixel of the surface.
+
+        Args:
+            pixel (Tuple[float, float]): The (x, y) pixel, e.g. a mouse position
+
+        Returns:
+            Optional[int]: The cell id, or None if the pixel is off the grid
+        """
+        if self.grid.wrap:
+            # Hexes of the surrounding copies continue the tile's layout
+            base_x, base_y = self._tile_origin()
+            tile = self.renderer.transformer
+            return self.grid.cell_id(
+                tile.pixel_to_hex(pixel[0] - base_x, pixel[1] - base_y)
+            )
+        position = self.transformer.pixel_to_hex(*pixel)
+        if not self.grid.is_valid_position(position):
+            return None
+        return self.grid.cell_id(position)
+
+    def viewport(self) -> Tuple[float, float, float, float]:
+        """Get the part of the grid visible on the surface.
+
+        Returns:
+            Tuple[float, float, float, float]: The visible area as (left, top,
+            width, height) fractions of the grid's pixel size; values outside
+            0..1 mean the surface extends past the grid
+        """
+        hex_size = self.transformer.hex_size
+        grid_width, grid_height = self._calculate_grid_pixel_size(hex_size)
+        left = self.transformer.origin_x + self._pan[0] - hex_size
+        top = self.transformer.origin_y + self._pan[1] - self.transformer.height / 2
+        return (
+            -left / grid_width,
+            -top / grid_height,
+            self.surface.get_width() / grid_width,
+            self.surface.get_height() / grid_height,
+        )
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the bytes held by the frame surface and the render caches.
+
+        Returns:
+            Dict[str, int]: Bytes by surface or cache name
+        """
+        usage = {"frame": self.surface.get_pitch() * self.surface.get_height()}
+        usage.update(self.renderer.memory_usage())
+        if self.cell_renderer is not None:
+            usage.update(self.cell_renderer.memory_usage())
+        if self.cell_layer is not None:
+            usage.update(self.cell_layer.memory_usage())
+        if self.minimap is not None:
+            usage.update(self.minimap.memory_usage())
+        if self._tile is not None:
+            usage["grid tile"] = self._tile.get_pitch() * self._tile.get_height()
+        return usage
+
+    def render(self, state: Optional[CellState] = None) -> None:
+        """Render the grid centered in the window.
+
+        Args:
+            state (Optional[CellState], optional): The cell state to fill
+                cells with. Defaults to None.
+        """
+        palette = self.config.palette
+        states = None
+        if state is not None and palette is not None and self.cell_renderer is not None:
+            states = palette.states(state)
+        if self.grid.wrap:
+            self._render_tiles(states)
+        else:
+            if states is None or self.cell_renderer is None:
+                # Clear background
+                self.surface.fill(self.config.background_color)
+            elif self.cell_layer is not None:
+                # The cached layer holds the background and the filled cells
+                self.cell_layer.render(self.surface, states)
+            else:
+                self.surface.fill(self.config.background_color)
+                self.cell_renderer.render(self.surface, states)
+            # Render grid
+            self.renderer.render(self.surface)
+        # Overlay the minimap, brought up to date block by block
+        if state is not None and self.minimap is not None:
+            self.minimap.update(state)
+            width, height = self.minimap.size
+            position = (
+                self.surface.get_width() - width - self.config.padding,
+                self.surface.get_height() - height - self.config.padding,
+            )
+            self.minimap.render(self.surface, position, self.viewport())
+
+    def _renderer_transformer(self) -> HexToPixelTransformer:
+        """Get the layout the renderers draw with.
+
+        Returns:
+            HexToPixelTransformer: The window layout, or for toroidal grids
+            the layout of the tile, whose top-left hex touches its corner
+        """
+        if not self.grid.wrap:
+            return self.transformer
+        hex_size = self.transformer.hex_size
+        margin = self.config.line_width
+        return HexToPixelTransformer(
+            hex_size=hex_size,
+            origin_x=hex_size + margin,
+            origin_y=hex_size * (3**0.5) / 2 + margin,
         )
 
-    def render(self) -> None:
-        """Render the grid centered in the window."""
-        # Clear background
+    def _periods(self) -> Tuple[float, float, float]:
+        """Get how far apart the copies of a toroidal grid are drawn.
+
+        Returns:
+            Tuple[float, float, float]: The horizontal period, the horizontal
+            shift between vertically adjacent copies and the vertical period,
+            in pixels
+        """
+        hex_size = self.transformer.hex_size
+        height = self.grid.dimensions.height
+        shift = 1.5 * hex_size if height % 2 else 0.0
+        return (
+            3 * hex_size * self.grid.dimensions.width,
+            shift,
+            height * (hex_size * (3**0.5) / 2),
+        )
+
+    def _tile_origin(self) -> Tuple[float, float]:
+        """Get where the tile is blitted before any repetition."""
+        tile = self.renderer.transformer
+        return (
+            self.transformer.origin_x - tile.origin_x + self._pan[0],
+            self.transformer.origin_y - tile.origin_y + self._pan[1],
+        )
+
+    def _render_tiles(self, states: Optional[np.ndarray]) -> None:
+        """Fill the window with copies of the toroidal grid's tile."""
+        tile = self._update_tile(states)
         self.surface.fill(self.config.background_color)
-        # Render grid
-        self.renderer.render(self.surface)
+        for position in self._tile_positions(tile.get_size()):
+            self.surface.blit(tile, position)
+
+    def _update_tile(self, states: Optional[np.ndarray]) -> pygame.Surface:
+        """Redraw the tile if the layout or any cell color changed."""
+        tile_layout = self.renderer.transformer
+        grid_width, grid_height = self._calculate_grid_pixel_size(tile_layout.hex_size)
+        # The last row reaches half a hex height below the grid's nominal size
+        grid_height += tile_layout.height / 2
+        margin = 2 * self.config.line_width
+        size = (math.ceil(grid_width) + margin, math.ceil(grid_height) + margin)
+        key = (size, tile_layout.hex_size)
+        if (
+            self._tile is not None
+            and key == self._tile_key
+            and _same_states(states, self._tile_states)
+        ):
+            return self._tile
+        tile = self._tile
+        if tile is None or tile.get_size() != size:
+            tile = pygame.Surface(size, pygame.SRCALPHA)
+        tile.fill((0, 0, 0, 0))
+        if states is not None and self.cell_renderer is not None:
+            self.cell_renderer.render(tile, states)
+        self.renderer.render(tile)
+        self._tile, self._tile_key = tile, key
+        self._tile_states = None if states is None else states.copy()
+        return tile
+
+    def _tile_positions(self, tile_size: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Get the positions of the tile copies overlapping the window."""
+        period_x, shift_x, period_y = self._periods()
+        base_x, base_y = self._tile_origin()
+        surface_width, surface_height = self.surface.get_size()
+        positions: List[Tuple[int, int]] = []
+        first_row = math.floor((-tile_size[1] - base_y) / period_y) + 1
+        last_row = math.ceil((surface_height - base_y) / period_y) - 1
+        for row in range(first_row, last_row + 1):
+            row_x = base_x + row * shift_x
+            first = math.floor((-tile_size[0] - row_x) / period_x) + 1
+            last = math.ceil((surface_width - row_x) / period_x) - 1
+            positions.extend(
+                (round(row_x + column * period_x), round(base_y + row * period_y))
+                for column in range(first, last + 1)
+            )
+        return positions
+
+
+def _same_states(states: Optional[np.ndarray], drawn: Optional[np.ndarray]) -> bool:
+    """Check whether a tile drawn with some cell states is still current."""
+    if states is None or drawn is None:
+        return states is drawn
+    return bool(np.array_equal(states, drawn))
@@ -1,5 +1,7 @@
 """Grid rendering implementation using Pygame."""
-from typing import Tuple
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 
 import pygame
 
@@ -8,6 +10,15 @@ from src.domain.value_objects.grid_position import GridPosition
 
 from .coordinate_transformer import HexToPixelTransformer
 
+Point = Tuple[float, float]
+TileIndex = Tuple[int, int]
+# Vertices closer than this (in pixels) are the same vertex
+_VERTEX_DECIMALS = 6
+# Side length in pixels of one cached piece of the outline
+_OUTLINE_TILE = 512
+# Outline pieces kept for reuse besides the ones currently on screen
+_OUTLINE_TILES = 16
+
 
 class GridRenderer:
     """Renders a hexagonal grid using Pygame.
@@ -16,12 +27,20 @@ class GridRenderer:
     It uses the coordinate transformer to convert grid positions to screen
     coordinates and handles the actual Pygame drawing operations.
 
+    In outline mode every edge shared by two hexes is drawn once instead of
+    twice. The unique edges are chained into polylines, which are split into
+    square tiles relative to the grid origin. Only the tiles overlapping the
+    target surface are drawn, each once, and a bounded number of them is
+    cached, so rendering a frame is a few blits. Moving the origin reuses the
+    cached tiles; only a new hex size or line style rebuilds them.
+
     Attributes:
         grid (HexGrid): The grid to render
         transformer (HexToPixelTransformer): Coordinate transformer
             for pixel conversion
         line_color (Tuple[int, int, int]): RGB color for grid lines
         line_width (int): Width of grid lines in pixels
+        outline (bool): Whether to render the cached shared-edge outline
     """
 
     def __init__(
@@ -30,6 +49,7 @@ class GridRenderer:
         transformer: HexToPixelTransformer,
         line_color: Tuple[int, int, int] = (100, 100, 100),
         line_width: int = 1,
+        outline: bool = False,
     ) -> None:
         """Initialize the grid renderer.
 
@@ -41,11 +61,19 @@ class GridRenderer:
                 grid lines. Defaults to gray (100, 100, 100).
             line_width (int, optional): Width of grid lines in pixels.
                 Defaults to 1.
+            outline (bool, optional): Draw each shared edge once through a
+                cached outline surface. Defaults to False.
         """
         self.grid = grid
         self.transformer = transformer
         self.line_color = line_color
         self.line_width = line_width
+        self.outline = outline
+        self._outline_key: Optional[Tuple[object, ...]] = None
+        self._outline_runs: Dict[TileIndex, List[List[Point]]] = {}
+        self._outline_base = (0, 0)
+        self._outline_pad = 0
+        self._outline_tiles: "OrderedDict[TileIndex, pygame.Surface]" = OrderedDict()
 
     def render(self, surface: pygame.Surface) -> None:
         """Render the grid on the given surface.
@@ -53,6 +81,9 @@ class GridRenderer:
         Args:
             surface (pygame.Surface): The surface to draw on
         """
+        if self.outline:
+            self._render_outline(surface)
+            return
         # Iterate through all possible grid positions
         for q in range(self.grid.dimensions.width):
             for r in range(self.grid.dimensions.height):
@@ -78,3 +109,163 @@ class GridRenderer:
             vertices,
             self.line_width,
         )
+
+    def outline_paths(self) -> List[List[Point]]:
+        """Chain the unique edges of the grid outline into polylines.
+
+        Returns:
+            List[List[Point]]: Polylines that together cover every edge of
+            every hexagon exactly once
+        """
+        adjacency: Dict[Point, Set[Point]] = {}
+        for q in range(self.grid.dimensions.width):
+            for r in range(self.grid.dimensions.height):
+                center = self.transformer.hex_to_pixel(GridPosition(q=q, r=r))
+                vertices = [
+                    (round(x, _VERTEX_DECIMALS), round(y, _VERTEX_DECIMALS))
+                    for x, y in self.transformer.get_hex_vertices(center)
+                ]
+                for start, end in zip(vertices, vertices[1:] + vertices[:1]):
+                    adjacency.setdefault(start, set()).add(end)
+                    adjacency.setdefault(end, set()).add(start)
+
+        # Starting at odd-degree vertices first keeps the number of paths low
+        starts = sorted(adjacency, key=lambda vertex: len(adjacency[vertex]) % 2 == 0)
+        paths = []
+        for start in starts:
+            while adjacency[start]:
+                path = [start]
+                current = start
+                while adjacency[current]:
+                    following = adjacency[current].pop()
+                    adjacency[following].discard(current)
+                    path.append(following)
+                    current = following
+                paths.append(path)
+        return paths
+
+    def _render_outline(self, surface: pygame.Surface) -> None:
+        """Blit the outline tiles overlapping the surface.
+
+        The origin is rounded to whole pixels, so with a fractional origin the
+        lines may sit up to half a pixel away from where polygons would.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on
+        """
+        key = (self.transformer.hex_size, self.line_color, self.line_width)
+        if key != self._outline_key:
+            self._split_outline()
+            self._outline_key = key
+        origin_x = round(self.transformer.origin_x) + self._outline_base[0]
+        origin_y = round(self.transformer.origin_y) + self._outline_base[1]
+        width, height = surface.get_width(), surface.get_height()
+        columns = range(
+            max(0, -origin_x // _OUTLINE_TILE), (width - origin_x) // _OUTLINE_TILE + 1
+        )
+        rows = range(
+            max(0, -origin_y // _OUTLINE_TILE), (height - origin_y) // _OUTLINE_TILE + 1
+        )
+        pad = self._outline_pad
+        visible = [
+            (column, row)
+            for row in rows
+            for column in columns
+            if (column, row) in self._outline_runs
+        ]
+        for index in visible:
+            tile = self._outline_tiles.get(index)
+            if tile is None:
+                tile = self._draw_outline_tile(index)
+                self._outline_tiles[index] = tile
+            self._outline_tiles.move_to_end(index)
+            surface.blit(
+                tile,
+                (
+                    origin_x + index[0] * _OUTLINE_TILE,
+                    origin_y + index[1] * _OUTLINE_TILE,
+                ),
+                (pad, pad, _OUTLINE_TILE, _OUTLINE_TILE),
+            )
+        while len(self._outline_tiles) > max(_OUTLINE_TILES, len(visible)):
+            self._outline_tiles.popitem(last=False)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the pixel bytes held by the cached outline tiles.
+
+        Returns:
+            Dict[str, int]: Bytes by cache name, empty before the first
+            outline render
+        """
+        if not self._outline_tiles:
+            return {}
+        return {
+            "outline": sum(
+                tile.get_pitch() * tile.get_height()
+                for tile in self._outline_tiles.values()
+            )
+        }
+
+    def _split_outline(self) -> None:
+        """Split the outline polylines into runs per tile.
+
+        Coordinates are kept relative to the transformer's origin, so the
+        runs stay valid when the origin moves.
+        """
+        origin_x, origin_y = self.transformer.origin_x, self.transformer.origin_y
+        paths = [
+            [(x - origin_x, y - origin_y) for x, y in path]
+            for path in self.outline_paths()
+        ]
+        points = [point for path in paths for point in path]
+        # Integer offsets keep every line on the same pixels as direct drawing
+        base_x = math.floor(min(x for x, _ in points)) - self.line_width
+        base_y = math.floor(min(y for _, y in points)) - self.line_width
+
+        runs: Dict[TileIndex, List[List[Point]]] = {}
+        previous: Dict[TileIndex, Tuple[int, int]] = {}
+        margin = self.line_width
+        for path_index, path in enumerate(paths):
+            for segment, (start, end) in enumerate(zip(path, path[1:])):
+                left = (min(start[0], end[0]) - margin - base_x) // _OUTLINE_TILE
+                right = (max(start[0], end[0]) + margin - base_x) // _OUTLINE_TILE
+                top = (min(start[1], end[1]) - margin - base_y) // _OUTLINE_TILE
+                bottom = (max(start[1], end[1]) + margin - base_y) // _OUTLINE_TILE
+                for row in range(int(top), int(bottom) + 1):
+                    for column in range(int(left), int(right) + 1):
+                        index = (column, row)
+                        tile_runs = runs.setdefault(index, [])
+                        # Consecutive segments of a path continue the same run
+                        if previous.get(index) == (path_index, segment - 1):
+                            tile_runs[-1].append(end)
+                        else:
+                            tile_runs.append([start, end])
+                        previous[index] = (path_index, segment)
+        self._outline_runs = runs
+        self._outline_base = (base_x, base_y)
+        # Room for a whole edge past each side; pygame shifts clipped lines
+        self._outline_pad = math.ceil(self.transformer.hex_size) + self.line_width
+        self._outline_tiles.clear()
+
+    def _draw_outline_tile(self, index: TileIndex) -> pygame.Surface:
+        """Draw the runs crossing one tile into a transparent surface.
+
+        The surface extends an edge length past the tile on every side, so
+        the lines crossing the tile are drawn whole, on the same pixels as in
+        one big surface.
+
+        Args:
+            index (TileIndex): The tile's column and row
+
+        Returns:
+            pygame.Surface: The padded tile
+        """
+        pad = self._outline_pad
+        left = self._outline_base[0] + index[0] * _OUTLINE_TILE - pad
+        top = self._outline_base[1] + index[1] * _OUTLINE_TILE - pad
+        size = _OUTLINE_TILE + 2 * pad
+        tile = pygame.Surface((size, size), pygame.SRCALPHA)
+        for run in self._outline_runs[index]:
+            shifted = [(x - left, y - top) for x, y in run]
+            pygame.draw.lines(tile, self.line_color, False, shifted, self.line_width)
+        return tile
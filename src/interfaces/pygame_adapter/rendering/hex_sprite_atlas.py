@@ -0,0 +1,90 @@
+"""Pre-rendered hexagon sprites for drawing filled cells."""
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+class HexSpriteAtlas:
+    """Pre-rendered filled hexagons, one per cell state color.
+
+    Every sprite is a flat-topped hexagon of the atlas' ``hex_size`` on a
+    transparent background with per-pixel alpha, so filled cells can be
+    blitted instead of rasterizing a polygon per cell and frame. Sprites
+    are only rebuilt when the hexagon size changes.
+
+    Attributes:
+        colors (Tuple[Color, ...]): The fill color of every state, indexed
+            by state number
+        hex_size (float): The size (radius) of the pre-rendered hexagons
+        sprites (List[pygame.Surface]): The sprite of every state
+    """
+
+    def __init__(self, colors: Sequence[Color], hex_size: float) -> None:
+        """Pre-render one sprite per color.
+
+        Args:
+            colors (Sequence[Color]): The fill color of every state
+            hex_size (float): The size (radius) of a hexagon in pixels
+
+        Raises:
+            ValueError: If no color is given
+        """
+        if not colors:
+            raise ValueError("A sprite atlas needs at least one color")
+        self.colors = tuple(colors)
+        self.hex_size = hex_size
+        self.sprites: List[pygame.Surface] = []
+        self._build()
+
+    @property
+    def anchor(self) -> Tuple[float, float]:
+        """Tuple[float, float]: The hexagon center within each sprite."""
+        return self.hex_size, self.hex_size * math.sqrt(3) / 2
+
+    def resize(self, hex_size: float) -> None:
+        """Re-render the sprites for a new hexagon size, if it changed.
+
+        Args:
+            hex_size (float): The new size (radius) of a hexagon in pixels
+        """
+        if hex_size != self.hex_size:
+            self.hex_size = hex_size
+            self._build()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the pixel bytes held by the sprites.
+
+        Returns:
+            Dict[str, int]: Bytes by cache name
+        """
+        return {
+            "sprites": sum(
+                sprite.get_pitch() * sprite.get_height() for sprite in self.sprites
+            )
+        }
+
+    def _build(self) -> None:
+        center_x, center_y = self.anchor
+        size = (math.ceil(2 * center_x) + 1, math.ceil(2 * center_y) + 1)
+        half = self.hex_size / 2
+        vertices = [
+            (center_x + self.hex_size, center_y),
+            (center_x + half, center_y * 2),
+            (center_x - half, center_y * 2),
+            (center_x - self.hex_size, center_y),
+            (center_x - half, 0.0),
+            (center_x + half, 0.0),
+        ]
+        # Sprites in the display's pixel format blit much faster
+        converted = pygame.display.get_surface() is not None
+        self.sprites = []
+        for color in self.colors:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, color, vertices)
+            self.sprites.append(sprite.convert_alpha() if converted else sprite)
+
+    def __str__(self) -> str:
+        return f"HexSpriteAtlas(colors={len(self.colors)}, hex_size={self.hex_size})"
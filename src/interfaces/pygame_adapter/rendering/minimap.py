@@ -0,0 +1,206 @@
+"""Downsampled overview of the whole grid with the visible area marked."""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.domain.entities.grid import HexGrid
+from src.domain.interfaces.cell_state import CellState
+
+from .cell_renderer import CellPalette
+from .hex_sprite_atlas import Color
+
+# The fields aggregated per block
+_FIELDS = ("terrain", "biomass")
+
+
+class Minimap:
+    """Shows the grid as square blocks of cells, one pixel per block.
+
+    Every block is colored by the palette from its dominant terrain type and
+    its mean biomass. Block colors are kept between frames and recomputed
+    only for blocks containing cells whose value changed since the previous
+    update, found by comparing fields whose version changed. A frame in
+    which neither field changed costs a version check and two blits.
+
+    Attributes:
+        grid (HexGrid): The grid to show
+        palette (CellPalette): Colors of terrain types and plant cover
+        block (int): The side of a block in cells
+        size (Tuple[int, int]): The minimap size in pixels
+        viewport_color (Color): The color of the visible area's outline
+        blocks_updated (int): Blocks recomputed by the latest update
+    """
+
+    def __init__(
+        self,
+        grid: HexGrid,
+        palette: CellPalette,
+        block: int,
+        size: Tuple[int, int],
+        viewport_color: Color = (255, 255, 255),
+    ) -> None:
+        """Initialize the minimap without any block computed.
+
+        Args:
+            grid (HexGrid): The grid to show
+            palette (CellPalette): Colors of terrain types and plant cover
+            block (int): The side of a block in cells
+            size (Tuple[int, int]): The minimap size in pixels
+            viewport_color (Color, optional): The color of the visible
+                area's outline. Defaults to white.
+
+        Raises:
+            ValueError: If the block or the size is not positive
+        """
+        if block <= 0:
+            raise ValueError("Minimap block must be positive")
+        if min(size) <= 0:
+            raise ValueError("Minimap size must be positive")
+        self.grid = grid
+        self.palette = palette
+        self.block = block
+        self.size = size
+        self.viewport_color = viewport_color
+        self.blocks_updated = 0
+        width, height = grid.dimensions.width, grid.dimensions.height
+        self.blocks_wide = -(-width // block)
+        self.blocks_high = -(-height // block)
+        self._colors = np.array(palette.colors, dtype=np.uint8)
+        self._blocks = pygame.Surface((self.blocks_wide, self.blocks_high), 0, 32)
+        self._scaled: Optional[pygame.Surface] = None
+        self._versions: Dict[str, Optional[int]] = {}
+        self._fields: Dict[str, Optional[np.ndarray]] = {}
+
+    def update(self, state: CellState) -> None:
+        """Recompute the blocks containing cells changed since the last update.
+
+        Args:
+            state (CellState): The cell state to show
+        """
+        self.blocks_updated = 0
+        versions = {name: state.versions.get(name) for name in _FIELDS}
+        if self._scaled is not None and versions == self._versions:
+            return
+        fields = {name: state.fields.get(name) for name in _FIELDS}
+        if self._scaled is None:
+            dirty = self._all_blocks()
+        else:
+            dirty = self._dirty_blocks(fields, versions)
+        if dirty.size:
+            self._recompute(dirty, fields)
+            self._scaled = pygame.transform.scale(self._blocks, self.size)
+        self.blocks_updated = int(dirty.size)
+        self._versions = versions
+        # Read-only snapshot arrays never change and can be kept as they are
+        self._fields = {
+            name: None
+            if values is None
+            else (values.copy() if values.flags.writeable else values)
+            for name, values in fields.items()
+        }
+
+    def render(
+        self,
+        surface: pygame.Surface,
+        position: Tuple[int, int],
+        viewport: Optional[Tuple[float, float, float, float]] = None,
+    ) -> None:
+        """Draw the minimap, outlining the visible part of the grid.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on
+            position (Tuple[int, int]): The top-left corner of the minimap
+            viewport (Optional[Tuple[float, float, float, float]], optional):
+                The visible area as (left, top, width, height) fractions of
+                the grid. Defaults to None (no outline).
+        """
+        if self._scaled is None:
+            return
+        surface.blit(self._scaled, position)
+        if viewport is None:
+            return
+        width, height = self.size
+        left, top, visible_width, visible_height = viewport
+        outline = pygame.Rect(
+            position[0] + round(left * width),
+            position[1] + round(top * height),
+            max(round(visible_width * width), 1),
+            max(round(visible_height * height), 1),
+        ).clip(pygame.Rect(position, self.size))
+        if outline.width and outline.height:
+            pygame.draw.rect(surface, self.viewport_color, outline, 1)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Get the pixel bytes held by the block and scaled surfaces.
+
+        Returns:
+            Dict[str, int]: Bytes by cache name
+        """
+        surfaces = [self._blocks] + ([self._scaled] if self._scaled else [])
+        return {
+            "minimap": sum(
+                surface.get_pitch() * surface.get_height() for surface in surfaces
+            )
+        }
+
+    def _all_blocks(self) -> np.ndarray:
+        blocks: np.ndarray = np.arange(self.blocks_wide * self.blocks_high)
+        return blocks
+
+    def _dirty_blocks(
+        self,
+        fields: Dict[str, Optional[np.ndarray]],
+        versions: Dict[str, Optional[int]],
+    ) -> np.ndarray:
+        """Find the blocks containing cells whose value changed."""
+        changed: np.ndarray = np.zeros(self.grid.cell_count, dtype=bool)
+        for name, values in fields.items():
+            previous = self._fields[name]
+            if versions[name] == self._versions[name] or values is previous:
+                continue
+            if values is None or previous is None:
+                # A field appeared or disappeared
+                return self._all_blocks()
+            changed |= values != previous
+        cells = np.flatnonzero(changed)
+        width = self.grid.dimensions.width
+        blocks = (cells // width // self.block) * self.blocks_wide + (
+            cells % width // self.block
+        )
+        dirty: np.ndarray = np.unique(blocks)
+        return dirty
+
+    def _recompute(
+        self, blocks: np.ndarray, fields: Dict[str, Optional[np.ndarray]]
+    ) -> None:
+        """Aggregate the cells of some blocks and repaint their pixels."""
+        width, height = self.grid.dimensions.width, self.grid.dimensions.height
+        block_q: np.ndarray = blocks % self.blocks_wide
+        block_r: np.ndarray = blocks // self.blocks_wide
+        offset_r, offset_q = np.divmod(np.arange(self.block**2), self.block)
+        q = block_q[:, None] * self.block + offset_q[None, :]
+        r = block_r[:, None] * self.block + offset_r[None, :]
+        inside = (q < width) & (r < height)
+        cells = np.where(inside, r * width + q, 0)
+        counts = inside.sum(axis=1)
+
+        terrain = fields["terrain"]
+        dominant = None
+        if terrain is not None:
+            types = len(self.palette.terrain_colors)
+            values = np.clip(terrain[cells], 0, types - 1).astype(np.int64)
+            keys = np.arange(blocks.size)[:, None] * types + values
+            histogram = np.bincount(
+                keys[inside], minlength=blocks.size * types
+            ).reshape(blocks.size, types)
+            dominant = histogram.argmax(axis=1)
+        biomass = fields["biomass"]
+        mean = None
+        if biomass is not None:
+            mean = np.where(inside, biomass[cells], 0.0).sum(axis=1) / counts
+
+        states = self.palette.classify(dominant, mean, blocks.size)
+        pixels = pygame.surfarray.pixels3d(self._blocks)
+        pixels[block_q, block_r] = self._colors[states]
+        del pixels
@@ -1,16 +1,33 @@
 """Main entry point for the HexLife simulation."""
+import logging
 import sys
+from bisect import bisect_left
+from concurrent.futures import Future
+from typing import Optional, Tuple
 
 import pygame
 
-from src.config import colors, display
+from src.application.services.memory_report import MemoryReport, engine_memory_report
+from src.application.services.metrics import MetricsStage, attach_metrics
+from src.application.services.rewind import RewindBuffer, RewindRecorder
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.simulation_worker import SimulationWorker
+from src.application.services.snapshots import FrameSnapshot, SnapshotBuffer
+from src.config import colors, display, simulation
 from src.domain.entities.grid import HexGrid
 from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.checkpoints import ForkCheckpointer
+from src.infrastructure.persistence.metrics_store import ChunkedMetricsWriter
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.interfaces.pygame_adapter.input.brushes import Brush, BrushTool
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellPalette
 from src.interfaces.pygame_adapter.rendering.grid_display import (
     DisplayConfig,
     GridDisplay,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class GameLoop:
     """Main game loop class that handles the simulation lifecycle."""
@@ -22,10 +39,55 @@ class GameLoop:
         pygame.display.set_caption(display.WINDOW_TITLE)
         self.clock = pygame.time.Clock()
         self.running = False
+        self.needs_redraw = True
 
         # Initialize grid and display components
         dimensions = GridDimensions(display.GRID_WIDTH, display.GRID_HEIGHT)
-        self.grid = HexGrid(dimensions)
+        self.grid = HexGrid(dimensions, wrap=display.GRID_WRAP)
+
+        # Compile the ecology rules once and create the initial world
+        self.engine = SimulationEngine.from_rule_set(
+            rule_set=load_rule_set(simulation.RULES_PATH),
+            grid=self.grid,
+            seed=simulation.SEED,
+            backend=simulation.BACKEND,
+        )
+
+        self.metrics: Optional[Tuple[MetricsStage, ChunkedMetricsWriter]] = None
+        if simulation.METRICS_PATH is not None:
+            writer = ChunkedMetricsWriter(
+                simulation.METRICS_PATH, simulation.METRICS_CHUNK_SIZE
+            )
+            stage = attach_metrics(
+                self.engine,
+                writer.append,
+                counts=dict(simulation.METRIC_COUNTS),
+                totals=simulation.METRIC_TOTALS,
+                histograms=simulation.METRIC_HISTOGRAMS,
+                state_hash=simulation.METRIC_HASH,
+            )
+            self.metrics = (stage, writer)
+
+        # Checkpoints are written in the background, so ticking continues;
+        # with the worker thread running they are copied rather than forked
+        self.checkpoints: Optional[ForkCheckpointer] = None
+        if simulation.CHECKPOINT_PATH is not None:
+            self.checkpoints = ForkCheckpointer(
+                simulation.CHECKPOINT_PATH,
+                simulation.CHECKPOINT_INTERVAL,
+                fork=simulation.CHECKPOINT_FORK,
+            )
+            self.engine.add_stage(self.checkpoints)
+
+        # The engine ticks on a worker thread and hands finished frames to
+        # the render loop through a lock-free snapshot buffer
+        self.snapshots = SnapshotBuffer()
+        self.worker = SimulationWorker(
+            engine=self.engine,
+            buffer=self.snapshots,
+            ticks_per_second=simulation.TICKS_PER_SECOND * simulation.SIMULATION_SPEED,
+        )
+        self.snapshot: Optional[FrameSnapshot] = None
 
         # Create display configuration
         display_config = DisplayConfig(
@@ -34,6 +96,18 @@ class GameLoop:
             line_color=colors.GRID_LINES,
             line_width=display.GRID_LINE_WIDTH,
             padding=display.GRID_PADDING,
+            outline=display.GRID_OUTLINE,
+            auto_fit=display.AUTO_FIT,
+            resize_debounce=display.RESIZE_DEBOUNCE_MS / 1000,
+            cell_layer=display.CELL_LAYER,
+            minimap=display.MINIMAP,
+            minimap_block=display.MINIMAP_BLOCK,
+            minimap_width=display.MINIMAP_WIDTH,
+            palette=CellPalette(
+                terrain_colors=colors.TERRAIN,
+                plant_colors=colors.PLANTS,
+                plant_threshold=colors.PLANT_THRESHOLD,
+            ),
         )
 
         # Initialize grid display
@@ -41,42 +115,215 @@ class GameLoop:
             grid=self.grid, config=display_config, surface=self.screen
         )
 
+        # Brush strokes become edit commands applied at the next tick boundary
+        self.brush_tool = BrushTool(
+            grid=self.grid,
+            commands=self.engine.commands,
+            brush=Brush(
+                field=display.BRUSH_FIELD,
+                value=display.BRUSH_VALUE,
+                radius=display.BRUSH_RADIUS,
+                shape=display.BRUSH_SHAPE,
+            ),
+            locate=self.grid_display.cell_at,
+        )
+
+        # Arrow keys scroll toroidal grids, moving the view toward the arrow
+        step = display.PAN_STEP
+        self.pan_keys = {
+            pygame.K_LEFT: (step, 0),
+            pygame.K_RIGHT: (-step, 0),
+            pygame.K_UP: (0, step),
+            pygame.K_DOWN: (0, -step),
+        }
+
+        # Recent states are kept compressed, so the display can scrub back
+        # through them and the simulation can continue from any of them;
+        # compression happens on the recorder's thread, not this one
+        self.rewind = RewindBuffer(display.REWIND_BUDGET_MB * 2**20)
+        self.recorder = RewindRecorder(self.rewind)
+        self.rewind_tick: Optional[int] = None
+        self.rewind_keys = {
+            pygame.K_COMMA: -1,
+            pygame.K_PERIOD: 1,
+            pygame.K_PAGEUP: -display.REWIND_JUMP,
+            pygame.K_PAGEDOWN: display.REWIND_JUMP,
+        }
+
+        # Engine memory is measured on the worker thread between ticks
+        self.memory_request: Optional["Future[MemoryReport]"] = None
+
+    @property
+    def idle(self) -> bool:
+        """bool: True while the simulation is paused and the frame is current."""
+        return (
+            self.worker.paused
+            and not self.needs_redraw
+            and not self.grid_display.resize_pending
+            and not self.brush_tool.painting
+            and not self.engine.commands.pending
+            and self.memory_request is None
+        )
+
     def handle_events(self) -> None:
-        """Process all pygame events."""
+        """Process all pending pygame events."""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                self.screen = pygame.display.set_mode(
-                    (event.w, event.h), pygame.RESIZABLE
-                )
-                self.grid_display.handle_resize((event.w, event.h))
+            self.handle_event(event)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Process one pygame event; any event invalidates the frame.
+
+        Args:
+            event (pygame.event.Event): The event to process
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.VIDEORESIZE:
+            # A resizable window's surface already follows the window, so the
+            # mode is never set again; the display relayouts once settled
+            self.screen = pygame.display.get_surface() or self.screen
+            self.grid_display.handle_resize((event.w, event.h), self.screen)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.toggle_pause()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+            self.request_memory_report()
+        elif event.type == pygame.KEYDOWN and event.key in self.pan_keys:
+            self.grid_display.pan(*self.pan_keys[event.key])
+        elif event.type == pygame.KEYDOWN and event.key in self.rewind_keys:
+            self.scrub(self.rewind_keys[event.key])
+        elif self.rewind_tick is None:
+            # Past states are only viewed, not painted
+            self.brush_tool.handle_event(event)
+        self.needs_redraw = True
+
+    def toggle_pause(self) -> None:
+        """Pause the simulation, or resume it if it is paused.
+
+        While rewinding, the simulation resumes from the state on screen.
+        """
+        if self.rewind_tick is not None:
+            self.worker.restore(self.rewind.frame_at(self.rewind_tick))
+            self.rewind_tick = None
+            self.worker.resume()
+        elif self.worker.paused:
+            self.worker.resume()
+        else:
+            self.worker.pause()
+
+    def scrub(self, frames: int) -> None:
+        """Show an earlier or later stored state, pausing the simulation.
+
+        No states are recorded while scrubbing, so the stored frames stay
+        put until the simulation resumes.
+
+        Args:
+            frames (int): Frames to move by, negative to go back in time
+        """
+        if self.rewind_tick is None:
+            # States still being compressed belong to the history shown
+            self.recorder.drain()
+            ticks = self.rewind.ticks
+            if not ticks:
+                return
+            self.worker.pause()
+            self.rewind_tick = ticks[-1]
+        ticks = self.rewind.ticks
+        index = bisect_left(ticks, self.rewind_tick) + frames
+        self.rewind_tick = ticks[min(max(index, 0), len(ticks) - 1)]
+
+    def request_memory_report(self) -> None:
+        """Ask the worker to measure the engine at its next tick boundary.
+
+        The report is completed with the display's memory and logged by
+        ``update`` once the worker has produced it.
+        """
+        if self.memory_request is None:
+            self.memory_request = self.worker.call(self._engine_memory_report)
+
+    def memory_report(self, engine_report: MemoryReport) -> MemoryReport:
+        """Add the memory of the display to a report on the engine.
+
+        Args:
+            engine_report (MemoryReport): The engine's memory, measured on
+                the worker thread
+
+        Returns:
+            MemoryReport: Engine memory, the latest snapshot, the display's
+            render caches and the rewind history
+        """
+        return engine_report.with_usage(
+            "render caches", self.grid_display.memory_usage()
+        ).with_usage("rewind", self.rewind.memory_usage())
+
+    def _engine_memory_report(self) -> MemoryReport:
+        # Runs on the worker thread, the only one touching the engine
+        snapshot = self.snapshots.latest()
+        return engine_memory_report(self.engine, [snapshot] if snapshot else [])
+
+    def wait_for_input(self) -> None:
+        """Block until an event arrives or the idle wait times out."""
+        event = pygame.event.wait(display.IDLE_WAIT_MS)
+        if event.type != pygame.NOEVENT:
+            self.handle_event(event)
 
     def update(self) -> None:
-        """Update game state."""
-        pass  # Will be implemented in the next step
+        """Pick up the latest snapshot and apply a settled window resize."""
+        self.worker.check()
+        if self.memory_request is not None and self.memory_request.done():
+            request, self.memory_request = self.memory_request, None
+            logger.info("%s", self.memory_report(request.result()).format())
+        if self.grid_display.update_layout():
+            self.needs_redraw = True
+        snapshot = self.snapshots.latest()
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            self.needs_redraw = True
+            if snapshot is not None and self.rewind_tick is None:
+                self.recorder.record(snapshot)
 
     def render(self) -> None:
-        """Render the current game state."""
-        self.grid_display.render()
+        """Render the current game state, or the stored state being viewed."""
+        if self.rewind_tick is None:
+            self.grid_display.render(self.snapshot)
+        else:
+            self.grid_display.render(self.rewind.frame_at(self.rewind_tick))
         pygame.display.flip()
+        self.needs_redraw = False
 
     def run(self) -> None:
         """Run the main game loop."""
         self.running = True
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(display.FPS)
+        self.worker.start()
+        try:
+            while self.running:
+                # Nothing changes on screen while paused until input arrives,
+                # so block instead of redrawing the same frame at full rate
+                if self.idle:
+                    self.wait_for_input()
+                self.handle_events()
+                self.update()
+                if self.needs_redraw:
+                    self.render()
+                self.clock.tick(display.FPS)
+        finally:
+            self.worker.stop()
 
     def cleanup(self) -> None:
         """Clean up resources before exiting."""
+        self.worker.stop()
+        self.recorder.close()
+        if self.metrics is not None:
+            stage, writer = self.metrics
+            stage.close()
+            writer.close()
+        if self.checkpoints is not None:
+            self.checkpoints.close()
         pygame.quit()
 
 
 def main() -> None:
     """Entry point of the application."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     game = GameLoop()
     try:
         game.run()
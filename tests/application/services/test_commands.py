@@ -0,0 +1,148 @@
+"""Tests for the batched edit command queue."""
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from src.application.services.commands import CellEdit, CommandQueue
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.simulation_worker import SimulationWorker
+from src.application.services.snapshots import SnapshotBuffer
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+
+@pytest.fixture
+def world():
+    """Create a 10x6 world with a single float field."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=10, height=6)))
+    world.add_field("biomass", np.float64)
+    return world
+
+
+def test_queue_coalesces_commands_last_write_wins(world):
+    """Test that overlapping edits keep the value of the latest command."""
+    queue = CommandQueue()
+    queue.submit(CellEdit.create("biomass", np.array([1, 2, 3]), 0.25))
+    queue.submit(CellEdit.create("biomass", np.array([3, 4]), np.array([0.5, 0.75])))
+    queue.submit(CellEdit.create("biomass", np.array([1, 1]), np.array([0.1, 0.9])))
+    version = world.versions["biomass"]
+    assert queue.pending == 3
+
+    batch = queue.apply(world)
+
+    assert queue.pending == 0
+    assert batch.commands == 3
+    assert batch.fields == ("biomass",)
+    assert np.array_equal(batch.cells, [1, 2, 3, 4])
+    assert np.allclose(world.fields["biomass"][:5], [0.0, 0.9, 0.25, 0.5, 0.75])
+    # One version bump for the whole batch
+    assert world.versions["biomass"] > version
+    assert world.versions["biomass"] == max(world.versions.values())
+    assert queue.apply(world) is None
+
+
+def test_batch_region_encloses_every_field(world):
+    """Test that a batch spanning fields is one dirty region."""
+    world.add_field("terrain", dtype=np.int8)
+    queue = CommandQueue()
+    queue.submit(CellEdit.create("biomass", np.array([12]), 1.0))
+    queue.submit(CellEdit.create("terrain", np.array([35, 13]), 2))
+
+    batch = queue.apply(world)
+
+    assert batch.fields == ("biomass", "terrain")
+    assert np.array_equal(batch.cells, [12, 13, 35])
+    assert batch.region == GridRegion(q=2, r=1, width=4, height=3)
+    assert world.fields["terrain"][35] == 2
+
+
+def test_invalid_commands_are_dropped_with_a_warning(world, caplog):
+    """Test that bad edits are logged and skipped, the rest still applied."""
+    with pytest.raises(ValueError):
+        CellEdit.create("biomass", np.array([-1]), 1.0)
+    world.add_field("terrain", dtype=np.int8)
+    queue = CommandQueue()
+    queue.submit(CellEdit.create("biomass", np.array([60]), 1.0))
+    queue.submit(CellEdit.create("missing", np.array([0]), 1.0))
+    queue.submit(CellEdit.create("biomass", np.array([2]), 0.5))
+    queue.submit(CellEdit.create("terrain", np.array([1]), "rock"))
+    versions = dict(world.versions)
+
+    with caplog.at_level(logging.WARNING):
+        batch = queue.apply(world)
+
+    assert batch.fields == ("biomass",)
+    assert np.array_equal(batch.cells, [2])
+    assert np.flatnonzero(world.fields["biomass"]).tolist() == [2]
+    assert not world.fields["terrain"].any()
+    assert world.versions["terrain"] == versions["terrain"]
+    assert len(caplog.records) == 3
+
+    queue.submit(CellEdit.create("missing", np.array([0]), 1.0))
+    assert queue.apply(world) is None
+
+
+def test_values_the_field_cannot_hold_are_dropped(world, caplog):
+    """Test that out-of-range values are rejected instead of wrapping."""
+    world.add_field("t", dtype=np.uint8)
+    world.add_field("small", dtype=np.float32)
+    queue = CommandQueue()
+    queue.submit(CellEdit.create("t", np.array([1, 2]), 300))
+    queue.submit(CellEdit.create("t", np.array([3]), -1.0))
+    queue.submit(CellEdit.create("t", np.array([4]), 2.5))
+    queue.submit(CellEdit.create("small", np.array([5]), 1e300))
+    queue.submit(CellEdit.create("t", np.array([6]), 255))
+    queue.submit(CellEdit.create("small", np.array([7]), 0.1))
+
+    with caplog.at_level(logging.WARNING):
+        batch = queue.apply(world)
+
+    assert len(caplog.records) == 4
+    assert np.array_equal(batch.cells, [6, 7])
+    assert np.flatnonzero(world.fields["t"]).tolist() == [6]
+    assert world.fields["t"][6] == 255
+    assert np.flatnonzero(world.fields["small"]).tolist() == [7]
+
+
+def test_engine_applies_edits_before_the_rules():
+    """Test that queued edits are part of the next tick."""
+    grid = HexGrid(dimensions=GridDimensions(width=8, height=6))
+    edited = SimulationEngine.from_rule_set(load_rule_set(), grid, seed=0)
+    expected = SimulationEngine.from_rule_set(load_rule_set(), grid, seed=0)
+    cells = np.arange(8)
+
+    edited.commands.submit(CellEdit.create("biomass", cells, 1.0))
+    edited.step()
+    expected.world.fields["biomass"][cells] = 1.0
+    expected.step()
+
+    assert np.array_equal(
+        edited.world.get_field("biomass"), expected.world.get_field("biomass")
+    )
+
+
+def test_paused_worker_publishes_applied_edits():
+    """Test that edits submitted while paused reach the renderer."""
+    grid = HexGrid(dimensions=GridDimensions(width=8, height=6))
+    engine = SimulationEngine.from_rule_set(load_rule_set(), grid, seed=0)
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+    worker.start()
+    try:
+        worker.pause()
+        time.sleep(0.05)
+        paused_tick = buffer.latest().tick
+        engine.commands.submit(CellEdit.create("biomass", np.array([5]), 0.5))
+        deadline = time.monotonic() + 5.0
+        while buffer.latest().get_field("biomass")[5] != 0.5:
+            assert time.monotonic() < deadline, "Edit not published in time"
+            time.sleep(0.005)
+        assert buffer.latest().tick == paused_tick
+    finally:
+        worker.stop()
+    worker.check()
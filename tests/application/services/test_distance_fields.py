@@ -0,0 +1,115 @@
+"""Tests for incrementally maintained distance fields."""
+import numpy as np
+import pytest
+
+from src.application.services.distance_fields import (
+    FAR,
+    DistanceField,
+    DistanceFieldStage,
+)
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+
+
+def hex_distances(grid, sources):
+    """Compute reference distances with the hex metric of the drawn layout."""
+    cells = np.arange(grid.cell_count)
+    q, r = cells % grid.dimensions.width, cells // grid.dimensions.width
+    # Axial coordinates of the layout, whose odd rows are shifted right
+    x, z = 2 * q + r % 2, r // 2 - q
+    distances = np.full(grid.cell_count, FAR, dtype=np.int64)
+    for source in np.flatnonzero(sources):
+        dx, dz = x - x[source], z - z[source]
+        distances = np.minimum(distances, (abs(dx) + abs(dz) + abs(dx + dz)) // 2)
+    return distances
+
+
+@pytest.fixture
+def grid():
+    """Create a medium grid."""
+    return HexGrid(dimensions=GridDimensions(width=20, height=15))
+
+
+def test_initial_build_matches_hex_distance(grid):
+    """Test that the multi-source search finds hex distances."""
+    sources = np.random.default_rng(1).random(grid.cell_count) < 0.02
+    field = DistanceField(grid, sources)
+
+    assert np.array_equal(field.distances, hex_distances(grid, sources))
+    assert np.array_equal(field.distances[field.nearest], np.zeros(grid.cell_count))
+
+
+def test_random_edits_match_full_rebuild(grid):
+    """Test that repaired distances equal a rebuild after every edit."""
+    rng = np.random.default_rng(2)
+    sources = rng.random(grid.cell_count) < 0.03
+    field = DistanceField(grid, sources)
+    for _ in range(40):
+        flipped = rng.choice(grid.cell_count, size=rng.integers(1, 6), replace=False)
+        previous = field.distances.copy()
+        sources = sources.copy()
+        sources[flipped] = ~sources[flipped]
+        changed = field.update(sources)
+
+        expected = hex_distances(grid, sources)
+        assert np.array_equal(field.distances, expected)
+        assert set(changed.tolist()) == set(np.flatnonzero(previous != expected))
+        assert np.all(field.sources == sources)
+
+
+def test_removing_last_source_leaves_no_distance(grid):
+    """Test that a grid without sources is far from everything."""
+    field = DistanceField(grid)
+    field.add_sources(np.array([7]))
+    assert field.distances.max() < FAR
+    field.remove_sources(np.array([7, 8]))
+
+    assert np.all(field.distances == FAR)
+    assert np.all(field.nearest == -1)
+
+
+def test_sparse_edit_repairs_only_its_footprint():
+    """Test that a far away source edit touches only nearby cells."""
+    grid = HexGrid(dimensions=GridDimensions(width=200, height=200))
+    sources = np.zeros((200, 200), dtype=bool)
+    # Rows are half a hex apart, so sources are twice as dense along columns
+    sources[::20, ::5] = True
+    sources = sources.ravel()
+    field = DistanceField(grid, sources)
+
+    corner = grid.cell_count - 1
+    assert field.add_sources(np.array([corner])).size < 100
+    assert field.remove_sources(np.array([corner])).size < 100
+    assert np.array_equal(field.distances, hex_distances(grid, sources))
+    with pytest.raises(ValueError):
+        field.update(sources[:-1])
+
+
+def test_stage_writes_distances_when_terrain_changes():
+    """Test that the stage repairs and writes only when its source changes."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=6, height=4)))
+    terrain = world.add_field("terrain", "int8", fill=1)
+    terrain[[0, 23]] = 0
+    world.touch("terrain")
+    world.add_field("water_distance", "float32")
+    stage = DistanceFieldStage("water_distance", "terrain", [0])
+
+    stage(world)
+    version = world.versions["water_distance"]
+    expected = hex_distances(world.grid, terrain == 0)
+    assert np.array_equal(world.get_field("water_distance"), expected)
+    stage(world)
+    assert world.versions["water_distance"] == version
+
+    terrain[23] = 1
+    world.touch("terrain")
+    stage(world)
+    expected = hex_distances(world.grid, terrain == 0)
+    assert np.array_equal(world.get_field("water_distance"), expected)
+    assert world.versions["water_distance"] != version
+
+    stage = DistanceFieldStage("forest_distance", "terrain", [2])
+    stage(world)
+    assert world.get_field("forest_distance").dtype == np.int32
+    assert np.all(world.get_field("forest_distance") == FAR)
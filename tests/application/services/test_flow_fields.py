@@ -0,0 +1,157 @@
+"""Tests for flow fields and the flow field cache."""
+import heapq
+
+import numpy as np
+import pytest
+
+from src.application.services.flow_fields import (
+    NO_DIRECTION,
+    FlowFieldCache,
+    compute_flow_field,
+)
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_position import GridPosition
+
+
+def dijkstra(grid, goals, costs):
+    """Compute reference distances one cell at a time."""
+    distances = np.full(grid.cell_count, np.inf)
+    queue = [(0.0, goal) for goal in goals]
+    for goal in goals:
+        distances[goal] = 0.0
+    while queue:
+        distance, cell = heapq.heappop(queue)
+        if distance > distances[cell]:
+            continue
+        for neighbor in grid.neighbors(grid.position_of(cell)):
+            if not grid.is_valid_position(neighbor):
+                continue
+            # Moving from the neighbor into this cell costs this cell's cost
+            candidate = distance + costs[cell]
+            neighbor_id = grid.cell_id(neighbor)
+            if candidate < distances[neighbor_id]:
+                distances[neighbor_id] = candidate
+                heapq.heappush(queue, (candidate, neighbor_id))
+    return distances
+
+
+@pytest.fixture
+def world():
+    """Create a world with random terrain costs and a wall."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=12, height=9)))
+    costs = np.random.default_rng(3).uniform(0.5, 3.0, world.grid.cell_count)
+    costs[
+        world.grid.dimensions.width * 4 : world.grid.dimensions.width * 5 - 1
+    ] = np.inf
+    world.set_field("move_cost", costs)
+    return world
+
+
+def test_distances_match_dijkstra(world):
+    """Test that the wavefront finds the cheapest path from every cell."""
+    costs = world.get_field("move_cost")
+    flow = compute_flow_field(world.grid, [5, 100], costs)
+
+    np.testing.assert_allclose(flow.distances, dijkstra(world.grid, [5, 100], costs))
+    assert flow.goals == (5, 100)
+
+
+def test_following_directions_reaches_goal_at_path_cost(world):
+    """Test that stepping along the field pays exactly the cell's distance."""
+    costs = world.get_field("move_cost")
+    flow = compute_flow_field(world.grid, [7], costs)
+
+    for start in range(world.grid.cell_count):
+        cell, paid = start, 0.0
+        while flow.directions[cell] != NO_DIRECTION:
+            direction = flow.directions[cell]
+            cell = world.grid.neighbor_table[direction, cell]
+            paid += costs[cell]
+        assert cell == 7
+        assert paid == pytest.approx(flow.distances[start])
+
+
+def test_directions_step_like_grid_positions():
+    """Test that a direction names the same step for positions and tables."""
+    grid = HexGrid(dimensions=GridDimensions(width=10, height=10))
+    goal = grid.cell_id(GridPosition(q=5, r=5))
+    flow = compute_flow_field(grid, [goal], np.ones(grid.cell_count))
+
+    start = GridPosition(q=5, r=3)
+    assert grid.position_of(goal) == start.get_neighbor(
+        flow.directions[grid.cell_id(start)]
+    )
+    for cell in np.flatnonzero(flow.directions != NO_DIRECTION):
+        position = grid.position_of(int(cell))
+        assert grid.cell_id(position.get_neighbor(flow.directions[cell])) == (
+            flow.next_cells(np.array([cell]))[0]
+        )
+
+
+def test_unreachable_cells_have_no_direction():
+    """Test that cells walled off from the goals stay put."""
+    # Two rows form a zigzag strip 0-5-1-6-2-7-3-8-4-9 walled off at 2
+    grid = HexGrid(dimensions=GridDimensions(width=5, height=2))
+    costs = np.ones(grid.cell_count)
+    costs[2] = np.inf
+    flow = compute_flow_field(grid, [0], costs)
+
+    assert flow.distances[[5, 1, 6, 2]].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert np.isinf(flow.distances[[7, 3, 8, 4, 9]]).all()
+    # South-west from the even row, north-west from the odd row
+    assert flow.directions[[0, 1, 2, 5, 6, 7]].tolist() == [
+        NO_DIRECTION,
+        4,
+        4,
+        5,
+        5,
+        NO_DIRECTION,
+    ]
+    assert flow.next_cells(np.array([0, 1, 2, 4])).tolist() == [0, 5, 6, 4]
+
+
+def test_invalid_goals_and_costs_are_rejected():
+    """Test that bad input fails before any work is done."""
+    grid = HexGrid(dimensions=GridDimensions(width=3, height=2))
+    with pytest.raises(ValueError):
+        compute_flow_field(grid, [], np.ones(6))
+    with pytest.raises(ValueError):
+        compute_flow_field(grid, [6], np.ones(6))
+    with pytest.raises(ValueError):
+        compute_flow_field(grid, [0], -np.ones(6))
+    with pytest.raises(ValueError):
+        compute_flow_field(grid, [0], np.ones(5))
+
+
+def test_cache_reuses_field_until_costs_change(world):
+    """Test that a field is recomputed only when the cost field is written."""
+    cache = FlowFieldCache()
+    first = cache.field(world, "move_cost", [100, 5])
+    assert cache.field(world, "move_cost", {5, 100}) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    world.get_field("move_cost")[0] = 10.0
+    world.touch("move_cost")
+    assert cache.field(world, "move_cost", [5, 100]) is not first
+    assert cache.misses == 2
+    with pytest.raises(UnknownCellField):
+        cache.field(world, "terrain", [5])
+
+
+def test_cache_evicts_least_recently_used(world):
+    """Test that the cache keeps at most its capacity of fields."""
+    cache = FlowFieldCache(capacity=2)
+    a = cache.field(world, "move_cost", [1])
+    cache.field(world, "move_cost", [2])
+    cache.field(world, "move_cost", [1])
+    cache.field(world, "move_cost", [3])
+
+    assert len(cache) == 2
+    assert cache.field(world, "move_cost", [1]) is a
+    cache.field(world, "move_cost", [2])
+    assert cache.misses == 4
+    assert cache.memory_usage()["flow fields"] == 2 * 9 * world.grid.cell_count
+    with pytest.raises(ValueError):
+        FlowFieldCache(capacity=0)
@@ -0,0 +1,102 @@
+"""Tests for per-subsystem memory accounting and allocation tracing."""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.application.services.memory_report import (
+    MemoryItem,
+    MemoryReport,
+    engine_memory_report,
+    trace_tick_allocations,
+)
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+
+@pytest.fixture
+def engine():
+    """Create an engine running the built-in rules on a small grid."""
+    return SimulationEngine.from_rule_set(
+        load_rule_set(None), HexGrid(GridDimensions(16, 12)), seed=2
+    )
+
+
+def test_report_lists_fields_tables_and_kernel_buffers(engine):
+    """Test that every field and every precomputed table is accounted for."""
+    engine.step()
+    report = engine_memory_report(engine)
+    items = {(item.subsystem, item.name): item.nbytes for item in report.items}
+
+    for name, values in engine.world.fields.items():
+        assert items["cell fields", name] == values.nbytes
+    assert items["index tables", "grid neighbor_table"] == 6 * 192 * 8
+    assert items["rule kernels", "grid neighbors"] == 6 * 192 * 8
+    assert ("rule kernels", "spare biomass") in items
+    assert report.total == sum(items.values())
+    assert report.bytes_per_cell == report.total / 192
+    assert set(report.subsystem_totals()) == {
+        "cell fields",
+        "index tables",
+        "rule kernels",
+    }
+
+
+def test_history_counts_each_snapshot_array_once(engine):
+    """Test that arrays shared between snapshots are not counted twice."""
+    first = FrameSnapshot.capture(engine.world)
+    engine.step()
+    second = FrameSnapshot.capture(engine.world, first)
+
+    history = [
+        item
+        for item in engine_memory_report(engine, [first, second]).items
+        if item.subsystem == "history"
+    ]
+    shared = [
+        name for name in second.fields if second.fields[name] is first.fields[name]
+    ]
+
+    assert len(history) == len(first.fields) + len(second.fields) - len(shared)
+
+
+def test_report_extension_and_formatting():
+    """Test adding a subsystem's usage and the plain-text table."""
+    report = MemoryReport(4, (MemoryItem("cell fields", "biomass", 16),))
+    report = report.with_usage("render caches", {"sprites": 1000, "outline": 24})
+
+    text = report.format()
+
+    assert report.total == 1040
+    assert report.bytes_per_cell == 260.0
+    assert "render caches" in text and "sprites" in text
+    assert "1,040" in text
+    assert text.endswith("bytes per cell: 260.0")
+
+
+def test_tick_loop_does_not_grow_memory(engine):
+    """Test that the steady-state tick loop retains no memory per tick."""
+    trace = trace_tick_allocations(engine, ticks=500, warmup=50)
+
+    assert engine.tick == 550
+    # A leak of even one small object per tick retains >= 500 * 16 bytes
+    assert trace.growth_per_tick < 8, trace.format()
+    assert trace.peak > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_trace_reports_sites_of_growing_stages(engine):
+    """Test that a stage that keeps data every tick is attributed."""
+    kept = []
+    engine.add_stage(lambda world: kept.append(np.zeros(128)))
+
+    trace = trace_tick_allocations(engine, ticks=20)
+
+    assert trace.growth_per_tick >= 1024
+    assert any("test_memory_report.py" in site.location for site in trace.sites)
+    assert "growth per tick" in trace.format()
+    with pytest.raises(ValueError):
+        trace_tick_allocations(engine, ticks=0)
@@ -0,0 +1,152 @@
+"""Tests for per-tick metrics collection."""
+import numpy as np
+import pytest
+
+from src.application.services.metrics import (
+    HistogramSpec,
+    MetricsCollector,
+    MetricsStage,
+    attach_metrics,
+    metrics_stream,
+)
+from src.application.services.simulation_engine import SimulationEngine
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.rule_set import RuleSet
+
+
+@pytest.fixture
+def world():
+    """Create a world with a categorical and a continuous field."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=3, height=2)))
+    world.set_field("terrain", np.array([0, 1, 1, 2, 2, 2], dtype=np.int8))
+    world.set_field("biomass", np.array([0.0, 0.1, 0.4, 0.6, 0.9, 1.5]))
+    return world
+
+
+@pytest.fixture
+def collector():
+    """Create a collector reporting every kind of metric."""
+    return MetricsCollector(
+        counts={"terrain": 4},
+        totals=("biomass",),
+        histograms={"biomass": HistogramSpec(0.0, 1.0, 2)},
+    )
+
+
+def test_collect_computes_counts_totals_and_histograms(world, collector):
+    """Test the values of every metric kind."""
+    record = collector.collect(world)
+
+    assert record.tick == 0
+    assert list(record.values["count.terrain"]) == [1, 2, 3, 0]
+    assert record.values["total.biomass"] == pytest.approx(3.5)
+    # Values outside the range are clamped into the outer bins
+    assert list(record.values["histogram.biomass"]) == [3, 3]
+
+
+def test_collect_reuses_aggregates_of_unchanged_fields(world, collector):
+    """Test that aggregates are only recomputed when a field's version changes."""
+    first = collector.collect(world)
+    world.get_field("biomass")[:] = 0.0
+    stale = collector.collect(world)
+    world.touch("biomass")
+    fresh = collector.collect(world)
+
+    assert stale.values["count.terrain"] is first.values["count.terrain"]
+    assert stale.values["total.biomass"] == first.values["total.biomass"]
+    assert fresh.values["count.terrain"] is first.values["count.terrain"]
+    assert fresh.values["total.biomass"] == 0.0
+
+
+def test_restricted_to_drops_metrics_of_missing_fields(collector):
+    """Test that a collector can be narrowed to the fields of a world."""
+    restricted = collector.restricted_to(["biomass"])
+
+    assert restricted.counts == {}
+    assert restricted.totals == ("biomass",)
+    assert set(restricted.histograms) == {"biomass"}
+
+
+def test_histogram_spec_validation():
+    """Test that empty ranges and bin counts are rejected."""
+    with pytest.raises(ValueError):
+        HistogramSpec(1.0, 1.0, 4)
+    with pytest.raises(ValueError):
+        HistogramSpec(0.0, 1.0, 0)
+
+
+def growth_engine():
+    """Create an engine whose biomass grows every tick."""
+    rule_set = RuleSet.from_dict(
+        {
+            "fields": {
+                "terrain": {"dtype": "int8", "initial": 1},
+                "biomass": {"dtype": "float64", "initial": 0.0},
+            },
+            "rules": [{"target": "biomass", "expression": "biomass + 1"}],
+        }
+    )
+    grid = HexGrid(dimensions=GridDimensions(width=3, height=2))
+    return SimulationEngine.from_rule_set(rule_set, grid, seed=1)
+
+
+def test_metrics_stream_yields_one_record_per_tick(collector):
+    """Test that the generator advances the engine tick by tick."""
+    records = list(metrics_stream(growth_engine(), collector, ticks=3))
+
+    assert [record.tick for record in records] == [1, 2, 3]
+    assert [record.values["total.biomass"] for record in records] == [6, 12, 18]
+
+
+def test_metrics_stage_delivers_records_in_tick_order(collector):
+    """Test that the background stage reports every tick of a run."""
+    engine = growth_engine()
+    records = []
+    stage = MetricsStage(collector, records.append, max_pending=2)
+    engine.add_stage(stage)
+    engine.run(5)
+    stage.close()
+
+    assert [record.tick for record in records] == [1, 2, 3, 4, 5]
+    assert records[-1].values["total.biomass"] == 30
+    assert list(records[-1].values["count.terrain"]) == [0, 6, 0, 0]
+
+
+def test_attach_metrics_skips_fields_the_world_lacks():
+    """Test that configured metrics of missing fields are left out."""
+    engine = growth_engine()
+    records = []
+    stage = attach_metrics(
+        engine,
+        records.append,
+        counts={"terrain": 4, "water": 2},
+        totals=("biomass", "moisture"),
+        histograms=[("biomass", 0.0, 1.0, 2)],
+    )
+    engine.run(2)
+    stage.close()
+
+    assert [record.tick for record in records] == [1, 2]
+    assert set(records[-1].values) == {
+        "count.terrain",
+        "total.biomass",
+        "histogram.biomass",
+    }
+
+
+def test_metrics_stage_surfaces_sink_errors(collector):
+    """Test that a failing sink stops the simulation on the next tick."""
+    engine = growth_engine()
+
+    def failing_sink(record):
+        raise OSError("disk full")
+
+    stage = MetricsStage(collector, failing_sink)
+    engine.add_stage(stage)
+    engine.step()
+    stage.close()
+
+    with pytest.raises(RuntimeError):
+        engine.step()
@@ -0,0 +1,80 @@
+"""Tests for the counter-based random stream service."""
+import numpy as np
+import pytest
+
+from src.application.services.random_streams import CounterRNG
+
+
+def test_rng_rejects_negative_seed():
+    """Test that a negative seed is rejected."""
+    with pytest.raises(ValueError):
+        CounterRNG(seed=-1)
+
+
+def test_rng_draws_are_reproducible():
+    """Test that the same key always yields the same numbers."""
+    cell_ids = np.arange(100)
+    first = CounterRNG(seed=42).uniform(tick=7, cell_ids=cell_ids)
+    second = CounterRNG(seed=42).uniform(tick=7, cell_ids=cell_ids)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_rng_tiled_draws_match_serial_draw():
+    """Test that drawing tile by tile matches one whole-field draw."""
+    rng = CounterRNG(seed=3)
+    serial = rng.field_uniform(tick=12, cell_count=1000)
+
+    # Shuffled, unevenly sized tiles as different workers would see them
+    order = np.random.default_rng(0).permutation(1000)
+    tiled = np.empty(1000)
+    for tile in np.array_split(order, 7):
+        tiled[tile] = rng.uniform(tick=12, cell_ids=tile)
+
+    np.testing.assert_array_equal(serial, tiled)
+
+
+def test_rng_streams_ticks_and_seeds_are_independent():
+    """Test that changing any key component changes the draws."""
+    cell_ids = np.arange(256)
+    base = CounterRNG(seed=1).random_bits(tick=0, cell_ids=cell_ids)
+    other_stream = CounterRNG(seed=1).random_bits(0, cell_ids, stream=1)
+    other_tick = CounterRNG(seed=1).random_bits(tick=1, cell_ids=cell_ids)
+    other_seed = CounterRNG(seed=2).random_bits(tick=0, cell_ids=cell_ids)
+
+    for other in (other_stream, other_tick, other_seed):
+        assert np.count_nonzero(base == other) == 0
+
+
+def test_rng_uniform_range_and_distribution():
+    """Test that uniform draws lie in [0, 1) and are roughly uniform."""
+    values = CounterRNG(seed=5).field_uniform(tick=0, cell_count=100_000)
+    assert values.min() >= 0.0
+    assert values.max() < 1.0
+    assert abs(values.mean() - 0.5) < 0.01
+    counts, _ = np.histogram(values, bins=10, range=(0.0, 1.0))
+    assert counts.min() > 9_000
+
+
+def test_rng_bernoulli_and_integers():
+    """Test derived draws respect their parameters."""
+    rng = CounterRNG(seed=9)
+    cell_ids = np.arange(10_000)
+
+    flips = rng.bernoulli(tick=0, cell_ids=cell_ids, probability=0.25)
+    assert flips.dtype == np.bool_
+    assert abs(flips.mean() - 0.25) < 0.02
+
+    values = rng.integers(tick=0, cell_ids=cell_ids, low=-2, high=3)
+    assert set(np.unique(values)) == {-2, -1, 0, 1, 2}
+
+    with pytest.raises(ValueError):
+        rng.integers(tick=0, cell_ids=cell_ids, low=3, high=3)
+
+
+def test_rng_rejects_negative_tick_and_stream():
+    """Test that negative counters are rejected."""
+    rng = CounterRNG(seed=0)
+    with pytest.raises(ValueError):
+        rng.uniform(tick=-1, cell_ids=[0])
+    with pytest.raises(ValueError):
+        rng.uniform(tick=0, cell_ids=[0], stream=-1)
@@ -0,0 +1,124 @@
+"""Tests for prefix-sum region aggregates."""
+import numpy as np
+import pytest
+
+from src.application.services.region_sums import RegionSums, RegionSumsCache
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+
+
+@pytest.fixture
+def grid():
+    """Create a medium grid."""
+    return HexGrid(dimensions=GridDimensions(width=17, height=11))
+
+
+def hex_distance(q, r, other_q, other_r):
+    """Compute hex distances in the drawn layout through axial coordinates."""
+    dx = (2 * other_q + other_r % 2) - (2 * q + r % 2)
+    dz = (other_r // 2 - other_q) - (r // 2 - q)
+    return (np.abs(dx) + np.abs(dz) + np.abs(dx + dz)) // 2
+
+
+def brute_hex_sums(grid, values, radius):
+    """Sum every cell's hex range by comparing all pairs of cells."""
+    cells = np.arange(grid.cell_count)
+    q, r = cells % grid.dimensions.width, cells // grid.dimensions.width
+    within = hex_distance(q[:, None], r[:, None], q[None, :], r[None, :]) <= radius
+    return (within * values[None, :]).sum(axis=1), within.sum(axis=1)
+
+
+@pytest.mark.parametrize("radius", [0, 1, 4, 30])
+def test_hex_sums_match_brute_force(grid, radius):
+    """Test hex range sums and means, clipped at the grid border."""
+    values = np.random.default_rng(radius).integers(0, 100, grid.cell_count)
+    sums = RegionSums(grid, values)
+    expected, counts = brute_hex_sums(grid, values, radius)
+
+    cells = np.arange(grid.cell_count)
+    assert np.array_equal(sums.hex_sums(cells, radius), expected)
+    assert np.allclose(sums.hex_means(cells, radius), expected / counts)
+    assert sums.hex_sum(40, radius) == expected[40]
+
+
+@pytest.mark.parametrize("height", [13, 14])
+@pytest.mark.parametrize("radius", [0, 1, 3])
+def test_wrapped_hex_sums_match_brute_force(height, radius):
+    """Test hex ranges wrapping around the edges of a toroidal grid."""
+    grid = HexGrid(dimensions=GridDimensions(width=7, height=height), wrap=True)
+    values = np.random.default_rng(radius).integers(0, 100, grid.cell_count)
+    sums = RegionSums(grid, values)
+
+    # Every position near the center within the radius, mapped onto the grid
+    q, r = np.meshgrid(np.arange(-7, 8), np.arange(-12, 13))
+    expected, counts = [], []
+    for cell in range(grid.cell_count):
+        center_q, center_r = cell % 7, cell // 7
+        near = hex_distance(center_q, center_r, center_q + q, center_r + r) <= radius
+        wrapped_q, wrapped_r = grid.wrap_coordinates(
+            center_q + q[near], center_r + r[near]
+        )
+        covered = wrapped_r * 7 + wrapped_q
+        assert np.unique(covered).size == covered.size
+        expected.append(values[covered].sum())
+        counts.append(covered.size)
+    cells = np.arange(grid.cell_count)
+    assert np.array_equal(sums.hex_sums(cells, radius), expected)
+    assert np.allclose(sums.hex_means(cells, radius), np.divide(expected, counts))
+    # Larger ranges would reach around the torus onto themselves
+    with pytest.raises(ValueError):
+        sums.hex_sums(cells, 4)
+    narrow = HexGrid(dimensions=GridDimensions(width=3, height=height), wrap=True)
+    with pytest.raises(ValueError):
+        RegionSums(narrow, np.zeros(narrow.cell_count)).hex_sums(cells[:1], 3)
+
+
+def test_rect_sums_match_brute_force(grid):
+    """Test rectangle sums, including windows reaching past the grid."""
+    values = np.random.default_rng(1).random(grid.cell_count)
+    sums = RegionSums(grid, values)
+    table = values.reshape(11, 17)
+
+    windows = [(0, 0, 17, 11), (3, 2, 5, 4), (15, 9, 6, 6), (-2, -1, 4, 3)]
+    q, r, width, height = (np.array(column) for column in zip(*windows))
+    expected = [
+        table[max(top, 0) : top + rows, max(left, 0) : left + columns].sum()
+        for left, top, columns, rows in windows
+    ]
+    assert np.allclose(sums.rect_sums(q, r, width, height), expected)
+    assert np.isclose(sums.rect_sum(GridRegion(3, 2, 5, 4)), expected[1])
+    assert np.isclose(sums.total, values.sum())
+
+
+def test_invalid_queries_are_rejected(grid):
+    """Test validation of the field shape and the radius."""
+    with pytest.raises(ValueError):
+        RegionSums(grid, np.zeros(3))
+    sums = RegionSums(grid, np.zeros(grid.cell_count, dtype=bool))
+    with pytest.raises(ValueError):
+        sums.hex_sums(np.array([0]), -1)
+
+
+def test_cache_rebuilds_only_written_fields(grid):
+    """Test that tables are reused until their field is written."""
+    world = World(grid=grid)
+    world.add_field("biomass", np.float64, fill=0.5)
+    cache = RegionSumsCache(capacity=2)
+
+    first = cache.sums(world, "biomass")
+    assert cache.sums(FrameSnapshot.capture(world), "biomass") is first
+    world.fields["biomass"][0] = 1.5
+    world.touch("biomass")
+    second = cache.sums(world, "biomass")
+
+    assert second is not first
+    assert second.total == pytest.approx(first.total + 1.0)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+    assert cache.memory_usage()["region sums"] > 0
+    with pytest.raises(UnknownCellField):
+        cache.sums(world, "missing")
+    with pytest.raises(ValueError):
+        RegionSumsCache(capacity=0)
@@ -0,0 +1,120 @@
+"""Tests for the compressed rewind history."""
+import numpy as np
+import pytest
+
+from src.application.services.rewind import RewindBuffer, RewindRecorder
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+GRID = HexGrid(dimensions=GridDimensions(width=16, height=12))
+
+
+def run_frames(ticks):
+    """Capture the snapshot of every tick of a short run."""
+    engine = SimulationEngine.from_rule_set(load_rule_set(), GRID, seed=5)
+    frames = [FrameSnapshot.capture(engine.world)]
+    for _ in range(ticks):
+        engine.step()
+        frames.append(FrameSnapshot.capture(engine.world, frames[-1]))
+    return engine, frames
+
+
+def test_frames_decompress_to_the_stored_states():
+    """Test that every stored frame is restored bit for bit."""
+    _, frames = run_frames(4)
+    buffer = RewindBuffer(memory_budget=2**20)
+    for frame in frames:
+        buffer.push(frame)
+
+    assert buffer.ticks == [0, 1, 2, 3, 4]
+    for index, expected in enumerate(frames):
+        stored = buffer.frame(index)
+        assert stored.tick == expected.tick
+        assert stored.versions == expected.versions
+        for name, values in expected.fields.items():
+            assert stored.fields[name].dtype == values.dtype
+            assert np.array_equal(stored.fields[name], values)
+            assert not stored.fields[name].flags.writeable
+    assert buffer.frame(-1).tick == 4
+    assert buffer.frame_at(3).tick == 3
+    with pytest.raises(IndexError):
+        buffer.frame(5)
+    with pytest.raises(KeyError):
+        buffer.frame_at(5)
+    with pytest.raises(IndexError):
+        RewindBuffer(memory_budget=2**20).frame(0)
+
+
+def test_budget_drops_oldest_frames_and_counts_shared_fields_once():
+    """Test that unchanged fields are stored once and the budget holds."""
+    _, frames = run_frames(9)
+    unlimited = RewindBuffer(memory_budget=2**30)
+    for frame in frames:
+        unlimited.push(frame)
+    per_frame = unlimited.memory_usage()["rewind"] / len(frames)
+
+    buffer = RewindBuffer(memory_budget=int(per_frame * 4))
+    for frame in frames:
+        buffer.push(frame)
+
+    assert 1 <= len(buffer) < len(frames)
+    assert buffer.ticks[-1] == 9
+    assert buffer.memory_usage()["rewind"] <= buffer.memory_budget
+    with pytest.raises(ValueError):
+        RewindBuffer(memory_budget=0)
+
+
+def test_resuming_from_a_frame_replaces_the_later_history():
+    """Test that a restored engine repeats its ticks and rewrites history."""
+    engine, frames = run_frames(6)
+    buffer = RewindBuffer(memory_budget=2**20)
+    for frame in frames:
+        buffer.push(frame)
+
+    engine.restore(buffer.frame(2))
+    assert engine.tick == 2
+    engine.step()
+    for name, values in frames[3].fields.items():
+        assert np.array_equal(engine.world.fields[name], values)
+
+    buffer.push(FrameSnapshot.capture(engine.world))
+    assert buffer.ticks == [0, 1, 2, 3]
+    other = World(grid=HexGrid(dimensions=GridDimensions(width=3, height=3)))
+    with pytest.raises(ValueError):
+        engine.restore(other)
+
+
+def test_recorder_compresses_in_the_background_and_skips_when_behind():
+    """Test that recorded states reach the buffer and overflow is skipped."""
+    _, frames = run_frames(4)
+    buffer = RewindBuffer(memory_budget=2**20)
+    recorder = RewindRecorder(buffer)
+    for frame in frames:
+        recorder.record(frame)
+    recorder.drain()
+    assert buffer.ticks == [0, 1, 2, 3, 4]
+    assert recorder.skipped == 0
+    recorder.close()
+
+    blocked = RewindBuffer(memory_budget=2**20)
+    recorder = RewindRecorder(blocked, max_pending=1)
+    with blocked._lock:  # Hold up the recorder thread
+        for frame in frames:
+            recorder.record(frame)
+    recorder.close()
+    assert recorder.skipped >= len(frames) - 2
+    assert len(blocked) == len(frames) - recorder.skipped
+
+
+def test_recorder_surfaces_errors():
+    """Test that a state that cannot be stored is re-raised."""
+    recorder = RewindRecorder(RewindBuffer(memory_budget=2**20))
+    recorder.record(object())  # type: ignore
+    with pytest.raises(RuntimeError):
+        recorder.drain()
+    with pytest.raises(RuntimeError):
+        recorder.close()
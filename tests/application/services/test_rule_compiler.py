@@ -0,0 +1,207 @@
+"""Tests for the rule compiler and its vectorized kernels."""
+import numpy as np
+import pytest
+
+from src.application.services.random_streams import CounterRNG
+from src.application.services.rule_compiler import CompiledRuleSet
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.rule_set import RuleDefinitionError, RuleSet
+
+
+@pytest.fixture(params=[False, True], ids=["bounded", "toroidal"])
+def grid(request):
+    """Create a test grid, with and without wraparound."""
+    return HexGrid(dimensions=GridDimensions(width=6, height=5), wrap=request.param)
+
+
+def compile_rules(grid, fields, rules=(), parameters=None):
+    """Compile a rule document built from its parts."""
+    document = {"fields": fields, "rules": list(rules), "parameters": parameters or {}}
+    return CompiledRuleSet(RuleSet.from_dict(document), grid)
+
+
+def ring_values(grid, values, cell_id):
+    """Collect the values of the existing neighbors of a cell, per cell."""
+    neighbors = grid.neighbor_table[:, cell_id]
+    return [values[n] for n in neighbors if n >= 0]
+
+
+def test_compiled_aggregates_match_per_cell_reference(grid):
+    """Test neighbor aggregates against a naive per-cell computation."""
+    rules = compile_rules(
+        grid,
+        fields={
+            "value": {"initial": "q * 10 + r"},
+            "ring_sum": {},
+            "ring_mean": {},
+            "ring_max": {},
+            "ring_min": {},
+        },
+        rules=[
+            {"target": "ring_sum", "expression": "neighbor_sum(value)"},
+            {"target": "ring_mean", "expression": "neighbor_mean(value)"},
+            {"target": "ring_max", "expression": "neighbor_max(value)"},
+            {"target": "ring_min", "expression": "neighbor_min(value)"},
+        ],
+    )
+    world = rules.create_world()
+    rules.apply(world)
+
+    value = world.get_field("value")
+    for cell_id in range(grid.cell_count):
+        ring = ring_values(grid, value, cell_id)
+        assert world.get_field("ring_sum")[cell_id] == sum(ring)
+        assert world.get_field("ring_mean")[cell_id] == pytest.approx(
+            sum(ring) / len(ring)
+        )
+        assert world.get_field("ring_max")[cell_id] == max(ring)
+        assert world.get_field("ring_min")[cell_id] == min(ring)
+
+
+def test_rules_read_previous_tick_state(grid):
+    """Test that rules update synchronously from the previous state."""
+    rules = compile_rules(
+        grid,
+        fields={"a": {"initial": 1.0}, "b": {"initial": 2.0}},
+        rules=[
+            {"target": "a", "expression": "b"},
+            {"target": "b", "expression": "a"},
+        ],
+    )
+    world = rules.create_world()
+    rules.apply(world)
+
+    assert np.all(world.get_field("a") == 2.0)
+    assert np.all(world.get_field("b") == 1.0)
+
+
+def test_rules_support_conditions_parameters_and_casting(grid):
+    """Test where-clauses, parameters and writes into integer fields."""
+    rules = compile_rules(
+        grid,
+        fields={"terrain": {"dtype": "int8", "initial": "r % 2"}, "level": {}},
+        rules=[
+            {"target": "level", "expression": "level + step", "where": "terrain == 1"},
+            {"target": "terrain", "expression": "terrain * 2.7"},
+        ],
+        parameters={"step": 0.5},
+    )
+    world = rules.create_world()
+    rules.apply(world)
+
+    odd_rows = np.arange(grid.cell_count) // grid.dimensions.width % 2 == 1
+    np.testing.assert_array_equal(world.get_field("level"), np.where(odd_rows, 0.5, 0))
+    np.testing.assert_array_equal(world.get_field("terrain"), np.where(odd_rows, 2, 0))
+    assert world.get_field("terrain").dtype == np.int8
+
+
+def test_non_finite_parameters_and_constants_compile():
+    """Test that infinities and NaN reach the kernel as float values."""
+    grid = HexGrid(dimensions=GridDimensions(width=6, height=5))
+    rules = compile_rules(
+        grid,
+        fields={"low": {}, "high": {}, "missing": {}},
+        rules=[
+            {"target": "low", "expression": "-ceiling"},
+            {"target": "high", "expression": "1e999"},
+            {"target": "missing", "expression": "unknown"},
+        ],
+        parameters={"ceiling": float("inf"), "unknown": float("nan")},
+    )
+    world = rules.create_world()
+    rules.apply(world)
+
+    assert np.all(world.get_field("low") == -np.inf)
+    assert np.all(world.get_field("high") == np.inf)
+    assert np.all(np.isnan(world.get_field("missing")))
+
+
+def test_random_rules_are_reproducible(grid):
+    """Test that random() draws from the per-cell counter streams."""
+    rules = compile_rules(
+        grid,
+        fields={"noise": {"initial": "random()"}, "coin": {"dtype": "bool"}},
+        rules=[{"target": "coin", "expression": "random() < 0.5"}],
+    )
+    first = rules.create_world(CounterRNG(seed=1))
+    second = rules.create_world(CounterRNG(seed=1))
+    rules.apply(first, CounterRNG(seed=1))
+    rules.apply(second, CounterRNG(seed=1))
+
+    np.testing.assert_array_equal(first.get_field("noise"), second.get_field("noise"))
+    np.testing.assert_array_equal(first.get_field("coin"), second.get_field("coin"))
+    assert 0 < np.count_nonzero(first.get_field("coin")) < grid.cell_count
+
+
+def test_shared_aggregates_are_computed_once(grid):
+    """Test that repeated aggregates are hoisted into one temporary."""
+    rules = compile_rules(
+        grid,
+        fields={"a": {}, "b": {}},
+        rules=[
+            {"target": "a", "expression": "neighbor_mean(b) + 1"},
+            {"target": "b", "expression": "neighbor_mean(b) * 2"},
+        ],
+    )
+    assert rules.source.count("ctx.neighbor_mean(f_b)") == 1
+
+
+def test_apply_reuses_output_buffers(grid):
+    """Test that steady-state ticks swap buffers instead of allocating."""
+    rules = compile_rules(
+        grid, fields={"a": {}}, rules=[{"target": "a", "expression": "a + 1"}]
+    )
+    world = rules.create_world()
+    rules.apply(world)
+    first_buffer = world.get_field("a")
+    rules.apply(world)
+    rules.apply(world)
+
+    assert world.get_field("a") is first_buffer
+    assert np.all(world.get_field("a") == 3.0)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "unknown + 1",
+        "a.real",
+        "a[0]",
+        "__import__('os')",
+        "neighbor_sum(a, a)",
+        "clip(a, 0)",
+        "lambda: a",
+        "'text'",
+        "a +",
+        "a @ a",
+        "a in a",
+    ],
+)
+def test_invalid_expressions_are_rejected(grid, expression):
+    """Test that anything outside the rule grammar fails at compile time."""
+    with pytest.raises(RuleDefinitionError):
+        compile_rules(
+            grid, fields={"a": {}}, rules=[{"target": "a", "expression": expression}]
+        )
+
+
+def test_initial_expressions_only_see_earlier_fields(grid):
+    """Test that initial values cannot read fields declared after them."""
+    with pytest.raises(RuleDefinitionError):
+        compile_rules(grid, fields={"a": {"initial": "b"}, "b": {}})
+
+
+def test_reserved_field_names_are_rejected(grid):
+    """Test that fields cannot shadow the built-in cell attributes."""
+    with pytest.raises(RuleDefinitionError):
+        compile_rules(grid, fields={"tick": {}})
+
+
+def test_random_without_service_fails(grid):
+    """Test that random() needs a random stream service at run time."""
+    rules = compile_rules(
+        grid, fields={"a": {}}, rules=[{"target": "a", "expression": "random()"}]
+    )
+    with pytest.raises(RuleDefinitionError):
+        rules.apply(rules.create_world())
@@ -0,0 +1,159 @@
+"""Tests for the background simulation worker."""
+import threading
+import time
+
+import pytest
+
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.simulation_worker import SimulationWorker
+from src.application.services.snapshots import SnapshotBuffer
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+
+@pytest.fixture
+def engine():
+    """Create an engine running the built-in rules."""
+    grid = HexGrid(dimensions=GridDimensions(width=8, height=6))
+    return SimulationEngine.from_rule_set(load_rule_set(), grid, seed=0)
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached in time")
+        time.sleep(0.005)
+
+
+def test_worker_publishes_snapshots(engine):
+    """Test that the worker publishes the initial and later ticks."""
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+    worker.start()
+    try:
+        assert buffer.latest() is not None
+        wait_for(lambda: buffer.latest().tick >= 3)
+    finally:
+        worker.stop()
+    assert not worker.running
+    worker.check()
+
+
+def test_worker_pause_and_resume(engine):
+    """Test that a paused worker stops ticking until resumed."""
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+    worker.start()
+    try:
+        worker.pause()
+        assert worker.paused
+        time.sleep(0.05)
+        paused_tick = buffer.latest().tick
+        time.sleep(0.05)
+        assert buffer.latest().tick == paused_tick
+
+        worker.resume()
+        wait_for(lambda: buffer.latest().tick > paused_tick)
+    finally:
+        worker.stop()
+
+
+def test_worker_restores_earlier_states_while_paused(engine):
+    """Test that a paused worker continues from a restored state."""
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+    worker.start()
+    try:
+        earlier = buffer.latest()
+        wait_for(lambda: buffer.latest().tick >= 3)
+        worker.pause()
+        worker.restore(earlier)
+        wait_for(lambda: buffer.latest().tick == earlier.tick)
+
+        worker.resume()
+        wait_for(lambda: buffer.latest().tick > earlier.tick)
+    finally:
+        worker.stop()
+    worker.check()
+
+
+def test_worker_runs_calls_between_ticks(engine):
+    """Test that calls run on the worker thread, running or paused."""
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+
+    def current():
+        return threading.current_thread().name, engine.tick
+
+    assert worker.call(current).result() == (threading.current_thread().name, 0)
+    worker.start()
+    try:
+        name, _ = worker.call(current).result(timeout=5)
+        assert name == "simulation-worker"
+        worker.pause()
+        time.sleep(0.05)
+        paused_tick = buffer.latest().tick
+        assert worker.call(current).result(timeout=5)[1] == paused_tick
+
+        failed = worker.call(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            failed.result(timeout=5)
+    finally:
+        worker.stop()
+    worker.check()
+
+
+def test_reader_never_waits_for_slow_tick(engine):
+    """Test that reading the latest frame does not block during a tick."""
+    in_tick = threading.Event()
+    release = threading.Event()
+    original_step = engine.step
+
+    def slow_step():
+        in_tick.set()
+        release.wait(2.0)
+        original_step()
+
+    engine.step = slow_step
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(engine, buffer, ticks_per_second=1000)
+    worker.start()
+    try:
+        assert in_tick.wait(2.0)
+        started = time.monotonic()
+        for _ in range(100):
+            assert buffer.latest().tick == 0
+        assert time.monotonic() - started < 0.1
+    finally:
+        release.set()
+        worker.stop()
+
+
+def test_worker_surfaces_errors(engine):
+    """Test that a failing tick stops the worker and is re-raised."""
+
+    def failing_step():
+        raise ValueError("boom")
+
+    engine.step = failing_step
+    worker = SimulationWorker(engine, SnapshotBuffer(), ticks_per_second=1000)
+    worker.start()
+    wait_for(lambda: not worker.running)
+    with pytest.raises(RuntimeError):
+        worker.check()
+
+
+def test_worker_rejects_invalid_rate_and_double_start(engine):
+    """Test worker argument and state validation."""
+    with pytest.raises(ValueError):
+        SimulationWorker(engine, SnapshotBuffer(), ticks_per_second=0)
+    worker = SimulationWorker(engine, SnapshotBuffer(), ticks_per_second=10)
+    worker.start()
+    try:
+        with pytest.raises(RuntimeError):
+            worker.start()
+    finally:
+        worker.stop()
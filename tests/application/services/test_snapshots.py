@@ -0,0 +1,65 @@
+"""Tests for frame snapshots and the snapshot handoff buffer."""
+import numpy as np
+import pytest
+
+from src.application.services.snapshots import FrameSnapshot, SnapshotBuffer
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+
+
+@pytest.fixture
+def world():
+    """Create a small world with one field."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=3, height=2)), tick=4)
+    world.add_field("biomass", "float32", fill=0.25)
+    return world
+
+
+def test_snapshot_captures_independent_copy(world):
+    """Test that later changes to the world do not leak into a snapshot."""
+    snapshot = FrameSnapshot.capture(world)
+    world.get_field("biomass")[:] = 1.0
+
+    assert snapshot.tick == 4
+    assert snapshot.grid is world.grid
+    assert np.all(snapshot.get_field("biomass") == 0.25)
+
+
+def test_snapshot_is_read_only(world):
+    """Test that snapshot arrays and mappings cannot be modified."""
+    snapshot = FrameSnapshot.capture(world)
+
+    with pytest.raises(ValueError):
+        snapshot.get_field("biomass")[0] = 1.0
+    with pytest.raises(TypeError):
+        snapshot.fields["terrain"] = np.zeros(6)  # type: ignore
+    with pytest.raises(UnknownCellField):
+        snapshot.get_field("terrain")
+
+
+def test_buffer_returns_latest_published_snapshot(world):
+    """Test that the reader always sees the most recent snapshot."""
+    buffer = SnapshotBuffer()
+    assert buffer.latest() is None
+
+    first = FrameSnapshot.capture(world)
+    world.tick = 5
+    second = FrameSnapshot.capture(world)
+    buffer.publish(first)
+    buffer.publish(second)
+
+    assert buffer.latest() is second
+
+
+def test_snapshot_shares_unchanged_fields(world):
+    """Test that only fields written since the previous snapshot are copied."""
+    world.add_field("terrain", "int8", fill=2)
+    first = FrameSnapshot.capture(world)
+    world.get_field("biomass")[:] = 0.5
+    world.touch("biomass")
+    second = FrameSnapshot.capture(world, previous=first)
+
+    assert second.get_field("terrain") is first.get_field("terrain")
+    assert second.get_field("biomass") is not first.get_field("biomass")
+    assert np.all(second.get_field("biomass") == 0.5)
@@ -0,0 +1,96 @@
+"""Tests for incremental state hashing."""
+import numpy as np
+
+from src.application.services.metrics import MetricsCollector, MetricsStage
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.snapshots import FrameSnapshot
+from src.application.services.state_hash import (
+    HASH_COLUMN,
+    StateHasher,
+    first_divergence,
+    state_hash,
+)
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.metrics_store import (
+    ChunkedMetricsWriter,
+    load_metrics,
+)
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+GRID = HexGrid(dimensions=GridDimensions(width=9, height=7))
+
+
+def test_incremental_hash_matches_hash_from_scratch():
+    """Test that updating changed cells gives the same hash as rehashing."""
+    engine = SimulationEngine.from_rule_set(load_rule_set(), GRID, seed=3)
+    hasher = StateHasher()
+    hashes = [hasher.update(engine.world)]
+    for _ in range(5):
+        engine.step()
+        hashes.append(hasher.update(engine.world))
+        assert hashes[-1] == state_hash(engine.world)
+    assert len(set(hashes)) == len(hashes)
+
+    # Only the field that was written is hashed again
+    engine.world.fields["terrain"][5] += 1
+    engine.world.touch("terrain")
+    hasher.update(engine.world)
+    assert hasher.cells_hashed == GRID.cell_count
+    assert hasher.value == state_hash(engine.world)
+    hasher.update(engine.world)
+    assert hasher.cells_hashed == 0
+
+
+def test_hash_compares_values_bit_for_bit():
+    """Test which states hash alike, whatever world holds them."""
+
+    def world_with(values, tick=0):
+        world = World(grid=HexGrid(dimensions=GridDimensions(width=3, height=1)))
+        world.set_field("biomass", np.array(values))
+        world.set_field("terrain", np.array([1, 2, 3], dtype=np.int8))
+        world.tick = tick
+        return world
+
+    base = state_hash(world_with([0.5, np.nan, 1.0]))
+    assert state_hash(world_with([0.5, np.nan, 1.0], tick=9)) == base
+    assert state_hash(world_with([0.5, np.nan, -1.0])) != base
+    assert state_hash(world_with([0.0, 0.0, 0.0])) != state_hash(
+        world_with([-0.0, 0.0, 0.0])
+    )
+    # Swapping two values moves them to other cells
+    assert state_hash(world_with([1.0, np.nan, 0.5])) != base
+
+    # Dropping a field removes its share of the hash
+    hasher = StateHasher()
+    world = world_with([0.5, np.nan, 1.0])
+    hasher.update(world)
+    del world.fields["terrain"]
+    assert hasher.update(FrameSnapshot.capture(world)) == state_hash(world)
+
+
+def record_run(directory, edit_tick=None):
+    """Record the state hashes of a short run, optionally editing one tick."""
+    engine = SimulationEngine.from_rule_set(load_rule_set(), GRID, seed=3)
+    writer = ChunkedMetricsWriter(directory, chunk_size=4)
+    stage = MetricsStage(MetricsCollector(state_hash=True), writer.append)
+    engine.add_stage(stage)
+    for _ in range(8):
+        if engine.world.tick == edit_tick:
+            engine.world.fields["moisture"][0] += 0.25
+            engine.world.touch("moisture")
+        engine.step()
+    stage.close()
+    writer.close()
+    return load_metrics(directory)
+
+
+def test_first_divergence_finds_the_first_differing_tick(tmp_path):
+    """Test that recorded hashes locate where two runs part ways."""
+    reference = record_run(tmp_path / "a")
+    assert reference[HASH_COLUMN].dtype == np.uint64
+    assert list(reference["tick"]) == list(range(1, 9))
+
+    assert first_divergence(reference, record_run(tmp_path / "b")) is None
+    assert first_divergence(reference, record_run(tmp_path / "c", 5)) == 6
@@ -0,0 +1,63 @@
+"""Tests for the backend equivalence harness."""
+import pytest
+
+from src.application.services.reference_rules import ReferenceRuleSet
+from src.application.use_cases import backend_equivalence
+from src.application.use_cases.backend_equivalence import (
+    BackendMismatch,
+    compare_backends,
+)
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+
+@pytest.fixture
+def grid():
+    """Create a small grid."""
+    return HexGrid(dimensions=GridDimensions(width=6, height=4))
+
+
+def test_default_rules_are_identical_on_every_backend(grid):
+    """Test that random worlds stay identical and every backend is timed."""
+    report = compare_backends(load_rule_set(), grid, ["python", "numpy"], [0, 1], 4)
+
+    assert [timing.backend for timing in report.timings] == ["python", "numpy"]
+    assert all(timing.ticks == 8 for timing in report.timings)
+    assert report.timings[1].ticks_per_second > 0
+    lines = report.format().splitlines()
+    assert lines[0] == "2 worlds identical on 2 backends"
+    assert lines[2].startswith("python") and lines[2].endswith("1.0x")
+
+
+def test_backends_agree_on_toroidal_grids():
+    """Test that wrapped neighbors are seen alike by every backend."""
+    grid = HexGrid(dimensions=GridDimensions(width=6, height=5), wrap=True)
+    report = compare_backends(load_rule_set(), grid, ["python", "numpy"], [2], 4)
+
+    assert report.format().splitlines()[0] == "1 worlds identical on 2 backends"
+
+
+class _DriftingRuleSet(ReferenceRuleSet):
+    """Reference rules that corrupt one cell from the third tick on."""
+
+    def apply(self, world, rng=None):
+        super().apply(world, rng)
+        if world.tick >= 2:
+            world.fields["biomass"][3] += 1
+
+
+def test_mismatch_names_backend_tick_and_field(grid, monkeypatch):
+    """Test that the first difference between backends is reported."""
+    real_create = backend_equivalence.create_backend
+
+    def create(name, rule_set, grid):
+        if name == "python":
+            return _DriftingRuleSet(rule_set, grid)
+        return real_create(name, rule_set, grid)
+
+    monkeypatch.setattr(backend_equivalence, "create_backend", create)
+    with pytest.raises(BackendMismatch, match="tick 3: backend 'python'.*biomass"):
+        compare_backends(load_rule_set(), grid, ["numpy", "python"], [5], 4)
+    with pytest.raises(ValueError):
+        compare_backends(load_rule_set(), grid, [], [5], 4)
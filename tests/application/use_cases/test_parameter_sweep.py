@@ -0,0 +1,83 @@
+"""Tests for the parameter sweep use case."""
+import numpy as np
+import pytest
+
+from src.application.services.random_streams import CounterRNG
+from src.application.services.rule_compiler import CompiledRuleSet
+from src.application.use_cases.parameter_sweep import (
+    SweepRun,
+    execute_run,
+    expand_parameter_grid,
+    summarize_world,
+)
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.infrastructure.persistence.world_store import load_world, save_world
+
+
+@pytest.fixture
+def grid():
+    """Create a test grid."""
+    return HexGrid(dimensions=GridDimensions(width=10, height=8))
+
+
+def test_expand_parameter_grid():
+    """Test that every seed is combined with every parameter combination."""
+    runs = expand_parameter_grid({"b": [1, 2], "a": [0.5]}, seeds=[0, 1, 2])
+
+    assert len(runs) == 6
+    assert runs[0] == SweepRun(seed=0, parameters={"a": 0.5, "b": 1.0})
+    assert len({run.run_id for run in runs}) == 6
+
+
+def test_run_id_is_stable():
+    """Test that run ids do not depend on parameter insertion order."""
+    first = SweepRun(seed=1, parameters={"a": 1.0, "b": 2.0})
+    second = SweepRun(seed=1, parameters={"b": 2.0, "a": 1.0})
+    assert first.run_id == second.run_id
+
+
+def test_summarize_world(grid):
+    """Test that summaries report the mean and sum of every field."""
+    rules = CompiledRuleSet(load_rule_set(), grid)
+    world = rules.create_world(CounterRNG(0))
+    summary = summarize_world(world)
+
+    assert summary["terrain_sum"] == pytest.approx(world.get_field("terrain").sum())
+    assert summary["biomass_mean"] == pytest.approx(world.get_field("biomass").mean())
+
+
+def test_execute_run_applies_parameters(grid):
+    """Test that parameter overrides change the outcome of a run."""
+    rule_set = load_rule_set()
+    slow = execute_run(
+        rule_set, grid, SweepRun(seed=0, parameters={"growth_rate": 0.0}), 20
+    )
+    fast = execute_run(
+        rule_set, grid, SweepRun(seed=0, parameters={"growth_rate": 0.5}), 20
+    )
+
+    assert slow["ticks"] == fast["ticks"] == 20
+    assert fast["biomass_sum"] > slow["biomass_sum"]
+
+
+def test_execute_run_from_mapped_initial_state(grid, tmp_path):
+    """Test that a shared read-only initial world gives identical results."""
+    rule_set = load_rule_set()
+    run = SweepRun(seed=3, parameters={"decay": 0.05})
+    rules = CompiledRuleSet(rule_set.with_parameters(run.parameters), grid)
+    save_world(rules.create_world(CounterRNG(run.seed)), tmp_path / "initial")
+    mapped = load_world(tmp_path / "initial", mmap=True)
+
+    shared = execute_run(rule_set, grid, run, 15, initial_world=mapped)
+    fresh = execute_run(rule_set, grid, run, 15)
+
+    for name in ("terrain_sum", "moisture_sum", "biomass_sum"):
+        assert shared[name] == fresh[name]
+    # The mapped terrain itself is never written
+    assert not mapped.get_field("terrain").flags.writeable
+    assert np.array_equal(
+        mapped.get_field("terrain"),
+        load_world(tmp_path / "initial").get_field("terrain"),
+    )
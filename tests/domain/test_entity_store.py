@@ -0,0 +1,109 @@
+"""Tests for the structure-of-arrays entity store."""
+import numpy as np
+import pytest
+
+from src.domain.entities.entity_store import (
+    ANIMAL_COMPONENTS,
+    EntityStore,
+    UnknownComponent,
+)
+
+
+@pytest.fixture
+def store():
+    """Create an animal store with a small initial capacity."""
+    return EntityStore(capacity=4)
+
+
+def test_spawn_sets_components_in_bulk(store):
+    """Test that spawned entities get the given values and zero otherwise."""
+    slots = store.spawn(3, position=[5, 6, 7], energy=2.5, species=1)
+
+    assert slots.tolist() == [0, 1, 2]
+    assert store.count == 3
+    assert store.component("position")[slots].tolist() == [5, 6, 7]
+    assert np.all(store.component("energy")[slots] == 2.5)
+    assert np.all(store.component("age")[slots] == 0)
+    assert set(store.components) == set(ANIMAL_COMPONENTS)
+
+
+def test_despawned_slots_are_recycled(store):
+    """Test that freed slots are reused before the store grows."""
+    store.spawn(4, energy=1.0)
+    store.despawn(np.array([1, 3]))
+
+    assert store.count == 2
+    assert store.living().tolist() == [0, 2]
+    recycled = store.spawn(2, energy=9.0)
+    assert sorted(recycled.tolist()) == [1, 3]
+    assert store.capacity == 4
+    assert np.all(store.component("energy")[recycled] == 9.0)
+
+
+def test_store_grows_when_the_free_list_runs_dry(store):
+    """Test that spawning beyond capacity keeps existing entities."""
+    first = store.spawn(3, position=[1, 2, 3])
+    grown = store.spawn(10, position=np.arange(10))
+
+    assert store.capacity >= 13
+    assert store.count == 13
+    assert store.component("position")[first].tolist() == [1, 2, 3]
+    assert store.component("position")[grown].tolist() == list(range(10))
+    assert len(set(first.tolist()) | set(grown.tolist())) == 13
+    # After growing, the lowest free slots are still used first
+    store.despawn(first)
+    assert sorted(store.spawn(3).tolist()) == sorted(first.tolist())
+
+
+def test_vectorized_system_updates_one_species(store):
+    """Test a metabolism system that ages, feeds on energy and removes."""
+    store.spawn(3, energy=[1.0, 0.5, 3.0], species=0)
+    store.spawn(2, energy=[0.2, 4.0], species=1)
+
+    # Every animal of species 0 ages and burns 0.75 energy; starved ones die
+    herd = store.living(species=0)
+    store.component("age")[herd] += 1
+    store.component("energy")[herd] -= 0.75
+    store.despawn(herd[store.component("energy")[herd] <= 0])
+
+    assert store.count == 4
+    assert store.living(species=0).tolist() == [0, 2]
+    assert store.component("age")[store.living(species=1)].tolist() == [0, 0]
+
+
+def test_cell_counts(store):
+    """Test counting the living entities per cell."""
+    store.spawn(4, position=[2, 2, 0, 3])
+    store.despawn(np.array([3]))
+
+    assert store.cell_counts(5).tolist() == [1, 0, 2, 0, 0]
+
+
+def test_invalid_operations_are_rejected(store):
+    """Test errors for unknown components, bad values and bad despawns."""
+    slots = store.spawn(2)
+    with pytest.raises(UnknownComponent):
+        store.component("speed")
+    with pytest.raises(UnknownComponent):
+        store.spawn(1, speed=2.0)
+    with pytest.raises(ValueError):
+        store.spawn(3, position=[1, 2])
+    with pytest.raises(ValueError):
+        store.spawn(-1)
+    with pytest.raises(ValueError):
+        store.despawn(np.array([slots[0], slots[0]]))
+    with pytest.raises(ValueError):
+        store.despawn(np.array([3]))
+    with pytest.raises(ValueError):
+        store.despawn(np.array([99]))
+    with pytest.raises(ValueError):
+        EntityStore({})
+
+    assert store.count == 2
+    assert store.living().tolist() == slots.tolist()
+    store.despawn(np.array([], dtype=np.int64))
+    assert "count=2" in str(store)
+    assert set(store.memory_usage()) == set(ANIMAL_COMPONENTS) | {
+        "alive",
+        "free list",
+    }
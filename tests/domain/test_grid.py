@@ -1,6 +1,15 @@
+import pickle
+
+import numpy as np
 import pytest
 
-from src.domain.entities.grid import HexGrid
+from src.domain.entities.grid import (
+    NEIGHBOR_OFFSETS,
+    HexGrid,
+    InvalidGridPosition,
+    from_axial,
+    to_axial,
+)
 from src.domain.value_objects.grid_dimensions import GridDimensions
 from src.domain.value_objects.grid_position import GridPosition
 
@@ -67,3 +76,150 @@ def test_position_validation_edge_cases():
     assert grid.is_valid_position(GridPosition(q=3, r=-1)) is False
     assert grid.is_valid_position(GridPosition(q=-1, r=3)) is False
     assert grid.is_valid_position(GridPosition(q=3, r=3)) is False
+
+
+def test_cell_id_round_trip():
+    """Test that cell ids are row-major and convert back to positions."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=3))
+
+    assert grid.cell_count == 12
+    assert grid.cell_id(GridPosition(q=0, r=0)) == 0
+    assert grid.cell_id(GridPosition(q=3, r=0)) == 3
+    assert grid.cell_id(GridPosition(q=1, r=2)) == 9
+    for cell_id in range(grid.cell_count):
+        assert grid.cell_id(grid.position_of(cell_id)) == cell_id
+
+
+def test_cell_id_rejects_invalid_positions():
+    """Test that ids are only produced for cells inside the grid."""
+    grid = HexGrid(dimensions=GridDimensions(width=2, height=2))
+
+    with pytest.raises(InvalidGridPosition):
+        grid.cell_id(GridPosition(q=2, r=0))
+    with pytest.raises(InvalidGridPosition):
+        grid.position_of(4)
+    with pytest.raises(InvalidGridPosition):
+        grid.position_of(-1)
+
+
+def test_neighbor_table_matches_grid_neighbors():
+    """Test that the neighbor table agrees with the grid's neighbor positions."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=5))
+    table = grid.neighbor_table
+
+    assert table.shape == (6, grid.cell_count)
+    for cell_id in range(grid.cell_count):
+        position = grid.position_of(cell_id)
+        for direction, neighbor in enumerate(grid.neighbors(position)):
+            expected = (
+                grid.cell_id(neighbor) if grid.is_valid_position(neighbor) else -1
+            )
+            assert table[direction, cell_id] == expected
+
+
+def test_neighbors_depend_on_row_parity():
+    """Test the neighbors of cells in even and odd rows."""
+    grid = HexGrid(dimensions=GridDimensions(width=6, height=8))
+
+    assert [n.as_tuple() for n in grid.neighbors(GridPosition(q=2, r=4))] == [
+        (2, 2),
+        (2, 3),
+        (2, 5),
+        (2, 6),
+        (1, 5),
+        (1, 3),
+    ]
+    assert [n.as_tuple() for n in grid.neighbors(GridPosition(q=2, r=3))] == [
+        (2, 1),
+        (3, 2),
+        (3, 4),
+        (2, 5),
+        (2, 4),
+        (2, 2),
+    ]
+
+
+def test_axial_coordinates_round_trip():
+    """Test that axial coordinates give neighbors a hex distance of one."""
+    q, r = np.meshgrid(np.arange(-4, 5), np.arange(-4, 5))
+    back_q, back_r = from_axial(*to_axial(q, r))
+    assert np.array_equal(back_q, q) and np.array_equal(back_r, r)
+
+    for parity, offsets in enumerate(NEIGHBOR_OFFSETS):
+        x, z = to_axial(np.int64(3), np.int64(4 + parity))
+        for dq, dr in offsets:
+            nx, nz = to_axial(3 + dq, 4 + parity + dr)
+            dx, dz = nx - x, nz - z
+            assert (abs(dx) + abs(dz) + abs(dx + dz)) // 2 == 1
+
+
+def test_neighbor_table_is_cached_and_read_only():
+    """Test that the neighbor table is built once and cannot be modified."""
+    grid = HexGrid(dimensions=GridDimensions(width=3, height=3))
+
+    assert grid.neighbor_table is grid.neighbor_table
+    with pytest.raises(ValueError):
+        grid.neighbor_table[0, 0] = 5
+
+
+def test_wrapped_grid_accepts_every_position():
+    """Test that a toroidal grid maps any position onto a cell."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=6), wrap=True)
+
+    assert grid.is_valid_position(GridPosition(q=-1, r=13)) is True
+    assert grid.wrapped(GridPosition(q=-1, r=13)) == GridPosition(q=3, r=1)
+    assert grid.cell_id(GridPosition(q=4, r=-1)) == grid.cell_id(GridPosition(q=0, r=5))
+    # Bounded grids leave positions unchanged
+    bounded = HexGrid(dimensions=GridDimensions(width=4, height=6))
+    assert bounded.wrapped(GridPosition(q=-1, r=7)) == GridPosition(q=-1, r=7)
+
+
+def test_odd_heights_wrap_with_a_half_column_shift():
+    """Test that rows below an odd height continue one column over."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=5), wrap=True)
+
+    # Row 5 is odd but continues as the even row 0 of the shifted copy below
+    assert grid.wrapped(GridPosition(q=1, r=5)) == GridPosition(q=1, r=0)
+    assert grid.wrapped(GridPosition(q=1, r=6)) == GridPosition(q=0, r=1)
+    assert grid.wrapped(GridPosition(q=1, r=-1)) == GridPosition(q=2, r=4)
+    assert grid.wrapped(GridPosition(q=1, r=-5)) == GridPosition(q=2, r=0)
+
+
+def test_wrapped_neighbor_table_has_six_neighbors_everywhere():
+    """Test that toroidal neighbors wrap and stay mutual, for odd heights too."""
+    for width, height in ((5, 5), (5, 6), (2, 5), (3, 9)):
+        grid = HexGrid(dimensions=GridDimensions(width, height), wrap=True)
+        table = grid.neighbor_table
+
+        assert (table >= 0).all()
+        for cell_id in range(grid.cell_count):
+            position = grid.position_of(cell_id)
+            neighbors = table[:, cell_id]
+            assert len(set(neighbors.tolist()) | {cell_id}) == 7
+            for direction, neighbor in enumerate(grid.neighbors(position)):
+                assert neighbors[direction] == grid.cell_id(neighbor)
+                # Direction d + 3 points back
+                assert table[(direction + 3) % 6, neighbors[direction]] == cell_id
+
+
+def test_wrapped_grid_needs_two_columns_and_five_rows():
+    """Test that toroidal grids too small for distinct neighbors are rejected."""
+    with pytest.raises(ValueError):
+        HexGrid(dimensions=GridDimensions(width=1, height=6), wrap=True)
+    with pytest.raises(ValueError):
+        HexGrid(dimensions=GridDimensions(width=5, height=4), wrap=True)
+
+
+def test_pickled_grid_leaves_out_the_neighbor_table():
+    """Test that the cached table is rebuilt instead of being pickled."""
+    grid = HexGrid(GridDimensions(width=40, height=30), wrap=True)
+    table = grid.neighbor_table
+    bare = len(pickle.dumps(HexGrid(GridDimensions(width=40, height=30), wrap=True)))
+
+    copy = pickle.loads(pickle.dumps(grid))
+
+    assert len(pickle.dumps(grid)) == bare
+    assert copy == grid
+    assert "neighbor_table" in grid.memory_usage()
+    assert copy.memory_usage() == {}
+    assert np.array_equal(copy.neighbor_table, table)
@@ -0,0 +1,85 @@
+"""Tests for the array-backed world entity."""
+import numpy as np
+import pytest
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import UnknownCellField, World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+
+
+@pytest.fixture
+def grid():
+    """Create a test grid."""
+    return HexGrid(dimensions=GridDimensions(width=4, height=3))
+
+
+def test_world_add_and_get_field(grid):
+    """Test that fields are created with one value per cell."""
+    world = World(grid=grid)
+    biomass = world.add_field("biomass", "float32", fill=0.5)
+
+    assert biomass.shape == (12,)
+    assert biomass.dtype == np.float32
+    assert world.get_field("biomass") is biomass
+    assert np.all(biomass == 0.5)
+    assert world.tick == 0
+
+
+def test_world_rejects_duplicate_and_unknown_fields(grid):
+    """Test that field names are unique and lookups are checked."""
+    world = World(grid=grid)
+    world.add_field("terrain", "int8")
+
+    with pytest.raises(ValueError):
+        world.add_field("terrain", "int8")
+    with pytest.raises(UnknownCellField):
+        world.get_field("moisture")
+
+
+def test_world_rejects_wrongly_sized_fields(grid):
+    """Test that every field must have exactly one entry per cell."""
+    with pytest.raises(ValueError):
+        World(grid=grid, fields={"biomass": np.zeros(5)})
+    world = World(grid=grid)
+    with pytest.raises(ValueError):
+        world.set_field("biomass", np.zeros((3, 4)))
+
+
+def test_world_copy_is_independent(grid):
+    """Test that copies do not share field arrays."""
+    world = World(grid=grid, tick=3)
+    world.add_field("biomass", "float64")
+    clone = world.copy()
+    clone.get_field("biomass")[0] = 1.0
+
+    assert clone.tick == 3
+    assert clone.grid is world.grid
+    assert world.get_field("biomass")[0] == 0.0
+
+
+def test_world_versions_change_on_write(grid):
+    """Test that writing a field gives it a new version."""
+    world = World(grid=grid)
+    world.add_field("biomass", "float64")
+    world.add_field("terrain", "int8")
+    before = dict(world.versions)
+
+    world.set_field("biomass", np.ones(12))
+    assert world.versions["biomass"] != before["biomass"]
+    assert world.versions["terrain"] == before["terrain"]
+
+    biomass_version = world.versions["biomass"]
+    world.get_field("biomass")[0] = 2.0
+    world.touch("biomass")
+    assert world.versions["biomass"] != biomass_version
+    assert world.copy().versions == world.versions
+
+
+def test_worlds_compare_by_identity(grid):
+    """Test that comparing worlds never compares their field arrays."""
+    world = World(grid=grid)
+    world.add_field("biomass", "float32")
+    copy = world.copy()
+
+    assert world == world
+    assert world != copy
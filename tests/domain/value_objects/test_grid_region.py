@@ -0,0 +1,43 @@
+"""Tests for the GridRegion value object."""
+import numpy as np
+import pytest
+
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+
+
+def test_region_validation():
+    """Test that a region must contain at least one cell."""
+    with pytest.raises(ValueError):
+        GridRegion(0, 0, 0, 3)
+    with pytest.raises(ValueError):
+        GridRegion(0, 0, 3, -1)
+
+
+def test_region_expand_and_clip():
+    """Test growing a region by a margin and clipping it to a grid."""
+    region = GridRegion(q=0, r=2, width=3, height=2)
+
+    assert region.expanded(1) == GridRegion(-1, 1, 5, 4)
+    assert region.expanded(1).clipped_to(GridDimensions(4, 4)) == GridRegion(0, 1, 4, 3)
+    with pytest.raises(ValueError):
+        GridRegion(5, 0, 2, 2).clipped_to(GridDimensions(4, 4))
+
+
+def test_region_cell_ids():
+    """Test that cell ids follow the full grid's row-major order."""
+    region = GridRegion(q=1, r=1, width=2, height=2)
+
+    assert region.cell_count == 4
+    assert region.dimensions == GridDimensions(2, 2)
+    assert np.array_equal(region.cell_ids(grid_width=5), [6, 7, 11, 12])
+
+
+def test_region_enclosing_and_union():
+    """Test bounding windows of cells and of other windows."""
+    region = GridRegion.enclosing(np.array([12, 3, 25]), grid_width=10)
+    assert region == GridRegion(q=2, r=0, width=4, height=3)
+    assert GridRegion.enclosing(np.array([7]), 10) == GridRegion(7, 0, 1, 1)
+    assert region.union(GridRegion(8, 4, 1, 1)) == GridRegion(2, 0, 7, 5)
+    with pytest.raises(ValueError):
+        GridRegion.enclosing(np.array([], dtype=np.int64), 10)
@@ -0,0 +1,81 @@
+"""Tests for the declarative rule set value objects."""
+import dataclasses
+
+import pytest
+
+from src.domain.value_objects.rule_set import (
+    FieldSpec,
+    RuleDefinition,
+    RuleDefinitionError,
+    RuleSet,
+)
+
+
+def test_rule_set_from_dict():
+    """Test that a rule document is parsed into value objects."""
+    rule_set = RuleSet.from_dict(
+        {
+            "parameters": {"rate": 1},
+            "fields": {
+                "terrain": {"dtype": "int8"},
+                "biomass": {"dtype": "float32", "initial": 0.5},
+            },
+            "rules": [{"target": "biomass", "expression": "biomass * rate"}],
+        }
+    )
+
+    assert rule_set.fields == (
+        FieldSpec(name="terrain", dtype="int8"),
+        FieldSpec(name="biomass", dtype="float32", initial=0.5),
+    )
+    assert rule_set.rules == (
+        RuleDefinition(target="biomass", expression="biomass * rate"),
+    )
+    assert rule_set.parameters == {"rate": 1.0}
+
+
+def test_rule_set_is_immutable():
+    """Test that rule sets cannot be modified."""
+    rule_set = RuleSet(fields=(FieldSpec(name="biomass"),))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rule_set.rules = ()  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"fields": {"not valid": {}}},
+        {"fields": {"biomass": {"dtype": "complex128"}}},
+        {"fields": {"biomass": {"colour": "green"}}},
+        {
+            "fields": {"biomass": {}},
+            "rules": [{"target": "moisture", "expression": "1"}],
+        },
+        {
+            "fields": {"biomass": {}},
+            "rules": [
+                {"target": "biomass", "expression": "1"},
+                {"target": "biomass", "expression": "2"},
+            ],
+        },
+        {"fields": {"biomass": {}}, "parameters": {"biomass": 1.0}},
+        {"fields": {"biomass": {}}, "parameters": {"rate": "fast"}},
+        {"fields": []},
+    ],
+)
+def test_rule_set_rejects_invalid_documents(document):
+    """Test that malformed rule documents raise RuleDefinitionError."""
+    with pytest.raises(RuleDefinitionError):
+        RuleSet.from_dict(document)
+
+
+def test_rule_set_with_parameters():
+    """Test that parameter overrides create a new rule set."""
+    rule_set = RuleSet(fields=(FieldSpec(name="biomass"),), parameters={"rate": 1.0})
+    tuned = rule_set.with_parameters({"rate": 2})
+
+    assert tuned.parameters == {"rate": 2.0}
+    assert rule_set.parameters == {"rate": 1.0}
+    assert tuned.fields == rule_set.fields
+    with pytest.raises(RuleDefinitionError):
+        rule_set.with_parameters({"speed": 1.0})
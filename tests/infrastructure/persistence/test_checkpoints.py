@@ -0,0 +1,174 @@
+"""Tests for forked copy-on-write checkpoints."""
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.checkpoints import (
+    CheckpointError,
+    CheckpointProgress,
+    ForkCheckpointer,
+    latest_checkpoint,
+)
+from src.infrastructure.persistence.world_store import load_world
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+@pytest.fixture
+def world():
+    """Create a world with two fields."""
+    world = World(grid=HexGrid(GridDimensions(16, 12)), tick=5)
+    world.add_field("terrain", "int8", fill=1)
+    world.add_field("biomass", "float32", fill=0.5)
+    return world
+
+
+@requires_fork
+def test_forked_checkpoint_keeps_the_state_at_the_fork(world, tmp_path):
+    """Test that changes after start do not leak into the checkpoint."""
+    checkpoints = ForkCheckpointer(tmp_path)
+
+    assert checkpoints.start(world)
+    world.get_field("biomass")[:] = 1.0
+    path = checkpoints.wait()
+
+    saved = load_world(path)
+    assert path == tmp_path / "tick_000000005"
+    assert saved.tick == 5
+    np.testing.assert_array_equal(saved.get_field("biomass"), 0.5)
+    assert checkpoints.completed == [path]
+    assert not checkpoints.in_flight
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
+
+
+@requires_fork
+def test_only_one_checkpoint_is_in_flight(world, tmp_path):
+    """Test that start declines while a checkpoint is being written."""
+    with ForkCheckpointer(tmp_path) as checkpoints:
+        assert checkpoints.start(world)
+        assert checkpoints.progress.tick == 5
+        world.tick = 6
+        assert not checkpoints.start(world)
+
+    assert latest_checkpoint(tmp_path) == tmp_path / "tick_000000005"
+    assert checkpoints.progress is None
+
+
+@requires_fork
+def test_stage_checkpoints_every_interval(world, tmp_path):
+    """Test that the stage starts checkpoints and collects finished ones."""
+    checkpoints = ForkCheckpointer(tmp_path, interval=2)
+    for tick in range(6, 12):
+        world.tick = tick
+        checkpoints(world)
+        checkpoints.wait()
+
+    assert [path.name for path in checkpoints.completed] == [
+        "tick_000000006",
+        "tick_000000008",
+        "tick_000000010",
+    ]
+    assert checkpoints.skipped == 0
+    assert latest_checkpoint(tmp_path).name == "tick_000000010"
+
+
+@requires_fork
+def test_failed_child_is_cleaned_up_and_reported(world, tmp_path, capfd):
+    """Test that a failed checkpoint leaves no partial directory behind."""
+    checkpoints = ForkCheckpointer(tmp_path)
+    world.fields["broken"] = object()  # Cannot be saved as an array
+
+    checkpoints.start(world)
+    with pytest.raises(CheckpointError):
+        checkpoints.wait()
+
+    assert list(tmp_path.iterdir()) == []
+    assert not checkpoints.in_flight
+    assert latest_checkpoint(tmp_path) is None
+    capfd.readouterr()
+
+
+@requires_fork
+def test_fork_safe_threads_do_not_prevent_forking(world, tmp_path):
+    """Test that a running metrics stage thread still allows a fork."""
+    checkpoints = ForkCheckpointer(tmp_path)
+    release = threading.Event()
+    stage = threading.Thread(target=release.wait, name="metrics-stage")
+    stage.start()
+    try:
+        assert checkpoints.start(world)
+        assert checkpoints.mode == "fork"
+        assert checkpoints._pid is not None
+        world.get_field("biomass")[:] = 1.0
+        path = checkpoints.wait()
+    finally:
+        release.set()
+        stage.join()
+
+    np.testing.assert_array_equal(load_world(path).get_field("biomass"), 0.5)
+
+
+@requires_fork
+def test_threaded_process_writes_a_copy_instead_of_forking(
+    world, tmp_path, monkeypatch, caplog
+):
+    """Test that a process running other threads is never forked."""
+
+    def no_fork():
+        raise AssertionError("forked a multithreaded process")
+
+    monkeypatch.setattr(os, "fork", no_fork)
+    checkpoints = ForkCheckpointer(tmp_path)
+    release = threading.Event()
+    other = threading.Thread(target=release.wait, name="helper")
+    other.start()
+    try:
+        with caplog.at_level("INFO"):
+            assert checkpoints.start(world)
+        assert checkpoints.mode == "thread"
+        assert "helper" in caplog.text
+        world.get_field("biomass")[:] = 1.0
+        assert checkpoints.in_flight
+        assert not checkpoints.start(world)
+        path = checkpoints.wait()
+    finally:
+        release.set()
+        other.join()
+
+    np.testing.assert_array_equal(load_world(path).get_field("biomass"), 0.5)
+    assert checkpoints.completed == [path]
+    assert not checkpoints.in_flight
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
+
+
+def test_synchronous_checkpoints_without_fork(world, tmp_path):
+    """Test that fork=False writes the checkpoint before start returns."""
+    checkpoints = ForkCheckpointer(tmp_path, fork=False)
+
+    assert checkpoints.start(world)
+    assert not checkpoints.in_flight
+    assert checkpoints.wait() is None
+    assert load_world(checkpoints.completed[0]).tick == 5
+    assert checkpoints.mode == "sync"
+
+    # Any failure of the write is reported as a checkpoint error
+    world.tick = 6
+    world.fields["broken"] = object()
+    with pytest.raises(CheckpointError):
+        checkpoints.start(world)
+    assert not checkpoints.in_flight
+    assert latest_checkpoint(tmp_path).name == "tick_000000005"
+
+
+def test_progress_fraction_and_interval_validation(tmp_path):
+    """Test the progress fraction and that the interval must be positive."""
+    assert CheckpointProgress(3).fraction == 0.0
+    assert CheckpointProgress(3, 25, 100).fraction == 0.25
+    with pytest.raises(ValueError):
+        ForkCheckpointer(tmp_path, interval=0)
+    assert latest_checkpoint(tmp_path / "missing") is None
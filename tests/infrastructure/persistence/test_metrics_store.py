@@ -0,0 +1,46 @@
+"""Tests for chunked columnar metrics storage."""
+import numpy as np
+import pytest
+
+from src.application.services.metrics import MetricsRecord
+from src.infrastructure.persistence.metrics_store import (
+    ChunkedMetricsWriter,
+    load_metrics,
+)
+
+
+def record(tick):
+    """Create a record with a scalar and an array column."""
+    return MetricsRecord(
+        tick=tick,
+        values={"total.biomass": tick * 0.5, "count.terrain": np.array([tick, 1])},
+    )
+
+
+def test_writer_splits_columns_into_chunks(tmp_path):
+    """Test that rows are written as fixed-size chunks per column."""
+    with ChunkedMetricsWriter(tmp_path, chunk_size=2) as writer:
+        for tick in range(1, 6):
+            writer.append(record(tick))
+
+    assert len(list((tmp_path / "tick").iterdir())) == 3
+    columns = load_metrics(tmp_path)
+    assert list(columns["tick"]) == [1, 2, 3, 4, 5]
+    assert list(columns["total.biomass"]) == [0.5, 1.0, 1.5, 2.0, 2.5]
+    assert columns["count.terrain"].shape == (5, 2)
+
+
+def test_writer_continues_existing_directory(tmp_path):
+    """Test that reopening a directory appends after its last chunk."""
+    with ChunkedMetricsWriter(tmp_path) as writer:
+        writer.append(record(1))
+    with ChunkedMetricsWriter(tmp_path) as writer:
+        writer.append(record(2))
+
+    assert list(load_metrics(tmp_path)["tick"]) == [1, 2]
+
+
+def test_writer_rejects_invalid_chunk_size(tmp_path):
+    """Test that chunks must hold at least one row."""
+    with pytest.raises(ValueError):
+        ChunkedMetricsWriter(tmp_path, chunk_size=0)
@@ -0,0 +1,48 @@
+"""Tests for the durable CSV results table."""
+import pytest
+
+from src.infrastructure.persistence.results_table import ResultsTable
+
+
+def test_results_table_appends_rows(tmp_path):
+    """Test that rows are written under a header and read back."""
+    table = ResultsTable(tmp_path / "results.csv", ["seed", "score"])
+    table.append({"run_id": "a", "seed": 1, "score": 0.5})
+    table.append({"run_id": "b", "seed": 2})
+
+    assert table.columns == ["run_id", "seed", "score"]
+    assert table.rows() == [
+        {"run_id": "a", "seed": "1", "score": "0.5"},
+        {"run_id": "b", "seed": "2", "score": ""},
+    ]
+
+
+def test_results_table_resumes_existing_file(tmp_path):
+    """Test that reopening a table keeps its completed runs."""
+    ResultsTable(tmp_path / "results.csv", ["score"]).append(
+        {"run_id": "a", "score": 1}
+    )
+    reopened = ResultsTable(tmp_path / "results.csv", ["score"])
+    reopened.append({"run_id": "b", "score": 2})
+
+    assert reopened.completed_run_ids() == {"a", "b"}
+
+
+def test_results_table_discards_row_cut_short_by_crash(tmp_path):
+    """Test that a partially written last row is dropped on reopen."""
+    path = tmp_path / "results.csv"
+    ResultsTable(path, ["score"]).append({"run_id": "a", "score": 1})
+    with open(path, "a") as table_file:
+        table_file.write("b,0.12")
+
+    reopened = ResultsTable(path, ["score"])
+    reopened.append({"run_id": "c", "score": 3})
+
+    assert [row["run_id"] for row in reopened.rows()] == ["a", "c"]
+
+
+def test_results_table_rejects_different_columns(tmp_path):
+    """Test that a table cannot be reopened with another layout."""
+    ResultsTable(tmp_path / "results.csv", ["score"])
+    with pytest.raises(ValueError):
+        ResultsTable(tmp_path / "results.csv", ["seed"])
@@ -0,0 +1,45 @@
+"""Tests for loading rule sets from JSON documents."""
+import json
+
+import pytest
+
+from src.domain.value_objects.rule_set import RuleDefinitionError
+from src.infrastructure.persistence.rule_loader import load_rule_set
+
+
+def test_load_default_rules():
+    """Test that the built-in rule set is used when no path is given."""
+    rule_set = load_rule_set()
+    assert [spec.name for spec in rule_set.fields] == ["terrain", "moisture", "biomass"]
+    assert {rule.target for rule in rule_set.rules} == {"moisture", "biomass"}
+
+
+def test_load_rules_from_file(tmp_path):
+    """Test that a JSON rule document is loaded from disk."""
+    path = tmp_path / "rules.json"
+    path.write_text(
+        json.dumps(
+            {
+                "fields": {"heat": {"initial": 1.0}},
+                "rules": [{"target": "heat", "expression": "neighbor_mean(heat)"}],
+            }
+        )
+    )
+    rule_set = load_rule_set(str(path))
+    assert rule_set.fields[0].name == "heat"
+    assert rule_set.rules[0].expression == "neighbor_mean(heat)"
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]"])
+def test_load_rules_rejects_malformed_files(tmp_path, content):
+    """Test that unreadable documents raise RuleDefinitionError."""
+    path = tmp_path / "rules.json"
+    path.write_text(content)
+    with pytest.raises(RuleDefinitionError):
+        load_rule_set(path)
+
+
+def test_load_rules_missing_file(tmp_path):
+    """Test that a missing file raises RuleDefinitionError."""
+    with pytest.raises(RuleDefinitionError):
+        load_rule_set(tmp_path / "missing.json")
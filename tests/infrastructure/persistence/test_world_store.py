@@ -0,0 +1,80 @@
+"""Tests for directory-based world persistence."""
+import json
+
+import numpy as np
+import pytest
+
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.world_store import (
+    WorldStoreError,
+    load_world,
+    save_world,
+)
+
+
+@pytest.fixture
+def world():
+    """Create a world with fields of different dtypes."""
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=5, height=4)), tick=9)
+    world.add_field("terrain", "int8", fill=2)
+    world.add_field("biomass", "float32")
+    world.get_field("biomass")[:] = np.linspace(0, 1, 20)
+    return world
+
+
+def test_save_and_load_round_trip(world, tmp_path):
+    """Test that a saved world loads back unchanged."""
+    save_world(world, tmp_path / "snapshot")
+    loaded = load_world(tmp_path / "snapshot")
+
+    assert loaded.tick == 9
+    assert loaded.grid.dimensions == world.grid.dimensions
+    for name, values in world.fields.items():
+        assert loaded.get_field(name).dtype == values.dtype
+        np.testing.assert_array_equal(loaded.get_field(name), values)
+
+
+def test_topology_round_trips_and_defaults_to_bounded(tmp_path):
+    """Test that toroidal grids reload wrapped and older snapshots bounded."""
+    grid = HexGrid(dimensions=GridDimensions(width=5, height=6), wrap=True)
+    save_world(World(grid=grid), tmp_path / "snapshot")
+    assert load_world(tmp_path / "snapshot").grid.wrap is True
+
+    metadata_file = tmp_path / "snapshot" / "world.json"
+    metadata = json.loads(metadata_file.read_text())
+    del metadata["wrap"]
+    metadata_file.write_text(json.dumps(metadata))
+    assert load_world(tmp_path / "snapshot").grid.wrap is False
+
+
+def test_load_with_mmap_is_read_only(world, tmp_path):
+    """Test that mapped fields are shared read-only views of the files."""
+    save_world(world, tmp_path)
+    loaded = load_world(tmp_path, mmap=True)
+
+    assert isinstance(loaded.get_field("terrain"), np.memmap)
+    with pytest.raises(ValueError):
+        loaded.get_field("terrain")[0] = 1
+
+
+def test_load_rejects_incomplete_or_foreign_snapshots(world, tmp_path):
+    """Test that missing metadata or an unknown version is reported."""
+    with pytest.raises(WorldStoreError):
+        load_world(tmp_path)
+
+    save_world(world, tmp_path)
+    metadata = json.loads((tmp_path / "world.json").read_text())
+    metadata["version"] = 99
+    (tmp_path / "world.json").write_text(json.dumps(metadata))
+    with pytest.raises(WorldStoreError):
+        load_world(tmp_path)
+
+
+def test_save_reports_progress_per_field(world, tmp_path):
+    """Test that the progress callback sees every field being written."""
+    reports = []
+    save_world(world, tmp_path, progress=lambda done, total: reports.append(done))
+
+    assert reports == [20, 100]
@@ -0,0 +1,133 @@
+"""Tests for the chunked world repository."""
+import numpy as np
+import pytest
+
+from src.domain.entities.world import UnknownCellField
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_region import GridRegion
+from src.infrastructure.repositories.chunked_world_repository import (
+    ChunkedWorldRepository,
+    ChunkStoreError,
+)
+
+DIMENSIONS = GridDimensions(width=10, height=7)
+FIELDS = {"terrain": "int8", "biomass": "float32"}
+
+
+def filled(repository):
+    """Write a distinct value to every cell of a repository."""
+    whole = GridRegion(0, 0, DIMENSIONS.width, DIMENSIONS.height)
+    cell_ids = np.arange(whole.cell_count)
+    repository.write_region(whole, {"terrain": cell_ids % 4, "biomass": cell_ids / 100})
+    return cell_ids
+
+
+def test_create_starts_zeroed(tmp_path):
+    """Test that a new repository holds zeros at tick 0."""
+    repository = ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4
+    )
+    world = repository.read_region(GridRegion(2, 3, 5, 4))
+
+    assert repository.tick == 0
+    assert world.grid.dimensions == GridDimensions(5, 4)
+    assert world.get_field("terrain").dtype == np.int8
+    assert not world.get_field("biomass").any()
+
+
+def test_regions_round_trip_across_chunks(tmp_path):
+    """Test that windows spanning several chunks read back what was written."""
+    repository = ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4
+    )
+    cell_ids = filled(repository)
+    region = GridRegion(q=3, r=2, width=6, height=5)
+    repository.write_region(region, {"terrain": np.full((5, 6), 7)})
+    world = repository.read_region(region)
+
+    assert np.all(world.get_field("terrain") == 7)
+    expected = (cell_ids / 100).astype(np.float32)[region.cell_ids(DIMENSIONS.width)]
+    assert np.array_equal(world.get_field("biomass"), expected)
+
+
+def test_lru_eviction_writes_back_dirty_chunks(tmp_path):
+    """Test that a small budget evicts chunks without losing writes."""
+    record_size = 16 * 1 + 16 * 4  # int8 and float32 blocks of 4x4 cells
+    repository = ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4, memory_budget=2 * record_size
+    )
+    cell_ids = filled(repository)
+
+    assert repository.resident_chunks == 2
+    assert repository.evictions == 4
+    whole = repository.read_region(GridRegion(0, 0, 10, 7))
+    assert np.array_equal(whole.get_field("terrain"), cell_ids % 4)
+    # Fully overwritten chunks are never read from the chunk file
+    assert repository.page_ins == 6
+
+
+def test_recently_used_chunks_stay_resident(tmp_path):
+    """Test that the least recently used chunk is evicted first."""
+    repository = ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4, memory_budget=2 * 80
+    )
+    first, second, third = (GridRegion(q, 0, 1, 1) for q in (0, 4, 8))
+    repository.read_region(first)
+    repository.read_region(second)
+    repository.read_region(first)
+    repository.read_region(third)
+    page_ins = repository.page_ins
+
+    repository.read_region(first)
+    assert repository.page_ins == page_ins
+    repository.read_region(second)
+    assert repository.page_ins == page_ins + 1
+
+
+def test_flush_persists_cells_and_tick(tmp_path):
+    """Test that a reopened repository sees flushed data."""
+    with ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4
+    ) as repository:
+        cell_ids = filled(repository)
+        repository.tick = 12
+
+    reopened = ChunkedWorldRepository(tmp_path)
+    world = reopened.read_region(GridRegion(0, 0, 10, 7))
+    assert reopened.tick == 12
+    assert np.array_equal(world.get_field("terrain"), cell_ids % 4)
+
+
+def test_invalid_access_is_rejected(tmp_path):
+    """Test region bounds, unknown fields, sizes and budgets."""
+    repository = ChunkedWorldRepository.create(
+        tmp_path, DIMENSIONS, FIELDS, chunk_size=4
+    )
+    with pytest.raises(ValueError):
+        repository.read_region(GridRegion(8, 0, 3, 1))
+    with pytest.raises(UnknownCellField):
+        repository.write_region(GridRegion(0, 0, 1, 1), {"moisture": np.zeros(1)})
+    with pytest.raises(ValueError):
+        repository.write_region(GridRegion(0, 0, 2, 2), {"terrain": np.zeros(3)})
+    with pytest.raises(ValueError):
+        ChunkedWorldRepository(tmp_path, memory_budget=10)
+
+
+def test_open_rejects_missing_or_truncated_store(tmp_path):
+    """Test that only complete chunked worlds can be opened."""
+    with pytest.raises(ChunkStoreError):
+        ChunkedWorldRepository(tmp_path / "missing")
+    ChunkedWorldRepository.create(tmp_path, DIMENSIONS, FIELDS, chunk_size=4)
+    with open(tmp_path / "chunks.bin", "r+b") as data_file:
+        data_file.truncate(10)
+    with pytest.raises(ChunkStoreError):
+        ChunkedWorldRepository(tmp_path)
+
+
+def test_wrapped_grid_survives_reopening(tmp_path):
+    """Test that a toroidal world is reopened as toroidal."""
+    ChunkedWorldRepository.create(tmp_path / "wrapped", DIMENSIONS, FIELDS, wrap=True)
+    ChunkedWorldRepository.create(tmp_path / "bounded", DIMENSIONS, FIELDS)
+
+    assert ChunkedWorldRepository(tmp_path / "wrapped").grid.wrap
+    assert not ChunkedWorldRepository(tmp_path / "bounded").grid.wrap
@@ -0,0 +1,229 @@
+"""Tests for the headless command line interface."""
+import csv
+
+from src.application.use_cases.parameter_sweep import SweepRun
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.metrics_store import load_metrics
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.infrastructure.persistence.world_store import load_world
+from src.interfaces.cli.app import main
+from src.interfaces.cli.sweep import _initial_state_key
+
+
+def read_results(path):
+    """Read the rows of a results table."""
+    with open(path, newline="") as table_file:
+        return list(csv.DictReader(table_file))
+
+
+def test_cli_run_prints_summary_and_saves(tmp_path, capsys):
+    """Test that the run command simulates and optionally saves the world."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "3",
+            "run",
+            "--save",
+            str(tmp_path),
+        ]
+    )
+
+    assert exit_code == 0
+    assert "biomass_mean" in capsys.readouterr().out
+    assert load_world(tmp_path).tick == 3
+
+
+def test_cli_run_records_metrics(tmp_path, capsys):
+    """Test that the run command records one metrics row per tick."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "4",
+            "run",
+            "--metrics",
+            str(tmp_path),
+        ]
+    )
+
+    columns = load_metrics(tmp_path)
+    assert exit_code == 0
+    assert list(columns["tick"]) == [1, 2, 3, 4]
+    assert columns["count.terrain"].shape == (4, 4)
+    assert columns["histogram.biomass"].sum(axis=1).tolist() == [30] * 4
+
+
+def test_cli_run_writes_checkpoints(tmp_path, capsys):
+    """Test that the run command checkpoints every interval."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "5",
+            "run",
+            "--checkpoint",
+            str(tmp_path),
+            "--checkpoint-every",
+            "2",
+        ]
+    )
+
+    assert exit_code == 0
+    assert "checkpoints: " in capsys.readouterr().out
+    assert load_world(tmp_path / "tick_000000002").tick == 2
+
+
+def test_cli_run_reports_memory_and_traces_allocations(capsys):
+    """Test the memory report and the traced tick loop of the run command."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "5",
+            "run",
+            "--memory-report",
+            "--trace-allocations",
+        ]
+    )
+
+    output = capsys.readouterr().out
+    assert exit_code == 0
+    assert "bytes per cell" in output
+    assert "traced ticks: 1" in output
+
+
+def test_cli_sweep_runs_grid_and_resumes(tmp_path, capsys):
+    """Test that a sweep fills the table and skips finished runs on resume."""
+    arguments = [
+        "--width", "6", "--height", "5", "--ticks", "4", "sweep",
+        "--param", "growth_rate=0.1,0.2", "--seeds", "0-1",
+        "--workers", "2", "--output", str(tmp_path),
+    ]  # fmt: skip
+    assert main(arguments) == 0
+    rows = read_results(tmp_path / "results.csv")
+    assert len(rows) == 4
+    assert {row["growth_rate"] for row in rows} == {"0.1", "0.2"}
+    # Both parameter values share one cached initial world per seed
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    capsys.readouterr()
+    assert main(arguments) == 0
+    assert "4 of 4 runs already complete" in capsys.readouterr().out
+    assert len(read_results(tmp_path / "results.csv")) == 4
+
+    # A different grid, tick count or topology is another experiment
+    for changed in (["--width", "8"], ["--ticks", "5"], ["--wrap"]):
+        assert main(arguments[:6] + changed + arguments[6:]) == 2
+        assert "another grid" in capsys.readouterr().err
+    assert len(read_results(tmp_path / "results.csv")) == 4
+
+
+def test_sweep_initial_states_depend_on_the_topology():
+    """Test that bounded and toroidal runs never share a cached world."""
+    rule_set, run = load_rule_set(), SweepRun(seed=0)
+    bounded = HexGrid(GridDimensions(16, 16))
+    wrapped = HexGrid(GridDimensions(16, 16), wrap=True)
+
+    assert _initial_state_key(rule_set, bounded, run) != _initial_state_key(
+        rule_set, wrapped, run
+    )
+
+
+def test_cli_sweep_rejects_unknown_parameter(tmp_path, capsys):
+    """Test that sweeping an undeclared parameter is an error."""
+    exit_code = main(["sweep", "--param", "speed=1", "--output", str(tmp_path)])
+    assert exit_code == 2
+    assert "speed" in capsys.readouterr().err
+
+
+def test_cli_record_writes_png_frames(tmp_path, capsys):
+    """Test that the record command renders a frame every few ticks."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "4",
+            "record",
+            "--output",
+            str(tmp_path),
+            "--every",
+            "2",
+            "--size",
+            "64x48",
+        ]
+    )
+
+    assert exit_code == 0
+    assert "frames: 3 (64x48)" in capsys.readouterr().out
+    assert len(list(tmp_path.glob("frame_*.png"))) == 3
+
+
+def test_cli_record_rejects_invalid_interval(tmp_path, capsys):
+    """Test that the frame interval must be positive."""
+    exit_code = main(["record", "--output", str(tmp_path), "--every", "0"])
+
+    assert exit_code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_cli_serve_streams_the_run(capsys):
+    """Test that serve runs the requested ticks on an ephemeral port."""
+    exit_code = main(
+        [
+            "--width",
+            "6",
+            "--height",
+            "5",
+            "--ticks",
+            "3",
+            "serve",
+            "--listen",
+            "127.0.0.1:0",
+            "--tps",
+            "0",
+        ]
+    )
+
+    output = capsys.readouterr().out
+    assert exit_code == 0
+    assert "serving on ('127.0.0.1'," in output
+    assert "ticks: 3" in output
+
+
+def test_cli_compare_backends_times_identical_runs(capsys):
+    """Test that compare-backends checks equivalence and prints timings."""
+    arguments = ["--width", "5", "--height", "4", "--ticks", "2", "compare-backends"]
+    exit_code = main(arguments + ["--backends", "python,numpy", "--seeds", "0-1"])
+
+    output = capsys.readouterr().out
+    assert exit_code == 0
+    assert "2 worlds identical on 2 backends" in output
+    assert output.splitlines()[-1].startswith("numpy")
+
+
+def test_cli_run_uses_selected_backend(capsys):
+    """Test that every backend produces the same run summary."""
+    summaries = []
+    for backend in ("python", "numpy"):
+        arguments = ["--width", "4", "--height", "3", "--ticks", "2"]
+        assert main(arguments + ["--backend", backend, "run"]) == 0
+        summaries.append(capsys.readouterr().out)
+
+    assert summaries[0] == summaries[1]
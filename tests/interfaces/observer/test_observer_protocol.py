@@ -0,0 +1,141 @@
+"""Tests for the observer wire format."""
+import io
+
+import numpy as np
+import pytest
+
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.interfaces.observer.protocol import (
+    DELTA,
+    DENSE,
+    HANDSHAKE,
+    SNAPSHOT,
+    SPARSE,
+    ProtocolError,
+    apply_delta,
+    decode_snapshot,
+    encode_delta,
+    encode_snapshot,
+    parse_address,
+    read_handshake,
+    read_message,
+)
+
+
+@pytest.fixture
+def world():
+    """A small world with an integer and a float field."""
+    world = World(grid=HexGrid(GridDimensions(8, 6)), tick=3)
+    world.set_field("terrain", np.arange(48, dtype=np.int8) % 4)
+    world.set_field("biomass", np.linspace(0, 1, 48, dtype=np.float32))
+    return world
+
+
+def payload_of(message):
+    """Split a framed message into its kind and payload."""
+    return read_message(io.BytesIO(message))
+
+
+def test_snapshot_round_trip(world):
+    """Test that a snapshot reproduces every field, dtype and the tick."""
+    kind, payload = payload_of(encode_snapshot(world))
+    received = decode_snapshot(payload)
+
+    assert kind == SNAPSHOT
+    assert received.grid == world.grid
+    assert received.tick == 3
+    for name, values in world.fields.items():
+        assert received.fields[name].dtype == values.dtype
+        np.testing.assert_array_equal(received.fields[name], values)
+        assert received.fields[name].flags.writeable
+
+
+def test_delta_sends_only_changed_cells_of_changed_fields(world):
+    """Test that a delta skips unchanged fields and encodes changes sparsely."""
+    previous = FrameSnapshot.capture(world)
+    world.fields["biomass"][[2, 40]] = 0.5
+    world.touch("biomass")
+    world.tick = 4
+    current = FrameSnapshot.capture(world, previous)
+
+    message = encode_delta(previous, current)
+    kind, payload = payload_of(message)
+    mirror = decode_snapshot(payload_of(encode_snapshot(previous))[1])
+    apply_delta(mirror, payload)
+
+    assert kind == DELTA
+    assert b"terrain" not in payload
+    assert payload[payload.index(b"biomass") + 7] == SPARSE
+    assert len(message) < world.fields["biomass"].nbytes
+    assert mirror.tick == 4
+    for name, values in current.fields.items():
+        np.testing.assert_array_equal(mirror.fields[name], values)
+
+
+def test_delta_falls_back_to_dense_fields(world):
+    """Test that a field with most cells changed is sent as a whole array."""
+    previous = FrameSnapshot.capture(world)
+    mirror = decode_snapshot(payload_of(encode_snapshot(previous))[1])
+    version = mirror.versions["terrain"]
+    world.set_field("terrain", (world.fields["terrain"] + 1).astype(np.int8))
+    current = FrameSnapshot.capture(world, previous)
+
+    _, payload = payload_of(encode_delta(previous, current))
+    apply_delta(mirror, payload)
+
+    assert payload[payload.index(b"terrain") + 7] == DENSE
+    np.testing.assert_array_equal(mirror.fields["terrain"], current.fields["terrain"])
+    assert mirror.versions["terrain"] != version
+
+
+def test_delta_requires_the_same_fields(world):
+    """Test that states with different fields cannot be diffed."""
+    previous = FrameSnapshot.capture(world)
+    world.add_field("moisture", np.float32)
+
+    with pytest.raises(ValueError):
+        encode_delta(previous, FrameSnapshot.capture(world))
+
+
+def test_malformed_streams_are_rejected(world):
+    """Test that truncated messages and unknown fields raise ProtocolError."""
+    message = encode_snapshot(world)
+    with pytest.raises(ProtocolError):
+        read_message(io.BytesIO(message[:-1]))
+    with pytest.raises(ProtocolError):
+        read_message(io.BytesIO(message[:3]))
+    with pytest.raises(EOFError):
+        read_message(io.BytesIO(b""))
+    with pytest.raises(ProtocolError):
+        decode_snapshot(payload_of(message)[1][:-4])
+
+    other = World(grid=world.grid)
+    other.add_field("moisture", np.float32)
+    previous = FrameSnapshot.capture(other)
+    other.fields["moisture"][0] = 1
+    other.touch("moisture")
+    _, payload = payload_of(encode_delta(previous, FrameSnapshot.capture(other)))
+    with pytest.raises(ProtocolError):
+        apply_delta(world, payload)
+
+
+def test_handshake_is_checked():
+    """Test that only a matching greeting is accepted."""
+    read_handshake(io.BytesIO(HANDSHAKE))
+    with pytest.raises(ProtocolError):
+        read_handshake(io.BytesIO(b"HTTP/"))
+    with pytest.raises(ProtocolError):
+        read_handshake(io.BytesIO(HANDSHAKE[:-1] + b"\x09"))
+
+
+def test_parse_address():
+    """Test parsing of TCP addresses and Unix socket paths."""
+    assert parse_address("localhost:7878") == ("localhost", 7878)
+    assert parse_address(":0") == ("127.0.0.1", 0)
+    assert parse_address("unix:observer.sock") == "observer.sock"
+    assert parse_address("/tmp/observer.sock") == "/tmp/observer.sock"
+    with pytest.raises(ValueError):
+        parse_address("localhost")
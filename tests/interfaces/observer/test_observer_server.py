@@ -0,0 +1,147 @@
+"""Tests for the observer server and client."""
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pygame
+import pytest
+
+from src.application.services.simulation_engine import SimulationEngine
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.infrastructure.persistence.rule_loader import load_rule_set
+from src.interfaces.observer.client import ObserverClient
+from src.interfaces.observer.server import ObserverServer
+
+
+def assert_same_state(world, state):
+    """Assert that a mirrored world matches a state."""
+    assert world.tick == state.tick
+    for name, values in state.fields.items():
+        np.testing.assert_array_equal(world.fields[name], values)
+
+
+def test_observer_mirrors_an_engine_over_tcp():
+    """Test that a client follows every tick of an engine with the server."""
+    engine = SimulationEngine.from_rule_set(
+        load_rule_set(None), HexGrid(GridDimensions(9, 7)), seed=4
+    )
+    with ObserverServer(("127.0.0.1", 0)) as server:
+        server(engine.world)
+        engine.add_stage(server)
+        with ObserverClient(server.address, timeout=5) as client:
+            assert_same_state(client.receive(), engine.world)
+            for _ in range(3):
+                engine.step()
+                assert_same_state(client.receive(), engine.world)
+
+
+def test_observer_over_unix_socket_removes_socket_file(tmp_path):
+    """Test serving on a Unix socket, which is removed on close."""
+    path = str(tmp_path / "observer.sock")
+    world = World(grid=HexGrid(GridDimensions(4, 4)))
+    world.add_field("biomass", np.float32, fill=0.25)
+
+    with ObserverServer(path) as server:
+        server.publish(FrameSnapshot.capture(world))
+        with ObserverClient(path, timeout=5) as client:
+            assert_same_state(client.receive(), world)
+
+    assert not (tmp_path / "observer.sock").exists()
+
+
+def test_slow_observer_is_coalesced_to_the_latest_state():
+    """Test that ticks a client is too slow for are skipped, not queued."""
+    world = World(grid=HexGrid(GridDimensions(512, 512)))
+    world.add_field("biomass", np.float32)
+    snapshot = FrameSnapshot.capture(world)
+
+    with ObserverServer(("127.0.0.1", 0)) as server:
+        server.publish(snapshot)
+        with ObserverClient(server.address, timeout=5) as client:
+            client.receive()
+            # Every state rewrites the whole 1 MiB field, far more than the
+            # socket buffers hold while the client is not reading
+            for tick in range(1, 21):
+                world.fields["biomass"][:] = tick
+                world.touch("biomass")
+                world.tick = tick
+                snapshot = FrameSnapshot.capture(world, snapshot)
+                server.publish(snapshot)
+
+            messages = 0
+            while client.world.tick < 20:
+                client.receive()
+                messages += 1
+
+            assert messages < 20
+            assert_same_state(client.world, snapshot)
+
+
+def test_observers_connect_and_disconnect_independently():
+    """Test that late clients start from the latest state and close cleanly."""
+    world = World(grid=HexGrid(GridDimensions(5, 5)))
+    world.add_field("terrain", np.int8)
+    server = ObserverServer(("127.0.0.1", 0))
+    server(world)
+    first = ObserverClient(server.address, timeout=5)
+    first.receive()
+    first.close()
+
+    world.fields["terrain"][3] = 2
+    world.touch("terrain")
+    world.tick = 1
+    server(world)
+    with ObserverClient(server.address, timeout=5) as second:
+        assert_same_state(second.receive(), FrameSnapshot.capture(world))
+        assert server.observers >= 1
+
+    server.close()
+    assert server.observers == 0
+    assert not any(
+        thread.name.startswith("observer") for thread in threading.enumerate()
+    )
+
+
+def test_server_close_wakes_blocked_clients():
+    """Test that closing the server ends a client's stream."""
+    server = ObserverServer(("127.0.0.1", 0))
+    with ObserverClient(server.address, timeout=5) as client:
+        server.close()
+        with pytest.raises(EOFError):
+            client.receive()
+
+
+def test_viewer_renders_the_received_state():
+    """Test that the viewer draws each state received from the server."""
+    from src.interfaces.observer.viewer import ObserverViewer
+
+    world = World(grid=HexGrid(GridDimensions(6, 5)))
+    world.add_field("terrain", np.int8)
+    with ObserverServer(("127.0.0.1", 0)) as server:
+        server(world)
+        viewer = ObserverViewer(ObserverClient(server.address, timeout=5))
+        try:
+            assert viewer.update()
+            viewer.grid_display.render(viewer.snapshot)
+
+            world.tick = 1
+            server(world)
+            while viewer.snapshot.tick < 1:
+                viewer.update()
+            assert not viewer.update()
+
+            # Resizing reuses the window surface instead of setting the mode
+            screen = viewer.screen
+            with patch("pygame.display.set_mode") as set_mode:
+                viewer.handle_event(
+                    pygame.event.Event(pygame.VIDEORESIZE, w=640, h=480)
+                )
+            set_mode.assert_not_called()
+            assert viewer.screen is screen
+            assert viewer.grid_display.resize_pending
+        finally:
+            viewer.close()
+        assert not viewer.connected
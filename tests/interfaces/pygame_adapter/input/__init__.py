@@ -0,0 +1 @@
+"""Tests for the Pygame adapter input components."""
@@ -0,0 +1,190 @@
+"""Tests for the brush painting tools."""
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+from src.application.services.commands import CommandQueue
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_position import GridPosition
+from src.interfaces.pygame_adapter.input.brushes import (
+    Brush,
+    BrushTool,
+    hex_line,
+    hex_range_offsets,
+)
+from src.interfaces.pygame_adapter.rendering.coordinate_transformer import (
+    HexToPixelTransformer,
+)
+
+
+@pytest.fixture
+def grid():
+    """Create a test grid."""
+    return HexGrid(dimensions=GridDimensions(width=12, height=10))
+
+
+# Drawn hexes of size 10, whose neighbors' centers are 10 * sqrt(3) apart
+LAYOUT = HexToPixelTransformer(hex_size=10.0, origin_x=0.0, origin_y=0.0)
+SPACING = 10.0 * math.sqrt(3)
+
+
+def center(grid, cell):
+    """Get the drawn center of a cell."""
+    pixel = LAYOUT.hex_to_pixel(grid.position_of(int(cell)))
+    return np.array([pixel.x, pixel.y])
+
+
+def drawn_distance(grid, cell, other):
+    """Get the distance between drawn cell centers in hex widths."""
+    return np.hypot(*(center(grid, cell) - center(grid, other))) / SPACING
+
+
+def hex_distance(dq, dr):
+    """Compute the axial hex distance of offsets."""
+    return (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+
+
+@pytest.mark.parametrize("radius", [0, 1, 3])
+def test_hex_range_offsets(radius):
+    """Test that a range holds exactly the cells within its radius."""
+    dq, dr = hex_range_offsets(radius)
+    assert dq.size == 3 * radius * (radius + 1) + 1
+    assert hex_distance(dq, dr).max() == radius
+    assert len(set(zip(dq.tolist(), dr.tolist()))) == dq.size
+
+
+def test_hex_line_follows_the_drawn_segment(grid):
+    """Test that a line holds the hexes under the segment between centers."""
+    start, end = 2 + 1 * 12, 9 + 8 * 12
+    q, r = hex_line(grid, start, end)
+
+    assert (q[0], r[0]) == (2, 1)
+    assert (q[-1], r[-1]) == (9, 8)
+    steps = q.size - 1
+    for step, (cell_q, cell_r) in enumerate(zip(q, r)):
+        x, y = center(grid, start) + (center(grid, end) - center(grid, start)) * (
+            step / steps
+        )
+        assert LAYOUT.pixel_to_hex(x, y) == GridPosition(q=cell_q, r=cell_r)
+
+
+def test_horizontal_lines_are_unbroken(grid):
+    """Test that a drag along a row steps through touching hexes."""
+    q, r = hex_line(grid, 1 + 4 * 12, 8 + 4 * 12)
+    cells = r * 12 + q
+
+    assert cells[0] == 49 and cells[-1] == 56
+    assert set(r.tolist()) == {4, 5}
+    assert all(
+        np.isclose(drawn_distance(grid, cell, other), 1.0)
+        for cell, other in zip(cells[:-1], cells[1:])
+    )
+
+
+@pytest.mark.parametrize("cell", [0, 26, 57, 119])
+def test_click_footprint_is_the_touching_hexes(grid, cell):
+    """Test that a radius 1 click paints the cell and the hexes touching it."""
+    footprint = Brush(field="terrain", value=0, radius=1).footprint(grid, cell, cell)
+
+    touching = [
+        other
+        for other in range(grid.cell_count)
+        if drawn_distance(grid, cell, other) < 1.01
+    ]
+    assert footprint.tolist() == touching
+    assert LAYOUT.pixel_to_hex(*center(grid, cell)) == grid.position_of(cell)
+
+
+def test_footprint_widens_the_line_and_clips_to_the_grid(grid):
+    """Test that a stroke segment covers every cell near its line."""
+    brush = Brush(field="terrain", value=0, radius=1)
+    q, r = hex_line(grid, 14, 105)
+    line = r * 12 + q
+
+    cells = brush.footprint(grid, 14, 105)
+    near = [
+        other
+        for other in range(grid.cell_count)
+        if min(drawn_distance(grid, cell, other) for cell in line) < 1.01
+    ]
+    assert cells.tolist() == near
+    assert np.array_equal(brush.footprint(grid, 0, 0), [0, 12, 24])
+
+
+def test_footprint_wraps_around_toroidal_grids():
+    """Test that strokes on a wrapped grid continue across the edges."""
+    grid = HexGrid(dimensions=GridDimensions(width=12, height=10), wrap=True)
+    brush = Brush(field="terrain", value=0, radius=1)
+
+    expected = sorted([0] + grid.neighbor_table[:, 0].tolist())
+    assert brush.footprint(grid, 0, 0).tolist() == expected
+    # The short way from the last column to the first crosses the edge
+    cells = Brush("terrain", 0).footprint(grid, 11, 0)
+    assert cells.tolist() == [0, 11, 23]
+    assert 23 in grid.neighbor_table[:, 0] and 23 in grid.neighbor_table[:, 11]
+
+
+def test_brush_validation():
+    """Test that a brush needs a known shape and a non-negative radius."""
+    with pytest.raises(ValueError):
+        Brush(field="terrain", value=0, radius=-1)
+    with pytest.raises(ValueError):
+        Brush(field="terrain", value=0, shape="spray")
+
+
+def mouse(kind, cell, **attributes):
+    """Create a mouse event whose position is the cell id itself."""
+    return pygame.event.Event(kind, pos=(cell, 0), **attributes)
+
+
+def test_circle_strokes_submit_one_edit_per_segment(grid):
+    """Test that a freehand stroke paints every segment in one command."""
+    queue = CommandQueue()
+    tool = BrushTool(grid, queue, Brush("biomass", 0.5), locate=lambda pos: pos[0])
+
+    assert tool.handle_event(mouse(pygame.MOUSEBUTTONDOWN, 0, button=1))
+    assert tool.painting
+    tool.handle_event(mouse(pygame.MOUSEMOTION, 0, buttons=(1, 0, 0)))
+    tool.handle_event(mouse(pygame.MOUSEMOTION, 4, buttons=(1, 0, 0)))
+    assert tool.handle_event(mouse(pygame.MOUSEBUTTONUP, 4, button=1))
+    assert not tool.painting
+    assert not tool.handle_event(mouse(pygame.MOUSEMOTION, 8, buttons=(0, 0, 0)))
+
+    assert queue.pending == 2
+    world = World(grid=grid)
+    world.add_field("biomass", np.float64)
+    batch = queue.apply(world)
+    # Along the top row the line zigzags through the second row
+    assert np.array_equal(batch.cells, [0, 1, 2, 3, 4, 12, 13, 14, 15])
+    assert world.fields["biomass"][:6].tolist() == [0.5] * 5 + [0.0]
+
+
+def test_line_strokes_paint_on_release(grid):
+    """Test that a line stroke paints once, from press to release."""
+    queue = CommandQueue()
+    brush = Brush("biomass", 1.0, shape="line")
+    tool = BrushTool(grid, queue, brush, locate=lambda pos: pos[0])
+
+    tool.handle_event(mouse(pygame.MOUSEBUTTONDOWN, 24, button=1))
+    tool.handle_event(mouse(pygame.MOUSEMOTION, 26, buttons=(1, 0, 0)))
+    assert queue.pending == 0
+    tool.handle_event(mouse(pygame.MOUSEBUTTONUP, 29, button=1))
+
+    assert queue.pending == 1
+    world = World(grid=grid)
+    world.add_field("biomass", np.float64)
+    expected = [24, 25, 26, 27, 28, 29, 36, 37, 38, 39, 40]
+    assert np.array_equal(queue.apply(world).cells, expected)
+
+
+def test_clicks_off_the_grid_are_ignored(grid):
+    """Test that the tool ignores presses outside the grid."""
+    queue = CommandQueue()
+    tool = BrushTool(grid, queue, Brush("biomass", 1.0), locate=lambda pos: None)
+
+    assert not tool.handle_event(mouse(pygame.MOUSEBUTTONDOWN, 0, button=1))
+    assert queue.pending == 0
@@ -0,0 +1,80 @@
+"""Tests for the cached layer of filled cells."""
+from unittest.mock import patch
+
+import numpy as np
+import pygame
+import pytest
+
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.interfaces.pygame_adapter.rendering.cell_layer import CellLayer
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellRenderer
+from src.interfaces.pygame_adapter.rendering.coordinate_transformer import (
+    HexToPixelTransformer,
+)
+from src.interfaces.pygame_adapter.rendering.hex_sprite_atlas import HexSpriteAtlas
+
+COLORS = [(200, 40, 40), (40, 200, 40), (40, 40, 200)]
+
+
+@pytest.fixture
+def grid():
+    """Create a test grid."""
+    return HexGrid(dimensions=GridDimensions(width=8, height=12))
+
+
+def create_layer(grid):
+    """Create a layer drawing cells with three colors."""
+    transformer = HexToPixelTransformer(hex_size=6.0, origin_x=10.0, origin_y=10.0)
+    renderer = CellRenderer(grid, transformer, HexSpriteAtlas(COLORS, 6.0))
+    return CellLayer(renderer, background_color=(0, 0, 0))
+
+
+def test_changed_cells_redraw_like_a_full_render(grid):
+    """Test that a partial redraw is pixel-identical to a full one."""
+    states = np.random.default_rng(3).integers(0, 3, grid.cell_count)
+    layer = create_layer(grid)
+    surface = pygame.Surface((180, 80))
+    layer.render(surface, states)
+    assert layer.last_redraw == surface.get_rect()
+
+    painted = states.copy()
+    painted[[41, 42, 49]] = (painted[[41, 42, 49]] + 1) % 3
+    with patch.object(
+        layer.cell_renderer, "render", wraps=layer.cell_renderer.render
+    ) as render:
+        layer.render(surface, painted)
+    (_, _, cells), _ = render.call_args
+    assert cells.size < grid.cell_count // 4
+    assert layer.last_redraw.width < surface.get_width() // 2
+
+    expected = pygame.Surface((180, 80))
+    create_layer(grid).render(expected, painted)
+    assert pygame.image.tobytes(surface, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_unchanged_states_only_blit_the_layer(grid):
+    """Test that a frame without changes redraws no cell."""
+    states = np.zeros(grid.cell_count, dtype=np.intp)
+    layer = create_layer(grid)
+    surface = pygame.Surface((180, 80))
+    layer.render(surface, states)
+
+    with patch.object(layer.cell_renderer, "render") as render:
+        layer.render(surface, states)
+    render.assert_not_called()
+    assert layer.last_redraw is None
+    assert layer.memory_usage()["cell layer"] > 0
+
+
+def test_layout_change_redraws_everything(grid):
+    """Test that a new layout or surface size rebuilds the layer."""
+    states = np.zeros(grid.cell_count, dtype=np.intp)
+    layer = create_layer(grid)
+    layer.render(pygame.Surface((180, 80)), states)
+
+    layer.cell_renderer.transformer.origin_x = 20.0
+    surface = pygame.Surface((200, 90))
+    layer.render(surface, states)
+
+    assert layer.last_redraw == surface.get_rect()
@@ -0,0 +1,99 @@
+"""Tests for filled cell rendering."""
+from unittest.mock import Mock
+
+import numpy as np
+import pygame
+import pytest
+
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.interfaces.pygame_adapter.rendering.cell_renderer import (
+    CellPalette,
+    CellRenderer,
+)
+from src.interfaces.pygame_adapter.rendering.coordinate_transformer import (
+    HexToPixelTransformer,
+)
+from src.interfaces.pygame_adapter.rendering.hex_sprite_atlas import HexSpriteAtlas
+
+RED, GREEN, BLUE = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+
+
+@pytest.fixture
+def grid():
+    """Create a test grid."""
+    return HexGrid(dimensions=GridDimensions(width=3, height=2))
+
+
+@pytest.fixture
+def transformer():
+    """Create a coordinate transformer for testing."""
+    return HexToPixelTransformer(hex_size=10.0, origin_x=20.0, origin_y=20.0)
+
+
+def test_palette_states_from_terrain_and_biomass(grid):
+    """Test that plant cover overrides the terrain color."""
+    palette = CellPalette(
+        terrain_colors=(RED, BLUE), plant_colors=(GREEN, GREEN), plant_threshold=0.5
+    )
+    world = World(grid=grid)
+    world.set_field("terrain", np.array([0, 1, 1, 5, 0, 1], dtype=np.int8))
+    world.set_field("biomass", np.array([0.0, 0.4, 0.5, 0.0, 0.8, 1.0]))
+
+    assert palette.colors == (RED, BLUE, GREEN, GREEN)
+    assert list(palette.states(world)) == [0, 1, 2, 1, 3, 3]
+
+
+def test_palette_validation():
+    """Test that a palette needs terrain colors and a valid threshold."""
+    with pytest.raises(ValueError):
+        CellPalette(terrain_colors=())
+    with pytest.raises(ValueError):
+        CellPalette(terrain_colors=(RED,), plant_threshold=1.0)
+
+
+def test_cells_are_drawn_in_one_blits_call(grid, transformer):
+    """Test that every cell is blitted with its state's sprite at once."""
+    atlas = HexSpriteAtlas([RED, BLUE], hex_size=10.0)
+    renderer = CellRenderer(grid, transformer, atlas)
+    surface = Mock(spec=pygame.Surface)
+
+    renderer.render(surface, np.array([0, 1, 0, 1, 0, 1]))
+
+    surface.blits.assert_called_once()
+    (sequence,), kwargs = surface.blits.call_args
+    assert kwargs == {"doreturn": False}
+    assert [sprite for sprite, _ in sequence] == [
+        atlas.sprites[0],
+        atlas.sprites[1],
+    ] * 3
+    assert sequence[0][1] == (10, 11)
+
+
+def test_cells_land_on_their_hexagons(grid, transformer):
+    """Test that a blitted cell covers its hexagon's center pixel."""
+    renderer = CellRenderer(grid, transformer, HexSpriteAtlas([RED], 10.0))
+    surface = pygame.Surface((120, 80))
+    state = FrameSnapshot.capture(World(grid=grid))
+
+    renderer.render(surface, CellPalette((RED,)).states(state))
+
+    for cell_id in range(grid.cell_count):
+        center = transformer.hex_to_pixel(grid.position_of(cell_id))
+        assert surface.get_at((int(center.x), int(center.y)))[:3] == RED
+
+
+def test_atlas_follows_transformer_size(grid, transformer):
+    """Test that a zoomed transformer re-renders the atlas once."""
+    atlas = HexSpriteAtlas([RED], hex_size=10.0)
+    renderer = CellRenderer(grid, transformer, atlas)
+    first = renderer.destinations()
+
+    transformer.hex_size = 20.0
+    second = renderer.destinations()
+
+    assert atlas.hex_size == 20.0
+    assert second != first
+    assert renderer.destinations() is second
@@ -4,6 +4,8 @@ import math
 
 import pytest
 
+from src.domain.entities.grid import HexGrid
+from src.domain.value_objects.grid_dimensions import GridDimensions
 from src.domain.value_objects.grid_position import GridPosition
 from src.interfaces.pygame_adapter.rendering.coordinate_transformer import (
     HexToPixelTransformer,
@@ -91,3 +93,46 @@ def test_get_hex_vertices():
     # Verify vertices are in counter-clockwise order starting from rightmost point
     assert vertices[0][0] > vertices[2][0]  # Right x > Left x
     assert vertices[1][1] > vertices[4][1]  # Bottom y > Top y
+
+
+def test_pixel_to_hex_finds_the_hexagon_under_a_pixel():
+    """Test that pixels near a center map back to its hexagon."""
+    transformer = HexToPixelTransformer(hex_size=10.0, origin_x=15.0, origin_y=25.0)
+    for q in range(-1, 4):
+        for r in range(-1, 5):
+            center = transformer.hex_to_pixel(GridPosition(q=q, r=r))
+            for dx, dy in [(0, 0), (8, 0), (-8, 0), (4, 7), (-4, -7)]:
+                position = transformer.pixel_to_hex(center.x + dx, center.y + dy)
+                assert position == GridPosition(q=q, r=r)
+
+
+@pytest.mark.parametrize("width, height", [(6, 7), (5, 8)])
+def test_neighbor_table_matches_drawn_adjacency(width, height):
+    """Test that table neighbors are exactly the hexes touching on screen."""
+    grid = HexGrid(dimensions=GridDimensions(width=width, height=height))
+    transformer = HexToPixelTransformer(hex_size=10.0, origin_x=0.0, origin_y=0.0)
+    centers = [
+        transformer.hex_to_pixel(grid.position_of(cell_id))
+        for cell_id in range(grid.cell_count)
+    ]
+    # Flat-topped hexes sharing an edge have centers sqrt(3) sizes apart
+    spacing = 10.0 * math.sqrt(3)
+
+    for cell_id, center in enumerate(centers):
+        touching = {
+            other
+            for other, other_center in enumerate(centers)
+            if math.isclose(
+                math.hypot(other_center.x - center.x, other_center.y - center.y),
+                spacing,
+            )
+        }
+        neighbors = grid.neighbor_table[:, cell_id]
+        assert set(neighbors[neighbors >= 0].tolist()) == touching
+        # Directions run clockwise from north
+        for direction, neighbor in enumerate(neighbors):
+            if neighbor >= 0:
+                angle = math.atan2(
+                    centers[neighbor].x - center.x, center.y - centers[neighbor].y
+                )
+                assert math.isclose(angle % (2 * math.pi), direction * math.pi / 3)
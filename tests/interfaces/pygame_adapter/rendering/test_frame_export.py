@@ -0,0 +1,87 @@
+"""Tests for the background frame export pipeline."""
+import io
+import threading
+
+import pygame
+import pytest
+
+from src.interfaces.pygame_adapter.rendering.frame_export import (
+    FrameExporter,
+    PngFrameSink,
+    RawFrameSink,
+)
+
+
+def solid_surface(color):
+    """Create a small surface filled with one color."""
+    surface = pygame.Surface((4, 3))
+    surface.fill(color)
+    return surface
+
+
+def test_raw_frames_stream_in_order():
+    """Test that raw frames are written as packed RGB in submission order."""
+    stream = io.BytesIO()
+    exporter = FrameExporter(RawFrameSink(stream))
+    exporter.submit(solid_surface((255, 0, 0)))
+    exporter.submit(solid_surface((0, 0, 255)))
+    exporter.close()
+
+    assert exporter.frames_written == 2
+    assert stream.getvalue() == bytes([255, 0, 0] * 12 + [0, 0, 255] * 12)
+
+
+def test_png_frames_are_numbered(tmp_path):
+    """Test that PNG frames are written to numbered files."""
+    exporter = FrameExporter(PngFrameSink(tmp_path))
+    for color in ((255, 0, 0), (0, 255, 0)):
+        exporter.submit(solid_surface(color))
+    exporter.close()
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == ["frame_000000.png", "frame_000001.png"]
+    image = pygame.image.load(str(tmp_path / "frame_000001.png"))
+    assert image.get_at((0, 0))[:3] == (0, 255, 0)
+
+
+def test_submit_blocks_when_the_queue_is_full():
+    """Test that a slow sink applies back-pressure instead of buffering."""
+    release = threading.Event()
+
+    class SlowSink:
+        def write(self, index, size, pixels):
+            release.wait()
+
+        def close(self):
+            pass
+
+    exporter = FrameExporter(SlowSink(), max_pending=1)
+    exporter.submit(solid_surface((0, 0, 0)))  # Taken by the writer
+    exporter.submit(solid_surface((0, 0, 0)))  # Fills the queue
+    blocked = threading.Thread(target=exporter.submit, args=(solid_surface((0, 0, 0)),))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join()
+    exporter.close()
+    assert exporter.frames_written == 3
+
+
+def test_sink_errors_are_surfaced():
+    """Test that a failing sink stops later submissions."""
+
+    class FailingSink:
+        def write(self, index, size, pixels):
+            raise OSError("disk full")
+
+        def close(self):
+            pass
+
+    exporter = FrameExporter(FailingSink())
+    exporter.submit(solid_surface((0, 0, 0)))
+    with pytest.raises(RuntimeError):
+        exporter.close()
+    with pytest.raises(RuntimeError):
+        exporter.submit(solid_surface((0, 0, 0)))
@@ -2,11 +2,15 @@
 import math
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pygame
 import pytest
 
+from src.application.services.snapshots import FrameSnapshot
 from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
 from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellPalette
 from src.interfaces.pygame_adapter.rendering.grid_display import (
     DisplayConfig,
     GridDisplay,
@@ -110,8 +114,15 @@ def test_window_resize_handling(grid, display_config, mock_surface):
     new_surface.get_width.return_value = 1024
     new_surface.get_height.return_value = 768
 
-    with patch("pygame.display.set_mode", return_value=new_surface):
-        display.handle_resize((1024, 768))
+    with patch("pygame.display.set_mode") as mock_set_mode:
+        display.handle_resize((1024, 768), new_surface)
+        mock_set_mode.assert_not_called()
+
+        # The layout only changes once the size has settled
+        assert display.resize_pending
+        assert not display.update_layout(now=0.0)
+        assert display.update_layout(now=float("inf"))
+        assert not display.resize_pending
 
         # For a 1024x768 window, 3x3 grid, and 20px padding:
         # Grid size is still ~250x303 pixels
@@ -135,3 +146,219 @@ def test_render_calls(grid, display_config, mock_surface):
     # Verify the surface is cleared and grid is rendered
     mock_surface.fill.assert_called_once_with(display_config.background_color)
     display.renderer.render.assert_called_once_with(mock_surface)
+
+
+def test_render_fills_cells_with_palette(grid, mock_surface):
+    """Test that a configured palette draws the cells of a state."""
+    config = DisplayConfig(hex_size=20.0, palette=CellPalette(((0, 0, 255),)))
+    display = GridDisplay(grid=grid, config=config, surface=mock_surface)
+    state = FrameSnapshot.capture(World(grid=grid))
+
+    display.render(state)
+    (sequence,), _ = mock_surface.blits.call_args
+    assert len(sequence) == grid.cell_count
+
+    # Without a state only the grid lines are drawn
+    mock_surface.blits.reset_mock()
+    display.render()
+    mock_surface.blits.assert_not_called()
+
+
+def test_resize_keeps_sprite_atlas(grid, mock_surface):
+    """Test that resizing the window does not re-render cell sprites."""
+    config = DisplayConfig(hex_size=20.0, palette=CellPalette(((0, 0, 255),)))
+    display = GridDisplay(grid=grid, config=config, surface=mock_surface)
+    atlas = display.cell_renderer.atlas
+    sprites = list(atlas.sprites)
+
+    display.handle_resize((1024, 768), mock_surface)
+    mock_surface.get_width.return_value = 1024
+    display.update_layout(now=float("inf"))
+
+    assert display.cell_renderer.atlas is atlas
+    assert display.cell_renderer.transformer is display.transformer
+    assert atlas.sprites == sprites
+
+
+def test_resize_events_are_debounced(grid, display_config, mock_surface):
+    """Test that only the last of a burst of resizes is laid out."""
+    display = GridDisplay(grid=grid, config=display_config, surface=mock_surface)
+    original = display.transformer
+
+    with patch("time.monotonic", return_value=10.0):
+        display.handle_resize((900, 600), mock_surface)
+    with patch("time.monotonic", return_value=10.05):
+        display.handle_resize((1000, 600), mock_surface)
+    mock_surface.get_width.return_value = 1000
+
+    assert not display.update_layout(now=10.1)
+    assert display.transformer is original
+    assert display.update_layout(now=10.2)
+    assert display.renderer.transformer is display.transformer
+    assert display.transformer.origin_x > original.origin_x
+
+
+def test_layouts_are_cached_by_window_size(grid, display_config, mock_surface):
+    """Test that returning to a known window size reuses its layout."""
+    display = GridDisplay(grid=grid, config=display_config, surface=mock_surface)
+    original = display.transformer
+
+    mock_surface.get_width.return_value = 1000
+    display.handle_resize((1000, 600), mock_surface)
+    display.update_layout(now=float("inf"))
+    mock_surface.get_width.return_value = 800
+    display.handle_resize((800, 600), mock_surface)
+    display.update_layout(now=float("inf"))
+
+    assert display.transformer is original
+
+
+def test_auto_fit_fills_the_window(grid, mock_surface):
+    """Test that auto-fit picks the largest hex size that fits."""
+    config = DisplayConfig(hex_size=10.0, padding=20, auto_fit=True)
+    display = GridDisplay(grid=grid, config=config, surface=mock_surface)
+
+    width, height = display._calculate_grid_pixel_size(display.transformer.hex_size)
+    assert width <= 800 - 40 and height <= 600 - 40
+    assert math.isclose(width, 760) or math.isclose(height, 560)
+
+    tiny = Mock(spec=pygame.Surface)
+    tiny.get_width.return_value = 30
+    tiny.get_height.return_value = 30
+    display.handle_resize((30, 30), tiny)
+    display.update_layout(now=float("inf"))
+    assert display.transformer.hex_size == config.min_hex_size
+
+
+def test_memory_usage_lists_frame_and_render_caches(grid):
+    """Test that the frame, sprites, outline and layout cache are accounted."""
+    surface = pygame.Surface((320, 240))
+    config = DisplayConfig(hex_size=20.0, palette=CellPalette(((0, 0, 255),)))
+    display = GridDisplay(grid=grid, config=config, surface=surface)
+    display.render(FrameSnapshot.capture(World(grid=grid)))
+
+    usage = display.memory_usage()
+
+    assert usage["frame"] == surface.get_pitch() * 240
+    assert usage["sprites"] > 0
+    assert usage["outline"] > 0
+    assert usage["destinations"] > 0
+
+
+def test_cell_at_locates_cells_under_pixels(grid, display_config, mock_surface):
+    """Test that pixels map to the cell drawn there, or None off the grid."""
+    display = GridDisplay(grid=grid, config=display_config, surface=mock_surface)
+    center = display.transformer.hex_to_pixel(grid.position_of(7))
+
+    assert display.cell_at((center.x + 5, center.y - 5)) == 7
+    assert display.cell_at((0, 0)) is None
+
+
+def test_cell_layer_redraws_changed_cells_only(grid):
+    """Test that an enabled cell layer keeps unchanged frames cheap."""
+    surface = pygame.Surface((320, 240))
+    config = DisplayConfig(
+        hex_size=20.0, palette=CellPalette(((0, 0, 255), (255, 0, 0))), cell_layer=True
+    )
+    display = GridDisplay(grid=grid, config=config, surface=surface)
+    world = World(grid=grid)
+    world.add_field("terrain", "int8")
+    display.render(FrameSnapshot.capture(world))
+
+    world.fields["terrain"][4] = 1
+    world.touch("terrain")
+    display.render(FrameSnapshot.capture(world))
+
+    center = display.transformer.hex_to_pixel(grid.position_of(4))
+    assert surface.get_at((int(center.x), int(center.y)))[:3] == (255, 0, 0)
+    assert display.cell_layer.last_redraw.width < surface.get_width()
+    assert display.memory_usage()["cell layer"] > 0
+
+
+def test_minimap_overlays_the_visible_area(grid):
+    """Test that an enabled minimap is drawn in the bottom-right corner."""
+    surface = pygame.Surface((320, 240))
+    config = DisplayConfig(
+        hex_size=20.0, palette=CellPalette(((0, 0, 255),)), minimap=True
+    )
+    display = GridDisplay(grid=grid, config=config, surface=surface)
+
+    display.render(FrameSnapshot.capture(World(grid=grid)))
+
+    left, top, width, height = display.viewport()
+    assert left < 0 and top < 0
+    assert left + width > 1 and top + height > 1
+    corner = (320 - config.padding - 1, 240 - config.padding - 1)
+    assert surface.get_at(corner)[:3] == config.minimap_viewport_color
+    assert display.memory_usage()["minimap"] > 0
+
+
+def test_toroidal_grids_are_tiled_and_panned():
+    """Test that every copy of a wrapped cell is drawn and located alike."""
+    grid = HexGrid(dimensions=GridDimensions(width=5, height=5), wrap=True)
+    surface = pygame.Surface((320, 240))
+    red, blue = (255, 0, 0), (0, 0, 255)
+    config = DisplayConfig(hex_size=10.0, palette=CellPalette((blue, red)))
+    display = GridDisplay(grid=grid, config=config, surface=surface)
+    world = World(grid=grid)
+    world.add_field("terrain", "int8")
+    world.fields["terrain"][[1, 7]] = 1
+    # The odd height shifts the copies below by half a column
+    copies = [(0, 0), (150, 0), (-150, 0), (15, 5 * 10 * math.sqrt(3) / 2)]
+
+    for pan_x, pan_y in [(0, 0), (37, -12)]:
+        assert display.pan(pan_x, pan_y)
+        display.render(FrameSnapshot.capture(world))
+        for cell_id in range(grid.cell_count):
+            center = display.transformer.hex_to_pixel(grid.position_of(cell_id))
+            for dx, dy in copies:
+                pixel = (round(center.x + pan_x + dx), round(center.y + pan_y + dy))
+                if 0 <= pixel[0] < 320 and 0 <= pixel[1] < 240:
+                    assert display.cell_at(pixel) == cell_id
+                    color = red if cell_id in (1, 7) else blue
+                    assert surface.get_at(pixel)[:3] == color
+        # The copies interlock without gaps
+        assert all(
+            surface.get_at((x, y))[:3] != config.background_color
+            for x in range(0, 320, 3)
+            for y in range(0, 240, 3)
+        )
+    assert display.memory_usage()["grid tile"] > 0
+    bounded = HexGrid(dimensions=GridDimensions(width=5, height=5))
+    assert not GridDisplay(grid=bounded, config=config, surface=surface).pan(1, 1)
+
+
+@pytest.mark.parametrize("height", [5, 6])
+def test_toroidal_neighbors_touch_across_the_edges(height):
+    """Test that every table neighbor is drawn next to its cell, seams included."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=height), wrap=True)
+    surface = pygame.Surface((320, 240))
+    # A color of its own for every cell
+    colors = tuple((40 + 8 * cell_id, 255 - 8 * cell_id, 90) for cell_id in range(24))
+    config = DisplayConfig(hex_size=10.0, line_width=0, palette=CellPalette(colors))
+    display = GridDisplay(grid=grid, config=config, surface=surface)
+    world = World(grid=grid)
+    world.set_field("terrain", np.arange(grid.cell_count, dtype=np.int8))
+    display.pan(23, 11)
+    display.render(FrameSnapshot.capture(world))
+    spacing = 10.0 * math.sqrt(3)
+
+    checked = 0
+    for cell_id in range(grid.cell_count):
+        center = display.transformer.hex_to_pixel(grid.position_of(cell_id))
+        for copy_x in (-120, 0, 120):
+            x, y = center.x + 23 + copy_x, center.y + 11
+            if not (spacing < x < 320 - spacing and spacing < y < 240 - spacing):
+                continue
+            for direction in range(6):
+                # One hex width away, clockwise from north
+                angle = direction * math.pi / 3
+                pixel = (
+                    round(x + spacing * math.sin(angle)),
+                    round(y - spacing * math.cos(angle)),
+                )
+                neighbor = grid.neighbor_table[direction, cell_id]
+                assert surface.get_at(pixel)[:3] == colors[neighbor]
+                assert display.cell_at(pixel) == neighbor
+                checked += 1
+    assert checked >= 6 * grid.cell_count
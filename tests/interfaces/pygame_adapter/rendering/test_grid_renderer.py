@@ -6,6 +6,7 @@ import pytest
 
 from src.domain.entities.grid import HexGrid
 from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.domain.value_objects.grid_position import GridPosition
 from src.interfaces.pygame_adapter.rendering.coordinate_transformer import (
     HexToPixelTransformer,
     PixelPosition,
@@ -102,3 +103,109 @@ def test_grid_renderer_correct_vertex_calculation(grid, transformer, mock_surfac
                 for call in mock_draw.call_args_list:
                     args, kwargs = call
                     assert args[2] == expected_vertices
+
+
+def unique_edges(grid, transformer):
+    """Collect the set of distinct hexagon edges by brute force."""
+    edges = set()
+    for q in range(grid.dimensions.width):
+        for r in range(grid.dimensions.height):
+            center = transformer.hex_to_pixel(GridPosition(q=q, r=r))
+            vertices = [
+                (round(x, 6), round(y, 6))
+                for x, y in transformer.get_hex_vertices(center)
+            ]
+            for start, end in zip(vertices, vertices[1:] + vertices[:1]):
+                edges.add(frozenset((start, end)))
+    return edges
+
+
+def test_outline_paths_cover_every_edge_once(transformer):
+    """Test that outline polylines draw each shared edge exactly once."""
+    grid = HexGrid(dimensions=GridDimensions(width=4, height=5))
+    renderer = GridRenderer(grid=grid, transformer=transformer, outline=True)
+
+    segments = [
+        frozenset(pair)
+        for path in renderer.outline_paths()
+        for pair in zip(path, path[1:])
+    ]
+    assert len(segments) == len(set(segments))
+    assert set(segments) == unique_edges(grid, transformer)
+    assert len(segments) < 6 * grid.cell_count
+
+
+def test_outline_is_cached_across_pans(grid, transformer):
+    """Test that the outline is drawn once, kept when panning, and redrawn
+    only for a new hex size."""
+    renderer = GridRenderer(grid=grid, transformer=transformer, outline=True)
+    surface = pygame.Surface((400, 400))
+
+    with patch("pygame.draw.lines", wraps=pygame.draw.lines) as mock_lines, patch(
+        "pygame.draw.polygon"
+    ) as mock_polygon:
+        renderer.render(surface)
+        calls = mock_lines.call_count
+        assert calls > 0
+        renderer.render(surface)
+        transformer.origin_x += 10
+        transformer.origin_y -= 7
+        renderer.render(surface)
+        assert mock_lines.call_count == calls
+
+        renderer.transformer = HexToPixelTransformer(
+            hex_size=40.0, origin_x=100.0, origin_y=100.0
+        )
+        renderer.render(surface)
+        assert mock_lines.call_count > calls
+        mock_polygon.assert_not_called()
+
+
+def test_outline_cache_covers_only_the_visible_area():
+    """Test that a huge grid caches outline tiles for the surface only."""
+    grid = HexGrid(dimensions=GridDimensions(width=200, height=200))
+    transformer = HexToPixelTransformer(hex_size=30.0, origin_x=0.0, origin_y=0.0)
+    renderer = GridRenderer(grid=grid, transformer=transformer, outline=True)
+    surface = pygame.Surface((640, 480))
+
+    renderer.render(surface)
+    # Four padded tiles of at most 600x600 RGBA pixels
+    assert renderer.memory_usage()["outline"] <= 4 * 600 * 600 * 4
+
+    for step in range(40):
+        transformer.origin_x -= 500
+        renderer.render(surface)
+    assert renderer.memory_usage()["outline"] <= 20 * 600 * 600 * 4
+
+
+def test_outline_matches_polygon_rendering(grid, transformer):
+    """Test that the cached outline produces the same pixels as polygons."""
+    polygons = pygame.Surface((400, 400))
+    GridRenderer(grid=grid, transformer=transformer).render(polygons)
+    outline = pygame.Surface((400, 400))
+    GridRenderer(grid=grid, transformer=transformer, outline=True).render(outline)
+
+    assert pygame.image.tostring(polygons, "RGB") == pygame.image.tostring(
+        outline, "RGB"
+    )
+
+
+def test_outline_matches_polygon_rendering_across_tiles():
+    """Test that lines crossing outline tile edges land on the same pixels."""
+    grid = HexGrid(dimensions=GridDimensions(width=30, height=60))
+    for line_width in (1, 2):
+        transformer = HexToPixelTransformer(
+            hex_size=20.0, origin_x=-300.0, origin_y=40.0
+        )
+        # The bottom row is left out: polygons are clipped there
+        polygons = pygame.Surface((1500, 700))
+        GridRenderer(grid, transformer, line_width=line_width).render(polygons)
+        outline = pygame.Surface((1500, 700))
+        GridRenderer(grid, transformer, line_width=line_width, outline=True).render(
+            outline
+        )
+
+        assert (
+            pygame.surfarray.array3d(polygons)[:, :-1].tolist()
+            == pygame.surfarray.array3d(outline)[:, :-1].tolist()
+        )
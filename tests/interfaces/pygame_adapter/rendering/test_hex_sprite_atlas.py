@@ -0,0 +1,36 @@
+"""Tests for the hexagon sprite atlas."""
+import pygame
+import pytest
+
+from src.interfaces.pygame_adapter.rendering.hex_sprite_atlas import HexSpriteAtlas
+
+
+def test_atlas_renders_one_sprite_per_color():
+    """Test that each color gets a filled hexagon with a transparent frame."""
+    atlas = HexSpriteAtlas([(255, 0, 0), (0, 0, 255)], hex_size=10.0)
+
+    assert len(atlas.sprites) == 2
+    red = atlas.sprites[0]
+    assert red.get_flags() & pygame.SRCALPHA
+    assert red.get_at((10, 9)) == pygame.Color(255, 0, 0, 255)
+    # Corners of the bounding box lie outside the hexagon
+    assert red.get_at((0, 0)).a == 0
+    assert atlas.anchor == pytest.approx((10.0, 8.66), abs=0.01)
+
+
+def test_atlas_rebuilds_only_when_size_changes():
+    """Test that resizing to the same size keeps the sprites."""
+    atlas = HexSpriteAtlas([(255, 0, 0)], hex_size=10.0)
+    sprite = atlas.sprites[0]
+
+    atlas.resize(10.0)
+    assert atlas.sprites[0] is sprite
+    atlas.resize(20.0)
+    assert atlas.sprites[0] is not sprite
+    assert atlas.sprites[0].get_width() > sprite.get_width()
+
+
+def test_atlas_needs_colors():
+    """Test that an atlas cannot be empty."""
+    with pytest.raises(ValueError):
+        HexSpriteAtlas([], hex_size=10.0)
@@ -0,0 +1,99 @@
+"""Tests for the incrementally updated minimap."""
+import numpy as np
+import pygame
+import pytest
+
+from src.application.services.snapshots import FrameSnapshot
+from src.domain.entities.grid import HexGrid
+from src.domain.entities.world import World
+from src.domain.value_objects.grid_dimensions import GridDimensions
+from src.interfaces.pygame_adapter.rendering.cell_renderer import CellPalette
+from src.interfaces.pygame_adapter.rendering.minimap import Minimap
+
+PALETTE = CellPalette(
+    terrain_colors=((0, 0, 200), (200, 200, 0), (120, 120, 120)),
+    plant_colors=((0, 150, 0), (0, 90, 0)),
+    plant_threshold=0.5,
+)
+
+
+@pytest.fixture
+def world():
+    """Create a world with random terrain and biomass."""
+    rng = np.random.default_rng(5)
+    world = World(grid=HexGrid(dimensions=GridDimensions(width=10, height=7)))
+    world.set_field("terrain", rng.integers(0, 3, 70).astype(np.int8))
+    world.set_field("biomass", rng.random(70) * 0.6)
+    return world
+
+
+def block_colors(world, block):
+    """Compute the color of every block cell by cell."""
+    width, height = world.grid.dimensions.width, world.grid.dimensions.height
+    colors = {}
+    for block_r in range(-(-height // block)):
+        for block_q in range(-(-width // block)):
+            cells = [
+                r * width + q
+                for r in range(block_r * block, min((block_r + 1) * block, height))
+                for q in range(block_q * block, min((block_q + 1) * block, width))
+            ]
+            terrain = np.bincount(world.fields["terrain"][cells], minlength=3)
+            mean = world.fields["biomass"][cells].mean()
+            state = PALETTE.classify(
+                terrain.argmax(keepdims=True), np.array([mean]), 1
+            )[0]
+            colors[block_q, block_r] = PALETTE.colors[state]
+    return colors
+
+
+def pixels_of(minimap):
+    """Read the color of every block from the minimap."""
+    surface = pygame.Surface(minimap.size)
+    minimap.render(surface, (0, 0))
+    return {
+        (q, r): tuple(surface.get_at((q, r)))[:3]
+        for q in range(minimap.blocks_wide)
+        for r in range(minimap.blocks_high)
+    }
+
+
+def test_blocks_show_dominant_terrain_and_mean_biomass(world):
+    """Test block colors against a cell-by-cell aggregate."""
+    minimap = Minimap(world.grid, PALETTE, block=3, size=(4, 3))
+    minimap.update(FrameSnapshot.capture(world))
+
+    assert (minimap.blocks_wide, minimap.blocks_high) == (4, 3)
+    assert minimap.blocks_updated == 12
+    assert pixels_of(minimap) == block_colors(world, 3)
+
+
+def test_only_blocks_with_changed_cells_are_recomputed(world):
+    """Test that an edit recomputes the blocks containing its cells."""
+    minimap = Minimap(world.grid, PALETTE, block=3, size=(4, 3))
+    snapshot = FrameSnapshot.capture(world)
+    minimap.update(snapshot)
+
+    minimap.update(FrameSnapshot.capture(world, snapshot))
+    assert minimap.blocks_updated == 0
+
+    world.fields["biomass"][[0, 1, 10, 69]] = 1.0
+    world.touch("biomass")
+    minimap.update(FrameSnapshot.capture(world, snapshot))
+
+    assert minimap.blocks_updated == 2
+    assert pixels_of(minimap) == block_colors(world, 3)
+
+
+def test_viewport_is_outlined(world):
+    """Test that the visible area is outlined on top of the blocks."""
+    minimap = Minimap(world.grid, PALETTE, block=1, size=(40, 28))
+    minimap.update(world)
+    surface = pygame.Surface((60, 40))
+
+    minimap.render(surface, (10, 5), viewport=(0.25, 0.5, 0.5, 0.25))
+
+    assert tuple(surface.get_at((20, 19)))[:3] == (255, 255, 255)
+    assert tuple(surface.get_at((39, 25)))[:3] == (255, 255, 255)
+    assert tuple(surface.get_at((25, 22)))[:3] != (255, 255, 255)
+    assert minimap.memory_usage()["minimap"] > 0
@@ -16,6 +16,7 @@ def test_display_config_initialization() -> None:
     assert config.WINDOW_TITLE == "HexLife: Hexagonal Life Simulation"
     assert isinstance(config.FPS, int)
     assert config.FPS > 0
+    assert config.IDLE_WAIT_MS > 0
 
 
 def test_display_config_immutability() -> None:
@@ -45,6 +46,8 @@ def test_colors_initialization() -> None:
     assert is_valid_rgb(colors.GRID_LINES)
     assert colors.BACKGROUND == (0, 0, 0)
     assert colors.GRID_LINES == (100, 100, 100)
+    assert all(is_valid_rgb(color) for color in colors.TERRAIN + colors.PLANTS)
+    assert 0 <= colors.PLANT_THRESHOLD < 1
 
 
 def test_colors_immutability() -> None:
@@ -63,6 +66,9 @@ def test_simulation_config_initialization() -> None:
     config = SimulationConfig()
     assert isinstance(config.SIMULATION_SPEED, float)
     assert config.SIMULATION_SPEED > 0
+    assert config.TICKS_PER_SECOND > 0
+    assert isinstance(config.SEED, int)
+    assert config.RULES_PATH is None
 
 
 def test_simulation_config_immutability() -> None:
@@ -1,9 +1,15 @@
 """Unit tests for the game loop implementation."""
+import logging
+import threading
 from unittest.mock import MagicMock, create_autospec, patch
 
+import numpy as np
 import pygame
 import pytest
 
+from src.application.services.memory_report import MemoryReport
+from src.application.services.snapshots import FrameSnapshot
+from src.config import display
 from src.main import GameLoop
 
 
@@ -36,6 +42,13 @@ def mock_pygame() -> MagicMock:
         mock.QUIT = pygame.QUIT
         mock.VIDEORESIZE = pygame.VIDEORESIZE
         mock.RESIZABLE = pygame.RESIZABLE
+        mock.KEYDOWN = pygame.KEYDOWN
+        mock.K_SPACE = pygame.K_SPACE
+        mock.K_m = pygame.K_m
+        mock.K_COMMA = pygame.K_COMMA
+        mock.K_PERIOD = pygame.K_PERIOD
+        mock.NOEVENT = pygame.NOEVENT
+        mock.event.wait.return_value = pygame.event.Event(pygame.NOEVENT)
 
         yield mock
 
@@ -117,3 +130,205 @@ def test_game_loop_run_sequence(mock_pygame: MagicMock) -> None:
         assert mock_grid_display_instance.render.called_once()
         assert mock_pygame.display.flip.called
         assert mock_pygame.time.Clock().tick.called
+
+
+def test_game_loop_update_picks_latest_snapshot(mock_pygame: MagicMock) -> None:
+    """Test that update takes the newest frame published by the worker."""
+    game = GameLoop()
+    assert game.snapshot is None
+
+    game.worker.start()
+    try:
+        game.update()
+    finally:
+        game.worker.stop()
+
+    assert game.snapshot is not None
+    assert game.snapshot.grid is game.grid
+
+
+def test_game_loop_run_stops_worker(mock_pygame: MagicMock) -> None:
+    """Test that leaving the loop also stops the simulation worker."""
+    with patch("src.main.GridDisplay"):
+        game = GameLoop()
+
+        def stop_after_one_iteration(*args: tuple, **kwargs: dict) -> None:
+            assert game.worker.running
+            game.running = False
+
+        mock_pygame.time.Clock().tick.side_effect = stop_after_one_iteration
+        game.run()
+
+        assert not game.worker.running
+
+
+def test_game_loop_redraws_only_changed_frames(mock_pygame: MagicMock) -> None:
+    """Test that a frame is redrawn only after a new snapshot or an event."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        mock_grid_display.return_value.update_layout.return_value = False
+        game = GameLoop()
+        game.worker.buffer.publish(MagicMock())
+        game.update()
+        assert game.needs_redraw
+
+        game.render()
+        game.update()
+        assert not game.needs_redraw
+
+        game.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN))
+        assert game.needs_redraw
+
+
+def test_game_loop_space_toggles_pause(mock_pygame: MagicMock) -> None:
+    """Test that the space key pauses and resumes the simulation."""
+    game = GameLoop()
+    space = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+    game.handle_event(space)
+    assert game.worker.paused
+    game.handle_event(space)
+    assert not game.worker.paused
+
+
+def test_game_loop_logs_memory_report(
+    mock_pygame: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the M key logs memory by subsystem, render caches included."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        mock_grid_display.return_value.memory_usage.return_value = {"sprites": 64}
+        game = GameLoop()
+
+        with caplog.at_level(logging.INFO, logger="src.main"):
+            game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m))
+            game.update()
+
+    assert game.memory_request is None
+    assert "cell fields" in caplog.text
+    assert "render caches" in caplog.text
+    assert "bytes per cell" in caplog.text
+
+
+def test_game_loop_measures_the_engine_on_the_worker_thread(
+    mock_pygame: MagicMock,
+) -> None:
+    """Test that the engine report is taken between ticks on the worker."""
+    with patch("src.main.GridDisplay"):
+        game = GameLoop()
+        threads = []
+        measure = game._engine_memory_report
+
+        def record_thread() -> MemoryReport:
+            threads.append(threading.current_thread().name)
+            return measure()
+
+        game._engine_memory_report = record_thread  # type: ignore
+        game.worker.start()
+        try:
+            game.request_memory_report()
+            assert game.memory_request is not None
+            game.memory_request.result(timeout=5)
+        finally:
+            game.worker.stop()
+
+    assert threads == ["simulation-worker"]
+
+
+def test_game_loop_blocks_instead_of_rendering_when_idle(
+    mock_pygame: MagicMock,
+) -> None:
+    """Test that a paused loop with a current frame waits for input."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        mock_grid_display.return_value.resize_pending = False
+        mock_grid_display.return_value.update_layout.return_value = False
+        game = GameLoop()
+        game.worker.pause()
+        game.needs_redraw = False
+        game.snapshots.latest = MagicMock(return_value=None)  # type: ignore
+
+        def stop_after_one_iteration(*args: tuple, **kwargs: dict) -> None:
+            game.running = False
+
+        mock_pygame.time.Clock().tick.side_effect = stop_after_one_iteration
+        game.run()
+
+        mock_pygame.event.wait.assert_called_once_with(display.IDLE_WAIT_MS)
+        mock_grid_display.return_value.render.assert_not_called()
+        mock_pygame.display.flip.assert_not_called()
+
+
+def test_game_loop_wakes_on_input(mock_pygame: MagicMock) -> None:
+    """Test that an event received while idle is handled and redrawn."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        mock_grid_display.return_value.resize_pending = False
+        game = GameLoop()
+        game.worker.pause()
+        game.needs_redraw = False
+        mock_pygame.event.wait.return_value = pygame.event.Event(
+            pygame.KEYDOWN, key=pygame.K_SPACE
+        )
+
+        game.wait_for_input()
+
+        assert not game.worker.paused
+        assert not game.idle
+
+
+def test_game_loop_resize_keeps_the_video_mode(mock_pygame: MagicMock) -> None:
+    """Test that resize events reuse the window surface and stay awake."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        mock_grid_display.return_value.resize_pending = True
+        game = GameLoop()
+        game.worker.pause()
+        mock_pygame.display.set_mode.reset_mock()
+
+        for width in (600, 620, 640):
+            game.handle_event(pygame.event.Event(pygame.VIDEORESIZE, w=width, h=480))
+
+        mock_pygame.display.set_mode.assert_not_called()
+        assert game.screen is mock_pygame.display.get_surface.return_value
+        mock_grid_display.return_value.handle_resize.assert_called_with(
+            (640, 480), game.screen
+        )
+        game.needs_redraw = False
+        # The loop keeps polling until the debounced layout has been applied
+        assert not game.idle
+
+
+def test_game_loop_rewinds_and_resumes_from_a_stored_state(
+    mock_pygame: MagicMock,
+) -> None:
+    """Test that scrubbing shows stored states and ticking resumes from one."""
+    with patch("src.main.GridDisplay") as mock_grid_display:
+        game = GameLoop()
+        for _ in range(3):
+            game.engine.step()
+            game.snapshots.publish(FrameSnapshot.capture(game.engine.world))
+            game.update()
+        game.recorder.drain()
+        assert game.rewind.ticks == [1, 2, 3]
+
+        back = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_COMMA)
+        forward = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_PERIOD)
+        for event in (back, back, back, forward):
+            game.handle_event(event)
+        assert game.worker.paused
+        # A tick finished after pausing is not recorded while scrubbing
+        game.engine.step()
+        game.snapshots.publish(FrameSnapshot.capture(game.engine.world))
+        game.update()
+        game.recorder.drain()
+        assert game.rewind.ticks == [1, 2, 3]
+        game.render()
+        shown = mock_grid_display.return_value.render.call_args[0][0]
+        assert shown.tick == 2
+
+        game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        assert not game.worker.paused
+        assert game.engine.tick == 2
+        for name, values in shown.fields.items():
+            assert np.array_equal(game.engine.world.fields[name], values)
+        # The history continues from the restored state
+        game.update()
+        game.recorder.drain()
+        assert game.rewind.ticks == [1, 2]
+        game.cleanup()